@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Sade Chocolate - HTML Parse Benchmark'i.
+
+Eski yol (her asama sayfayi html.parser ile yeniden parse eder) ile yeni
+yolu (lxml ile tek parse, tum asamalar ayni DOM'u paylasir) kaydedilmis
+rakip sayfalari uzerinde karsilastirir.
+
+Kullanım:
+    python scripts/benchmark_html_parsing.py --record          # Hedef sayfalari kaydet
+    python scripts/benchmark_html_parsing.py                   # data/recorded_pages/*.html
+    python scripts/benchmark_html_parsing.py sayfa1.html dir/  # Belirli dosyalar
+    python scripts/benchmark_html_parsing.py --synthetic 500   # Uretilmis 500 urunluk sayfa
+
+Gereksinimler (--record icin):
+    - scraping_targets.json veya Firebase hedefleri
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+# Proje root'unu Python path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from sade_agents.scrapers.parsing import HTML_PARSER, clean_text, parse_html  # noqa: E402
+from sade_agents.scrapers.structured_data import extract_structured_products  # noqa: E402
+
+DEFAULT_PAGES_DIR = project_root / "data" / "recorded_pages"
+
+
+# ============================================================================
+# Asamalar (SmartScraper/AIScraper'in DOM uzerinde yaptiklari)
+# ============================================================================
+
+
+def stage_menu_links(soup: BeautifulSoup) -> int:
+    """Menu kesfi: nav/header/menu icindeki linkler."""
+    links = []
+    for nav in soup.find_all(["nav", "header", "menu"]):
+        links.extend(nav.find_all("a", href=True))
+    return len(links)
+
+
+def stage_all_links(soup: BeautifulSoup) -> int:
+    """AI kesfi: sayfadaki tum linkler."""
+    return len(soup.find_all("a", href=True))
+
+
+def stage_clean_text(soup: BeautifulSoup) -> int:
+    """Urun cikarma: LLM'e gidecek temiz metin."""
+    return len(clean_text(soup))
+
+
+def stage_structured(soup: BeautifulSoup) -> int:
+    """Yapisal veri hizli yolu."""
+    return len(extract_structured_products(soup))
+
+
+DOM_STAGES = [stage_menu_links, stage_all_links, stage_clean_text]
+
+
+def old_pipeline(html: str) -> None:
+    """Eski yol: her asama kendi html.parser parse'ini yapar."""
+    for stage in DOM_STAGES:
+        stage(BeautifulSoup(html, "html.parser"))
+
+
+def new_pipeline(html: str) -> None:
+    """Yeni yol: tek lxml parse, asamalar DOM'u paylasir (+ yapisal veri)."""
+    soup = parse_html(html)
+    for stage in (*DOM_STAGES, stage_structured):
+        stage(soup)
+
+
+# ============================================================================
+# Olcum
+# ============================================================================
+
+
+def measure(func, html: str, repeat: int) -> float:
+    """Medyan sure (ms)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def synthetic_page(product_count: int) -> str:
+    """Menu, script ve urun kartlari iceren uretilmis kategori sayfasi."""
+    nav = "".join(f'<li><a href="/kategori/{i}">Kategori {i}</a></li>' for i in range(40))
+    cards = "".join(
+        f'<div class="product-card"><a href="/urun/{i}"><h3>Bitter Tablet No{i} 100g</h3></a>'
+        f'<span class="price">{400 + i},00 TL</span><p class="desc">%70 kakao</p></div>'
+        for i in range(product_count)
+    )
+    return (
+        "<html><head><title>Cikolata</title><script>var x = 1;</script></head><body>"
+        f"<header><nav><ul>{nav}</ul></nav></header><main>{cards}</main>"
+        "<footer>Iletisim</footer></body></html>"
+    )
+
+
+def collect_pages(paths: list[str]) -> list[tuple[str, str]]:
+    """Verilen dosya/dizinlerdeki .html dosyalarini okur."""
+    sources = [Path(p) for p in paths] or [DEFAULT_PAGES_DIR]
+    pages = []
+    for source in sources:
+        files = sorted(source.glob("*.html")) if source.is_dir() else [source]
+        for file in files:
+            if file.exists():
+                pages.append((file.name, file.read_text(encoding="utf-8", errors="replace")))
+    return pages
+
+
+async def record_pages(target_dir: Path) -> int:
+    """Config'deki hedeflerin sayfalarini diske kaydeder."""
+    from sade_agents.scrapers.ai_scraper import load_targets_from_config
+    from sade_agents.scrapers.http_session import get_session_manager
+
+    manager = get_session_manager()
+    target_dir.mkdir(parents=True, exist_ok=True)
+    saved = 0
+    try:
+        for target in load_targets_from_config():
+            try:
+                response = await manager.fetch(target.url, timeout=30)
+            except Exception as e:
+                print(f"  ✗ {target.url}: {e}")
+                continue
+            if not response.ok:
+                print(f"  ✗ {target.url}: HTTP {response.status}")
+                continue
+            name = f"{target.name}_{urlparse(target.url).netloc}.html"
+            (target_dir / name).write_text(response.text, encoding="utf-8")
+            print(f"  ✓ {name} ({len(response.text) // 1024} KB)")
+            saved += 1
+    finally:
+        await manager.close()
+    return saved
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="HTML parse benchmark'i")
+    parser.add_argument("paths", nargs="*", help="HTML dosyalari veya dizinleri")
+    parser.add_argument("--repeat", type=int, default=5, help="Sayfa basina tekrar")
+    parser.add_argument("--record", action="store_true", help="Hedef sayfalari kaydet")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="N urunluk uretilmis sayfa")
+    args = parser.parse_args()
+
+    if args.record:
+        print(f"📥 Sayfalar kaydediliyor: {DEFAULT_PAGES_DIR}")
+        saved = asyncio.run(record_pages(DEFAULT_PAGES_DIR))
+        return 0 if saved else 1
+
+    pages = collect_pages(args.paths)
+    if args.synthetic:
+        pages.append((f"synthetic_{args.synthetic}", synthetic_page(args.synthetic)))
+    if not pages:
+        print("Sayfa bulunamadi. Once --record calistirin veya --synthetic kullanin.")
+        return 1
+
+    print(f"Backend: {HTML_PARSER} | tekrar: {args.repeat}\n")
+    print(f"{'Sayfa':40} {'KB':>6} {'eski ms':>9} {'yeni ms':>9} {'hizlanma':>9}")
+    total_old = total_new = 0.0
+    for name, html in pages:
+        old_ms = measure(old_pipeline, html, args.repeat)
+        new_ms = measure(new_pipeline, html, args.repeat)
+        total_old += old_ms
+        total_new += new_ms
+        print(
+            f"{name[:40]:40} {len(html) // 1024:>6} {old_ms:>9.1f} {new_ms:>9.1f} "
+            f"{old_ms / new_ms:>8.1f}x"
+        )
+
+    print(f"\nToplam: eski {total_old:.1f} ms, yeni {total_new:.1f} ms "
+          f"({total_old / total_new:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Sade Chocolate - Fiyat Gecmisi Sorgu Benchmark'i.
+
+Gecici bir veritabanina uretilmis scrape sonuclari ekler ve
+PriceHistoryStore sorgularinin surelerini olcer.
+
+Kullanım:
+    python scripts/benchmark_price_history.py                 # ~1M satir
+    python scripts/benchmark_price_history.py --days 30       # Daha kucuk veri
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Proje root'unu Python path'e ekle
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from sade_agents.scrapers.base import ProductPrice, ScraperResult  # noqa: E402
+from sade_agents.scrapers.product_identity import product_key  # noqa: E402
+from sade_agents.storage.price_history import PriceHistoryStore  # noqa: E402
+
+CATEGORIES = ["tablet", "truffle", "draje", "hediye_kutu", "diger"]
+
+
+def fill(store: PriceHistoryStore, days: int, sources: int, products: int, start: datetime) -> None:
+    """Her gun, her kaynak icin bir scrape sonucu ekler."""
+    for day in range(days):
+        results = [
+            ScraperResult(
+                source=f"rakip{s}",
+                success=True,
+                products=[
+                    ProductPrice(
+                        name=f"Urun {i}",
+                        price_tl=round(100 + random.random() * 900, 2),
+                        weight_grams=(100, 200, None)[i % 3],
+                        category=CATEGORIES[i % len(CATEGORIES)],
+                    )
+                    for i in range(products)
+                ],
+                scraped_at=start + timedelta(days=day),
+            )
+            for s in range(sources)
+        ]
+        store.record_many(results)
+
+
+def measure(label: str, func) -> None:
+    start = time.perf_counter()
+    rows = func()
+    print(f"  {label:40} {len(rows):>7} satir {(time.perf_counter() - start) * 1000:>8.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fiyat gecmisi sorgu benchmark'i")
+    parser.add_argument("--days", type=int, default=200, help="Gun sayisi")
+    parser.add_argument("--sources", type=int, default=20, help="Rakip sayisi")
+    parser.add_argument("--products", type=int, default=250, help="Rakip basina urun")
+    args = parser.parse_args()
+
+    start = datetime(2024, 1, 1)
+    end = start + timedelta(days=args.days)
+    key = product_key(ProductPrice(name="Urun 7", price_tl=0, weight_grams=200))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PriceHistoryStore(Path(tmp) / "price_history.sqlite3")
+        began = time.perf_counter()
+        fill(store, args.days, args.sources, args.products, start)
+        print(f"Eklenen: {len(store):,} satir ({time.perf_counter() - began:.1f} sn)\n")
+
+        measure("latest_prices(source)", lambda: store.latest_prices(source="rakip3"))
+        measure("latest_prices()", lambda: store.latest_prices())
+        measure(
+            "price_range(urun, tum gecmis)",
+            lambda: store.price_range(source="rakip3", product_key=key),
+        )
+        measure(
+            "price_range(urun, son 30 gun)",
+            lambda: store.price_range(
+                source="rakip3", product_key=key, start=end - timedelta(days=30)
+            ),
+        )
+        measure("category_stats()", lambda: store.category_stats())
+        measure(
+            "category_stats(son 7 gun)",
+            lambda: store.category_stats(start=end - timedelta(days=7)),
+        )
+        measure(
+            "category_stats(gun ortasindan)",
+            lambda: store.category_stats(start=end - timedelta(days=7, hours=12)),
+        )
+        measure("category_stats(latest_only)", lambda: store.category_stats(latest_only=True))
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,8 +4,13 @@ Sade Agents - Yapilandirma ayarlari.
 pydantic-settings ile type-safe config yonetimi.
 """
 
+from pathlib import Path
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Proje koku (src/sade_agents/config/settings.py -> ../../../)
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
 
 class Settings(BaseSettings):
     """
@@ -33,10 +38,61 @@ class Settings(BaseSettings):
     # Feature Flags (ozellik acma/kapama)
     feature_real_scraping: bool = False
     feature_firebase_storage: bool = False
+    feature_http_cache: bool = False  # Rakip sayfalari icin diskte conditional-GET cache
+    feature_extraction_cache: bool = False  # Degismeyen sayfalar icin LLM cikarma cache'i
+    feature_incremental_sitemap: bool = False  # Sitemap'ten sadece degisen sayfalari sec
+    feature_scraping_resilience: bool = False  # Tekrar deneme + domain/LLM devre kesici
+    feature_incremental_scraping: bool = False  # Icerigi degismeyen sayfalari tekrar cikarma
+    feature_price_history: bool = False  # Scrape sonuclarini fiyat gecmisine yaz
+    feature_batched_extraction: bool = False  # Kucuk sayfalari tek LLM isteginde cikar
+    feature_parallel_crew_tasks: bool = False  # Bagimsiz crew task'larini paralel calistir
+    feature_crew_pool: bool = False  # Agent/crew'lari process basina bir kez kur, tekrar kullan
+    feature_crew_cache: bool = False  # Ayni girdili crew task'larinin LLM cevabini tekrar kullan
 
     # Scraping
     scraping_timeout_seconds: int = 30
     scraping_targets_file: str = "scraping_targets.json"  # Hedefler bu dosyadan okunur
+    scraping_llm_concurrency: int = 5  # Ayni anda calisan LLM cikarma cagrisi
+    scraping_llm_timeout_seconds: float = 60.0  # LLM cagrisi basina timeout
+    scraping_chunk_tokens: int = 6000  # Buyuk sayfalar bu butceyle parcalanip cikarilir
+    scraping_max_pages_per_site: int = 30  # Site basina taranacak toplam sayfa (sayfalama dahil)
+    scraping_max_crawl_depth: int = 2  # Kesfedilen sayfalardan takip edilecek alt kategori seviyesi
+    scraping_crawl_workers: int = 4  # Site basina eszamanli sayfa taramasi
+    scraping_sitemap_full_crawl_hours: float = 168.0  # Artimli sitemap: periyodik tam tarama
+
+    # Toplu cikarma (FEATURE_BATCHED_EXTRACTION=true ise)
+    scraping_batch_tokens: int = 6000  # Tek istekte toplanan sayfalarin token butcesi
+    scraping_batch_page_tokens: int = 1500  # Bu boyuta kadar sayfalar toplu cikarilir
+    scraping_batch_linger_seconds: float = 0.05  # Diger kucuk sayfalar icin bekleme
+
+    # Nezaket zamanlayicisi (tum HTTP istekleri)
+    scraping_global_concurrency: int = 32  # Toplam eszamanli istek
+    scraping_domain_concurrency: int = 4  # Domain basina eszamanli istek
+    scraping_domain_rate_per_second: float = 2.0  # Domain basina istek/saniye
+    scraping_domain_burst: int = 4  # Domain basina anlik istek birikimi
+    scraping_max_retries_on_throttle: int = 2  # 429/503 sonrasi tekrar deneme
+    scraping_max_retry_after_seconds: float = 60.0  # Uyulacak en uzun Retry-After
+
+    # Tekrar deneme ve devre kesici (sayfa cekme + LLM cagrilari)
+    scraping_retry_attempts: int = 3  # Cagri basina toplam deneme
+    scraping_retry_backoff_seconds: float = 0.5  # Jitter'li ustel bekleme carpani
+    scraping_retry_backoff_max_seconds: float = 8.0  # Tek beklemenin ust siniri
+    scraping_circuit_failure_threshold: int = 5  # Devreyi acan art arda hata
+    scraping_circuit_reset_seconds: float = 60.0  # Acik devrenin tekrar deneme suresi
+    scraping_run_failure_budget: int = 50  # Tarama basina toplam tekrar deneme
+
+    # Disk cache'leri (goreli yollar proje kokune gore)
+    cache_dir: str = "data/cache"
+    http_cache_max_mb: int = 200
+    extraction_cache_ttl_hours: int = 168  # 1 hafta
+    extraction_cache_max_entries: int = 50000
+    crew_cache_ttl_hours: int = 24
+
+    # Crew havuzu (FEATURE_CREW_POOL=true ise)
+    crew_pool_max_idle: int = 2  # Crew turu basina bekleyen hazir crew
+
+    # Fiyat gecmisi (goreli yol proje kokune gore)
+    price_history_path: str = "data/price_history.sqlite3"
 
     # Tenant (multi-tenant SaaS hazirlik)
     app_default_tenant_id: str = "default"
@@ -54,6 +110,20 @@ class Settings(BaseSettings):
         """API key'in ayarlanip ayarlanmadigini kontrol eder."""
         return bool(self.openai_api_key and self.openai_api_key != "your-api-key-here")
 
+    def get_cache_dir(self) -> Path:
+        """Cache dizininin mutlak yolunu dondurur."""
+        path = Path(self.cache_dir)
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+        return path
+
+    def get_price_history_path(self) -> Path:
+        """Fiyat gecmisi veritabaninin mutlak yolunu dondurur."""
+        path = Path(self.price_history_path)
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+        return path
+
     def is_firebase_configured(self) -> bool:
         """Firebase yapilandirmasinin tamamlanip tamamlanmadigini kontrol eder."""
         return bool(
@@ -9,7 +9,14 @@ from sade_agents.crews.base_crew import (
     timed_execution,
     requires_approval,
 )
+from sade_agents.crews.llm_cache import (
+    CachedTask,
+    CrewResponseCache,
+    get_crew_cache,
+)
+from sade_agents.crews.loop_runner import LoopRunner, get_loop_runner
 from sade_agents.crews.factory import SadeCrewFactory, CrewType
+from sade_agents.crews.pool import CrewPool, get_crew_pool, lease_crew
 from sade_agents.crews.market_analysis_crew import MarketAnalysisCrew
 from sade_agents.crews.product_launch_crew import ProductLaunchCrew
 from sade_agents.crews.quality_audit_crew import QualityAuditCrew
@@ -20,9 +27,20 @@ __all__: list[str] = [
     "create_task_with_context",
     "timed_execution",
     "requires_approval",
+    # Task cevap cache'i
+    "CachedTask",
+    "CrewResponseCache",
+    "get_crew_cache",
+    # Arka plan event loop'u
+    "LoopRunner",
+    "get_loop_runner",
     # Factory
     "SadeCrewFactory",
     "CrewType",
+    # Hazir crew havuzu
+    "CrewPool",
+    "get_crew_pool",
+    "lease_crew",
     # Crews
     "MarketAnalysisCrew",
     "ProductLaunchCrew",
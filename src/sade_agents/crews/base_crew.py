@@ -9,6 +9,7 @@ import time
 from typing import Callable, TypeVar
 from crewai import Task
 from sade_agents.agents.base import SadeAgent
+from sade_agents.crews.llm_cache import CachedTask
 
 T = TypeVar("T")
 
@@ -18,6 +19,8 @@ def create_task_with_context(
     expected_output: str,
     agent: SadeAgent,
     context: list[Task] | None = None,
+    cache_namespace: str | None = None,
+    async_execution: bool = False,
 ) -> Task:
     """
     Task olusturur, context dependency'leri ile.
@@ -27,6 +30,10 @@ def create_task_with_context(
         expected_output: Beklenen cikti formati
         agent: Gorevi calistiracak agent
         context: Bagimli oldugu onceki task'lar (optional)
+        cache_namespace: Verilirse cevap crew cache'inde bu namespace
+            altinda saklanir (FEATURE_CREW_CACHE=true ise)
+        async_execution: True ise task sonraki async task'larla paralel
+            calisir; ilk async olmayan task hepsini bekler
 
     Returns:
         Configured Task instance
@@ -38,6 +45,10 @@ def create_task_with_context(
     }
     if context:
         task_kwargs["context"] = context
+    if async_execution:
+        task_kwargs["async_execution"] = True
+    if cache_namespace:
+        return CachedTask(cache_namespace=cache_namespace, **task_kwargs)
 
     return Task(**task_kwargs)
 
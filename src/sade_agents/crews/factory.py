@@ -7,10 +7,10 @@ Tum crew turlerini tek noktadan olusturur.
 
 from typing import Literal, Union
 
-from sade_agents.crews.product_launch_crew import ProductLaunchCrew
 from sade_agents.crews.market_analysis_crew import MarketAnalysisCrew
+from sade_agents.crews.product_launch_crew import ProductLaunchCrew
 from sade_agents.crews.quality_audit_crew import QualityAuditCrew
-
+from sade_agents.models import MarketAnalysisOutput, ProductLaunchOutput, QualityAuditOutput
 
 CrewType = Literal["product_launch", "market_analysis", "quality_audit"]
 
@@ -28,6 +28,9 @@ class SadeCrewFactory:
         factory = SadeCrewFactory()
         crew = factory.create_product_launch_crew()
         result = crew.kickoff(inputs)
+
+    Async kullanim (tek event loop'ta bircok crew):
+        result = await factory.akickoff("market_analysis", inputs)
     """
 
     def create_product_launch_crew(self) -> ProductLaunchCrew:
@@ -96,5 +99,23 @@ class SadeCrewFactory:
 
         return crew_map[crew_type]()
 
+    async def akickoff(
+        self, crew_type: CrewType, inputs: dict
+    ) -> Union[ProductLaunchOutput, MarketAnalysisOutput, QualityAuditOutput]:
+        """
+        Crew olusturur ve cagiranin event loop'unda calistirir.
+
+        Args:
+            crew_type: 'product_launch', 'market_analysis', veya 'quality_audit'
+            inputs: Crew'un input field'lari
+
+        Returns:
+            Crew turune ait output modeli
+
+        Raises:
+            ValueError: Gecersiz crew_type icin
+        """
+        return await self.create_crew(crew_type).akickoff(inputs)
+
 
 __all__ = ["SadeCrewFactory", "CrewType"]
@@ -0,0 +1,357 @@
+"""
+Sade Chocolate - Crew Task Yanit Cache'i.
+
+Crew'lar her kickoff'ta tum agent task'larini bastan calistirir; ayni
+form tekrar gonderildiginde veya storage hatasi sonrasi yeniden
+calistirildiginda ayni LLM cevaplari icin tekrar token harcanir.
+
+CachedTask, task cevabini (raw cikti) su alanlarin hash'i ile saklar:
+- Model adi ve agent rolu
+- Task aciklamasi (kickoff input'lari islenmis hali) ve beklenen cikti
+- Onceki task'lardan gelen islenmis context
+- Agent'in tool listesi
+
+Task'a verilen dis veri (orn. MarketAnalysisCrew'un scrape ettigi
+GERCEK VERI) aciklamaya gomulu oldugu icin anahtarin parcasidir: veri
+degisirse task tekrar calisir. Agent'in calisma sirasinda cagirdigi
+tool'larin (sosyal medya, reddit) sonuclari ise cevabin parcasi olarak
+cache'lenir; TTL bu veri icin tazelik sinirini belirler.
+
+Kayitlar crew bazinda (namespace) tutulur; invalidate(namespace) tek bir
+crew'un cache'ini temizler.
+
+Yan etkisi olan tool'lari calistiran task'lar (orn. etiket PNG'si ureten
+Curator) cache'lenmemelidir: cache'ten donen cevapta tool calismaz. Bu
+task'lara cache_namespace verilmez.
+
+Kullanim:
+    task = create_task_with_context(..., cache_namespace="market_analysis")
+    get_crew_cache().invalidate("market_analysis")
+"""
+
+import datetime
+import hashlib
+import inspect
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+
+logger = logging.getLogger(__name__)
+
+# Anahtar semasi degistiginde artirin (eski kayitlar gecersiz olur)
+CACHE_KEY_VERSION = "1"
+
+# CachedTask'in sardigi public Task metotlari ve beklenen parametreleri
+_WRAPPED_TASK_METHODS = ("execute_sync", "execute_async", "aexecute_sync")
+_WRAPPED_TASK_PARAMS = ["self", "agent", "context", "tools"]
+
+
+@dataclass
+class CrewCacheStats:
+    """Crew cache istatistikleri."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+
+
+class CrewResponseCache:
+    """
+    Crew task cevaplari icin kalici cache (SQLite, TTL'li).
+
+    Kullanim:
+        key = CrewResponseCache.make_key(model, role, description, expected, context, tools)
+        raw = cache.get("market_analysis", key)
+        if raw is None:
+            raw = run_task()
+            cache.put("market_analysis", key, raw)
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float = 24 * 3600) -> None:
+        """
+        Args:
+            path: SQLite dosya yolu (dizin yoksa olusturulur)
+            ttl_seconds: Kaydin gecerlilik suresi
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.stats = CrewCacheStats()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS crew_cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                raw TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        agent_role: str,
+        description: str,
+        expected_output: str,
+        context: str | None,
+        tool_names: list[str],
+    ) -> str:
+        """Task cevabinin cache anahtari (sha256)."""
+        digest = hashlib.sha256()
+        parts = (
+            CACHE_KEY_VERSION,
+            model,
+            agent_role,
+            description,
+            expected_output,
+            context or "",
+            ",".join(sorted(tool_names)),
+        )
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, namespace: str, key: str) -> str | None:
+        """Kayitli cevabi dondurur (yoksa veya TTL'i gectiyse None)."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT raw, created_at FROM crew_cache WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            if now - row[1] > self.ttl_seconds:
+                self._conn.execute(
+                    "DELETE FROM crew_cache WHERE namespace = ? AND key = ?", (namespace, key)
+                )
+                self._conn.commit()
+                self.stats.expired += 1
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            return row[0]
+
+    def put(self, namespace: str, key: str, raw: str) -> None:
+        """Cevabi saklar."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO crew_cache (namespace, key, raw, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, raw, time.time()),
+            )
+            self._conn.commit()
+
+    def invalidate(self, namespace: str | None = None) -> int:
+        """
+        Bir crew'un (namespace None ise tum crew'larin) kayitlarini siler.
+
+        Returns:
+            Silinen kayit sayisi
+        """
+        with self._lock:
+            if namespace is None:
+                cursor = self._conn.execute("DELETE FROM crew_cache")
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM crew_cache WHERE namespace = ?", (namespace,)
+                )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        """TTL'i gecmis kayitlari siler; silinen kayit sayisini dondurur."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM crew_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM crew_cache").fetchone()[0]
+
+    def close(self) -> None:
+        """SQLite baglantisini kapatir."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedTask(Task):
+    """
+    Cevabi CrewResponseCache'te saklanan Task.
+
+    Cache, crew'un task calistirmak icin cagirdigi public metotlarin
+    (execute_sync, execute_async, aexecute_sync) etrafina kurulur.
+    Cache kapaliysa (FEATURE_CREW_CACHE=false) normal Task gibi calisir.
+    Cache'ten donen cikti icin agent calistirilmaz; task callback'leri
+    ve guardrail'ler de tekrar calismaz (cikti ilk calismada zaten
+    onlardan gecmistir).
+    """
+
+    cache_namespace: str = "default"
+
+    def execute_sync(
+        self,
+        agent: Any | None = None,
+        context: str | None = None,
+        tools: list[Any] | None = None,
+    ) -> TaskOutput:
+        cache, key, cached = self._cache_lookup(agent, context, tools)
+        if cached is not None:
+            return cached
+        output = super().execute_sync(agent, context, tools)
+        if cache is not None:
+            cache.put(self.cache_namespace, key, output.raw)
+        return output
+
+    def execute_async(
+        self,
+        agent: Any | None = None,
+        context: str | None = None,
+        tools: list[Any] | None = None,
+    ) -> Future[TaskOutput]:
+        cache, key, cached = self._cache_lookup(agent, context, tools)
+        if cached is not None:
+            future: Future[TaskOutput] = Future()
+            future.set_result(cached)
+            return future
+        inner = super().execute_async(agent, context, tools)
+        if cache is None:
+            return inner
+
+        # Cevap, sonucu bekleyen crew'a verilmeden once saklanir
+        future = Future()
+
+        def store(done: Future[TaskOutput]) -> None:
+            try:
+                output = done.result()
+            except BaseException as e:
+                future.set_exception(e)
+                return
+            try:
+                cache.put(self.cache_namespace, key, output.raw)
+            finally:
+                future.set_result(output)
+
+        inner.add_done_callback(store)
+        return future
+
+    async def aexecute_sync(
+        self,
+        agent: Any | None = None,
+        context: str | None = None,
+        tools: list[Any] | None = None,
+    ) -> TaskOutput:
+        cache, key, cached = self._cache_lookup(agent, context, tools)
+        if cached is not None:
+            return cached
+        output = await super().aexecute_sync(agent, context, tools)
+        if cache is not None:
+            cache.put(self.cache_namespace, key, output.raw)
+        return output
+
+    def _cache_lookup(
+        self, agent: Any, context: str | None, tools: list[Any] | None
+    ) -> tuple[CrewResponseCache | None, str | None, TaskOutput | None]:
+        """(cache, anahtar, cache'ten uretilmis cikti) - cache kapaliysa (None, None, None)."""
+        cache = get_crew_cache()
+        agent = agent or self.agent
+        if cache is None or agent is None:
+            return None, None, None
+
+        llm = getattr(agent, "llm", None)
+        model = str(getattr(llm, "model", llm) or "")
+        tools = tools or self.tools or agent.tools or []
+        tool_names = [getattr(t, "name", str(t)) for t in tools]
+        key = cache.make_key(
+            model, agent.role, self.description, self.expected_output, context, tool_names
+        )
+        raw = cache.get(self.cache_namespace, key)
+        if raw is None:
+            return cache, key, None
+
+        self.agent = agent
+        self.prompt_context = context
+        self.start_time = datetime.datetime.now()
+        self.output = TaskOutput(
+            name=self.name or self.description,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=raw,
+            agent=agent.role,
+            output_format=self._get_output_format(),
+        )
+        self.end_time = datetime.datetime.now()
+        return cache, key, self.output
+
+
+def crewai_supported() -> bool:
+    """
+    Kurulu crewai surumu CachedTask'in sardigi metotlari bekledigi
+    imzayla sunuyor mu? (Desteklenmiyorsa cache devre disi kalir.)
+    """
+    for name in _WRAPPED_TASK_METHODS:
+        method = getattr(Task, name, None)
+        if method is None:
+            # Native async yol eski surumlerde yok (crew de cagirmaz)
+            if name == "aexecute_sync":
+                continue
+            return False
+        params = list(inspect.signature(method).parameters)
+        if params[: len(_WRAPPED_TASK_PARAMS)] != _WRAPPED_TASK_PARAMS:
+            return False
+    return True
+
+
+_crew_cache: CrewResponseCache | None = None
+
+
+def get_crew_cache() -> CrewResponseCache | None:
+    """
+    Paylasilan CrewResponseCache'i dondurur.
+
+    FEATURE_CREW_CACHE kapaliysa veya kurulu crewai surumu desteklenmiyorsa
+    None doner.
+    """
+    global _crew_cache
+    if _crew_cache is None:
+        from sade_agents.config import get_settings
+
+        settings = get_settings()
+        if not settings.feature_crew_cache:
+            return None
+        if not crewai_supported():
+            logger.warning("Kurulu crewai surumu crew cache'i desteklemiyor, cache kapali")
+            return None
+        _crew_cache = CrewResponseCache(
+            settings.get_cache_dir() / "crew_cache.sqlite3",
+            ttl_seconds=settings.crew_cache_ttl_hours * 3600,
+        )
+    return _crew_cache
+
+
+__all__ = [
+    "CachedTask",
+    "CrewCacheStats",
+    "CrewResponseCache",
+    "crewai_supported",
+    "get_crew_cache",
+]
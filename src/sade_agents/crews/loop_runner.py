@@ -0,0 +1,120 @@
+"""
+Sade Chocolate - Paylasilan Arka Plan Event Loop'u.
+
+Crew'larin asil calisma yolu async'tir (akickoff). Senkron kickoff her
+cagrida yeni event loop acip kapatiyordu; bu hem loop kurulum maliyeti
+demek hem de cagiranin zaten calisan bir loop'u varsa (Streamlit, API
+sunucusu) kirilir. LoopRunner tek bir daemon thread'de surekli acik bir
+loop tutar; senkron cagrilar coroutine'i bu loop'a gonderip sonucu
+bekler.
+
+Ayni loop'ta kalmanin yan faydasi: loop'a bagli kaynaklar (scraper'larin
+aiohttp session'lari) kickoff'lar arasinda tekrar kullanilir.
+
+Kullanim:
+    result = get_loop_runner().run(crew.akickoff(inputs))
+"""
+
+import asyncio
+import atexit
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class LoopRunner:
+    """
+    Arka plan thread'inde calisan uzun omurlu event loop.
+
+    Loop ilk run() cagrisinda baslatilir. run() herhangi bir thread'den
+    (calisan baska bir loop'un icinden de) cagrilabilir; sadece
+    runner'in kendi loop'undan cagrilamaz (kilitlenir) - orada
+    dogrudan await kullanilmalidir.
+    """
+
+    def __init__(self, name: str = "sade-crew-loop") -> None:
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Loop'u (gerekirse) baslatir ve dondurur."""
+        with self._lock:
+            if self._loop is not None and self.running:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def serve() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=serve, name=self.name, daemon=True)
+            thread.start()
+            started.wait()
+            self._loop, self._thread = loop, thread
+            return loop
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """
+        Coroutine'i arka plan loop'unda calistirir ve sonucunu bekler.
+
+        Args:
+            coro: Calistirilacak coroutine
+            timeout: Saniye; asilirsa coroutine iptal edilir ve TimeoutError
+
+        Raises:
+            RuntimeError: Runner'in kendi loop'undan cagrildiysa
+        """
+        loop = self.start()
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        if current is loop:
+            coro.close()
+            raise RuntimeError("LoopRunner.run kendi loop'undan cagrilamaz; await kullanin")
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        """Loop'u durdurur ve kapatir (sonraki run() yenisini baslatir)."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+_loop_runner: LoopRunner | None = None
+_loop_runner_lock = threading.Lock()
+
+
+def get_loop_runner() -> LoopRunner:
+    """Process genelinde paylasilan LoopRunner'i dondurur."""
+    global _loop_runner
+    with _loop_runner_lock:
+        if _loop_runner is None:
+            _loop_runner = LoopRunner()
+            atexit.register(_loop_runner.stop)
+        return _loop_runner
+
+
+__all__ = ["LoopRunner", "get_loop_runner"]
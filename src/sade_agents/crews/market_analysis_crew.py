@@ -12,23 +12,30 @@ ONEMLI: Bu crew GERCEK scraper verisi kullanir, LLM hayal gucu DEGIL!
 
 import asyncio
 import time
-from crewai import Crew, Process
+from crewai import Crew, Process, Task
 
 from sade_agents.agents import (
     PricingAnalystAgent,
     GrowthHackerAgent,
     NarratorAgent,
 )
+from sade_agents.config import get_settings
 from sade_agents.crews.base_crew import create_task_with_context
+from sade_agents.crews.loop_runner import get_loop_runner
 from sade_agents.models import MarketAnalysisInput, MarketAnalysisOutput
 from sade_agents.scrapers import SmartScraper, ScrapingTarget
+from sade_agents.scrapers.product_frame import ProductFrame
+from sade_agents.storage.price_history import get_price_history
 
 
 class MarketAnalysisCrew:
     """
     Pazar analizi workflow'u.
 
-    Pipeline: PricingAnalyst -> GrowthHacker (optional) -> Narrator
+    Pipeline (varsayilan, sirali): Scrape -> PricingAnalyst -> GrowthHacker (optional) -> Narrator
+    Paralel mod (FEATURE_PARALLEL_CREW_TASKS):
+    - URL varsa: (Scrape || GrowthHacker) -> PricingAnalyst -> Narrator
+    - URL yoksa: (PricingAnalyst || GrowthHacker) -> Narrator
     Kullanim: Rakip analizi, fiyatlandirma onerisi, trend raporu
 
     Agents:
@@ -37,12 +44,18 @@ class MarketAnalysisCrew:
     - Narrator: Bulgulari 'Sessiz Luks' tonunda ozetler
     """
 
+    # Crew cache'i namespace'i (get_crew_cache().invalidate(...) icin)
+    CACHE_NAMESPACE = "market_analysis"
+
     def __init__(self) -> None:
         """Agent'lari olusturur."""
         self.pricing = PricingAnalystAgent()
         self.growth = GrowthHackerAgent()
         self.narrator = NarratorAgent()
         self._scraper = SmartScraper()
+        # Fiyat ve trend analizi birbirinin ciktisini kullanmaz; paralel
+        # modda ikisi ayni anda calisir, Narrator ikisini bekler
+        self.parallel_tasks = get_settings().feature_parallel_crew_tasks
 
     async def _fetch_real_data(self, competitor_name: str, competitor_url: str | None) -> str:
         """
@@ -62,6 +75,11 @@ class MarketAnalysisCrew:
 
         result = await self._scraper.scrape_site(target)
 
+        # Sonucu fiyat gecmisine yaz (trend sorulari icin tekrar scrape gerekmez)
+        price_history = get_price_history()
+        if price_history is not None:
+            price_history.record(result, tenant_id=get_settings().app_default_tenant_id)
+
         if not result.success or not result.products:
             error_msg = result.error or "Urun bulunamadi"
             return f"UYARI: {competitor_name} sitesinden veri cekilemedi. Hata: {error_msg}"
@@ -70,16 +88,21 @@ class MarketAnalysisCrew:
         lines = [f"GERCEK VERİ - {competitor_name} ({len(result.products)} urun):"]
         lines.append("-" * 50)
 
-        # Fiyat istatistikleri
-        prices = [p.price_tl for p in result.products if p.price_tl > 0]
-        if prices:
-            lines.append(f"Fiyat araligi: {min(prices):.0f} - {max(prices):.0f} TL")
-            lines.append(f"Ortalama fiyat: {sum(prices)/len(prices):.0f} TL")
+        # Fiyat istatistikleri (tum urunler uzerinden, vektorel)
+        frame = ProductFrame.from_results(result)
+        if len(frame):
+            summary = frame.summary()
+            lines.append(
+                f"Fiyat araligi: {summary['min_price']:.0f} - {summary['max_price']:.0f} TL"
+            )
+            lines.append(f"Ortalama fiyat: {summary['avg_price']:.0f} TL")
+            lines.append("Kategori ozeti:")
+            lines.extend(frame.to_text())
             lines.append("")
 
         # Urun listesi
         lines.append("Urunler:")
-        for p in result.products[:20]:  # Max 20 urun goster
+        for p in result.products[:20]:  # Max 20 urun goster (ozet yukarida tum urunleri kapsar)
             weight_info = f" ({p.weight_grams}g)" if p.weight_grams else ""
             category_info = f" [{p.category}]" if p.category else ""
             gram_price = ""
@@ -89,8 +112,95 @@ class MarketAnalysisCrew:
 
         return "\n".join(lines)
 
-    def _create_tasks(self, inputs: MarketAnalysisInput, real_data: str) -> list:
-        """Task zinciri olusturur, GERCEK VERİ ile."""
+    async def _prepare_inputs(
+        self,
+        competitor_name: str,
+        competitor_url: str | None,
+        trend_task: Task | None = None,
+    ) -> str:
+        """
+        Scrape verisini ceker; trend_task verilirse onu ayni anda calistirir.
+
+        Trend task'i (senkron LLM cagrilari) thread'de calisir, scraper
+        event loop'ta kalir. Scrape hatasi metin olarak doner; trend
+        hatasinda devam eden scrape iptal edilir ve hata yukari iletilir
+        (crew hatasi gibi).
+
+        Cakisma sadece paralel modda (FEATURE_PARALLEL_CREW_TASKS=true)
+        vardir: varsayilan sirali modda trend task'i fiyat analizini
+        context olarak alir, scrape'ten once calistirilamaz ve kickoff
+        trend_task vermez (once scrape, sonra tum task'lar sirayla).
+
+        Returns:
+            Pricing/summary task'larina verilecek GERCEK VERİ metni
+        """
+
+        async def scrape() -> str:
+            try:
+                return await self._fetch_real_data(competitor_name, competitor_url)
+            except Exception as e:
+                return f"HATA: Veri cekilemedi - {str(e)}"
+
+        if trend_task is None:
+            return await scrape()
+        try:
+            async with asyncio.TaskGroup() as group:
+                scrape_task = group.create_task(scrape())
+                group.create_task(
+                    asyncio.to_thread(trend_task.execute_sync, agent=self.growth)
+                )
+        except ExceptionGroup as eg:
+            # Trend hatasi: scrape iptal edilip beklendi, asil hata iletilir
+            raise eg.exceptions[0] from None
+        return scrape_task.result()
+
+    def _create_trend_task(
+        self,
+        inputs: MarketAnalysisInput,
+        context: list[Task] | None = None,
+        async_execution: bool = False,
+    ) -> Task:
+        """GrowthHacker trend task'i (scrape verisine bagli degildir)."""
+        return create_task_with_context(
+            description=f"""
+Pazar trend analizi yap: {inputs.product_category}
+
+Rakip: {inputs.competitor_name}
+
+Analiz edilecekler:
+- Trend olan lezzetler
+- Sosyal medya sentiment (pozitif/negitif/notr)
+- Hashtag hacimleri
+- Tuketici davranis degisimleri
+
+Cikti formati:
+- trending_flavors: Liste
+- social_sentiment: pozitif/negatif/notr
+- hashtag_volume: Sayi
+- consumer_insights: Liste
+            """,
+            expected_output=(
+                "JSON: trending_flavors, social_sentiment, hashtag_volume, consumer_insights"
+            ),
+            agent=self.growth,
+            context=context,
+            cache_namespace=self.CACHE_NAMESPACE,
+            async_execution=async_execution,
+        )
+
+    def _create_tasks(
+        self,
+        inputs: MarketAnalysisInput,
+        real_data: str,
+        trend_task: Task | None = None,
+    ) -> list[Task]:
+        """
+        Task zinciri olusturur, GERCEK VERİ ile.
+
+        trend_task verilirse (kickoff'ta scrape ile paralel calistirilmis)
+        crew'a eklenmez, sadece ozet task'ina context olarak baglanir.
+        """
+        parallel = self.parallel_tasks and inputs.include_trends and trend_task is None
         # Task 1: PricingAnalyst - Fiyat analizi (GERCEK VERİYLE)
         pricing_task = create_task_with_context(
             description=f"""
@@ -130,34 +240,22 @@ Cikti formati:
             """,
             expected_output="JSON: competitor, price_range, price_by_category, positioning, recommendation",
             agent=self.pricing,
+            cache_namespace=self.CACHE_NAMESPACE,
+            async_execution=parallel,
         )
 
         tasks = [pricing_task]
         context_for_summary = [pricing_task]
 
         # Task 2 (optional): GrowthHacker - Trend analizi
-        if inputs.include_trends:
-            trend_task = create_task_with_context(
-                description=f"""
-Pazar trend analizi yap: {inputs.product_category}
-
-Rakip: {inputs.competitor_name}
-
-Analiz edilecekler:
-- Trend olan lezzetler
-- Sosyal medya sentiment (pozitif/negitif/notr)
-- Hashtag hacimleri
-- Tuketici davranis degisimleri
-
-Cikti formati:
-- trending_flavors: Liste
-- social_sentiment: pozitif/negatif/notr
-- hashtag_volume: Sayi
-- consumer_insights: Liste
-                """,
-                expected_output="JSON: trending_flavors, social_sentiment, hashtag_volume, consumer_insights",
-                agent=self.growth,
-                context=[pricing_task],
+        if trend_task is not None:
+            # Scrape ile ayni anda onceden calistirildi; sadece ozete context olur
+            context_for_summary.append(trend_task)
+        elif inputs.include_trends:
+            trend_task = self._create_trend_task(
+                inputs,
+                context=None if parallel else [pricing_task],
+                async_execution=parallel,
             )
             tasks.append(trend_task)
             context_for_summary.append(trend_task)
@@ -188,6 +286,7 @@ Ozet formati:
             expected_output="Tek paragraf ozet metni - GERCEK verilerle",
             agent=self.narrator,
             context=context_for_summary,
+            cache_namespace=self.CACHE_NAMESPACE,
         )
         tasks.append(summary_task)
 
@@ -197,8 +296,20 @@ Ozet formati:
         """
         Market analysis workflow'unu calistirir.
 
+        Senkron giris: akickoff'u paylasilan arka plan loop'unda calistirir.
+        """
+        return get_loop_runner().run(self.akickoff(inputs))
+
+    async def akickoff(self, inputs: dict) -> MarketAnalysisOutput:
+        """
+        Market analysis workflow'unu calistirir (async).
+
+        Crew senkron agent cagrilarini bir thread'de calistirir; cagiranin
+        event loop'u bloklanmaz.
+
         SIRA:
-        1. SmartScraper ile GERCEK veri cek
+        1. SmartScraper ile GERCEK veri cek (paralel modda trend analizi
+           ayni anda calisir)
         2. Veriyi agent'lara context olarak ver
         3. Agent'lar GERCEK veriye dayanarak analiz yapar
 
@@ -215,26 +326,24 @@ Ozet formati:
         validated_inputs = MarketAnalysisInput(**inputs)
         start_time = time.time()
 
-        # 1. GERCEK VERİ CEK (async scraper'i sync cagir)
+        # 1. GERCEK VERİ CEK
         competitor_url = inputs.get("competitor_url")
-        try:
-            # Async scraper'i sync context'te calistir
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                real_data = loop.run_until_complete(
-                    self._fetch_real_data(validated_inputs.competitor_name, competitor_url)
-                )
-            finally:
-                loop.close()
-        except Exception as e:
-            real_data = f"HATA: Veri cekilemedi - {str(e)}"
+        # Paralel modda trend analizi scrape verisine ihtiyac duymaz: scrape
+        # suresince onceden calistirilir (kritik yol: max(scrape, trend)).
+        # Sirali modda (varsayilan) trend fiyat analizini bekler; cakisma yok
+        trend_task = None
+        if self.parallel_tasks and validated_inputs.include_trends and competitor_url:
+            trend_task = self._create_trend_task(validated_inputs)
+
+        real_data = await self._prepare_inputs(
+            validated_inputs.competitor_name, competitor_url, trend_task
+        )
 
         # 2. Task'lari GERCEK VERİ ile olustur
-        tasks = self._create_tasks(validated_inputs, real_data)
+        tasks = self._create_tasks(validated_inputs, real_data, trend_task)
 
         agents = [self.pricing]
-        if validated_inputs.include_trends:
+        if validated_inputs.include_trends and trend_task is None:
             agents.append(self.growth)
         agents.append(self.narrator)
 
@@ -252,7 +361,7 @@ Ozet formati:
             "include_trends": bool(inputs.get("include_trends", True)),
         }
 
-        result = crew.kickoff(inputs=crewai_inputs)
+        result = await crew.kickoff_async(inputs=crewai_inputs)
         elapsed = time.time() - start_time
 
         # Parse result into structured output
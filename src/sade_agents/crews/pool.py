@@ -0,0 +1,215 @@
+"""
+Sade Chocolate - Hazir Crew Havuzu.
+
+SadeCrewFactory her cagrida tum agent'lari (uzun backstory'ler, tool
+listeleri), SmartScraper/AIScraper icindeki OpenAI client'larini ve
+Settings'i bastan kurar; Streamlit sayfalari bunu her form gonderiminde
+oder. CrewPool crew'lari process basina bir kez kurar ve tekrar verir:
+
+- Kiralama (lease) ozeldir: bir crew ayni anda tek calismaya verilir;
+  bos crew yoksa yenisi kurulur
+- Iade edilen crew'un agent'larinin calisma durumu (tool sonuclari,
+  hata sayaclari, crew referansi) temizlenir
+- Yapilandirma degisirse (ortam degiskenleri veya .env) havuz bosaltilir
+  ve crew'lar yeni ayarlarla kurulur
+
+Kullanim:
+    with lease_crew("market_analysis") as crew:
+        result = crew.kickoff(inputs)
+"""
+
+import hashlib
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from crewai.agents.agent_builder.base_agent import BaseAgent
+
+from sade_agents.crews.factory import CrewType, SadeCrewFactory
+
+# Crew turu basina bekletilecek maksimum bos crew
+DEFAULT_MAX_IDLE = 2
+
+# Settings'in okudugu dosya (Settings.model_config env_file ile ayni)
+ENV_FILE = ".env"
+
+
+def config_fingerprint() -> str:
+    """
+    Crew kurulumunu etkileyen yapilandirmanin parmak izi.
+
+    Settings alanlarina karsilik gelen ortam degiskenleri ve .env
+    dosyasinin degisim zamani/boyutu hash'lenir (Settings kurulmaz).
+    """
+    from sade_agents.config import Settings
+
+    fields = {name.upper() for name in Settings.model_fields}
+    digest = hashlib.sha256()
+    for key in sorted(k for k in os.environ if k.upper() in fields):
+        digest.update(f"{key}={os.environ[key]}".encode("utf-8"))
+        digest.update(b"\x00")
+    try:
+        stat = Path(ENV_FILE).stat()
+        digest.update(f"{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+    except OSError:
+        digest.update(b"-")
+    return digest.hexdigest()
+
+
+def reset_agent_state(crew: Any) -> None:
+    """Crew'un agent'larinda onceki calismadan kalan durumu temizler."""
+    for value in vars(crew).values():
+        if isinstance(value, BaseAgent):
+            # Eski tool sonuclari result_as_answer kontrolune sizabilir
+            value.tools_results = []
+            value.reset_tool_failures()
+            if hasattr(value, "_times_executed"):
+                value._times_executed = 0
+            value.crew = None
+
+
+@dataclass
+class CrewPoolStats:
+    """Crew havuzu istatistikleri."""
+
+    built: int = 0
+    reused: int = 0
+    rebuilds: int = 0  # Yapilandirma degisikligi nedeniyle bosaltma
+
+
+class CrewPool:
+    """
+    Crew turu basina hazir crew havuzu.
+
+    Kullanim:
+        pool = CrewPool()
+        pool.warm(["market_analysis"])
+        with pool.lease("market_analysis") as crew:
+            crew.kickoff(inputs)
+    """
+
+    def __init__(
+        self,
+        factory: SadeCrewFactory | None = None,
+        max_idle: int = DEFAULT_MAX_IDLE,
+    ) -> None:
+        self._factory = factory or SadeCrewFactory()
+        self.max_idle = max_idle
+        self.stats = CrewPoolStats()
+        self._idle: dict[str, list[Any]] = {}
+        self._leased: dict[int, str] = {}  # id(crew) -> kuruldugu parmak izi
+        self._fingerprint: str | None = None
+        self._lock = threading.Lock()
+
+    def acquire(self, crew_type: CrewType) -> Any:
+        """
+        Bos bir crew verir (yoksa kurar). Is bitince release() cagrilmalidir.
+
+        Raises:
+            ValueError: Gecersiz crew_type icin
+        """
+        fingerprint = config_fingerprint()
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                if self._fingerprint is not None:
+                    self.stats.rebuilds += 1
+                self._idle.clear()
+                self._fingerprint = fingerprint
+            idle = self._idle.get(crew_type)
+            if idle:
+                crew = idle.pop()
+                self.stats.reused += 1
+                self._leased[id(crew)] = fingerprint
+                return crew
+
+        # Kurulum yavas; kilit disinda yapilir
+        crew = self._factory.create_crew(crew_type)
+        with self._lock:
+            self.stats.built += 1
+            self._leased[id(crew)] = fingerprint
+        return crew
+
+    def release(self, crew_type: CrewType, crew: Any) -> None:
+        """Crew'u temizleyip havuza iade eder (eski ayarlarla kurulduysa atar)."""
+        reset_agent_state(crew)
+        with self._lock:
+            fingerprint = self._leased.pop(id(crew), None)
+            idle = self._idle.setdefault(crew_type, [])
+            if fingerprint == self._fingerprint and len(idle) < self.max_idle:
+                idle.append(crew)
+
+    @contextmanager
+    def lease(self, crew_type: CrewType) -> Iterator[Any]:
+        """acquire/release'i saran context manager."""
+        crew = self.acquire(crew_type)
+        try:
+            yield crew
+        finally:
+            self.release(crew_type, crew)
+
+    def warm(self, crew_types: list[CrewType]) -> None:
+        """Verilen crew turlerini onceden kurar (ilk istek beklemez)."""
+        crews = [(crew_type, self.acquire(crew_type)) for crew_type in crew_types]
+        for crew_type, crew in crews:
+            self.release(crew_type, crew)
+
+    def idle_count(self, crew_type: CrewType) -> int:
+        """Havuzda bekleyen crew sayisi."""
+        with self._lock:
+            return len(self._idle.get(crew_type, []))
+
+    def clear(self) -> None:
+        """Bekleyen tum crew'lari atar."""
+        with self._lock:
+            self._idle.clear()
+
+
+_crew_pool: CrewPool | None = None
+_crew_pool_lock = threading.Lock()
+
+
+def get_crew_pool() -> CrewPool | None:
+    """
+    Paylasilan CrewPool'u dondurur.
+
+    FEATURE_CREW_POOL kapaliysa None doner.
+    """
+    global _crew_pool
+    with _crew_pool_lock:
+        if _crew_pool is None:
+            from sade_agents.config import get_settings
+
+            settings = get_settings()
+            if not settings.feature_crew_pool:
+                return None
+            _crew_pool = CrewPool(max_idle=settings.crew_pool_max_idle)
+        return _crew_pool
+
+
+@contextmanager
+def lease_crew(crew_type: CrewType) -> Iterator[Any]:
+    """
+    Calistirilacak crew'u verir.
+
+    Havuz aciksa hazir crew kiralanir ve is bitince iade edilir; kapaliysa
+    her cagrida yeni crew kurulur (eski davranis).
+    """
+    pool = get_crew_pool()
+    if pool is None:
+        yield SadeCrewFactory().create_crew(crew_type)
+        return
+    with pool.lease(crew_type) as crew:
+        yield crew
+
+
+__all__ = [
+    "CrewPool",
+    "CrewPoolStats",
+    "config_fingerprint",
+    "get_crew_pool",
+    "lease_crew",
+]
@@ -15,6 +15,7 @@ from sade_agents.agents import (
     PerfectionistAgent,
 )
 from sade_agents.crews.base_crew import create_task_with_context
+from sade_agents.crews.loop_runner import get_loop_runner
 from sade_agents.models import ProductLaunchInput, ProductLaunchOutput
 
 
@@ -32,6 +33,9 @@ class ProductLaunchCrew:
     - Perfectionist: Tum ciktilari marka tutarliligi icin denetler
     """
 
+    # Crew cache'i namespace'i (get_crew_cache().invalidate(...) icin)
+    CACHE_NAMESPACE = "product_launch"
+
     def __init__(self) -> None:
         """Agent'lari olusturur."""
         self.alchemist = AlchemistAgent()
@@ -57,6 +61,7 @@ Cikti formati:
             """,
             expected_output="JSON formatinda recete: flavor_profile, ingredients, technical_notes, serving_suggestion",
             agent=self.alchemist,
+            cache_namespace=self.CACHE_NAMESPACE,
         )
 
         # Task 2: Narrator - Hikaye yaz (receteye bagli)
@@ -77,9 +82,12 @@ Kurallar:
             expected_output="JSON: etiket_hikayesi, instagram_caption, kutu_notu",
             agent=self.narrator,
             context=[recipe_task],
+            cache_namespace=self.CACHE_NAMESPACE,
         )
 
         # Task 3: Curator - Etiket tasarla (recete + hikayeye bagli)
+        # Cache'lenmez: etiket tool'u PNG uretir (yan etki); cache'ten donen
+        # cevap eski/silinmis bir dosyayi gosterebilir
         label_task = create_task_with_context(
             description=f"""
 Recete ve hikaye bilgilerini kullanarak etiket gorseli tasarla.
@@ -114,6 +122,7 @@ Her cikti icin AuditResult formati kullan.
                 expected_output="AuditResult JSON: overall_score, verdict, issues, suggestions",
                 agent=self.perfectionist,
                 context=[story_task, label_task],
+                cache_namespace=self.CACHE_NAMESPACE,
             )
             tasks.append(audit_task)
 
@@ -123,6 +132,17 @@ Her cikti icin AuditResult formati kullan.
         """
         Product launch workflow'unu calistirir.
 
+        Senkron giris: akickoff'u paylasilan arka plan loop'unda calistirir.
+        """
+        return get_loop_runner().run(self.akickoff(inputs))
+
+    async def akickoff(self, inputs: dict) -> ProductLaunchOutput:
+        """
+        Product launch workflow'unu calistirir (async).
+
+        Crew senkron agent cagrilarini bir thread'de calistirir; cagiranin
+        event loop'u bloklanmaz.
+
         Args:
             inputs: ProductLaunchInput field'lari (scalar degerler)
 
@@ -165,7 +185,7 @@ Her cikti icin AuditResult formati kullan.
         crewai_inputs["price_range_max"] = float(inputs.get("price_range_max", 200.0))
         crewai_inputs["include_audit"] = bool(inputs.get("include_audit", True))
 
-        result = crew.kickoff(inputs=crewai_inputs)
+        result = await crew.kickoff_async(inputs=crewai_inputs)
         elapsed = time.time() - start_time
 
         return ProductLaunchOutput(
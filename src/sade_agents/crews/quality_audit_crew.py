@@ -12,6 +12,7 @@ from crewai import Crew, Process
 
 from sade_agents.agents import PerfectionistAgent
 from sade_agents.crews.base_crew import create_task_with_context
+from sade_agents.crews.loop_runner import get_loop_runner
 from sade_agents.models import QualityAuditInput, QualityAuditOutput, AUDIT_CRITERIA_BY_TYPE
 
 
@@ -26,6 +27,9 @@ class QualityAuditCrew:
     - Perfectionist: Marka tutarliligi ve kalite kontrolu
     """
 
+    # Crew cache'i namespace'i (get_crew_cache().invalidate(...) icin)
+    CACHE_NAMESPACE = "quality_audit"
+
     def __init__(self) -> None:
         """Agent'lari olusturur."""
         self.perfectionist = PerfectionistAgent()
@@ -65,6 +69,7 @@ Cikti formati (AuditResult):
             """,
             expected_output="AuditResult JSON with all fields",
             agent=self.perfectionist,
+            cache_namespace=self.CACHE_NAMESPACE,
         )
 
         return [audit_task]
@@ -73,6 +78,17 @@ Cikti formati (AuditResult):
         """
         Quality audit workflow'unu calistirir.
 
+        Senkron giris: akickoff'u paylasilan arka plan loop'unda calistirir.
+        """
+        return get_loop_runner().run(self.akickoff(inputs))
+
+    async def akickoff(self, inputs: dict) -> QualityAuditOutput:
+        """
+        Quality audit workflow'unu calistirir (async).
+
+        Crew senkron agent cagrilarini bir thread'de calistirir; cagiranin
+        event loop'u bloklanmaz.
+
         Args:
             inputs: QualityAuditInput field'lari
 
@@ -98,7 +114,7 @@ Cikti formati (AuditResult):
             "source_agent": str(inputs.get("source_agent", "narrator")),
         }
 
-        result = crew.kickoff(inputs=crewai_inputs)
+        result = await crew.kickoff_async(inputs=crewai_inputs)
         elapsed = time.time() - start_time
 
         # Get threshold for pass/fail determination
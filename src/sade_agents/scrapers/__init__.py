@@ -13,11 +13,86 @@ ESKİ SCRAPER (AIScraper):
 - SmartScraper tarafindan kullanilir
 """
 
-from sade_agents.scrapers.base import BaseScraper, ProductPrice, ScraperResult
+from sade_agents.scrapers.base import (
+    PAGE_EVENT,
+    TARGET_EVENT,
+    BaseScraper,
+    ProductPrice,
+    ScrapeEvent,
+    ScraperResult,
+)
+from sade_agents.scrapers.chunking import (
+    estimate_tokens,
+    merge_product_lists,
+    split_into_chunks,
+)
+from sade_agents.scrapers.extraction_batcher import BatchItem, ExtractionBatcher
+from sade_agents.scrapers.extraction_cache import (
+    ExtractionCache,
+    ExtractionCacheStats,
+    get_extraction_cache,
+)
+from sade_agents.scrapers.fingerprint import (
+    FingerprintStore,
+    PageSnapshot,
+    get_fingerprint_store,
+    page_fingerprint,
+)
+from sade_agents.scrapers.frontier import (
+    CrawlFrontier,
+    FrontierPage,
+    canonicalize_url,
+    crawl,
+    extract_links,
+)
+from sade_agents.scrapers.http_cache import (
+    CachedResponse,
+    DomainCacheStats,
+    HttpCache,
+    get_http_cache,
+)
+from sade_agents.scrapers.http_session import (
+    ConnectionStats,
+    FetchResponse,
+    HttpSessionManager,
+    get_session_manager,
+)
+from sade_agents.scrapers.page_cache import CrawlPageCache, PageCacheStats
+from sade_agents.scrapers.parsing import clean_text, parse_html
+from sade_agents.scrapers.product_identity import (
+    ProductIndex,
+    deduplicate_products,
+    normalize_name,
+    product_key,
+)
+from sade_agents.scrapers.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    FailureBudget,
+    ResiliencePolicy,
+    get_resilience,
+)
+from sade_agents.scrapers.scheduler import (
+    DomainMetrics,
+    PolitenessScheduler,
+    TokenBucket,
+    parse_retry_after,
+)
+from sade_agents.scrapers.sitemap import (
+    SitemapEntry,
+    SitemapReader,
+    SitemapState,
+    SiteSnapshot,
+    get_sitemap_state,
+)
+from sade_agents.scrapers.structured_data import extract_structured_products
+from sade_agents.scrapers.url_classifier import UrlClassifier, UrlVerdict
 from sade_agents.scrapers.ai_scraper import (
     AIScraper,
     ScrapingTarget,
+    create_ai_scraper_from_settings,
     scrape_all_with_ai,
+    scrape_all_with_ai_stream,
     load_targets_from_config,
     load_targets_from_file,
     load_targets_from_firebase,
@@ -27,6 +102,7 @@ from sade_agents.scrapers.smart_scraper import (
     DiscoveredPage,
     SiteDiscoveryResult,
     smart_scrape_all,
+    smart_scrape_stream,
 )
 
 __all__ = [
@@ -34,10 +110,81 @@ __all__ = [
     "BaseScraper",
     "ProductPrice",
     "ScraperResult",
+    # Akisli tarama olaylari
+    "PAGE_EVENT",
+    "TARGET_EVENT",
+    "ScrapeEvent",
+    # HTTP session havuzu
+    "ConnectionStats",
+    "FetchResponse",
+    "HttpSessionManager",
+    "get_session_manager",
+    # Domain bazli nezaket zamanlayicisi
+    "DomainMetrics",
+    "PolitenessScheduler",
+    "TokenBucket",
+    "parse_retry_after",
+    # Tekrar deneme ve devre kesici
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "FailureBudget",
+    "ResiliencePolicy",
+    "get_resilience",
+    # Kalici conditional-GET cache
+    "CachedResponse",
+    "DomainCacheStats",
+    "HttpCache",
+    "get_http_cache",
+    # Kucuk sayfalarin toplu LLM cikarmasi
+    "BatchItem",
+    "ExtractionBatcher",
+    # LLM cikarma cache'i
+    "ExtractionCache",
+    "ExtractionCacheStats",
+    "get_extraction_cache",
+    # Sayfa parmak izleri (artimli yeniden tarama)
+    "FingerprintStore",
+    "PageSnapshot",
+    "get_fingerprint_store",
+    "page_fingerprint",
+    # Urun kimligi (bulanik tekrar tespiti, kararli anahtarlar)
+    "ProductIndex",
+    "deduplicate_products",
+    "normalize_name",
+    "product_key",
+    # Oncelikli tarama kuyrugu (sayfalama, alt kategoriler)
+    "CrawlFrontier",
+    "FrontierPage",
+    "canonicalize_url",
+    "crawl",
+    "extract_links",
+    # Derlenmis URL siniflandirici
+    "UrlClassifier",
+    "UrlVerdict",
+    # Tarama bazli sayfa cache'i
+    "CrawlPageCache",
+    "PageCacheStats",
+    # Ortak HTML parse asamasi (lxml, sayfa basina tek parse)
+    "clean_text",
+    "parse_html",
+    # Akisli sitemap okuyucu
+    "SitemapEntry",
+    "SitemapReader",
+    "SitemapState",
+    "SiteSnapshot",
+    "get_sitemap_state",
+    # Yapisal veri (JSON-LD / microdata / OpenGraph)
+    "extract_structured_products",
+    # Buyuk sayfa parcalama (map-reduce cikarma)
+    "estimate_tokens",
+    "merge_product_lists",
+    "split_into_chunks",
     # AI Scraper (tek sayfa)
     "AIScraper",
     "ScrapingTarget",
     "scrape_all_with_ai",
+    "scrape_all_with_ai_stream",
+    "create_ai_scraper_from_settings",
     "load_targets_from_config",
     "load_targets_from_file",
     "load_targets_from_firebase",
@@ -46,6 +193,7 @@ __all__ = [
     "DiscoveredPage",
     "SiteDiscoveryResult",
     "smart_scrape_all",
+    "smart_scrape_stream",
     # Eski (deprecated)
     "get_all_scrapers",
     "scrape_all_competitors",
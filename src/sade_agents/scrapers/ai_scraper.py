@@ -5,14 +5,62 @@ HTML'i LLM'e verip urun/fiyat cikartan akilli scraper.
 Site yapisi degisse bile calisir.
 """
 
+import asyncio
 import json
-from dataclasses import dataclass
+import logging
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 
-import aiohttp
-from openai import OpenAI
+from bs4 import BeautifulSoup
+from openai import AsyncOpenAI
 
 from sade_agents.config import get_settings
-from sade_agents.scrapers.base import ProductPrice, ScraperResult
+from sade_agents.scrapers.base import TARGET_EVENT, ProductPrice, ScrapeEvent, ScraperResult
+from sade_agents.scrapers.chunking import (
+    PRICE_MENTION_RE,
+    estimate_tokens,
+    merge_product_lists,
+    split_into_chunks,
+)
+from sade_agents.scrapers.extraction_batcher import (
+    DEFAULT_LINGER_SECONDS,
+    DEFAULT_PAGE_TOKENS,
+    BatchItem,
+    ExtractionBatcher,
+)
+from sade_agents.scrapers.extraction_cache import ExtractionCache, get_extraction_cache
+from sade_agents.scrapers.http_session import get_session_manager
+from sade_agents.scrapers.page_cache import CrawlPageCache
+from sade_agents.scrapers.parsing import clean_text, parse_html
+from sade_agents.scrapers.resilience import ResiliencePolicy, get_resilience
+from sade_agents.scrapers.structured_data import extract_structured_products
+
+logger = logging.getLogger(__name__)
+
+# Eszamanli LLM cagrisi limiti ve cagri basina timeout (saniye)
+DEFAULT_LLM_CONCURRENCY = 5
+DEFAULT_LLM_TIMEOUT = 60.0
+
+# Yapisal veri hizli yolu: sayfadaki fiyat ifadelerinin en az bu orani
+# yapisal urunlerle karsilanmalidir (indirimli urunlerde iki fiyat gorunur)
+STRUCTURED_MIN_COVERAGE = 0.5
+
+# Buyuk sayfalar bu token butcesini asarsa parcalanip paralel cikarilir;
+# parca basina cikti limiti ~80 urunu karsilar
+DEFAULT_CHUNK_TOKENS = 6000
+LLM_MAX_OUTPUT_TOKENS = 4000
+
+# Asiri buyuk sayfalarda LLM maliyetine ust sinir (asilirsa loglanir)
+MAX_EXTRACTION_CHUNKS = 20
+
+# Cikarma prompt'u degistiginde artirin (eski cache kayitlari gecersiz olur)
+EXTRACTION_PROMPT_VERSION = "1"
+
+EXTRACTION_SYSTEM_PROMPT = (
+    "Sen bir veri cikarma asistanisin. "
+    "Sadece JSON formatinda cevap ver."
+)
 
 
 @dataclass
@@ -22,6 +70,9 @@ class ScrapingTarget:
     name: str  # Kaynak adi (vakko, kahve_dunyasi, vs)
     url: str  # Urun sayfasi URL'i
     description: str  # Ne ariyoruz (cikolata, truffle, vs)
+    # Siteye ozel ek URL pattern'leri (SmartScraper varsayilanlarina eklenir)
+    product_url_patterns: list[str] = field(default_factory=list)
+    skip_url_patterns: list[str] = field(default_factory=list)
 
 
 class AIScraper:
@@ -30,28 +81,106 @@ class AIScraper:
 
     HTML'i ceker, LLM'e verir, yapilandirilmis urun verisi alir.
     CSS selector'lara bagimli degil.
+
+    LLM cagrilari AsyncOpenAI ile yapilir (event loop bloklanmaz);
+    eszamanli cagri sayisi llm_semaphore ile sinirlanir. resilience
+    verilirse gecici LLM hatalari tekrar denenir ve endpoint cevap
+    vermiyorsa devre kesici cagrilari aninda sonlandirir.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_LLM_CONCURRENCY,
+        llm_timeout: float = DEFAULT_LLM_TIMEOUT,
+        extraction_cache: ExtractionCache | None = None,
+        min_structured_products: int = 1,
+        chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+        resilience: ResiliencePolicy | None = None,
+        batch_tokens: int = 0,
+        batch_page_tokens: int = DEFAULT_PAGE_TOKENS,
+        batch_linger: float = DEFAULT_LINGER_SECONDS,
+    ) -> None:
+        """
+        Args:
+            max_concurrency: Ayni anda calisabilecek LLM cagrisi sayisi
+            llm_timeout: LLM cagrisi basina timeout (saniye)
+            extraction_cache: Icerik adresli cikarma cache'i (None ise kapali)
+            min_structured_products: LLM'i atlamak icin gereken minimum yapisal urun
+            chunk_tokens: Tek LLM cagrisina verilecek maksimum (tahmini) metin token'i
+            resilience: LLM cagrilari icin tekrar deneme ve devre kesici (None ise kapali)
+            batch_tokens: Kucuk sayfalari toplu cikarma butcesi (0 ise kapali)
+            batch_page_tokens: Bu boyuta kadar sayfalar toplu cikarilir
+            batch_linger: Toplu istek icin diger sayfalarin beklenecegi sure (saniye)
+        """
         self._settings = get_settings()
-        self._client = OpenAI(api_key=self._settings.openai_api_key)
+        self._client = AsyncOpenAI(api_key=self._settings.openai_api_key)
+        self.max_concurrency = max_concurrency
+        # asyncio.Semaphore loop'a baglidir; havuzdaki crew hem kickoff hem
+        # akickoff ile farkli loop'larda calisabilir
+        self._llm_semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+        self.llm_timeout = llm_timeout
+        self._extraction_cache = extraction_cache
+        self.min_structured_products = min_structured_products
+        self.chunk_tokens = chunk_tokens
+        self.resilience = resilience
+        self._batcher = None
+        if batch_tokens > 0:
+            self._batcher = ExtractionBatcher(
+                self._extract_batch,
+                batch_tokens=batch_tokens,
+                page_tokens=min(batch_page_tokens, chunk_tokens),
+                linger=batch_linger,
+            )
 
-    async def scrape(self, target: ScrapingTarget) -> ScraperResult:
+    @property
+    def llm_semaphore(self) -> asyncio.Semaphore:
+        """Calisan loop'un LLM semaforu (kapanmis loop'lar birakilir)."""
+        loop = asyncio.get_running_loop()
+        for stale_loop in [lp for lp in self._llm_semaphores if lp.is_closed()]:
+            del self._llm_semaphores[stale_loop]
+
+        semaphore = self._llm_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._llm_semaphores[loop] = semaphore
+        return semaphore
+
+    async def scrape(
+        self, target: ScrapingTarget, page_cache: CrawlPageCache | None = None
+    ) -> ScraperResult:
         """
         Hedef URL'den urun bilgilerini ceker.
 
         Args:
             target: Scraping hedefi
+            page_cache: Tarama bazli sayfa cache'i (verilirse sayfa ve DOM paylasilir)
 
         Returns:
             ScraperResult ile urun listesi
         """
         try:
-            # 1. HTML'i cek
-            html = await self._fetch_page(target.url)
-
-            # 2. HTML'i temizle (cok uzunsa kirp)
-            cleaned_html = self._clean_html(html)
+            # 1. HTML'i cek, parse et ve temizle (kirpilmaz; uzun sayfalar
+            #    parcalanarak cikarilir)
+            if page_cache is not None:
+                response = await page_cache.fetch(target.url)
+                if response.status != 200:
+                    raise RuntimeError(f"HTTP {response.status}: {target.url}")
+                soup = await page_cache.get_soup(target.url)
+                cleaned_html = await page_cache.get_text(target.url)
+            else:
+                html = await self._fetch_page(target.url)
+                soup = parse_html(html)
+                cleaned_html = self._clean_soup(soup)
+
+            # 2. Yapisal veri (JSON-LD, microdata, OpenGraph) yeterliyse LLM'e gitme
+            structured = extract_structured_products(soup, target.url)
+            if self._structured_is_sufficient(structured, cleaned_html):
+                return ScraperResult(
+                    source=target.name,
+                    success=True,
+                    products=structured,
+                    extraction_method="structured",
+                )
 
             # 3. LLM'e ver, urun cikar
             products = await self._extract_products_with_ai(
@@ -62,6 +191,7 @@ class AIScraper:
                 source=target.name,
                 success=True,
                 products=products,
+                extraction_method="llm",
             )
         except Exception as e:
             return ScraperResult(
@@ -71,55 +201,133 @@ class AIScraper:
                 error=str(e),
             )
 
+    def _structured_is_sufficient(self, products: list[ProductPrice], page_text: str) -> bool:
+        """
+        Yapisal veriden gelen urunler LLM'i atlamaya yeter mi?
+
+        Sayfadaki fiyat ifadelerinin (TL/₺) yeterli kismini karsilamalidir;
+        aksi halde ornegin sadece one cikan tek urunun JSON-LD'si olan bir
+        kategori sayfasinda diger urunler kaybolur.
+        """
+        if len(products) < self.min_structured_products:
+            return False
+        price_mentions = len(PRICE_MENTION_RE.findall(page_text))
+        return len(products) >= price_mentions * STRUCTURED_MIN_COVERAGE
+
     async def _fetch_page(self, url: str, timeout: int = 30) -> str:
         """Sayfa HTML'ini ceker."""
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7",
-            }
-            async with session.get(
-                url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as response:
-                response.raise_for_status()
-                return await response.text()
-
-    def _clean_html(self, html: str, max_chars: int = 50000) -> str:
+        response = await get_session_manager().fetch(
+            url, timeout=timeout, raise_for_status=True, use_cache=True
+        )
+        return response.text
+
+    def _clean_html(self, html: str, max_chars: int | None = None) -> str:
         """
-        HTML'i temizler ve kisaltir.
+        HTML'i temizler (max_chars verilirse kisaltir).
 
         Script, style, nav, footer gibi gereksiz kisimları atar.
         """
-        from bs4 import BeautifulSoup
+        soup = parse_html(html)
+        return self._clean_soup(soup, max_chars=max_chars)
 
-        soup = BeautifulSoup(html, "html.parser")
+    def _clean_soup(self, soup: BeautifulSoup, max_chars: int | None = None) -> str:
+        """
+        Parse edilmis DOM'dan temiz metin cikarir.
 
-        # Gereksiz elementleri kaldir
-        for tag in soup.find_all(["script", "style", "nav", "footer", "header", "noscript", "iframe"]):
-            tag.decompose()
+        DOM'u DEGISTIRMEZ (decompose yok); gereksiz elementlerin alt agaci
+        atlanir. Boylece ayni DOM baska asamalarla paylasilabilir.
+        """
+        return clean_text(soup, max_chars=max_chars)
 
-        # Sadece body icerigini al
-        body = soup.find("body")
-        if body:
-            text = body.get_text(separator=" ", strip=True)
-        else:
-            text = soup.get_text(separator=" ", strip=True)
+    async def _extract_products_with_ai(
+        self, html_text: str, source_name: str, description: str
+    ) -> list[ProductPrice]:
+        """
+        LLM kullanarak HTML'den urun bilgilerini cikarir.
 
-        # Cok uzunsa kirp
-        if len(text) > max_chars:
-            text = text[:max_chars] + "..."
+        Metin chunk_tokens butcesini asarsa urun sinirlarindan parcalanir,
+        parcalar paralel cikarilir (llm_semaphore limitiyle) ve sonuclar
+        birlestirilir. Basarisiz parcalar atlanir; hepsi basarisizsa ilk
+        hata firlatilir. Toplu cikarma aciksa kucuk sayfalar diger kucuk
+        sayfalarla ayni istekte cikarilir.
+        """
+        tokens = estimate_tokens(html_text)
+        if self._batcher is not None and self._batcher.accepts(tokens):
+            _, cached = self._cached_extraction(html_text, description)
+            if cached is not None:
+                return cached
+            return await self._batcher.submit(html_text, source_name, description)
+
+        if tokens <= self.chunk_tokens:
+            return await self._extract_chunk(html_text, source_name, description)
+
+        chunks = split_into_chunks(html_text, self.chunk_tokens)
+        if len(chunks) > MAX_EXTRACTION_CHUNKS:
+            logger.warning(
+                "%s: sayfa %d parcaya bolundu, ilk %d parca cikarilacak",
+                source_name,
+                len(chunks),
+                MAX_EXTRACTION_CHUNKS,
+            )
+            chunks = chunks[:MAX_EXTRACTION_CHUNKS]
 
-        return text
+        results = await asyncio.gather(
+            *(self._extract_chunk(chunk, source_name, description) for chunk in chunks),
+            return_exceptions=True,
+        )
 
-    async def _extract_products_with_ai(
+        product_lists = [r for r in results if not isinstance(r, BaseException)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            if not product_lists:
+                raise errors[0]
+            logger.warning(
+                "%s: %d/%d parca cikarilamadi: %s",
+                source_name,
+                len(errors),
+                len(chunks),
+                errors[0],
+            )
+
+        return merge_product_lists(product_lists)
+
+    async def complete(self, messages: list[dict[str, str]], max_tokens: int) -> str:
+        """
+        LLM'e chat istegi gonderir, yanit metnini dondurur.
+
+        llm_semaphore ve llm_timeout uygulanir; resilience varsa gecici
+        hatalar tekrar denenir (semafor denemeler arasinda birakilir).
+        """
+
+        async def attempt() -> str:
+            async with self.llm_semaphore:
+                response = await asyncio.wait_for(
+                    self._client.chat.completions.create(
+                        model=self._settings.openai_model_name,
+                        messages=messages,
+                        temperature=0,
+                        max_tokens=max_tokens,
+                    ),
+                    timeout=self.llm_timeout,
+                )
+            return response.choices[0].message.content or "[]"
+
+        if self.resilience is None:
+            return await attempt()
+        return await self.resilience.call(f"llm:{self._client.base_url.host}", attempt)
+
+    async def _extract_chunk(
         self, html_text: str, source_name: str, description: str
     ) -> list[ProductPrice]:
-        """LLM kullanarak HTML'den urun bilgilerini cikarir."""
+        """
+        Tek bir metin parcasindan LLM ile urun cikarir.
+
+        Ayni metin (ayni prompt versiyonu, model ve aciklama ile) daha once
+        cikarildiysa sonuc cache'ten doner, LLM cagrilmaz.
+        """
+        cache_key, cached = self._cached_extraction(html_text, description)
+        if cached is not None:
+            return cached
 
         prompt = f"""Bu bir {source_name} web sitesinden alinan metin.
 {description} urunlerinin fiyat bilgilerini cikar.
@@ -142,22 +350,121 @@ Site metni:
 {html_text}
 """
 
-        response = self._client.chat.completions.create(
-            model=self._settings.openai_model_name,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "Sen bir veri cikarma asistanisin. Sadece JSON formatinda cevap ver.",
-                },
+        content = await self.complete(
+            [
+                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=LLM_MAX_OUTPUT_TOKENS,
+        )
+
+        products_data = self._parse_json(content)
+        if not isinstance(products_data, list):
+            return []
+        products = self._parse_products(products_data)
+
+        # Sadece gecerli JSON yanitlari cache'lenir
+        if cache_key is not None:
+            self._extraction_cache.put(cache_key, products)
+
+        return products
+
+    async def _extract_batch(
+        self, description: str, items: list[BatchItem]
+    ) -> list[list[ProductPrice] | BaseException]:
+        """
+        Birden fazla kucuk sayfayi tek LLM isteginde cikarir.
+
+        Sayfalar numarali ayiraclarla verilir; cevap {"sayfa no": [...]}
+        nesnesidir. Cevap parse edilemezse veya bir sayfa cevapta yoksa o
+        sayfa(lar) tek tek cikarilir (urunler yanlis sayfaya yazilmaz).
+        Her sayfanin sonucu tek sayfa cikarmasiyla ayni anahtarla cache'lenir.
+        """
+        if len(items) == 1:
+            item = items[0]
+            return [await self._extract_chunk(item.text, item.source_name, description)]
+
+        pages = "\n\n".join(
+            f"=== SAYFA {n} ({item.source_name}) ===\n{item.text}"
+            for n, item in enumerate(items, start=1)
+        )
+        prompt = f"""Asagida e-ticaret sitelerinden {len(items)} ayri sayfanin metni var.
+Her sayfa "=== SAYFA <no> (...) ===" satiriyla baslar.
+Her sayfadaki {description} urunlerinin fiyat bilgilerini AYRI AYRI cikar.
+
+Her urun icin:
+- name: Urun adi
+- price_tl: Fiyat (sadece sayi, TL cinsinden)
+- weight_grams: Gramaj (varsa, sadece sayi)
+- category: Kategori (tablet, truffle, draje, hediye_kutu, diger)
+
+SADECE JSON nesnesi dondur; anahtar sayfa numarasi, deger o sayfanin urun
+listesi. Urun bulunmayan sayfa icin bos liste ver. Bir urunu sadece
+gectigi sayfaya yaz. Ornek:
+{{"1": [{{"name": "Bitter 100g", "price_tl": 450, "weight_grams": 100, "category": "tablet"}}],
+ "2": []}}
+
+{pages}
+"""
+
+        # LLM hatasi (tekrar denemeler sonrasi) tum sayfalara iletilir
+        content = await self.complete(
+            [
+                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
-            temperature=0,
-            max_tokens=4000,
+            max_tokens=LLM_MAX_OUTPUT_TOKENS,
         )
+        data = self._parse_json(content)
+        if not isinstance(data, dict):
+            logger.warning(
+                "Toplu cikarma cevabi okunamadi (%d sayfa), tek tek deneniyor", len(items)
+            )
+            data = {}
 
-        content = response.choices[0].message.content or "[]"
+        results: list[list[ProductPrice] | BaseException | None] = []
+        for n, item in enumerate(items, start=1):
+            page_data = data.get(str(n))
+            if not isinstance(page_data, list):
+                results.append(None)
+                continue
+            products = self._parse_products(page_data)
+            cache_key, _ = self._cached_extraction(item.text, description, lookup=False)
+            if cache_key is not None:
+                self._extraction_cache.put(cache_key, products)
+            results.append(products)
+
+        # Cevapta olmayan sayfalar tek basina cikarilir (hatalar sayfa bazinda)
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            fallback = await asyncio.gather(
+                *(
+                    self._extract_chunk(items[i].text, items[i].source_name, description)
+                    for i in missing
+                ),
+                return_exceptions=True,
+            )
+            for i, products in zip(missing, fallback):
+                results[i] = products
+        return results
+
+    def _cached_extraction(
+        self, html_text: str, description: str, lookup: bool = True
+    ) -> tuple[str | None, list[ProductPrice] | None]:
+        """(cache anahtari, cache'teki urunler) - cache kapaliysa (None, None)."""
+        if self._extraction_cache is None:
+            return None, None
+        cache_key = ExtractionCache.make_key(
+            html_text,
+            EXTRACTION_PROMPT_VERSION,
+            self._settings.openai_model_name,
+            description,
+        )
+        return cache_key, self._extraction_cache.get(cache_key) if lookup else None
 
-        # JSON parse et
+    @staticmethod
+    def _parse_json(content: str):
+        """LLM cevabini JSON olarak parse eder (```json sarmali temizlenir); hatada None."""
         try:
             # Bazen LLM ```json ... ``` ile sarar, temizle
             content = content.strip()
@@ -165,13 +472,13 @@ Site metni:
                 content = content.split("```")[1]
                 if content.startswith("json"):
                     content = content[4:]
-            content = content.strip()
-
-            products_data = json.loads(content)
+            return json.loads(content.strip())
         except json.JSONDecodeError:
-            return []
+            return None
 
-        # ProductPrice objelerine cevir
+    @staticmethod
+    def _parse_products(products_data: list) -> list[ProductPrice]:
+        """LLM'in urun sozluklerini ProductPrice objelerine cevirir (gecersizler atlanir)."""
         products = []
         for p in products_data:
             try:
@@ -183,12 +490,32 @@ Site metni:
                         category=p.get("category"),
                     )
                 )
-            except (ValueError, TypeError):
+            except (ValueError, TypeError, AttributeError):
                 continue
-
         return products
 
 
+def create_ai_scraper_from_settings() -> AIScraper:
+    """
+    Ayarlardaki LLM limitleri, cikarma cache'i, parcalama ve toplu cikarma
+    ayarlariyla AIScraper olusturur (tum tarama yollari bunu kullanir).
+    """
+    settings = get_settings()
+    return AIScraper(
+        max_concurrency=settings.scraping_llm_concurrency,
+        llm_timeout=settings.scraping_llm_timeout_seconds,
+        extraction_cache=get_extraction_cache(),
+        chunk_tokens=settings.scraping_chunk_tokens,
+        resilience=get_resilience(),
+        # Kucuk kategori sayfalari tek LLM isteginde toplanir (kapaliysa 0)
+        batch_tokens=(
+            settings.scraping_batch_tokens if settings.feature_batched_extraction else 0
+        ),
+        batch_page_tokens=settings.scraping_batch_page_tokens,
+        batch_linger=settings.scraping_batch_linger_seconds,
+    )
+
+
 def load_targets_from_firebase(tenant_id: str = "default") -> list[ScrapingTarget]:
     """
     Firebase'den scraping hedeflerini yukler.
@@ -230,6 +557,8 @@ def load_targets_from_firebase(tenant_id: str = "default") -> list[ScrapingTarge
                         name=data.get("name", doc.id),
                         url=data["url"],
                         description=data.get("description", "urunler"),
+                        product_url_patterns=data.get("product_url_patterns", []),
+                        skip_url_patterns=data.get("skip_url_patterns", []),
                     )
                 )
 
@@ -269,6 +598,8 @@ def load_targets_from_file() -> list[ScrapingTarget]:
                 name=t["name"],
                 url=t["url"],
                 description=t.get("description", "urunler"),
+                product_url_patterns=t.get("product_url_patterns", []),
+                skip_url_patterns=t.get("skip_url_patterns", []),
             )
         )
 
@@ -326,9 +657,29 @@ async def scrape_all_with_ai(tenant_id: str = "default") -> dict[str, ScraperRes
             error="Scraping hedefi tanimlanmamis. UI'dan veya scraping_targets.json dosyasindan rakip ekleyin.",
         )}
 
-    scraper = AIScraper()
+    manager = get_session_manager()
+    stats_before = manager.stats
+    scheduler_before = manager.scheduler.metrics() if manager.scheduler else None
+
+    # Tarama boyunca tekrar denemeler tek butceyi paylasir
+    resilience = get_resilience()
+    budget_scope = resilience.failure_budget() if resilience else nullcontext()
+    scraper = create_ai_scraper_from_settings()
     tasks = [scraper.scrape(target) for target in targets]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    with budget_scope:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    run_stats = manager.stats.since(stats_before)
+    logger.info(
+        "AI scrape tamamlandi: %d istek, %d yeni baglanti, %d tekrar kullanilan baglanti",
+        run_stats.requests,
+        run_stats.connections_created,
+        run_stats.connections_reused,
+    )
+    if manager.scheduler:
+        manager.scheduler.log_metrics(since=scheduler_before)
+    if resilience and resilience.open_circuits():
+        logger.warning("Acik devreler: %s", ", ".join(resilience.open_circuits()))
 
     output = {}
     for target, result in zip(targets, results, strict=False):
@@ -343,3 +694,84 @@ async def scrape_all_with_ai(tenant_id: str = "default") -> dict[str, ScraperRes
             output[target.name] = result
 
     return output
+
+
+async def scrape_all_with_ai_stream(tenant_id: str = "default") -> AsyncIterator[ScrapeEvent]:
+    """
+    scrape_all_with_ai'in akisli hali.
+
+    Hedefler paralel taranir; her hedef tamamlandiginda (asyncio.as_completed)
+    ilerleme sayaclariyla bir ScrapeEvent uretilir. Akis erken birakilirsa
+    bekleyen task'lar iptal edilir.
+
+    Args:
+        tenant_id: Tenant kimlik
+
+    Yields:
+        TARGET_EVENT olaylari
+    """
+    targets = load_targets_from_config(tenant_id)
+
+    if not targets:
+        yield ScrapeEvent(
+            kind=TARGET_EVENT,
+            source="_warning",
+            result=ScraperResult(
+                source="config",
+                success=False,
+                products=[],
+                error=(
+                    "Scraping hedefi tanimlanmamis. UI'dan veya scraping_targets.json "
+                    "dosyasindan rakip ekleyin."
+                ),
+            ),
+        )
+        return
+
+    manager = get_session_manager()
+    stats_before = manager.stats
+    scheduler_before = manager.scheduler.metrics() if manager.scheduler else None
+
+    resilience = get_resilience()
+    scraper = create_ai_scraper_from_settings()
+
+    async def scrape_target(target: ScrapingTarget) -> tuple[str, ScraperResult]:
+        try:
+            return target.name, await scraper.scrape(target)
+        except Exception as e:
+            return target.name, ScraperResult(
+                source=target.name, success=False, products=[], error=str(e)
+            )
+
+    # Tarama boyunca tekrar denemeler tek butceyi paylasir (task'lar
+    # olusturulurken butceyi context'ten devralir)
+    with resilience.failure_budget() if resilience else nullcontext() as budget:
+        tasks = [asyncio.create_task(scrape_target(target)) for target in targets]
+
+    try:
+        for done, next_result in enumerate(asyncio.as_completed(tasks), start=1):
+            name, result = await next_result
+            yield ScrapeEvent(
+                kind=TARGET_EVENT,
+                source=name,
+                result=result,
+                targets_done=done,
+                targets_total=len(targets),
+            )
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    run_stats = manager.stats.since(stats_before)
+    logger.info(
+        "AI scrape tamamlandi: %d istek, %d yeni baglanti, %d tekrar kullanilan baglanti",
+        run_stats.requests,
+        run_stats.connections_created,
+        run_stats.connections_reused,
+    )
+    if manager.scheduler:
+        manager.scheduler.log_metrics(since=scheduler_before)
+    if budget is not None and budget.exhausted:
+        logger.warning("Tekrar deneme butcesi tukendi (%d)", budget.limit)
+    if resilience and resilience.open_circuits():
+        logger.warning("Acik devreler: %s", ", ".join(resilience.open_circuits()))
@@ -4,14 +4,20 @@ Sade Agents - Scraper Base Interface.
 Tum scraper'larin uymasi gereken temel arayuz.
 """
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductPrice:
-    """Urun fiyat bilgisi modeli."""
+    """
+    Urun fiyat bilgisi modeli.
+
+    __slots__ kullanir (obje basina __dict__ yok). Buyuk kataloglar icin
+    kolon bazli ProductBatch'e bakin.
+    """
 
     name: str  # Urun adi
     price_tl: float  # Fiyat (TL)
@@ -35,6 +41,8 @@ class ScraperResult:
     products: list[ProductPrice]
     error: str | None = None
     scraped_at: datetime = field(default_factory=datetime.utcnow)
+    extraction_method: str | None = None  # structured, llm, mixed, unchanged
+    pages_skipped: int = 0  # Icerigi degismedigi icin cikarilmayan sayfa sayisi
 
     @property
     def product_count(self) -> int:
@@ -50,6 +58,38 @@ class ScraperResult:
         return round(sum(valid_prices) / len(valid_prices), 2)
 
 
+# ScrapeEvent turleri
+PAGE_EVENT = "page"  # Bir sayfa tamamlandi (SmartScraper)
+TARGET_EVENT = "target"  # Bir hedef tamamlandi (birlesik sonuc)
+
+
+@dataclass
+class ScrapeEvent:
+    """
+    Akisli taramada tamamlanan bir sayfa veya hedef.
+
+    Sayaclar olayi ureten akisin kapsamindadir: tek hedef akisinda
+    hedefin sayfalari, tum hedefler akisinda o ana kadar kesfedilen
+    tum sayfalar (pages_total tarama ilerledikce buyur). Sayfa takibi
+    yapmayan akislar (scrape_all_with_ai_stream) sadece hedef sayaclarini
+    doldurur; pages_done/pages_total 0 kalir.
+    """
+
+    kind: str  # page, target
+    source: str  # Hedef adi
+    result: ScraperResult
+    url: str | None = None  # Sayfa olaylarinda sayfa URL'i
+    targets_done: int = 0
+    targets_total: int = 0
+    pages_done: int = 0
+    pages_total: int = 0
+
+    @property
+    def is_final(self) -> bool:
+        """Hedefin birlesik sonucu mu?"""
+        return self.kind == TARGET_EVENT
+
+
 class BaseScraper(ABC):
     """Tum scraper'lar icin temel sinif."""
 
@@ -86,71 +126,64 @@ class BaseScraper(ABC):
         Returns:
             HTML icerigi
         """
-        import aiohttp
-
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7",
-            }
-            async with session.get(
-                url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as response:
-                response.raise_for_status()
-                return await response.text()
+        from sade_agents.scrapers.http_session import get_session_manager
 
-    def _parse_price(self, price_text: str) -> float | None:
-        """
-        Fiyat metnini float'a cevirir.
+        response = await get_session_manager().fetch(url, timeout=timeout, raise_for_status=True)
+        return response.text
 
-        Ornekler:
-            "450,00 TL" -> 450.0
-            "1.250,50 ₺" -> 1250.5
-        """
-        import re
+    def _parse_price(self, price_text: str) -> float | None:
+        """Fiyat metnini float'a cevirir (bkz. parse_price)."""
+        return parse_price(price_text)
 
-        if not price_text:
-            return None
+    def _parse_weight(self, text: str) -> int | None:
+        """Gramaj metnini int'e cevirir (bkz. parse_weight)."""
+        return parse_weight(text)
 
-        # Temizle
-        cleaned = price_text.strip()
-        cleaned = re.sub(r"[TL₺\s]", "", cleaned)  # Para birimi ve bosluk kaldir
-        cleaned = cleaned.replace(".", "")  # Binlik ayirici kaldir
-        cleaned = cleaned.replace(",", ".")  # Ondalik virgul -> nokta
 
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
+def parse_price(price_text: str) -> float | None:
+    """
+    Fiyat metnini float'a cevirir.
 
-    def _parse_weight(self, text: str) -> int | None:
-        """
-        Gramaj metnini int'e cevirir.
+    Ornekler:
+        "450,00 TL" -> 450.0
+        "1.250,50 ₺" -> 1250.5
+    """
+    if not price_text:
+        return None
 
-        Ornekler:
-            "100g" -> 100
-            "150 gram" -> 150
-            "0.5 kg" -> 500
-        """
-        import re
+    # Temizle
+    cleaned = price_text.strip()
+    cleaned = re.sub(r"[TL₺\s]", "", cleaned)  # Para birimi ve bosluk kaldir
+    cleaned = cleaned.replace(".", "")  # Binlik ayirici kaldir
+    cleaned = cleaned.replace(",", ".")  # Ondalik virgul -> nokta
 
-        if not text:
-            return None
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
 
-        # Kilogram kontrolu
-        kg_match = re.search(r"(\d+(?:[.,]\d+)?)\s*kg", text.lower())
-        if kg_match:
-            kg = float(kg_match.group(1).replace(",", "."))
-            return int(kg * 1000)
 
-        # Gram kontrolu
-        g_match = re.search(r"(\d+)\s*(?:g|gram)", text.lower())
-        if g_match:
-            return int(g_match.group(1))
+def parse_weight(text: str) -> int | None:
+    """
+    Gramaj metnini int'e cevirir.
 
+    Ornekler:
+        "100g" -> 100
+        "150 gram" -> 150
+        "0.5 kg" -> 500
+    """
+    if not text:
         return None
+
+    # Kilogram kontrolu
+    kg_match = re.search(r"(\d+(?:[.,]\d+)?)\s*kg", text.lower())
+    if kg_match:
+        kg = float(kg_match.group(1).replace(",", "."))
+        return int(kg * 1000)
+
+    # Gram kontrolu
+    g_match = re.search(r"(\d+)\s*(?:g|gram)", text.lower())
+    if g_match:
+        return int(g_match.group(1))
+
+    return None
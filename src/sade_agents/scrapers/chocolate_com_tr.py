@@ -5,6 +5,7 @@ Chocolate.com.tr sitesinden fiyat bilgisi cekmek icin scraper.
 """
 
 from sade_agents.scrapers.base import BaseScraper, ProductPrice, ScraperResult
+from sade_agents.scrapers.parsing import parse_html
 
 
 class ChocolateComTrScraper(BaseScraper):
@@ -42,9 +43,7 @@ class ChocolateComTrScraper(BaseScraper):
 
     def _parse_products(self, html: str) -> list[ProductPrice]:
         """HTML'den urun bilgilerini parse eder."""
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(html, "html.parser")
+        soup = parse_html(html)
         products = []
 
         # Urun kartlarini bul
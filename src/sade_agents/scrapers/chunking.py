@@ -0,0 +1,119 @@
+"""
+Sade Agents - Buyuk Sayfalar icin Token Butceli Metin Bolucu.
+
+Buyuk kategori sayfalari tek bir LLM cagrisina sigmaz; eskiden metin
+50.000 karakterde kesiliyor ve sonraki urunler kayboluyordu.
+
+Akis (map-reduce):
+1. split_into_chunks: Temiz metni token butcesine gore parcalara boler.
+   Kesim noktasi urun siniri olarak fiyat ifadesinin (450 TL, ₺450)
+   hemen arkasi secilir; urun kartlari genelde fiyatla biter.
+2. Her parca ayri LLM cagrisiyla paralel cikarilir (AIScraper).
+3. merge_product_lists: Parca sonuclari birlestirilir, tekrarlar atilir.
+"""
+
+import re
+
+from sade_agents.scrapers.base import ProductPrice
+
+# Sayfa metnindeki fiyat ifadeleri ("1.250,00 TL", "450₺", "₺ 450")
+PRICE_MENTION_RE = re.compile(r"\d[\d.,]*\s*(?:TL|₺)|₺\s*\d[\d.,]*", re.IGNORECASE)
+
+# Kaba token tahmini: Turkce metin ingilizceden daha fazla token'a bolunur
+CHARS_PER_TOKEN = 3
+
+# Kesim noktasi parcanin en az bu kadarindan sonra aranir (cok kucuk parca olmasin)
+MIN_CHUNK_FILL = 0.5
+
+
+def estimate_tokens(text: str) -> int:
+    """Metnin yaklasik token sayisi."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def split_into_chunks(text: str, max_tokens: int) -> list[str]:
+    """
+    Metni urun sinirlarindan token butcesine gore boler.
+
+    Args:
+        text: Temizlenmis sayfa metni
+        max_tokens: Parca basina maksimum (tahmini) token
+
+    Returns:
+        Parcalar (metin butceye sigiyorsa tek elemanli liste)
+    """
+    max_chars = max(1, max_tokens * CHARS_PER_TOKEN)
+    if len(text) <= max_chars:
+        return [text]
+
+    chunks: list[str] = []
+    start = 0
+    while len(text) - start > max_chars:
+        end = _find_boundary(text, start, start + max_chars)
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        start = end
+
+    tail = text[start:].strip()
+    if tail:
+        chunks.append(tail)
+    return chunks
+
+
+def _find_boundary(text: str, start: int, limit: int) -> int:
+    """
+    [start, limit] araliginda en iyi kesim noktasini bulur.
+
+    Oncelik: son fiyat ifadesinin sonu > son bosluk > sert kesim.
+    """
+    floor = start + int((limit - start) * MIN_CHUNK_FILL)
+
+    last_price_end = None
+    for match in PRICE_MENTION_RE.finditer(text, floor, limit):
+        last_price_end = match.end()
+    if last_price_end is not None:
+        return last_price_end
+
+    space = text.rfind(" ", floor, limit)
+    if space > start:
+        return space
+    return limit
+
+
+def merge_product_lists(product_lists: list[list[ProductPrice]]) -> list[ProductPrice]:
+    """
+    Parca sonuclarini birlestirir, ayni urunu (isim + fiyat) tek tutar.
+
+    Ilk gorulen siralama korunur; tekrar eden kayitta eksik alanlar
+    (gramaj, kategori, URL) sonraki kayittan tamamlanir.
+    """
+    merged: dict[tuple[str, float], ProductPrice] = {}
+    for products in product_lists:
+        for product in products:
+            key = (_normalize_name(product.name), round(product.price_tl, 2))
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = product
+                continue
+            if existing.weight_grams is None and product.weight_grams is not None:
+                existing.weight_grams = product.weight_grams
+                existing.price_per_gram = product.price_per_gram
+            if existing.category is None:
+                existing.category = product.category
+            if existing.url is None:
+                existing.url = product.url
+    return list(merged.values())
+
+
+def _normalize_name(name: str) -> str:
+    """Karsilastirma icin urun adi (kucuk harf, tek bosluk)."""
+    return " ".join(name.casefold().split())
+
+
+__all__ = [
+    "PRICE_MENTION_RE",
+    "estimate_tokens",
+    "merge_product_lists",
+    "split_into_chunks",
+]
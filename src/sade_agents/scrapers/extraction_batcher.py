@@ -0,0 +1,146 @@
+"""
+Sade Agents - Kucuk Sayfalar Icin Toplu LLM Cikarma.
+
+Genis ama sig sitelerde (onlarca kucuk kategori sayfasi) her sayfa ayri
+LLM istegi olur; birkac yuz karakterlik metin icin istek basina ek yuk
+ve LLM concurrency slotu baskin maliyettir. ExtractionBatcher kisa bir
+bekleme penceresinde gelen kucuk sayfalari toplayip tek istekte cikarir:
+
+- Sayfalar aciklamaya (description) gore gruplanir (ayni prompt)
+- Grup token butcesine veya sayfa limitine ulasinca hemen, aksi halde
+  linger suresi sonunda gonderilir
+- Tek sayfalik grup normal (tek sayfa) yoldan gider
+- Sonuclar sayfa bazinda geri dagitilir; her cagiran sadece kendi
+  sayfasinin urunlerini alir
+
+Batch'in kendisi (prompt, cevabin sayfalara bolunmesi) run_batch
+callback'i ile AIScraper tarafindan yapilir.
+
+Kullanim:
+    batcher = ExtractionBatcher(run_batch, batch_tokens=6000)
+    if batcher.accepts(tokens):
+        products = await batcher.submit(text, source_name, description)
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from sade_agents.scrapers.base import ProductPrice
+from sade_agents.scrapers.chunking import estimate_tokens
+
+# Batch basina toplam (tahmini) metin token'i
+DEFAULT_BATCH_TOKENS = 6000
+
+# Bu boyuttan buyuk sayfalar batch'e alinmaz (tek basina cikarilir)
+DEFAULT_PAGE_TOKENS = 1500
+
+# Ilk sayfadan sonra digerlerinin beklenecegi sure (saniye)
+DEFAULT_LINGER_SECONDS = 0.05
+
+# Batch basina maksimum sayfa (cikti limiti ~80 urunu karsilar)
+MAX_BATCH_PAGES = 8
+
+
+@dataclass
+class BatchItem:
+    """Batch'e alinmis tek sayfa."""
+
+    text: str
+    source_name: str
+    tokens: int
+    future: asyncio.Future = field(repr=False)
+
+
+class ExtractionBatcher:
+    """
+    Kucuk sayfa cikarma isteklerini toplayip tek LLM istegine indirger.
+
+    run_batch(description, items) her item icin (ayni sirada) urun
+    listesi veya o sayfanin hatasini dondurmelidir; kendisi hata
+    firlatirsa hata batch'teki tum cagiranlara iletilir.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[
+            [str, list[BatchItem]], Awaitable[list[list[ProductPrice] | BaseException]]
+        ],
+        batch_tokens: int = DEFAULT_BATCH_TOKENS,
+        page_tokens: int = DEFAULT_PAGE_TOKENS,
+        linger: float = DEFAULT_LINGER_SECONDS,
+        max_pages: int = MAX_BATCH_PAGES,
+    ) -> None:
+        self._run_batch = run_batch
+        self.batch_tokens = batch_tokens
+        self.page_tokens = page_tokens
+        self.linger = linger
+        self.max_pages = max_pages
+        self._pending: dict[str, list[BatchItem]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._running: set[asyncio.Task] = set()
+        self.batches_sent = 0
+        self.pages_batched = 0
+
+    def accepts(self, tokens: int) -> bool:
+        """Bu boyuttaki sayfa batch'e alinir mi?"""
+        return tokens <= self.page_tokens
+
+    async def submit(self, text: str, source_name: str, description: str) -> list[ProductPrice]:
+        """Sayfayi batch'e ekler ve kendi urunlerini bekler."""
+        loop = asyncio.get_running_loop()
+        item = BatchItem(
+            text=text,
+            source_name=source_name,
+            tokens=estimate_tokens(text),
+            future=loop.create_future(),
+        )
+
+        pending = self._pending.get(description)
+        if pending and sum(i.tokens for i in pending) + item.tokens > self.batch_tokens:
+            self._flush(description)
+        pending = self._pending.setdefault(description, [])
+        pending.append(item)
+
+        if len(pending) >= self.max_pages or sum(i.tokens for i in pending) >= self.batch_tokens:
+            self._flush(description)
+        elif len(pending) == 1:
+            self._timers[description] = loop.call_later(self.linger, self._flush, description)
+
+        return await item.future
+
+    def _flush(self, description: str) -> None:
+        """Bekleyen grubu gonderir."""
+        timer = self._timers.pop(description, None)
+        if timer is not None:
+            timer.cancel()
+        items = self._pending.pop(description, None)
+        if not items:
+            return
+        task = asyncio.ensure_future(self._run(description, items))
+        # Referans tutulur (aksi halde task GC ile kaybolabilir)
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, description: str, items: list[BatchItem]) -> None:
+        if len(items) > 1:
+            self.batches_sent += 1
+            self.pages_batched += len(items)
+        try:
+            results = await self._run_batch(description, items)
+        except Exception as e:
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+        for item, products in zip(items, results, strict=True):
+            # Cagiran iptal edildiyse future zaten kapali
+            if item.future.done():
+                continue
+            if isinstance(products, BaseException):
+                item.future.set_exception(products)
+            else:
+                item.future.set_result(products)
+
+
+__all__ = ["BatchItem", "ExtractionBatcher"]
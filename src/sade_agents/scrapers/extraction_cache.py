@@ -0,0 +1,224 @@
+"""
+Sade Agents - Icerik Adresli LLM Cikarma Cache'i.
+
+Temizlenmis sayfa metni degismediyse LLM'e tekrar gitmeye gerek yok.
+Anahtar su alanlarin hash'idir:
+- Temizlenmis sayfa metni
+- Prompt sablon versiyonu
+- Model adi
+- Aranan urun aciklamasi
+
+Deger: parse edilmis ProductPrice listesi.
+
+Cache tenant'lar arasi paylasilir (ayni metin -> ayni urunler).
+Kayitlar SQLite'ta tutulur; TTL'i gecen kayitlar okunmaz, kayit sayisi
+limiti asilinca en uzun suredir kullanilmayanlar (LRU) silinir.
+Sicak kayitlar icin bellekte kucuk bir LRU katmani vardir.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from sade_agents.scrapers.base import ProductPrice
+
+
+@dataclass
+class ExtractionCacheStats:
+    """Cikarma cache istatistikleri."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+
+
+class ExtractionCache:
+    """
+    LLM urun cikarma sonuclari icin kalici cache.
+
+    Kullanim:
+        key = ExtractionCache.make_key(text, "v1", "gpt-4o-mini", "cikolata")
+        products = cache.get(key)
+        if products is None:
+            products = await llm_extract(...)
+            cache.put(key, products)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_entries: int = 50_000,
+        memory_entries: int = 1024,
+    ) -> None:
+        """
+        Args:
+            path: SQLite dosya yolu (dizin yoksa olusturulur)
+            ttl_seconds: Kaydin gecerlilik suresi
+            max_entries: Diskteki maksimum kayit sayisi
+            memory_entries: Bellekteki LRU katmaninin boyutu
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.stats = ExtractionCacheStats()
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS extraction_cache (
+                key TEXT PRIMARY KEY,
+                products TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_extraction_cache_access "
+            "ON extraction_cache(last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(text: str, prompt_version: str, model: str, description: str) -> str:
+        """Icerik adresli cache anahtari (sha256)."""
+        digest = hashlib.sha256()
+        for part in (prompt_version, model, description, text):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> list[ProductPrice] | None:
+        """
+        Kayitli urun listesini dondurur.
+
+        Her cagri yeni ProductPrice objeleri uretir (cagiran degistirebilir).
+        Kayit yoksa veya TTL'i gectiyse None doner.
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                created_at, rows = cached
+                if now - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self.stats.hits += 1
+                    return [ProductPrice(**row) for row in rows]
+                del self._memory[key]
+
+            row = self._conn.execute(
+                "SELECT products, created_at FROM extraction_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            created_at = row[1]
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM extraction_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.stats.expired += 1
+                self.stats.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE extraction_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            rows = json.loads(row[0])
+            self._remember_locked(key, created_at, rows)
+            self.stats.hits += 1
+
+        return [ProductPrice(**row) for row in rows]
+
+    def put(self, key: str, products: list[ProductPrice]) -> None:
+        """Urun listesini saklar (LRU limiti asilirsa eski kayitlar silinir)."""
+        rows = [asdict(p) for p in products]
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extraction_cache (key, products, created_at, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(rows, ensure_ascii=False), now, now),
+            )
+            self._evict_locked()
+            self._conn.commit()
+            self._remember_locked(key, now, rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0]
+
+    def clear(self) -> None:
+        """Tum kayitlari siler."""
+        with self._lock:
+            self._conn.execute("DELETE FROM extraction_cache")
+            self._conn.commit()
+            self._memory.clear()
+
+    def close(self) -> None:
+        """SQLite baglantisini kapatir."""
+        with self._lock:
+            self._conn.close()
+
+    def _remember_locked(self, key: str, created_at: float, rows: list[dict]) -> None:
+        """Bellek LRU katmanina ekler (lock alinmis olmali)."""
+        self._memory[key] = (created_at, rows)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_locked(self) -> None:
+        """Kayit limiti asildiysa en eski erisilenleri siler (lock alinmis olmali)."""
+        count = self._conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+
+        evicted = self._conn.execute(
+            "SELECT key FROM extraction_cache ORDER BY last_access ASC LIMIT ?", (overflow,)
+        ).fetchall()
+        self._conn.executemany("DELETE FROM extraction_cache WHERE key = ?", evicted)
+        for (key,) in evicted:
+            self._memory.pop(key, None)
+
+
+_extraction_cache: ExtractionCache | None = None
+
+
+def get_extraction_cache() -> ExtractionCache | None:
+    """
+    Paylasilan ExtractionCache'i dondurur.
+
+    FEATURE_EXTRACTION_CACHE kapaliysa None doner.
+    """
+    global _extraction_cache
+    if _extraction_cache is None:
+        from sade_agents.config import get_settings
+
+        settings = get_settings()
+        if not settings.feature_extraction_cache:
+            return None
+        _extraction_cache = ExtractionCache(
+            settings.get_cache_dir() / "extraction_cache.sqlite3",
+            ttl_seconds=settings.extraction_cache_ttl_hours * 3600,
+            max_entries=settings.extraction_cache_max_entries,
+        )
+    return _extraction_cache
+
+
+__all__ = [
+    "ExtractionCache",
+    "ExtractionCacheStats",
+    "get_extraction_cache",
+]
@@ -0,0 +1,196 @@
+"""
+Sade Agents - Sayfa Icerik Parmak Izi Deposu.
+
+Rakip listeleri cogunlukla haftada bir bile degismez. Her sayfa icin
+son taramadaki:
+- Normalize edilmis temiz metnin hash'i (parmak izi)
+- Cikarilan urunlerin kimlikleri (normalize isim + gramaj hash'i)
+- Urun listesinin kendisi (snapshot)
+saklanir. Parmak izi degismeyen sayfa tekrar cikarilmaz (yapisal veri
+veya LLM), urunleri snapshot'tan verilir.
+
+Parmak izi prompt versiyonu, model ve urun aciklamasini da icerir;
+bunlardan biri degisirse sayfalar yeniden cikarilir.
+
+URL basina tek kayit tutulur; kayitlar SQLite'ta saklanir
+(FEATURE_INCREMENTAL_SCRAPING).
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from sade_agents.scrapers.base import ProductPrice
+from sade_agents.scrapers.product_identity import product_key
+
+
+@dataclass
+class PageSnapshot:
+    """Bir sayfanin son basarili cikarimi."""
+
+    url: str
+    fingerprint: str
+    product_ids: list[str]
+    products: list[ProductPrice]
+    extraction_method: str | None
+    updated_at: float
+
+
+def page_fingerprint(text: str, *context: str) -> str:
+    """
+    Temiz sayfa metninin parmak izi (sha256).
+
+    Metin kucuk harfe cevrilir ve bosluklar tekillenir; boylece sadece
+    bosluk/satir sonu farklari sayfayi "degismis" yapmaz.
+
+    Args:
+        text: Temizlenmis sayfa metni
+        *context: Cikarimi etkileyen diger girdiler (prompt versiyonu, model, ...)
+    """
+    digest = hashlib.sha256()
+    for part in (*context, " ".join(text.casefold().split())):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def product_id(product: ProductPrice) -> str:
+    """Fiyattan bagimsiz urun kimligi (bkz. product_identity.product_key)."""
+    return product_key(product)
+
+
+class FingerprintStore:
+    """
+    URL bazli parmak izi ve urun snapshot deposu.
+
+    Kullanim:
+        snapshot = store.get(url)
+        if snapshot and snapshot.fingerprint == fingerprint:
+            products = snapshot.products
+        else:
+            products = await extract(...)
+            store.put(url, fingerprint, products, "llm")
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path: SQLite dosya yolu (dizin yoksa olusturulur)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS page_fingerprints (
+                url TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                product_ids TEXT NOT NULL,
+                products TEXT NOT NULL,
+                extraction_method TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> PageSnapshot | None:
+        """
+        URL'in son snapshot'i (yoksa None).
+
+        Her cagri yeni ProductPrice objeleri uretir (cagiran degistirebilir).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, product_ids, products, extraction_method, updated_at "
+                "FROM page_fingerprints WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return PageSnapshot(
+            url=url,
+            fingerprint=row[0],
+            product_ids=json.loads(row[1]),
+            products=[ProductPrice(**p) for p in json.loads(row[2])],
+            extraction_method=row[3],
+            updated_at=row[4],
+        )
+
+    def put(
+        self,
+        url: str,
+        fingerprint: str,
+        products: list[ProductPrice],
+        extraction_method: str | None = None,
+    ) -> None:
+        """URL'in snapshot'ini yazar (oncekinin yerine)."""
+        rows = [asdict(p) for p in products]
+        product_ids = [product_id(p) for p in products]
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO page_fingerprints "
+                "(url, fingerprint, product_ids, products, extraction_method, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    fingerprint,
+                    json.dumps(product_ids),
+                    json.dumps(rows, ensure_ascii=False),
+                    extraction_method,
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM page_fingerprints").fetchone()[0]
+
+    def clear(self) -> None:
+        """Tum kayitlari siler (sonraki tarama her sayfayi yeniden cikarir)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM page_fingerprints")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """SQLite baglantisini kapatir."""
+        with self._lock:
+            self._conn.close()
+
+
+_fingerprint_store: FingerprintStore | None = None
+
+
+def get_fingerprint_store() -> FingerprintStore | None:
+    """
+    Paylasilan FingerprintStore'u dondurur.
+
+    FEATURE_INCREMENTAL_SCRAPING kapaliysa None doner.
+    """
+    global _fingerprint_store
+    if _fingerprint_store is None:
+        from sade_agents.config import get_settings
+
+        settings = get_settings()
+        if not settings.feature_incremental_scraping:
+            return None
+        _fingerprint_store = FingerprintStore(
+            settings.get_cache_dir() / "page_fingerprints.sqlite3"
+        )
+    return _fingerprint_store
+
+
+__all__ = [
+    "FingerprintStore",
+    "PageSnapshot",
+    "get_fingerprint_store",
+    "page_fingerprint",
+    "product_id",
+]
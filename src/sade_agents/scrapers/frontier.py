@@ -0,0 +1,268 @@
+"""
+Sade Agents - Oncelikli Tarama Sinir Kuyrugu (Crawl Frontier).
+
+SmartScraper kesfi tek seviyedir: sitemap/menu/AI ile bulunan sayfalar
+taranir. Buyuk kataloglarda urunlerin cogu sayfalama (?page=2,
+/sayfa/2) ve alt kategori linklerinin arkasindadir. Bu modul kesfi
+sinirli bir taramaya cevirir:
+
+- URL kanonik hale getirilir (host kucuk harf, fragment/izleme
+  parametreleri atilir, query siralanir) -> ayni sayfa iki kez girmez
+- Oncelik kuyrugu: guveni yuksek sayfa once taranir
+- Derinlik siniri (alt kategori linkleri) ve sayfa butcesi (toplam
+  kabul edilen sayfa); sayfalama derinlik harcamaz, butceyi harcar
+- Sayfalama tespiti: rel="next" ve ayni listenin sayfa numarali linkleri
+- Sabit sayida async worker (fan-out sinirli)
+
+Kullanim:
+    frontier = CrawlFrontier(max_pages=30, max_depth=2)
+    frontier.push("https://site.com/cikolata", "product_list", 0.9)
+    async for page, result in crawl(frontier, visit, workers=4):
+        ...
+"""
+
+import asyncio
+import heapq
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from bs4 import BeautifulSoup
+
+# Varsayilan sinirlar (Settings ile ezilir)
+DEFAULT_MAX_PAGES = 30
+DEFAULT_MAX_DEPTH = 2
+DEFAULT_WORKERS = 4
+
+# Kanonik URL'den atilan izleme parametreleri
+TRACKING_PARAMS = frozenset({
+    "gclid", "fbclid", "yclid", "msclkid", "mc_cid", "mc_eid", "ref", "_ga",
+})
+TRACKING_PREFIXES = ("utm_",)
+
+# Sayfa numarasi tasiyan query parametreleri
+PAGE_PARAMS = frozenset({"page", "sayfa", "pg", "pagenum"})
+
+# Yol sonundaki sayfa numarasi: /page/2, /sayfa/2
+_PAGE_PATH = re.compile(r"/(?:page|sayfa)/(\d+)/?$", re.IGNORECASE)
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def canonicalize_url(url: str, base_url: str | None = None) -> str:
+    """
+    URL'i kanonik hale getirir.
+
+    - Goreli URL base_url'e gore cozulur
+    - Sema ve host kucuk harf, varsayilan port atilir
+    - Fragment ve izleme parametreleri (utm_*, gclid, ...) atilir
+    - Query parametreleri siralanir
+    - Kok disinda sondaki "/" atilir (yol buyuk/kucuk harfe dokunulmaz)
+    """
+    if base_url is not None:
+        url = urljoin(base_url, url)
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port is not None and str(parts.port) != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def page_number(url: str) -> int | None:
+    """Kanonik URL'deki sayfa numarasi (yoksa None)."""
+    parts = urlsplit(url)
+    for key, value in parse_qsl(parts.query):
+        if key.lower() in PAGE_PARAMS and value.isdigit():
+            return int(value)
+    match = _PAGE_PATH.search(parts.path)
+    return int(match.group(1)) if match else None
+
+
+def listing_key(url: str) -> str:
+    """Sayfa numarasi cikarilmis URL (ayni listenin sayfalari ayni anahtari alir)."""
+    parts = urlsplit(url)
+    path = _PAGE_PATH.sub("", parts.path) or "/"
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in PAGE_PARAMS
+    ])
+    return urlunsplit((parts.scheme, parts.netloc, path, query, ""))
+
+
+@dataclass
+class PageLinks:
+    """Bir sayfadan cikarilan linkler (kanonik, ayni host)."""
+
+    pagination: list[str] = field(default_factory=list)
+    links: list[tuple[str, str]] = field(default_factory=list)  # (url, link metni)
+
+
+def extract_links(soup: BeautifulSoup, page_url: str) -> PageLinks:
+    """
+    Sayfadaki linkleri tek gecisle siniflandirir.
+
+    Sayfalama: rel="next" veya ayni listenin (listing_key) baska bir sayfa
+    numarasi (1. sayfa haric). Digerleri links'e gider. Baska host'a giden,
+    javascript: ve sadece fragment linkler atlanir.
+    """
+    page_url = canonicalize_url(page_url)
+    host = urlsplit(page_url).netloc
+    key = listing_key(page_url)
+    result = PageLinks()
+    seen = {page_url}
+
+    for tag in soup.find_all(["a", "link"], href=True):
+        href = tag["href"].strip()
+        if not href or href.startswith(("#", "javascript:", "mailto:", "tel:")):
+            continue
+        url = canonicalize_url(href, page_url)
+        if url in seen or urlsplit(url).netloc != host:
+            continue
+        rel = tag.get("rel") or []
+        is_next = "next" in rel
+        number = page_number(url)
+        if is_next or (number is not None and number > 1 and listing_key(url) == key):
+            seen.add(url)
+            result.pagination.append(url)
+        elif tag.name == "a":
+            seen.add(url)
+            result.links.append((url, tag.get_text(strip=True)))
+    return result
+
+
+@dataclass
+class FrontierPage:
+    """Sinir kuyruguna kabul edilmis sayfa."""
+
+    url: str  # Kanonik URL
+    page_type: str
+    confidence: float
+    depth: int = 0
+    index: int = 0  # Kabul sirasi (birlestirme sirasi icin)
+
+
+class CrawlFrontier:
+    """
+    Oncelikli, tekrarsiz ve butceli tarama kuyrugu.
+
+    Oncelik: yuksek confidence once, esitlikte sig derinlik, sonra kabul
+    sirasi. Sayfa butcesi kabul aninda harcanir; butce dolunca yeni URL
+    kabul edilmez.
+    """
+
+    def __init__(
+        self, max_pages: int = DEFAULT_MAX_PAGES, max_depth: int = DEFAULT_MAX_DEPTH
+    ) -> None:
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.pages: list[FrontierPage] = []
+        self._heap: list[tuple[float, int, int, FrontierPage]] = []
+        self._seen: set[str] = set()
+
+    def push(
+        self, url: str, page_type: str, confidence: float, depth: int = 0
+    ) -> FrontierPage | None:
+        """
+        URL'i kuyruga ekler.
+
+        Returns:
+            Kabul edilen sayfa; zaten gorulmus, derinlik asimi veya butce
+            doluysa None
+        """
+        if depth > self.max_depth or self.full:
+            return None
+        url = canonicalize_url(url)
+        if url in self._seen:
+            return None
+        self._seen.add(url)
+        page = FrontierPage(
+            url=url, page_type=page_type, confidence=confidence, depth=depth, index=len(self.pages)
+        )
+        self.pages.append(page)
+        heapq.heappush(self._heap, (-confidence, depth, page.index, page))
+        return page
+
+    def pop(self) -> FrontierPage | None:
+        """Oncelikli sayfayi cikarir (kuyruk bossa None)."""
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[-1]
+
+    @property
+    def full(self) -> bool:
+        return len(self.pages) >= self.max_pages
+
+    @property
+    def admitted(self) -> int:
+        """Kabul edilen toplam sayfa."""
+        return len(self.pages)
+
+    def __len__(self) -> int:
+        """Taranmayi bekleyen sayfa sayisi."""
+        return len(self._heap)
+
+
+async def crawl(
+    frontier: CrawlFrontier,
+    visit: Callable[[FrontierPage], Awaitable[Any]],
+    workers: int = DEFAULT_WORKERS,
+) -> AsyncIterator[tuple[FrontierPage, Any]]:
+    """
+    Kuyrugu sabit sayida worker ile tarar; (sayfa, sonuc) tamamlandikca uretir.
+
+    visit sayfayi tarar ve bulduklarini frontier.push ile ekleyebilir.
+    visit'in hatasi sonuc olarak uretilir (tarama durmaz). Tum kabul
+    edilen sayfalar bitince akis biter; erken birakilirsa worker'lar
+    iptal edilir.
+    """
+    done: asyncio.Queue[tuple[FrontierPage, Any]] = asyncio.Queue()
+    wakeup = asyncio.Event()
+
+    async def worker() -> None:
+        while True:
+            page = frontier.pop()
+            if page is None:
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+            try:
+                result = await visit(page)
+            except Exception as e:
+                result = e
+            # Yeni sayfalar sonuc bildirilmeden once eklenir (bitis sayaci icin)
+            wakeup.set()
+            await done.put((page, result))
+
+    tasks = [asyncio.create_task(worker()) for _ in range(max(1, workers))]
+    finished = 0
+    try:
+        while finished < frontier.admitted:
+            item = await done.get()
+            finished += 1
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+__all__ = [
+    "CrawlFrontier",
+    "FrontierPage",
+    "PageLinks",
+    "canonicalize_url",
+    "crawl",
+    "extract_links",
+    "listing_key",
+    "page_number",
+]
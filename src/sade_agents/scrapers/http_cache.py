@@ -0,0 +1,312 @@
+"""
+Sade Agents - Kalici Conditional-GET HTTP Cache.
+
+Rakip sayfalari ve sitemap'ler gun icinde defalarca taranir, cogu degismez.
+Bu cache govdeyi ETag / Last-Modified / Cache-Control header'lari ile
+birlikte diskte (SQLite) saklar:
+
+- Cache-Control max-age icindeyse istek HIC atilmaz
+- Degilse If-None-Match / If-Modified-Since ile conditional istek atilir,
+  304 donerse govde diskten verilir
+- Toplam boyut sinirlidir; asilinca en uzun suredir kullanilmayan (LRU)
+  kayitlar silinir
+- Domain bazli hit/miss istatistikleri tutulur
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlparse
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+@dataclass
+class CachedResponse:
+    """Diskte saklanan HTTP yaniti."""
+
+    url: str
+    body: str
+    etag: str | None = None
+    last_modified: str | None = None
+    cache_control: str | None = None
+    stored_at: float = 0.0  # Son dogrulama zamani (epoch)
+
+    @property
+    def max_age(self) -> int | None:
+        """Cache-Control max-age degeri (saniye)."""
+        if not self.cache_control:
+            return None
+        match = _MAX_AGE_RE.search(self.cache_control)
+        return int(match.group(1)) if match else None
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Sunucuya sormadan kullanilabilir mi?"""
+        if self.cache_control and "no-cache" in self.cache_control.lower():
+            return False
+        max_age = self.max_age
+        if max_age is None:
+            return False
+        now = time.time() if now is None else now
+        return now - self.stored_at < max_age
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Conditional istek header'lari."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class DomainCacheStats:
+    """Domain bazli cache istatistikleri."""
+
+    fresh_hits: int = 0  # Istek atilmadan diskten
+    revalidated_hits: int = 0  # 304 ile dogrulanip diskten
+    misses: int = 0  # Tam govde indirildi
+
+    @property
+    def hits(self) -> int:
+        """Toplam hit (fresh + 304)."""
+        return self.fresh_hits + self.revalidated_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        """Hit orani (0-1)."""
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return round(self.hits / total, 3)
+
+
+class HttpCache:
+    """
+    SQLite tabanli, boyut sinirli conditional-GET cache.
+
+    Kullanim:
+        cache = HttpCache(Path("data/cache/http_cache.sqlite3"))
+        entry = cache.get(url)
+        if entry and entry.is_fresh():
+            ...
+    """
+
+    def __init__(self, path: Path, max_bytes: int = 200 * 1024 * 1024) -> None:
+        """
+        Args:
+            path: SQLite dosya yolu (dizin yoksa olusturulur)
+            max_bytes: Govdelerin toplam boyut limiti
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats: dict[str, DomainCacheStats] = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                cache_control TEXT,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_http_cache_access ON http_cache(last_access)"
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Okuma / yazma
+    # ------------------------------------------------------------------
+
+    def get(self, url: str) -> CachedResponse | None:
+        """URL icin kayitli yaniti dondurur (LRU icin erisim zamanini gunceller)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, cache_control, stored_at "
+                "FROM http_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE http_cache SET last_access = ? WHERE url = ?", (time.time(), url)
+            )
+            self._conn.commit()
+        return CachedResponse(
+            url=url,
+            body=row[0],
+            etag=row[1],
+            last_modified=row[2],
+            cache_control=row[3],
+            stored_at=row[4],
+        )
+
+    def store(self, url: str, body: str, headers: dict[str, str]) -> bool:
+        """
+        200 yanitini saklar.
+
+        Dogrulayici (ETag/Last-Modified) veya max-age yoksa ya da
+        no-store ise saklanmaz.
+
+        Returns:
+            Kaydedildiyse True
+        """
+        headers = _normalize_headers(headers)
+        cache_control = headers.get("cache-control")
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+
+        if cache_control and "no-store" in cache_control.lower():
+            return False
+        entry = CachedResponse(url=url, body=body, cache_control=cache_control)
+        if not (etag or last_modified or entry.max_age):
+            return False
+
+        size = len(body.encode("utf-8"))
+        if size > self.max_bytes:
+            return False
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(url, body, etag, last_modified, cache_control, stored_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, cache_control, now, now, size),
+            )
+            self._evict_locked()
+            self._conn.commit()
+        return True
+
+    def revalidate(self, url: str, headers: dict[str, str]) -> None:
+        """304 sonrasi kaydi tazeler (yeni dogrulayicilar varsa gunceller)."""
+        headers = _normalize_headers(headers)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE http_cache SET stored_at = ?, last_access = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified), "
+                "cache_control = COALESCE(?, cache_control) WHERE url = ?",
+                (
+                    now,
+                    now,
+                    headers.get("etag"),
+                    headers.get("last-modified"),
+                    headers.get("cache-control"),
+                    url,
+                ),
+            )
+            self._conn.commit()
+
+    def total_bytes(self) -> int:
+        """Saklanan govdelerin toplam boyutu."""
+        with self._lock:
+            row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()
+        return int(row[0])
+
+    def clear(self) -> None:
+        """Tum kayitlari ve istatistikleri siler."""
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache")
+            self._conn.commit()
+            self._stats.clear()
+
+    def close(self) -> None:
+        """SQLite baglantisini kapatir."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict_locked(self) -> None:
+        """Limit asildiysa en eski erisilen kayitlari siler (lock alinmis olmali)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # Tekrar tekrar tetiklenmesin diye limitin %90'ina kadar bosalt
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute(
+            "SELECT url, size FROM http_cache ORDER BY last_access ASC"
+        ).fetchall()
+        to_delete = []
+        for url, size in rows:
+            if total <= target:
+                break
+            to_delete.append((url,))
+            total -= size
+        self._conn.executemany("DELETE FROM http_cache WHERE url = ?", to_delete)
+
+    # ------------------------------------------------------------------
+    # Istatistikler
+    # ------------------------------------------------------------------
+
+    def record(self, url: str, outcome: str) -> None:
+        """
+        Domain istatistigine sonuc ekler.
+
+        Args:
+            url: Istenen URL
+            outcome: "fresh", "revalidated" veya "miss"
+        """
+        domain = urlparse(url).netloc
+        stats = self._stats.setdefault(domain, DomainCacheStats())
+        if outcome == "fresh":
+            stats.fresh_hits += 1
+        elif outcome == "revalidated":
+            stats.revalidated_hits += 1
+        else:
+            stats.misses += 1
+
+    @property
+    def stats(self) -> dict[str, DomainCacheStats]:
+        """Domain -> istatistik eslemesi."""
+        return dict(self._stats)
+
+
+def _normalize_headers(headers: dict[str, str]) -> dict[str, str]:
+    """Header adlarini kucuk harfe cevirir."""
+    return {str(k).lower(): str(v) for k, v in headers.items()}
+
+
+_http_cache: HttpCache | None = None
+
+
+def get_http_cache() -> HttpCache | None:
+    """
+    Paylasilan HttpCache'i dondurur.
+
+    FEATURE_HTTP_CACHE kapaliysa None doner.
+    """
+    global _http_cache
+    if _http_cache is None:
+        from sade_agents.config import get_settings
+
+        settings = get_settings()
+        if not settings.feature_http_cache:
+            return None
+        _http_cache = HttpCache(
+            settings.get_cache_dir() / "http_cache.sqlite3",
+            max_bytes=settings.http_cache_max_mb * 1024 * 1024,
+        )
+    return _http_cache
+
+
+__all__ = [
+    "CachedResponse",
+    "DomainCacheStats",
+    "HttpCache",
+    "get_http_cache",
+]
@@ -0,0 +1,455 @@
+"""
+Sade Agents - Paylasimli HTTP Session Yoneticisi.
+
+Tum scraper'lar tek bir aiohttp.ClientSession havuzu kullanir:
+- Keep-alive baglanti havuzu (TCP+TLS el sikismasi tekrar edilmez)
+- Host basina baglanti limiti
+- DNS cache
+- Tek noktadan varsayilan header'lar
+- Baglanti yeniden kullanim istatistikleri
+- Istege bagli kalici conditional-GET cache (bkz. http_cache.py)
+- Istege bagli domain bazli nezaket zamanlayicisi (bkz. scheduler.py):
+  her ag istegi slot alir, 429/Retry-After'a uyulur
+- Istege bagli tekrar deneme ve domain bazli devre kesici
+  (bkz. resilience.py)
+
+aiohttp session'lari event loop'a baglidir; bu yuzden her loop icin
+ayri bir session tutulur.
+"""
+
+import asyncio
+import gzip
+import logging
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass, field, replace
+from urllib.parse import urlparse
+
+import aiohttp
+
+from sade_agents.scrapers.http_cache import CachedResponse, HttpCache, get_http_cache
+from sade_agents.scrapers.resilience import ResiliencePolicy, get_resilience, is_transient_status
+from sade_agents.scrapers.scheduler import PolitenessScheduler, create_scheduler_from_settings
+
+logger = logging.getLogger(__name__)
+
+# stream(use_cache=True) ile saklanacak en buyuk (indirilen) govde
+STREAM_CACHE_MAX_BYTES = 10 * 1024 * 1024
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+DEFAULT_HEADERS: dict[str, str] = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+
+@dataclass
+class ConnectionStats:
+    """HTTP baglanti istatistikleri."""
+
+    requests: int = 0  # Gonderilen istek sayisi
+    connections_created: int = 0  # Yeni acilan TCP baglantisi
+    connections_reused: int = 0  # Havuzdan tekrar kullanilan baglanti
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Tekrar kullanilan baglanti orani (0-1)."""
+        total = self.connections_created + self.connections_reused
+        if not total:
+            return 0.0
+        return round(self.connections_reused / total, 3)
+
+    def since(self, earlier: "ConnectionStats") -> "ConnectionStats":
+        """Verilen snapshot'tan bu yana olan farki dondurur (run bazli rapor icin)."""
+        return ConnectionStats(
+            requests=self.requests - earlier.requests,
+            connections_created=self.connections_created - earlier.connections_created,
+            connections_reused=self.connections_reused - earlier.connections_reused,
+            dns_cache_hits=self.dns_cache_hits - earlier.dns_cache_hits,
+            dns_cache_misses=self.dns_cache_misses - earlier.dns_cache_misses,
+        )
+
+
+@dataclass
+class FetchResponse:
+    """Tek bir HTTP isteginin sonucu."""
+
+    url: str
+    status: int
+    text: str
+    headers: dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False  # Govde diskteki HTTP cache'ten geldi
+
+    @property
+    def ok(self) -> bool:
+        """2xx durum kodu mu?"""
+        return 200 <= self.status < 300
+
+
+class HttpSessionManager:
+    """
+    Process genelinde paylasilan aiohttp session yoneticisi.
+
+    Kullanim:
+        manager = get_session_manager()
+        response = await manager.fetch("https://example.com", timeout=15)
+        print(manager.stats.connections_reused)
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 8,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        headers: dict[str, str] | None = None,
+        http_cache: HttpCache | None = None,
+        scheduler: PolitenessScheduler | None = None,
+        resilience: ResiliencePolicy | None = None,
+    ) -> None:
+        """
+        Args:
+            limit: Toplam eszamanli baglanti limiti
+            limit_per_host: Host basina eszamanli baglanti limiti
+            dns_cache_ttl: DNS cache suresi (saniye)
+            keepalive_timeout: Bos baglantinin havuzda tutulma suresi (saniye)
+            headers: Varsayilan header'lar (None ise DEFAULT_HEADERS)
+            http_cache: Kalici conditional-GET cache (None ise cache kullanilmaz)
+            scheduler: Domain bazli istek zamanlayicisi (None ise limitsiz)
+            resilience: Tekrar deneme ve devre kesici (None ise tek deneme)
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.headers = dict(headers or DEFAULT_HEADERS)
+        self.http_cache = http_cache
+        self.scheduler = scheduler
+        self.resilience = resilience
+        self._sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._stats = ConnectionStats()
+
+    @property
+    def stats(self) -> ConnectionStats:
+        """Kumulatif istatistiklerin kopyasi."""
+        return replace(self._stats)
+
+    def reset_stats(self) -> None:
+        """Istatistikleri sifirlar."""
+        self._stats = ConnectionStats()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Calisan event loop icin paylasilan session'i dondurur.
+
+        Session kapatilmissa veya loop degismisse yenisi olusturulur.
+        Donen session'i `async with` ile KULLANMAYIN (kapatir).
+        """
+        loop = asyncio.get_running_loop()
+
+        # Kapanmis loop'lara ait session'lari birak
+        for stale_loop in [lp for lp in self._sessions if lp.is_closed()]:
+            del self._sessions[stale_loop]
+
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = self._create_session()
+            self._sessions[loop] = session
+        return session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Havuzlu connector ve trace hook'lari ile yeni session olusturur."""
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            trace_configs=[self._build_trace_config()],
+        )
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """Baglanti olaylarini sayan TraceConfig."""
+        manager = self
+
+        async def on_request_start(session, ctx, params) -> None:
+            manager._stats.requests += 1
+
+        async def on_connection_create_end(session, ctx, params) -> None:
+            manager._stats.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params) -> None:
+            manager._stats.connections_reused += 1
+
+        async def on_dns_cache_hit(session, ctx, params) -> None:
+            manager._stats.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx, params) -> None:
+            manager._stats.dns_cache_misses += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    async def fetch(
+        self,
+        url: str,
+        timeout: float = 30,
+        headers: dict[str, str] | None = None,
+        raise_for_status: bool = False,
+        use_cache: bool = False,
+    ) -> FetchResponse:
+        """
+        URL'i paylasilan session ile ceker.
+
+        Args:
+            url: Cekilecek URL
+            timeout: Toplam timeout (saniye)
+            headers: Varsayilanlarin uzerine yazilacak ek header'lar
+            raise_for_status: 4xx/5xx durumunda ClientResponseError firlat
+            use_cache: Kalici HTTP cache'i kullan (yapilandirilmissa)
+
+        Returns:
+            FetchResponse (status, text, headers)
+
+        Raises:
+            CircuitOpenError: Domain'in devresi aciksa (resilience varsa)
+        """
+        cache = self.http_cache if use_cache else None
+        cached = cache.get(url) if cache is not None else None
+
+        # Taze kayit: sunucuya hic sorma
+        if cached is not None and cached.is_fresh():
+            cache.record(url, "fresh")
+            return FetchResponse(url=url, status=200, text=cached.body, from_cache=True)
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            request_headers.update(cached.conditional_headers())
+
+        if self.resilience is None:
+            return await self._fetch_network(
+                url, timeout, request_headers, raise_for_status, cache, cached
+            )
+        # Gecici hatalar (baglanti, timeout, 5xx) tekrar denenir
+        return await self.resilience.call(
+            urlparse(url).netloc,
+            lambda: self._fetch_network(
+                url, timeout, request_headers, raise_for_status, cache, cached
+            ),
+            is_failure=lambda r: is_transient_status(r.status),
+        )
+
+    async def _fetch_network(
+        self,
+        url: str,
+        timeout: float,
+        request_headers: dict[str, str],
+        raise_for_status: bool,
+        cache: HttpCache | None,
+        cached: CachedResponse | None,
+    ) -> FetchResponse:
+        """Tek bir fetch denemesi (zamanlayicinin 429/503 tekrarlari dahil)."""
+        session = await self.get_session()
+        attempt = 0
+        while True:
+            async with self._slot(url):
+                # Slot beklenirken devre acilmis olabilir: timeout'u bekleme
+                self._check_circuit(url)
+                async with session.get(
+                    url,
+                    headers=request_headers or None,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                ) as response:
+                    # 429/503: zamanlayici domain'i bekletir, istek tekrar denenir
+                    if self.scheduler is not None and self.scheduler.note_response(
+                        url, response.status, response.headers, attempt
+                    ):
+                        attempt += 1
+                        continue
+
+                    # 304: govde degismemis, diskten ver
+                    if response.status == 304 and cached is not None:
+                        cache.revalidate(url, dict(response.headers))
+                        cache.record(url, "revalidated")
+                        return FetchResponse(
+                            url=url,
+                            status=200,
+                            text=cached.body,
+                            headers=dict(response.headers),
+                            from_cache=True,
+                        )
+
+                    if raise_for_status:
+                        response.raise_for_status()
+                    text = await response.text() if response.status < 400 else ""
+                    response_headers = dict(response.headers)
+            break
+
+        if cache is not None and response.status == 200:
+            cache.record(url, "miss")
+            cache.store(url, text, response_headers)
+
+        return FetchResponse(
+            url=url,
+            status=response.status,
+            text=text,
+            headers=response_headers,
+        )
+
+    async def stream(
+        self,
+        url: str,
+        timeout: float = 30,
+        headers: dict[str, str] | None = None,
+        chunk_size: int = 64 * 1024,
+        use_cache: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yaniti govdeyi bellege almadan parca parca dondurur (buyuk dosyalar icin).
+
+        use_cache ile fetch() gibi conditional GET yapilir: taze veya 304
+        donen kayit diskten akitilir. Sonuna kadar okunan ve
+        STREAM_CACHE_MAX_BYTES'tan kucuk 200 yanitlari saklanir (gzip
+        govdeler acilmis halde). 2xx olmayan yanitta ClientResponseError
+        firlatir.
+
+        Args:
+            url: Cekilecek URL
+            timeout: Toplam timeout (saniye)
+            headers: Varsayilanlarin uzerine yazilacak ek header'lar
+            chunk_size: Parca boyutu (byte)
+            use_cache: Kalici HTTP cache'i kullan (yapilandirilmissa)
+
+        Yields:
+            Ham govde parcalari (Content-Encoding cozulmus halde)
+        """
+        cache = self.http_cache if use_cache else None
+        cached = cache.get(url) if cache is not None else None
+        if cached is not None and cached.is_fresh():
+            cache.record(url, "fresh")
+            for chunk in _iter_chunks(cached.body, chunk_size):
+                yield chunk
+            return
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            request_headers.update(cached.conditional_headers())
+
+        session = await self.get_session()
+        body = bytearray() if cache is not None else None
+        complete = False
+        async with self._slot(url):
+            self._check_circuit(url)
+            async with session.get(
+                url,
+                headers=request_headers or None,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                if self.scheduler is not None:
+                    self.scheduler.note_response(
+                        url, response.status, response.headers, self.scheduler.max_retries
+                    )
+                response_headers = dict(response.headers)
+                not_modified = response.status == 304 and cached is not None
+                if not not_modified:
+                    response.raise_for_status()
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        if body is not None:
+                            # Cok buyuk dosyalar saklanmaz (bellek sinirli kalsin)
+                            if len(body) + len(chunk) > STREAM_CACHE_MAX_BYTES:
+                                body = None
+                            else:
+                                body.extend(chunk)
+                        yield chunk
+                    complete = True
+
+        # 304: govde degismemis, diskten akit (slot birakildiktan sonra)
+        if not_modified:
+            cache.revalidate(url, response_headers)
+            cache.record(url, "revalidated")
+            for chunk in _iter_chunks(cached.body, chunk_size):
+                yield chunk
+            return
+
+        if complete and body is not None:
+            text = _decode_body(bytes(body))
+            if text is not None:
+                cache.record(url, "miss")
+                cache.store(url, text, response_headers)
+
+    def _check_circuit(self, url: str) -> None:
+        """Domain'in devresi aciksa CircuitOpenError firlatir."""
+        if self.resilience is not None:
+            self.resilience.check(urlparse(url).netloc)
+
+    def _slot(self, url: str) -> AbstractAsyncContextManager[None]:
+        """Zamanlayici varsa istek slotu, yoksa bos context."""
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.slot(url)
+
+    async def close(self) -> None:
+        """Calisan loop'a ait session'i kapatir."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+
+
+def _iter_chunks(text: str, chunk_size: int) -> Iterator[bytes]:
+    """Cache'teki govdeyi akis parcalarina boler."""
+    data = text.encode("utf-8")
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+
+def _decode_body(data: bytes) -> str | None:
+    """Akis govdesini cache'lenebilir metne cevirir (gzip acilir; metin degilse None)."""
+    try:
+        if data[:2] == _GZIP_MAGIC:
+            data = gzip.decompress(data)
+        return data.decode("utf-8")
+    except (OSError, EOFError, UnicodeDecodeError):
+        return None
+
+
+_session_manager: HttpSessionManager | None = None
+
+
+def get_session_manager() -> HttpSessionManager:
+    """Process genelinde tek HttpSessionManager'i dondurur."""
+    global _session_manager
+    if _session_manager is None:
+        _session_manager = HttpSessionManager(
+            http_cache=get_http_cache(),
+            scheduler=create_scheduler_from_settings(),
+            resilience=get_resilience(),
+        )
+    return _session_manager
+
+
+__all__ = [
+    "DEFAULT_HEADERS",
+    "ConnectionStats",
+    "FetchResponse",
+    "HttpSessionManager",
+    "get_session_manager",
+]
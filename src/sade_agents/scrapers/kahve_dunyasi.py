@@ -5,6 +5,7 @@ Kahve Dunyasi cikolata urunlerini cekmek icin scraper.
 """
 
 from sade_agents.scrapers.base import BaseScraper, ProductPrice, ScraperResult
+from sade_agents.scrapers.parsing import parse_html
 
 
 class KahveDunyasiScraper(BaseScraper):
@@ -42,9 +43,7 @@ class KahveDunyasiScraper(BaseScraper):
 
     def _parse_products(self, html: str) -> list[ProductPrice]:
         """HTML'den urun bilgilerini parse eder."""
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(html, "html.parser")
+        soup = parse_html(html)
         products = []
 
         # Urun kartlarini bul (site yapisina gore guncellenmeli)
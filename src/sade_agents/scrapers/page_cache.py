@@ -0,0 +1,124 @@
+"""
+Sade Agents - Tarama Bazli Sayfa Cache'i.
+
+Tek bir site taramasi (crawl) boyunca her URL'in:
+- Sadece BIR KEZ indirilmesini (eszamanli istekler tek istege indirgenir)
+- Sadece BIR KEZ parse edilmesini
+saglar.
+
+Ornek: SmartScraper ana sayfayi menu kesfi, AI kesfi ve urun cikarma
+icin uc kez ister; ag istegi ve parse islemi yalnizca bir kez yapilir.
+
+NOT: get_soup() ile donen DOM paylasimlidir, DEGISTIRILMEMELIDIR
+(decompose/extract yapmayin).
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+from bs4 import BeautifulSoup
+
+from sade_agents.scrapers.http_session import (
+    FetchResponse,
+    HttpSessionManager,
+    get_session_manager,
+)
+from sade_agents.scrapers.parsing import clean_text, parse_html
+
+
+@dataclass
+class PageCacheStats:
+    """Sayfa cache istatistikleri."""
+
+    fetches: int = 0  # Gercekten aga giden istek
+    hits: int = 0  # Cache'ten (veya devam eden istekten) karsilanan
+    parses: int = 0  # HTML parse sayisi
+
+
+class CrawlPageCache:
+    """
+    Tek bir tarama icin single-flight sayfa cache'i.
+
+    Her scrape_site cagrisi kendi cache'ini olusturur; cache tarama
+    bitince birakilir.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 15,
+        manager: HttpSessionManager | None = None,
+    ) -> None:
+        """
+        Args:
+            timeout: Varsayilan istek timeout'u (saniye)
+            manager: HTTP session yoneticisi (None ise paylasilan)
+        """
+        self.timeout = timeout
+        self._manager = manager
+        self._responses: dict[str, asyncio.Task[FetchResponse]] = {}
+        self._soups: dict[str, BeautifulSoup] = {}
+        self._texts: dict[str, str] = {}
+        self.stats = PageCacheStats()
+
+    async def fetch(self, url: str, timeout: float | None = None) -> FetchResponse:
+        """
+        URL'i ceker; ayni URL icin devam eden veya tamamlanmis istegi paylasir.
+
+        Hatalar da memoize edilir: ayni tarama icinde basarisiz URL tekrar denenmez.
+        """
+        task = self._responses.get(url)
+        if task is None:
+            self.stats.fetches += 1
+            manager = self._manager or get_session_manager()
+            task = asyncio.ensure_future(
+                manager.fetch(url, timeout=timeout or self.timeout, use_cache=True)
+            )
+            self._responses[url] = task
+        else:
+            self.stats.hits += 1
+        # shield: bir bekleyenin iptali diger bekleyenlerin istegini iptal etmesin
+        return await asyncio.shield(task)
+
+    async def get_html(self, url: str, timeout: float | None = None) -> str | None:
+        """200 donen sayfanin HTML'ini, aksi halde None dondurur."""
+        response = await self.fetch(url, timeout=timeout)
+        if response.status != 200:
+            return None
+        return response.text
+
+    async def get_soup(self, url: str, timeout: float | None = None) -> BeautifulSoup | None:
+        """Sayfanin parse edilmis DOM'unu dondurur (tarama boyunca tek parse)."""
+        soup = self._soups.get(url)
+        if soup is not None:
+            return soup
+
+        html = await self.get_html(url, timeout=timeout)
+        if html is None:
+            return None
+
+        # await sonrasi baska bir bekleyen parse etmis olabilir
+        soup = self._soups.get(url)
+        if soup is None:
+            self.stats.parses += 1
+            soup = parse_html(html)
+            self._soups[url] = soup
+        return soup
+
+    async def get_text(self, url: str, timeout: float | None = None) -> str | None:
+        """Sayfanin temiz metnini dondurur (tarama boyunca tek temizleme)."""
+        text = self._texts.get(url)
+        if text is not None:
+            return text
+
+        soup = await self.get_soup(url, timeout=timeout)
+        if soup is None:
+            return None
+        text = self._texts.setdefault(url, clean_text(soup))
+        return text
+
+    def peek_soup(self, url: str) -> BeautifulSoup | None:
+        """Ag istegi yapmadan, zaten parse edilmis DOM'u dondurur."""
+        return self._soups.get(url)
+
+
+__all__ = ["CrawlPageCache", "PageCacheStats"]
@@ -0,0 +1,88 @@
+"""
+Sade Agents - Ortak HTML Parse Asamasi.
+
+Tum scraper'lar HTML'i buradan parse eder:
+- Backend: lxml (C tabanli, html.parser'dan kat kat hizli).
+  lxml kurulu degilse html.parser'a duser.
+- Sayfa basina TEK parse: CrawlPageCache DOM'u bir kez olusturur;
+  metin temizleme, yapisal veri, menu ve link kesfi ayni DOM'u kullanir.
+- Sadece belirli etiketler gerekiyorsa parse_only (SoupStrainer) ile
+  kisitli parse yapilir; geri kalan agac hic olusturulmaz.
+- Sitemap'ler BeautifulSoup ile degil, akisli XML parser ile okunur
+  (bkz. sitemap.py).
+
+NOT: Paylasilan DOM DEGISTIRILMEMELIDIR (decompose/extract yapmayin).
+"""
+
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer, Tag
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - lxml bagimliliklarda var
+    HTML_PARSER = "html.parser"
+
+# Metni LLM'e gonderilmeyecek elementler
+NOISE_TAGS = frozenset({"script", "style", "nav", "footer", "header", "noscript", "iframe"})
+
+# get_text() ile ayni: yorum, doctype vb. haric duz metin
+TEXT_TYPES = (NavigableString, CData)
+
+
+def parse_html(html: str | bytes, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    """
+    HTML'i ortak backend ile parse eder.
+
+    Args:
+        html: Sayfa HTML'i
+        parse_only: Verilirse sadece eslesen etiketler agaca alinir
+
+    Returns:
+        Parse edilmis DOM
+    """
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+
+def clean_text(soup: BeautifulSoup, max_chars: int | None = None) -> str:
+    """
+    DOM'dan gereksiz elementler (script, nav, footer...) haric duz metin cikarir.
+
+    DOM'u DEGISTIRMEZ; gereksiz elementlerin alt agaci atlanir.
+
+    Args:
+        soup: Parse edilmis sayfa
+        max_chars: Verilirse metin bu uzunlukta kirpilir
+    """
+    # Sadece body icerigini al
+    root = soup.find("body") or soup
+
+    parts: list[str] = []
+    stack = list(reversed(list(root.children)))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Tag):
+            # Gereksiz elementleri atla
+            if node.name in NOISE_TAGS:
+                continue
+            stack.extend(reversed(list(node.children)))
+        elif type(node) in TEXT_TYPES:
+            text = node.strip()
+            if text:
+                parts.append(text)
+
+    text = " ".join(parts)
+
+    # Istenirse kirp
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars] + "..."
+
+    return text
+
+
+__all__ = [
+    "HTML_PARSER",
+    "NOISE_TAGS",
+    "clean_text",
+    "parse_html",
+]
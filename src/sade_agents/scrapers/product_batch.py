@@ -0,0 +1,222 @@
+"""
+Sade Agents - Kolon Bazli Urun Toplulugu (ProductBatch).
+
+Cok rakipli tam kataloglar (on binlerce urun) ProductPrice objeleri
+olarak tutuldugunda her urun ayri bir Python objesi ve birkac float/str
+objesi demektir. ProductBatch ayni veriyi tipli kolonlarda tutar:
+
+- price_tl, weight_grams, price_per_gram: float64 numpy dizileri
+  (gramaj yoksa NaN)
+- source, name, category: sozluk kodlamasi (int32 kod + tekil string
+  listesi); tekrar eden isim/kategori tek kez saklanir
+- url: obje dizisi
+
+price_per_gram toplu hesaplanir. to_frame() sayisal kolonlari
+kopyalamadan pandas DataFrame'e verir (string kolonlar Categorical olur).
+
+Kullanim:
+    batch = ProductBatch.from_results(results)
+    batch.nbytes, len(batch), batch[0]
+    df = batch.to_frame()
+"""
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from sade_agents.scrapers.base import ProductPrice, ScraperResult
+
+
+class _Dictionary:
+    """String -> int32 kod sozlugu (tekil degerler eklenme sirasinda)."""
+
+    def __init__(self) -> None:
+        self.values: list[str | None] = []
+        self._codes: dict[str | None, int] = {}
+
+    def encode(self, value: str | None) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class ProductBatch:
+    """
+    Urunlerin tipli kolonlarda tutuldugu topluluk.
+
+    Indeksleme ve iterasyon ProductPrice uretir (ihtiyac aninda).
+    """
+
+    def __init__(
+        self,
+        price_tl: np.ndarray,
+        weight_grams: np.ndarray,
+        price_per_gram: np.ndarray,
+        source_codes: np.ndarray,
+        sources: Sequence[str | None],
+        name_codes: np.ndarray,
+        names: Sequence[str | None],
+        category_codes: np.ndarray,
+        categories: Sequence[str | None],
+        urls: np.ndarray,
+    ) -> None:
+        self.price_tl = price_tl
+        self.weight_grams = weight_grams
+        self.price_per_gram = price_per_gram
+        self.source_codes = source_codes
+        self.sources = list(sources)
+        self.name_codes = name_codes
+        self.names = list(names)
+        self.category_codes = category_codes
+        self.categories = list(categories)
+        self.urls = urls
+
+    @classmethod
+    def from_products(
+        cls, products: Iterable[ProductPrice], source: str | None = None
+    ) -> "ProductBatch":
+        """Tek kaynagin urunlerinden batch olusturur."""
+        return cls._build([(source, products)])
+
+    @classmethod
+    def from_results(
+        cls, results: ScraperResult | Iterable[ScraperResult] | Mapping[str, ScraperResult]
+    ) -> "ProductBatch":
+        """
+        Scrape sonuclarindan batch olusturur (basarisiz sonuclar atlanir).
+
+        Args:
+            results: Tek sonuc, sonuc listesi veya {kaynak: sonuc} dict'i
+        """
+        if isinstance(results, ScraperResult):
+            results = [results]
+        elif isinstance(results, Mapping):
+            results = results.values()
+        return cls._build((r.source, r.products) for r in results if r.success)
+
+    @classmethod
+    def _build(
+        cls, groups: Iterable[tuple[str | None, Iterable[ProductPrice]]]
+    ) -> "ProductBatch":
+        sources, names, categories = _Dictionary(), _Dictionary(), _Dictionary()
+        price, weight, per_gram, urls = [], [], [], []
+        source_codes, name_codes, category_codes = [], [], []
+        for source, products in groups:
+            source_code = sources.encode(source)
+            for p in products:
+                price.append(p.price_tl)
+                weight.append(p.weight_grams)
+                per_gram.append(p.price_per_gram)
+                urls.append(p.url)
+                source_codes.append(source_code)
+                name_codes.append(names.encode(p.name))
+                category_codes.append(categories.encode(p.category))
+
+        price_tl = np.array(price, dtype=np.float64)
+        weight_grams = np.array(weight, dtype=np.float64)
+        return cls(
+            price_tl=price_tl,
+            weight_grams=weight_grams,
+            price_per_gram=compute_price_per_gram(
+                price_tl, weight_grams, np.array(per_gram, dtype=np.float64)
+            ),
+            source_codes=np.array(source_codes, dtype=np.int32),
+            sources=sources.values,
+            name_codes=np.array(name_codes, dtype=np.int32),
+            names=names.values,
+            category_codes=np.array(category_codes, dtype=np.int32),
+            categories=categories.values,
+            urls=np.array(urls, dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return len(self.price_tl)
+
+    def __getitem__(self, index: int) -> ProductPrice:
+        """index'teki urunu ProductPrice olarak dondurur."""
+        weight = self.weight_grams[index]
+        per_gram = self.price_per_gram[index]
+        return ProductPrice(
+            name=self.names[self.name_codes[index]],
+            price_tl=float(self.price_tl[index]),
+            weight_grams=None if np.isnan(weight) else int(weight),
+            price_per_gram=None if np.isnan(per_gram) else float(per_gram),
+            url=self.urls[index],
+            category=self.categories[self.category_codes[index]],
+        )
+
+    def __iter__(self) -> Iterator[ProductPrice]:
+        return (self[i] for i in range(len(self)))
+
+    def source_of(self, index: int) -> str | None:
+        """index'teki urunun kaynagi."""
+        return self.sources[self.source_codes[index]]
+
+    @property
+    def nbytes(self) -> int:
+        """Kolon dizilerinin toplam boyutu (tekil string'ler haric)."""
+        arrays = (
+            self.price_tl,
+            self.weight_grams,
+            self.price_per_gram,
+            self.source_codes,
+            self.name_codes,
+            self.category_codes,
+            self.urls,
+        )
+        return sum(a.nbytes for a in arrays)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Sayisal kolonlari kopyalamadan DataFrame'e cevirir.
+
+        Kolonlar: source, name, category (Categorical), price_tl,
+        weight_grams, price_per_gram (float64, eksik NaN), url
+        """
+        return pd.DataFrame(
+            {
+                "source": _categorical(self.source_codes, self.sources),
+                "name": _categorical(self.name_codes, self.names),
+                "category": _categorical(self.category_codes, self.categories),
+                "price_tl": self.price_tl,
+                "weight_grams": self.weight_grams,
+                "price_per_gram": self.price_per_gram,
+                "url": self.urls,
+            },
+            copy=False,
+        )
+
+
+def _categorical(codes: np.ndarray, values: list[str | None]) -> pd.Categorical:
+    """Sozluk kodlarini Categorical'a cevirir (None degeri NaN olur)."""
+    if None not in values:
+        return pd.Categorical.from_codes(codes, values)
+    none_code = values.index(None)
+    # None'dan sonraki kodlar bir kayar; None -> -1 (NaN)
+    shifted = np.where(codes > none_code, codes - 1, codes)
+    shifted[codes == none_code] = -1
+    return pd.Categorical.from_codes(shifted, [v for v in values if v is not None])
+
+
+def compute_price_per_gram(
+    price_tl: np.ndarray, weight_grams: np.ndarray, given: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    TL/gram'i toplu hesaplar (ProductPrice.__post_init__ ile ayni yuvarlama).
+
+    Args:
+        price_tl: Fiyatlar
+        weight_grams: Gramajlar (yoksa NaN)
+        given: Onceden verilmis TL/gram (NaN olmayanlar korunur)
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        computed = np.where(weight_grams > 0, np.round(price_tl / weight_grams, 2), np.nan)
+    if given is None:
+        return computed
+    return np.where(np.isnan(given), computed, given)
+
+
+__all__ = ["ProductBatch", "compute_price_per_gram"]
@@ -0,0 +1,204 @@
+"""
+Sade Agents - Vektorel Urun Analitigi (ProductFrame).
+
+Bir veya birden fazla ScraperResult'i (ProductBatch uzerinden) tek
+pandas DataFrame'e cevirir;
+istatistikler Python dongusu yerine kolon bazli hesaplanir. Onlarca
+rakip x binlerce urun (yuz binlerce satir) milisaniyeler-saniyenin
+altinda ozetlenir.
+
+Kolonlar:
+    source, name, category, price_tl, weight_grams, pieces,
+    price_per_gram, price_per_piece, url
+
+- price_per_gram: gramaj biliniyorsa TL/gram
+- pieces: isimdeki adet ("12 adet", "16'li", "9 parca"); yoksa NaN
+- price_per_piece: adet biliniyorsa TL/adet (truffle/praline kutulari)
+
+Kullanim:
+    frame = ProductFrame.from_results(results)
+    frame.category_percentiles("price_per_gram")
+    frame.brand_comparison()
+    frame.df[frame.outliers()]
+"""
+
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from sade_agents.scrapers.base import ScraperResult
+from sade_agents.scrapers.product_batch import ProductBatch
+
+# Varsayilan yuzdelikler
+DEFAULT_PERCENTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+# Aykiri deger esigi (kategori ici IQR carpani; Tukey)
+OUTLIER_IQR_FACTOR = 1.5
+
+# Kategorisi olmayan urunlerin gruplandigi etiket
+UNCATEGORIZED = "diger"
+
+# Isimdeki adet ifadesi: "12 adet", "16'li", "9 parca", "24 pcs"
+_PIECES_PATTERN = r"(?i)(\d+)\s*(?:adet|parca|parça|pcs|pc|['’]?\s*l[iıuü]\b)"
+
+_COLUMNS = [
+    "source",
+    "name",
+    "category",
+    "price_tl",
+    "weight_grams",
+    "pieces",
+    "price_per_gram",
+    "price_per_piece",
+    "url",
+]
+
+
+class ProductFrame:
+    """
+    Urun fiyatlarinin kolon bazli gorunumu.
+
+    Sadece fiyati pozitif urunler alinir.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+
+    @classmethod
+    def from_results(
+        cls, results: ScraperResult | Iterable[ScraperResult] | Mapping[str, ScraperResult]
+    ) -> "ProductFrame":
+        """
+        Scrape sonuclarindan frame olusturur (basarisiz sonuclar atlanir).
+
+        Args:
+            results: Tek sonuc, sonuc listesi veya {kaynak: sonuc} dict'i
+        """
+        df = ProductBatch.from_results(results).to_frame()
+        category = df["category"]
+        if UNCATEGORIZED not in category.cat.categories:
+            category = category.cat.add_categories([UNCATEGORIZED])
+        # Gruplar alfabetik siralansin (Categorical eklenme sirasini korur)
+        df["category"] = category.fillna(UNCATEGORIZED).cat.reorder_categories(
+            sorted(category.cat.categories)
+        )
+        df = df[df["price_tl"] > 0].reset_index(drop=True)
+
+        weight_grams = df["weight_grams"].where(df["weight_grams"] > 0)
+        pieces = pd.Series(
+            pd.to_numeric(df["name"].str.extract(_PIECES_PATTERN)[0], errors="coerce")
+            .to_numpy(dtype="float64", na_value=np.nan),
+            index=df.index,
+        )
+        pieces = pieces.where(pieces > 0)
+        df["weight_grams"] = weight_grams
+        df["pieces"] = pieces
+        df["price_per_piece"] = df["price_tl"] / pieces
+        return cls(df[_COLUMNS])
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def summary(self) -> dict[str, float | int | None]:
+        """Tum urunlerin fiyat ozeti."""
+        price = self.df["price_tl"]
+        per_gram = self.df["price_per_gram"]
+        return {
+            "count": len(price),
+            "min_price": _scalar(price.min()),
+            "max_price": _scalar(price.max()),
+            "avg_price": _scalar(price.mean()),
+            "median_price": _scalar(price.median()),
+            "avg_price_per_gram": _scalar(per_gram.mean()),
+            "median_price_per_gram": _scalar(per_gram.median()),
+        }
+
+    def category_percentiles(
+        self,
+        column: str = "price_tl",
+        percentiles: Iterable[float] = DEFAULT_PERCENTILES,
+    ) -> pd.DataFrame:
+        """
+        Kategori bazli yuzdelikler.
+
+        Returns:
+            index=kategori, kolonlar: count + her yuzdelik (orn. p25, p50)
+        """
+        percentiles = list(percentiles)
+        values = self.df[["category", column]].dropna()
+        grouped = values.groupby("category", sort=True)[column]
+        table = grouped.quantile(percentiles).unstack().reindex(columns=percentiles)
+        table.columns = [f"p{round(q * 100):g}" for q in percentiles]
+        table.insert(0, "count", grouped.size())
+        return table
+
+    def unit_price_distribution(self) -> pd.DataFrame:
+        """
+        Kategori bazli TL/gram ve TL/adet dagilimi.
+
+        Returns:
+            index=kategori, kolonlar: (price_per_gram|price_per_piece, count/mean/std/min/...)
+        """
+        return self.df.groupby("category", sort=True)[
+            ["price_per_gram", "price_per_piece"]
+        ].describe()
+
+    def outliers(
+        self, column: str = "price_per_gram", factor: float = OUTLIER_IQR_FACTOR
+    ) -> pd.Series:
+        """
+        Kategori ici aykiri degerler (Tukey: Q1 - k*IQR, Q3 + k*IQR disi).
+
+        Deger yoksa (orn. gramaj bilinmiyorsa) False.
+
+        Returns:
+            df ile ayni index'te bool Series
+        """
+        grouped = self.df.groupby("category")[column]
+        q1 = grouped.transform("quantile", 0.25)
+        q3 = grouped.transform("quantile", 0.75)
+        spread = (q3 - q1) * factor
+        values = self.df[column]
+        return ((values < q1 - spread) | (values > q3 + spread)).fillna(False).astype(bool)
+
+    def brand_comparison(self, column: str = "price_per_gram") -> pd.DataFrame:
+        """
+        Kaynak (marka) x kategori medyan tablosu.
+
+        Returns:
+            index=kaynak, kolonlar=kategori; urunu olmayan hucreler NaN
+        """
+        return self.df.pivot_table(
+            index="source", columns="category", values=column, aggfunc="median"
+        )
+
+    def to_text(self, currency: str = "TL") -> list[str]:
+        """Kategori ozetleri (LLM prompt'u icin satirlar)."""
+        percentiles = self.category_percentiles("price_tl", (0.25, 0.5, 0.75))
+        per_gram = self.df.groupby("category")["price_per_gram"].median()
+        per_piece = self.df.groupby("category")["price_per_piece"].median()
+        flagged = self.outliers().groupby(self.df["category"]).sum()
+
+        lines = []
+        for category, row in percentiles.iterrows():
+            line = (
+                f"  - {category}: {int(row['count'])} urun, medyan {row['p50']:.0f} {currency} "
+                f"(p25-p75: {row['p25']:.0f}-{row['p75']:.0f})"
+            )
+            if not pd.isna(per_gram.get(category)):
+                line += f", medyan {per_gram[category]:.2f} {currency}/g"
+            if not pd.isna(per_piece.get(category)):
+                line += f", medyan {per_piece[category]:.0f} {currency}/adet"
+            if flagged.get(category, 0):
+                line += f", {int(flagged[category])} aykiri fiyat"
+            lines.append(line)
+        return lines
+
+
+def _scalar(value) -> float | None:
+    """NaN -> None, numpy skaler -> float."""
+    return None if pd.isna(value) else round(float(value), 2)
+
+
+__all__ = ["ProductFrame"]
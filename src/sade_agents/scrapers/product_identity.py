@@ -0,0 +1,288 @@
+"""
+Sade Agents - Urun Kimligi ve Bulanik Tekrar Tespiti.
+
+Ayni urun farkli sayfalarda/taramalarda farkli yazilabilir:
+- "Sütlü Fındıklı Tablet 100g" / "sutlu findikli tablet"
+- "Bitter Tablet %70" / "%70 Bitter Tablet"
+
+Bu modul:
+- Turkce duyarli isim normalizasyonu (ı/i, ş/s, ğ/g, ...; gramaj
+  ifadeleri ve noktalama atilir, kelimeler siralanir)
+- Normalize isim + gramajdan kararli urun anahtari (product_key);
+  taramalar arasinda degismez
+- Gramaj ve isimdeki sayilara gore bloklama + MinHash/LSH ile yakin
+  tekrar adaylari; adaylar gercek Jaccard benzerligi ve kategori
+  uyumu ile dogrulanir
+
+Her urun sabit sayida LSH kovasina bakar; on binlerce urunluk
+kataloglarda sure yaklasik dogrusal kalir.
+"""
+
+import hashlib
+import re
+import struct
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+
+from sade_agents.scrapers.base import ProductPrice
+
+# MinHash imza uzunlugu (blake2b'nin 64 byte'lik ciktisi = 32 x 16 bit)
+NUM_PERM = 32
+
+# LSH bant sayisi (bant basina NUM_PERM // LSH_BANDS satir).
+# 8 bant x 4 satir -> ~0.6 Jaccard ustundeki ciftler yuksek olasilikla aday olur.
+LSH_BANDS = 8
+
+# Ayni urun sayilmak icin minimum karakter 3-gram Jaccard benzerligi
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+
+# Bir LSH kovasinda tutulacak maksimum urun (cok kisa/ortak isimlerde
+# kovalarin sisip karsilastirmalari karesel yapmasini onler)
+MAX_BUCKET_SIZE = 64
+
+SHINGLE_SIZE = 3
+
+_TURKISH_FOLD = str.maketrans(
+    {
+        "ı": "i",
+        "İ": "i",
+        "ş": "s",
+        "Ş": "s",
+        "ğ": "g",
+        "Ğ": "g",
+        "ü": "u",
+        "Ü": "u",
+        "ö": "o",
+        "Ö": "o",
+        "ç": "c",
+        "Ç": "c",
+    }
+)
+
+# Gramaj ifadeleri (isimden atilir; gramaj ayri alan olarak karsilastirilir)
+_WEIGHT_PATTERN = re.compile(r"\b\d+(?:[.,]\d+)?\s*(?:kg|kilogram|gr|gram|g)\b")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+_NUMBER = re.compile(r"\d+")
+
+
+def fold_turkish(text: str) -> str:
+    """
+    Turkce karakterleri ASCII karsiliklarina indirir ve kucuk harfe cevirir.
+
+    "İ".lower() Python'da "i̇" (noktali) verdigi icin once Turkce harfler
+    cevrilir, sonra casefold ve aksan temizligi yapilir.
+    """
+    folded = text.translate(_TURKISH_FOLD).casefold()
+    if folded.isascii():
+        return folded
+    decomposed = unicodedata.normalize("NFKD", folded)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def normalize_name(name: str) -> str:
+    """
+    Karsilastirma icin urun adi.
+
+    Ornek: "Sütlü  Fındıklı Tablet 100g!" -> "findikli sutlu tablet"
+
+    Gramaj ifadeleri ve noktalama atilir, kelimeler tekillenip siralanir
+    (kelime sirasi kimligi degistirmez).
+    """
+    text = _WEIGHT_PATTERN.sub(" ", fold_turkish(name))
+    tokens = {token for token in _NON_WORD.split(text) if token}
+    return " ".join(sorted(tokens))
+
+
+def product_key(product: ProductPrice) -> str:
+    """
+    Fiyattan bagimsiz, taramalar arasi kararli urun anahtari.
+
+    Normalize isim + gramajin sha1'i (ilk 16 karakter).
+    """
+    key = f"{normalize_name(product.name)}\x00{product.weight_grams or ''}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _shingles(name: str) -> frozenset[str]:
+    """Normalize ismin karakter 3-gram'lari (kisa isimler tek parca)."""
+    if len(name) <= SHINGLE_SIZE:
+        return frozenset([name])
+    return frozenset(name[i : i + SHINGLE_SIZE] for i in range(len(name) - SHINGLE_SIZE + 1))
+
+
+@lru_cache(maxsize=65536)
+def _shingle_hashes(shingle: str) -> tuple[int, ...]:
+    """Bir 3-gram'in NUM_PERM adet 16 bitlik hash'i (tek blake2b cagrisi)."""
+    digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=NUM_PERM * 2).digest()
+    return struct.unpack(f"<{NUM_PERM}H", digest)
+
+
+def minhash_signature(shingles: frozenset[str]) -> tuple[int, ...]:
+    """MinHash imzasi: her permutasyon icin 3-gram hash'lerinin minimumu."""
+    return tuple(map(min, zip(*(_shingle_hashes(s) for s in shingles))))
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    """Iki kumenin Jaccard benzerligi."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class _Entry:
+    """Indeksteki bir urun."""
+
+    key: str
+    product: ProductPrice
+    name: str
+    shingles: frozenset[str]
+    numbers: frozenset[str]
+    category: str | None
+    band_keys: list[tuple]
+
+
+class ProductIndex:
+    """
+    Urun kimligi indeksi (gramaj + sayi bloklu MinHash/LSH).
+
+    Kullanim:
+        index = ProductIndex()
+        for product in products:
+            key = index.resolve(product)  # Yakin tekrar varsa onun anahtari
+
+    Iki urun su kosullarda ayni sayilir:
+    - Ayni gramaj (ikisinde de yoksa da esit sayilir)
+    - Kategoriler ayni ya da birinde eksik
+    - Isimdeki sayilar ayni ("%70" ile "%85" birlesmez)
+    - Normalize isimlerin 3-gram Jaccard benzerligi >= threshold
+    """
+
+    def __init__(self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> None:
+        self.threshold = threshold
+        self._entries: list[_Entry] = []
+        self._by_key: dict[str, int] = {}
+        self._buckets: dict[tuple, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def match(self, product: ProductPrice) -> ProductPrice | None:
+        """Indeksteki yakin tekrari (yoksa None)."""
+        index = self._find(self._entry(product))
+        return None if index is None else self._entries[index].product
+
+    def resolve(self, product: ProductPrice) -> str:
+        """Yakin tekrarin anahtarini dondurur; yoksa urunu ekler ve yeni anahtari dondurur."""
+        return self._resolve(product).key
+
+    def _resolve(self, product: ProductPrice) -> _Entry:
+        """Yakin tekrarin kaydi; yoksa urunun yeni kaydi (imza tek kez hesaplanir)."""
+        entry = self._entry(product)
+        index = self._find(entry)
+        if index is not None:
+            return self._entries[index]
+        self._insert(entry)
+        return entry
+
+    def add(self, product: ProductPrice, key: str | None = None) -> str:
+        """
+        Urunu eslestirmeden ekler.
+
+        Args:
+            product: Eklenecek urun
+            key: Onceden bilinen anahtar (orn. veritabanindan); yoksa product_key
+        """
+        entry = self._entry(product, key)
+        self._insert(entry)
+        return entry.key
+
+    def _entry(self, product: ProductPrice, key: str | None = None) -> _Entry:
+        name = normalize_name(product.name)
+        shingles = _shingles(name)
+        numbers = frozenset(_NUMBER.findall(name))
+        signature = minhash_signature(shingles)
+        rows = NUM_PERM // LSH_BANDS
+        block = (product.weight_grams, numbers)
+        return _Entry(
+            key=key or product_key(product),
+            product=product,
+            name=name,
+            shingles=shingles,
+            numbers=numbers,
+            category=fold_turkish(product.category) if product.category else None,
+            band_keys=[
+                (block, band, signature[band * rows : (band + 1) * rows])
+                for band in range(LSH_BANDS)
+            ],
+        )
+
+    def _find(self, entry: _Entry) -> int | None:
+        exact = self._by_key.get(entry.key)
+        if exact is not None and self._compatible(entry, self._entries[exact]):
+            return exact
+
+        best, best_score = None, self.threshold
+        seen: set[int] = set()
+        for band_key in entry.band_keys:
+            for candidate in self._buckets.get(band_key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                other = self._entries[candidate]
+                if not self._compatible(entry, other):
+                    continue
+                score = jaccard(entry.shingles, other.shingles)
+                if score >= best_score:
+                    best, best_score = candidate, score
+        return best
+
+    def _insert(self, entry: _Entry) -> None:
+        index = len(self._entries)
+        self._entries.append(entry)
+        self._by_key.setdefault(entry.key, index)
+        for band_key in entry.band_keys:
+            bucket = self._buckets.setdefault(band_key, [])
+            if len(bucket) < MAX_BUCKET_SIZE:
+                bucket.append(index)
+
+    @staticmethod
+    def _compatible(a: _Entry, b: _Entry) -> bool:
+        if a.product.weight_grams != b.product.weight_grams or a.numbers != b.numbers:
+            return False
+        return a.category is None or b.category is None or a.category == b.category
+
+
+def deduplicate_products(
+    products: list[ProductPrice],
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+) -> list[ProductPrice]:
+    """
+    Yakin tekrar urunleri tek kayda indirir.
+
+    Ilk gorulen siralama korunur; tekrar eden kayitta eksik alanlar
+    (kategori, URL) sonraki kayittan tamamlanir.
+    """
+    index = ProductIndex(threshold)
+    unique = []
+    for product in products:
+        existing = index._resolve(product).product
+        if existing is product:
+            unique.append(product)
+            continue
+        if existing.category is None:
+            existing.category = product.category
+        if existing.url is None:
+            existing.url = product.url
+    return unique
+
+
+__all__ = [
+    "ProductIndex",
+    "deduplicate_products",
+    "fold_turkish",
+    "minhash_signature",
+    "normalize_name",
+    "product_key",
+]
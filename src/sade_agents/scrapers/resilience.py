@@ -0,0 +1,349 @@
+"""
+Sade Agents - Tekrar Deneme ve Devre Kesici (Resilience) Katmani.
+
+Sayfa cekme ve LLM cikarma cagrilarini sarar:
+- Gecici hatalarda (baglanti, timeout, 5xx) jitter'li ustel tekrar deneme
+  (tenacity)
+- Anahtar basina (domain veya LLM endpoint'i) devre kesici: art arda
+  hata veren host'a bir sure istek gonderilmez, cagrilar aninda
+  CircuitOpenError ile biter
+- Tarama (run) basina hata butcesi: butce tukenince tekrar deneme
+  yapilmaz, her cagri tek denemeyle sonuclanir
+
+Boylece cevap vermeyen tek bir rakip sitesi, her sayfasi icin
+15-30 sn'lik timeout'lari tekrar tekrar bekletmez.
+
+NOT: 429/503 yanitlari PolitenessScheduler tarafindan Retry-After ile
+tekrar denenir; burada tekrar denenmez (ust uste tekrar carpilmasin).
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TypeVar
+
+import aiohttp
+import openai
+from tenacity import AsyncRetrying, RetryCallState, stop_after_attempt, wait_random_exponential
+
+from sade_agents.scrapers.scheduler import THROTTLE_STATUSES
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Devre durumlari
+CLOSED = "closed"  # Normal calisma
+OPEN = "open"  # Istekler aninda reddedilir
+HALF_OPEN = "half_open"  # Tek deneme istegine izin verilir
+
+# Tekrar denenebilir OpenAI hatalari (baglanti, timeout, rate limit, 5xx)
+TRANSIENT_LLM_ERRORS = (
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Devre acik: host'a gecici olarak istek gonderilmiyor."""
+
+    def __init__(self, key: str, retry_in: float) -> None:
+        super().__init__(f"Devre acik: {key} ({retry_in:.0f} sn sonra tekrar denenecek)")
+        self.key = key
+        self.retry_in = retry_in
+
+
+def is_transient_status(status: int) -> bool:
+    """Tekrar denenebilir HTTP durumu mu? (429/503 zamanlayiciya aittir)"""
+    return status >= 500 and status not in THROTTLE_STATUSES
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Hata gecici mi (tekrar denemeye deger mi)?"""
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, aiohttp.ClientResponseError):
+        return is_transient_status(error.status)
+    return isinstance(
+        error,
+        (aiohttp.ClientConnectionError, asyncio.TimeoutError, *TRANSIENT_LLM_ERRORS),
+    )
+
+
+class CircuitBreaker:
+    """
+    Art arda hatalarda acilan devre kesici.
+
+    failure_threshold art arda hatadan sonra devre acilir; reset_timeout
+    sonunda tek bir deneme istegine izin verilir (half-open). Deneme
+    basariliysa devre kapanir, degilse tekrar acilir.
+    """
+
+    def __init__(
+        self, name: str = "", failure_threshold: int = 5, reset_timeout: float = 60.0
+    ) -> None:
+        """
+        Args:
+            name: Loglar ve hatalar icin anahtar (domain veya LLM endpoint'i)
+            failure_threshold: Devreyi acan art arda hata sayisi
+            reset_timeout: Acik devrenin deneme istegine izin verene kadar suresi (saniye)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def open_for(self) -> float:
+        """Devrenin acik kalacagi sure (saniye; acik degilse 0)."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def before_call(self) -> None:
+        """Istege izin verilmiyorsa CircuitOpenError firlatir."""
+        if self.state == CLOSED:
+            return
+        if self.state == OPEN:
+            retry_in = self.open_for()
+            if retry_in > 0:
+                raise CircuitOpenError(self.name, retry_in)
+            self.state = HALF_OPEN
+            self._trial_in_flight = False
+        if self._trial_in_flight:
+            raise CircuitOpenError(self.name, 0)
+        self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        """Basarili (veya host'un cevap verdigi) cagri."""
+        self.state = CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Sonucsuz biten (iptal edilen) deneme istegini birakir."""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Gecici hata; esik asilirsa devre acilir."""
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning("%s: devre acildi (%d art arda hata)", self.name, self.failures)
+            self.state = OPEN
+            self._opened_at = time.monotonic()
+
+
+@dataclass
+class FailureBudget:
+    """Tarama basina tekrar deneme butcesi."""
+
+    limit: int
+    used: int = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return self.used >= self.limit
+
+    def consume(self) -> bool:
+        """Bir tekrar deneme harcar; butce tukendiyse False dondurur."""
+        if self.exhausted:
+            return False
+        self.used += 1
+        return True
+
+
+# Calisan taramanin butcesi (asyncio task'lari context'i kopyalar,
+# butce nesnesi tarama icindeki tum task'larca paylasilir)
+_current_budget: ContextVar[FailureBudget | None] = ContextVar("failure_budget", default=None)
+
+
+class ResiliencePolicy:
+    """
+    Tekrar deneme + anahtar bazli devre kesici.
+
+    Kullanim:
+        result = await policy.call("shop.com", lambda: fetch(url))
+
+        with policy.failure_budget():
+            await asyncio.gather(...)  # Taramanin tum cagrilari
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        run_failure_budget: int = 50,
+    ) -> None:
+        """
+        Args:
+            max_attempts: Cagri basina toplam deneme (ilk deneme dahil)
+            backoff_base: Ustel beklemenin carpani (saniye)
+            backoff_max: Tek bir beklemenin ust siniri (saniye)
+            failure_threshold: Devreyi acan art arda hata sayisi
+            reset_timeout: Acik devrenin tekrar deneme suresi (saniye)
+            run_failure_budget: Tarama basina toplam tekrar deneme
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.run_failure_budget = run_failure_budget
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        """Anahtarin devre kesicisi (yoksa olusturulur)."""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, self.failure_threshold, self.reset_timeout)
+            self._breakers[key] = breaker
+        return breaker
+
+    def open_circuits(self) -> list[str]:
+        """Su an acik olan devrelerin anahtarlari."""
+        return sorted(key for key, b in self._breakers.items() if b.state == OPEN)
+
+    @contextmanager
+    def failure_budget(self) -> Iterator[FailureBudget]:
+        """Blok icindeki (ve olusturulan task'lardaki) cagrilar icin yeni butce."""
+        budget = FailureBudget(self.run_failure_budget)
+        token = _current_budget.set(budget)
+        try:
+            yield budget
+        finally:
+            _current_budget.reset(token)
+            if budget.exhausted:
+                logger.warning("Tekrar deneme butcesi tukendi (%d)", budget.limit)
+
+    async def call(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[T]],
+        is_failure: Callable[[T], bool] | None = None,
+    ) -> T:
+        """
+        func'i devre kesici ve tekrar deneme ile cagirir.
+
+        Args:
+            key: Devre anahtari (domain veya "llm:<host>")
+            func: Her denemede cagrilacak fonksiyon
+            is_failure: Donen sonucu gecici hata sayar mi (orn. HTTP 502)?
+                Denemeler tukenirse son sonuc dondurulur.
+
+        Raises:
+            CircuitOpenError: Devre acikken
+            Son denemenin hatasi: Denemeler tukenirse veya hata kalici ise
+        """
+        breaker = self.breaker(key)
+
+        async def attempt() -> T:
+            breaker.before_call()
+            try:
+                result = await func()
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except CircuitOpenError:
+                # Slot beklenirken devre acildi: sonuc kaydedilmez
+                breaker.release()
+                raise
+            except Exception as e:
+                if is_transient_error(e):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()  # Host cevap verdi (orn. 404)
+                raise
+            if is_failure is not None and is_failure(result):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            return result
+
+        def should_retry(state: RetryCallState) -> bool:
+            if state.attempt_number >= self.max_attempts:
+                return False
+            outcome = state.outcome
+            if outcome.failed:
+                transient = is_transient_error(outcome.exception())
+            else:
+                transient = is_failure is not None and is_failure(outcome.result())
+            if not transient or breaker.state == OPEN:
+                return False
+            budget = _current_budget.get()
+            return budget is None or budget.consume()
+
+        def log_retry(state: RetryCallState) -> None:
+            outcome = state.outcome
+            reason = outcome.exception() if outcome.failed else "basarisiz yanit"
+            logger.info(
+                "%s: deneme %d basarisiz (%s), %.1f sn sonra tekrar",
+                key,
+                state.attempt_number,
+                reason,
+                state.next_action.sleep if state.next_action else 0,
+            )
+
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.max_attempts),
+            wait=wait_random_exponential(multiplier=self.backoff_base, max=self.backoff_max),
+            retry=should_retry,
+            before_sleep=log_retry,
+            reraise=True,
+        )
+        return await retrying(attempt)
+
+    def check(self, key: str) -> None:
+        """Devre aciksa CircuitOpenError firlatir (deneme hakki tuketmez)."""
+        breaker = self._breakers.get(key)
+        retry_in = breaker.open_for() if breaker is not None else 0.0
+        if retry_in > 0:
+            raise CircuitOpenError(key, retry_in)
+
+
+_resilience: ResiliencePolicy | None = None
+
+
+def get_resilience() -> ResiliencePolicy | None:
+    """
+    Paylasilan ResiliencePolicy'yi dondurur.
+
+    FEATURE_SCRAPING_RESILIENCE kapaliysa None doner.
+    """
+    global _resilience
+    if _resilience is None:
+        from sade_agents.config import get_settings
+
+        settings = get_settings()
+        if not settings.feature_scraping_resilience:
+            return None
+        _resilience = ResiliencePolicy(
+            max_attempts=settings.scraping_retry_attempts,
+            backoff_base=settings.scraping_retry_backoff_seconds,
+            backoff_max=settings.scraping_retry_backoff_max_seconds,
+            failure_threshold=settings.scraping_circuit_failure_threshold,
+            reset_timeout=settings.scraping_circuit_reset_seconds,
+            run_failure_budget=settings.scraping_run_failure_budget,
+        )
+    return _resilience
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "FailureBudget",
+    "ResiliencePolicy",
+    "get_resilience",
+    "is_transient_error",
+]
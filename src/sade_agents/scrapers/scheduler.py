@@ -0,0 +1,328 @@
+"""
+Sade Agents - Domain Bazli Nezaket (Politeness) Zamanlayicisi.
+
+Tum HTTP istekleri (HttpSessionManager.fetch / stream) buradan gecer:
+- Global eszamanli istek limiti
+- Domain basina eszamanli istek limiti
+- Domain basina token-bucket istek hizi (istek/saniye + burst)
+- 429 / 503 yanitlarinda Retry-After'a uyma: domain o sure boyunca
+  beklemeye alinir, istek sinirli sayida tekrar denenir
+- Domain basina kuyruk derinligi, bekleme ve gecikme metrikleri
+
+asyncio.Semaphore event loop'a baglidir; bu yuzden semaforlar loop basina
+tutulur. Hiz limiti, Retry-After durumu ve metrikler tum loop'lar arasinda
+paylasilir.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Bu durum kodlarinda domain yavaslatilir ve istek tekrar denenir
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+@dataclass
+class DomainMetrics:
+    """Domain bazli zamanlayici metrikleri."""
+
+    requests: int = 0  # Slot alan istek sayisi (tekrarlar dahil)
+    retries: int = 0  # 429/503 sonrasi tekrar denemeler
+    throttled: int = 0  # Alinan 429/503 yaniti
+    in_flight: int = 0  # Su an calisan istek
+    queue_depth: int = 0  # Su an slot bekleyen istek
+    max_queue_depth: int = 0
+    total_wait: float = 0.0  # Kuyrukta gecen toplam sure (saniye)
+    total_latency: float = 0.0  # Slot icinde gecen toplam sure (saniye)
+    max_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        """Ortalama istek suresi (saniye)."""
+        if not self.requests:
+            return 0.0
+        return round(self.total_latency / self.requests, 3)
+
+    @property
+    def avg_wait(self) -> float:
+        """Ortalama kuyruk bekleme suresi (saniye)."""
+        if not self.requests:
+            return 0.0
+        return round(self.total_wait / self.requests, 3)
+
+
+class TokenBucket:
+    """
+    Rezervasyonlu token bucket.
+
+    Her cagiran bir token rezerve eder ve kendisine dusen sure kadar bekler;
+    token'lar eksiye dusebilir (sirali bekleme, adil dagilim).
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """
+        Args:
+            rate: Saniyede eklenen token (istek/saniye)
+            burst: Biriktirilebilecek maksimum token
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Bir token rezerve eder; beklenmesi gereken sureyi (saniye) dondurur."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+
+@dataclass
+class _DomainPolicy:
+    """Loop'tan bagimsiz domain durumu (hiz limiti ve Retry-After)."""
+
+    bucket: TokenBucket
+    blocked_until: float = 0.0  # time.monotonic() cinsinden
+
+
+@dataclass
+class _LoopState:
+    """Tek bir event loop'a ait semaforlar."""
+
+    global_semaphore: asyncio.Semaphore
+    domain_semaphores: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """
+    Retry-After header'ini saniyeye cevirir.
+
+    Saniye ("120") veya HTTP tarihi ("Wed, 21 Oct 2015 07:28:00 GMT") olabilir.
+    """
+    if not value or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class PolitenessScheduler:
+    """
+    Domain bazli istek zamanlayicisi.
+
+    Kullanim:
+        async with scheduler.slot(url):
+            ... istek ...
+        retry = scheduler.note_response(url, status, headers, attempt)
+    """
+
+    def __init__(
+        self,
+        global_limit: int = 32,
+        per_domain_limit: int = 4,
+        rate_per_second: float = 2.0,
+        burst: int = 4,
+        max_retries: int = 2,
+        max_retry_after: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            global_limit: Tum domain'ler icin toplam eszamanli istek
+            per_domain_limit: Domain basina eszamanli istek
+            rate_per_second: Domain basina saniyedeki istek (0 ise limitsiz)
+            burst: Domain basina anlik izin verilen istek birikimi
+            max_retries: 429/503 sonrasi maksimum tekrar deneme
+            max_retry_after: Uyulacak en uzun Retry-After (saniye)
+        """
+        self.global_limit = global_limit
+        self.per_domain_limit = per_domain_limit
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self._policies: dict[str, _DomainPolicy] = {}
+        self._loop_states: dict[asyncio.AbstractEventLoop, _LoopState] = {}
+        self._metrics: dict[str, DomainMetrics] = {}
+
+    def metrics(self) -> dict[str, DomainMetrics]:
+        """Domain bazli metriklerin kopyasi."""
+        return {domain: replace(m) for domain, m in self._metrics.items()}
+
+    def reset_metrics(self) -> None:
+        """Metrikleri sifirlar."""
+        self._metrics.clear()
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Istek icin slot alir.
+
+        Sira: domain semaforu -> Retry-After beklemesi -> hiz limiti ->
+        global semafor. Beklemeler domain slotu tutulurken yapilir; boylece
+        yavaslatilan bir domain global slotlari mesgul etmez.
+        """
+        domain = urlparse(url).netloc
+        metrics = self._metrics.setdefault(domain, DomainMetrics())
+        state = self._loop_state()
+        domain_semaphore = state.domain_semaphores.get(domain)
+        if domain_semaphore is None:
+            domain_semaphore = asyncio.Semaphore(self.per_domain_limit)
+            state.domain_semaphores[domain] = domain_semaphore
+
+        metrics.queue_depth += 1
+        metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+        enqueued = time.monotonic()
+        queued = True
+        try:
+            async with domain_semaphore:
+                await self._wait_for_turn(domain)
+                async with state.global_semaphore:
+                    started = time.monotonic()
+                    metrics.queue_depth -= 1
+                    queued = False
+                    metrics.requests += 1
+                    metrics.in_flight += 1
+                    metrics.total_wait += started - enqueued
+                    try:
+                        yield
+                    finally:
+                        latency = time.monotonic() - started
+                        metrics.in_flight -= 1
+                        metrics.total_latency += latency
+                        metrics.max_latency = max(metrics.max_latency, latency)
+        finally:
+            if queued:
+                metrics.queue_depth -= 1
+
+    def note_response(
+        self, url: str, status: int, headers: Mapping[str, str], attempt: int = 0
+    ) -> bool:
+        """
+        Yaniti kaydeder; 429/503 ise domain'i yavaslatir.
+
+        Args:
+            url: Istek URL'i
+            status: HTTP durum kodu
+            headers: Yanit header'lari
+            attempt: Bu istegin kacinci denemesi oldugu (0'dan baslar)
+
+        Returns:
+            Istek tekrar denenmeli mi?
+        """
+        if status not in THROTTLE_STATUSES:
+            return False
+
+        domain = urlparse(url).netloc
+        metrics = self._metrics.setdefault(domain, DomainMetrics())
+        metrics.throttled += 1
+
+        delay = parse_retry_after(headers.get("Retry-After"))
+        if delay is None:
+            delay = float(2**attempt)  # Header yoksa ustel bekleme
+        delay = min(delay, self.max_retry_after)
+
+        policy = self._policy(domain)
+        policy.blocked_until = max(policy.blocked_until, time.monotonic() + delay)
+        logger.warning("%s HTTP %d: domain %.1f sn bekletiliyor", domain, status, delay)
+
+        if attempt >= self.max_retries:
+            return False
+        metrics.retries += 1
+        return True
+
+    def log_metrics(self, since: dict[str, DomainMetrics] | None = None) -> None:
+        """Domain bazli ozet loglar (since verilirse sadece aradaki istekler)."""
+        for domain, current in sorted(self._metrics.items()):
+            earlier = (since or {}).get(domain, DomainMetrics())
+            requests = current.requests - earlier.requests
+            if not requests:
+                continue
+            logger.info(
+                "%s: %d istek, %d tekrar, %d throttle, max kuyruk %d, "
+                "ort. bekleme %.2f sn, ort. sure %.2f sn",
+                domain,
+                requests,
+                current.retries - earlier.retries,
+                current.throttled - earlier.throttled,
+                current.max_queue_depth,
+                (current.total_wait - earlier.total_wait) / requests,
+                (current.total_latency - earlier.total_latency) / requests,
+            )
+
+    async def _wait_for_turn(self, domain: str) -> None:
+        """Retry-After ve token bucket beklemeleri."""
+        policy = self._policy(domain)
+        while True:
+            blocked = policy.blocked_until - time.monotonic()
+            if blocked <= 0:
+                break
+            await asyncio.sleep(blocked)
+
+        delay = policy.bucket.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _policy(self, domain: str) -> _DomainPolicy:
+        policy = self._policies.get(domain)
+        if policy is None:
+            policy = _DomainPolicy(bucket=TokenBucket(self.rate_per_second, self.burst))
+            self._policies[domain] = policy
+        return policy
+
+    def _loop_state(self) -> _LoopState:
+        """Calisan loop'un semaforlari (kapanmis loop'lar birakilir)."""
+        loop = asyncio.get_running_loop()
+        for stale_loop in [lp for lp in self._loop_states if lp.is_closed()]:
+            del self._loop_states[stale_loop]
+
+        state = self._loop_states.get(loop)
+        if state is None:
+            state = _LoopState(global_semaphore=asyncio.Semaphore(self.global_limit))
+            self._loop_states[loop] = state
+        return state
+
+
+def create_scheduler_from_settings() -> PolitenessScheduler:
+    """Ayarlardaki limitlerle zamanlayici olusturur."""
+    from sade_agents.config import get_settings
+
+    settings = get_settings()
+    return PolitenessScheduler(
+        global_limit=settings.scraping_global_concurrency,
+        per_domain_limit=settings.scraping_domain_concurrency,
+        rate_per_second=settings.scraping_domain_rate_per_second,
+        burst=settings.scraping_domain_burst,
+        max_retries=settings.scraping_max_retries_on_throttle,
+        max_retry_after=settings.scraping_max_retry_after_seconds,
+    )
+
+
+__all__ = [
+    "DomainMetrics",
+    "PolitenessScheduler",
+    "TokenBucket",
+    "create_scheduler_from_settings",
+    "parse_retry_after",
+]
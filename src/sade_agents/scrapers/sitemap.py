@@ -0,0 +1,497 @@
+"""
+Sade Agents - Akisli Sitemap Okuyucu.
+
+Sitemap'ler tek seferde bellege alinmaz; yanit parca parca indirilirken
+artimli XML parser'a (XMLPullParser) beslenir ve URL'ler tembel olarak
+(async generator) uretilir.
+
+Ozellikler:
+- robots.txt `Sitemap:` satirlari yoksa varsayilan yollar eszamanli
+  yoklanir; secilen sitemap'in yoklama akisi okumada kullanilir
+- Sitemap'ler HTTP cache uzerinden cekilir (degismediyse 304, govde
+  tekrar indirilmez)
+- <sitemapindex> alt sitemap'leri ozyinelemeli izlenir (derinlik limitli)
+- .xml.gz dosyalari akis halinde acilir (gzip imzasindan tespit edilir)
+- Her URL <lastmod> ile birlikte doner; `since` verilirse sadece o
+  tarihten sonra degisen URL'ler (ve alt sitemap'ler) secilir
+
+Artimli tarama icin domain basina son tarama zamani ve sayfa bazli
+urunler SitemapState'te tutulur (FEATURE_INCREMENTAL_SITEMAP); degismeyen
+sayfalar tekrar taranmaz ama urunleri sonuca eklenir.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import threading
+import xml.etree.ElementTree as ET
+import zlib
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from sade_agents.scrapers.base import ProductPrice
+from sade_agents.scrapers.http_session import HttpSessionManager, get_session_manager
+from sade_agents.scrapers.page_cache import CrawlPageCache
+
+logger = logging.getLogger(__name__)
+
+# robots.txt'te sitemap yoksa denenecek yollar (oncelik sirasiyla)
+DEFAULT_SITEMAP_PATHS = ("/sitemap.xml", "/sitemap_index.xml", "/sitemap-products.xml")
+
+# Ic ice sitemap index limiti
+MAX_SITEMAP_DEPTH = 3
+
+# sitemaps.org limiti: acilmis halde 50 MB
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+SITEMAP_ROOTS = frozenset({"urlset", "sitemapindex"})
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ROBOTS_SITEMAP_RE = re.compile(r"^\s*sitemap\s*:\s*(\S+)", re.IGNORECASE | re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class SitemapEntry:
+    """Sitemap'teki tek kayit (<url> veya alt <sitemap>)."""
+
+    url: str
+    lastmod: datetime | None = None  # Her zaman timezone'lu (UTC varsayilir)
+
+    def changed_since(self, since: datetime | None) -> bool:
+        """Kayit verilen tarihten sonra degisti mi? (lastmod yoksa evet)"""
+        if since is None or self.lastmod is None:
+            return True
+        return self.lastmod > since
+
+
+def parse_lastmod(value: str | None) -> datetime | None:
+    """W3C datetime (2024-01-31, 2024-01-31T10:00:00+03:00) parse eder."""
+    if not value or not value.strip():
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    return _as_utc(parsed)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    """Timezone'suz tarihleri UTC kabul eder."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _local_name(tag: str) -> str:
+    """'{namespace}url' -> 'url'."""
+    return tag.rsplit("}", 1)[-1]
+
+
+class _SitemapParser:
+    """Tek bir sitemap dosyasini artimli parse eder (gzip dahil)."""
+
+    def __init__(self) -> None:
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._decompressor = None
+        self._sniffed = False
+        self._root: ET.Element | None = None
+        self.kind: str | None = None  # urlset, sitemapindex (veya beklenmeyen kok)
+        self.bytes_read = 0
+
+    def feed(self, chunk: bytes) -> list[SitemapEntry]:
+        """Ham parcayi besler, tamamlanan kayitlari dondurur."""
+        if not self._sniffed:
+            self._sniffed = True
+            if chunk[:2] == _GZIP_MAGIC:
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._decompressor is not None:
+            chunk = self._decompressor.decompress(chunk)
+        self.bytes_read += len(chunk)
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> list[SitemapEntry]:
+        """Dosya sonu: kalan kayitlari dondurur."""
+        if self._decompressor is not None:
+            self._parser.feed(self._decompressor.flush())
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> list[SitemapEntry]:
+        entries = []
+        for event, element in self._parser.read_events():
+            name = _local_name(element.tag)
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                    self.kind = name
+                continue
+
+            if name not in ("url", "sitemap") or element is self._root:
+                continue
+
+            loc = lastmod = None
+            for child in element:
+                child_name = _local_name(child.tag)
+                if child_name == "loc":
+                    loc = (child.text or "").strip()
+                elif child_name == "lastmod":
+                    lastmod = child.text
+            if loc:
+                entries.append(SitemapEntry(url=loc, lastmod=parse_lastmod(lastmod)))
+            # Islenen kayitlari agactan at (bellek sabit kalsin)
+            self._root.clear()
+        return entries
+
+
+class _SitemapDocument:
+    """Acik (indirilmekte olan) tek bir sitemap."""
+
+    def __init__(self, url: str, chunks: AsyncIterator[bytes]) -> None:
+        self.url = url
+        self._chunks = chunks
+        self._parser = _SitemapParser()
+        self._pending: list[SitemapEntry] = []
+
+    @property
+    def kind(self) -> str | None:
+        return self._parser.kind
+
+    async def open(self) -> bool:
+        """Kok element gorunene kadar okur; gecerli bir sitemap mi?"""
+        try:
+            while self._parser.kind is None:
+                chunk = await anext(self._chunks)
+                self._pending.extend(self._parser.feed(chunk))
+        except StopAsyncIteration:
+            pass
+        except Exception as e:
+            logger.debug("Sitemap acilamadi %s: %s", self.url, e)
+
+        if self._parser.kind in SITEMAP_ROOTS:
+            return True
+        await self.aclose()
+        return False
+
+    async def entries(self) -> AsyncIterator[SitemapEntry]:
+        """Kayitlari indirildikce uretir."""
+        try:
+            for entry in self._pending:
+                yield entry
+            self._pending = []
+
+            async for chunk in self._chunks:
+                if self._parser.bytes_read > MAX_SITEMAP_BYTES:
+                    logger.warning("Sitemap boyut limiti asildi, kesiliyor: %s", self.url)
+                    return
+                for entry in self._parser.feed(chunk):
+                    yield entry
+            for entry in self._parser.close():
+                yield entry
+        except Exception as e:
+            # Bozuk/yarim sitemap: o ana kadar okunanlar gecerli
+            logger.debug("Sitemap okuma hatasi %s: %s", self.url, e)
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """HTTP akisini kapatir."""
+        await self._chunks.aclose()
+
+
+class SitemapReader:
+    """
+    Bir sitenin sitemap'lerini akis halinde okur.
+
+    Kullanim:
+        reader = SitemapReader(page_cache=page_cache)
+        async for entry in reader.iter_entries("https://shop.com", since=last_crawl):
+            print(entry.url, entry.lastmod)
+    """
+
+    def __init__(
+        self,
+        page_cache: CrawlPageCache | None = None,
+        manager: HttpSessionManager | None = None,
+        timeout: float = 30,
+        max_depth: int = MAX_SITEMAP_DEPTH,
+    ) -> None:
+        """
+        Args:
+            page_cache: robots.txt icin tarama bazli sayfa cache'i
+            manager: HTTP session yoneticisi (None ise paylasilan)
+            timeout: Sitemap basina toplam timeout (saniye)
+            max_depth: Ic ice sitemap index limiti
+        """
+        self._manager = manager
+        self._page_cache = page_cache or CrawlPageCache(timeout=timeout, manager=manager)
+        self.timeout = timeout
+        self.max_depth = max_depth
+        self.sitemaps_read: list[str] = []
+
+    async def iter_entries(
+        self, domain: str, since: datetime | None = None
+    ) -> AsyncIterator[SitemapEntry]:
+        """
+        Sitenin sitemap URL'lerini tembel olarak uretir (tekrarsiz).
+
+        Args:
+            domain: "https://shop.com" formatinda site koku
+            since: Verilirse sadece bu tarihten sonra degisen kayitlar
+
+        Yields:
+            SitemapEntry (url + lastmod)
+        """
+        since = _as_utc(since)
+        documents = await self._find_sitemaps(domain)
+        visited = set(documents)
+        seen: set[str] = set()
+        # Ayni anda tek sitemap akisi acik tutulur (domain slotlarini tuketmesin)
+        try:
+            for sitemap_url in list(documents):
+                # Yoklamada acilmis akis varsa tekrar indirilmez
+                document = documents.pop(sitemap_url) or await self._open(sitemap_url)
+                if document is None:
+                    continue
+                async with aclosing(self._walk(document, since, 0, visited)) as entries:
+                    async for entry in entries:
+                        if entry.url not in seen:
+                            seen.add(entry.url)
+                            yield entry
+        finally:
+            # Erken birakilirsa okunmamis yoklama akislari kapatilir
+            for document in documents.values():
+                if document is not None:
+                    await document.aclose()
+
+    async def _find_sitemaps(self, domain: str) -> dict[str, _SitemapDocument | None]:
+        """
+        Okunacak sitemap'leri bulur.
+
+        robots.txt yetkili kaynaktir: `Sitemap:` satirlari varsa aday yollar
+        hic yoklanmaz. Yoksa varsayilan yollar eszamanli yoklanir.
+
+        Returns:
+            Sitemap URL'i -> yoklamada acilmis akis (yoksa None; okunurken acilir)
+        """
+        robots_urls = await self._robots_sitemaps(domain)
+        if robots_urls:
+            return dict.fromkeys(robots_urls)
+        return await self._probe_candidates([f"{domain}{path}" for path in DEFAULT_SITEMAP_PATHS])
+
+    async def _probe_candidates(self, candidates: list[str]) -> dict[str, _SitemapDocument | None]:
+        """
+        Adaylari eszamanli yoklar; oncelik sirasindaki ilk gecerli olan secilir.
+
+        Secilen adayin akisi acik birakilir ve okumada kullanilir (ikinci kez
+        indirilmez). Daha oncelikli bir aday henuz sonuclanmamisken gecerli
+        cikan aday domain slotu tutmasin diye kapatilir; secilirse yeniden
+        acilir.
+        """
+        invalid: set[int] = set()
+
+        async def probe(index: int) -> _SitemapDocument | bool:
+            document = await self._open(candidates[index])
+            if document is None:
+                invalid.add(index)
+                return False
+            if invalid.issuperset(range(index)):
+                return document
+            await document.aclose()
+            return True
+
+        tasks = [asyncio.create_task(probe(index)) for index in range(len(candidates))]
+        try:
+            for url, task in zip(candidates, tasks, strict=True):
+                result = await task
+                if result is not False:
+                    return {url: result if isinstance(result, _SitemapDocument) else None}
+            return {}
+        finally:
+            # Secilenden sonraki adaylar gerekmez (bekleyenler iptal edilir)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _robots_sitemaps(self, domain: str) -> list[str]:
+        """robots.txt'teki `Sitemap:` satirlari (sirali, tekrarsiz)."""
+        try:
+            robots = await self._page_cache.get_html(f"{domain}/robots.txt", timeout=10)
+        except Exception:
+            return []
+        if not robots:
+            return []
+        return list(dict.fromkeys(_ROBOTS_SITEMAP_RE.findall(robots)))
+
+    async def _open(self, url: str) -> _SitemapDocument | None:
+        """Sitemap'i acar; gecerli degilse None."""
+        manager = self._manager or get_session_manager()
+        document = _SitemapDocument(url, manager.stream(url, timeout=self.timeout, use_cache=True))
+        if not await document.open():
+            return None
+        return document
+
+    async def _walk(
+        self,
+        document: _SitemapDocument,
+        since: datetime | None,
+        depth: int,
+        visited: set[str],
+    ) -> AsyncIterator[SitemapEntry]:
+        """urlset kayitlarini uretir, sitemapindex'i ozyinelemeli izler."""
+        self.sitemaps_read.append(document.url)
+        async with aclosing(document.entries()) as entries:
+            if document.kind == "urlset":
+                async for entry in entries:
+                    if entry.changed_since(since):
+                        yield entry
+                return
+
+            # sitemapindex kucuktur: once alt listeyi topla, akisi kapat, sonra in
+            children = [
+                entry.url
+                async for entry in entries
+                if entry.changed_since(since) and entry.url not in visited
+            ]
+
+        if depth >= self.max_depth:
+            logger.warning("Sitemap index derinlik limiti asildi: %s", document.url)
+            return
+
+        for child_url in children:
+            if child_url in visited:
+                continue
+            visited.add(child_url)
+            child = await self._open(child_url)
+            if child is None:
+                continue
+            async with aclosing(self._walk(child, since, depth + 1, visited)) as child_entries:
+                async for entry in child_entries:
+                    yield entry
+
+
+@dataclass
+class SiteSnapshot:
+    """Bir sitenin son basarili taramasi (artimli tarama icin)."""
+
+    crawled_at: datetime
+    full_crawl_at: datetime | None  # Son tam (since'siz) tarama
+    pages: dict[str, list[ProductPrice]]  # Sayfa URL'i -> o sayfadaki urunler
+
+
+class SitemapState:
+    """
+    Domain basina son basarili tarama (zaman + sayfa bazli urunler).
+
+    Artimli taramada sadece degisen sayfalar taranir; degismeyen
+    sayfalarin urunleri buradaki snapshot'tan verilir, boylece sonuc yine
+    tam katalogdur. Kucuk bir JSON dosyasinda tutulur.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._data: dict[str, Any] = {}
+        if self.path.exists():
+            try:
+                self._data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                self._data = {}
+
+    def last_crawl(self, domain: str) -> datetime | None:
+        """Domain'in son tarama zamani."""
+        record = self._data.get(domain)
+        # Eski format: sadece zaman damgasi
+        value = record.get("crawled_at") if isinstance(record, dict) else record
+        return parse_lastmod(value) if value else None
+
+    def snapshot(self, domain: str) -> SiteSnapshot | None:
+        """
+        Son taramanin sayfa snapshot'i.
+
+        Sayfa bilgisi olmayan kayitlar (eski format) icin None doner; bu
+        durumda tam tarama yapilmalidir. Her cagri yeni ProductPrice
+        objeleri uretir.
+        """
+        record = self._data.get(domain)
+        if not isinstance(record, dict) or not record.get("pages"):
+            return None
+        crawled_at = parse_lastmod(record.get("crawled_at"))
+        if crawled_at is None:
+            return None
+        return SiteSnapshot(
+            crawled_at=crawled_at,
+            full_crawl_at=parse_lastmod(record.get("full_crawl_at")),
+            pages={
+                url: [ProductPrice(**p) for p in products]
+                for url, products in record["pages"].items()
+            },
+        )
+
+    def mark_crawled(
+        self,
+        domain: str,
+        when: datetime,
+        pages: dict[str, list[ProductPrice]] | None = None,
+        full: bool = True,
+    ) -> None:
+        """
+        Taramayi kaydeder (atomik yazim).
+
+        Args:
+            domain: Site koku
+            when: Taramanin baslangic zamani
+            pages: Sayfa URL'i -> urunler (artimli taramada tasinanlar dahil)
+            full: Tam tarama mi (since'siz); degilse onceki tam tarama zamani korunur
+        """
+        with self._lock:
+            previous = self._data.get(domain)
+            full_crawl_at = _as_utc(when).isoformat() if full else None
+            if not full and isinstance(previous, dict):
+                full_crawl_at = previous.get("full_crawl_at")
+            self._data[domain] = {
+                "crawled_at": _as_utc(when).isoformat(),
+                "full_crawl_at": full_crawl_at,
+                "pages": {
+                    url: [asdict(p) for p in products] for url, products in (pages or {}).items()
+                },
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
+            tmp_path.replace(self.path)
+
+
+_sitemap_state: SitemapState | None = None
+
+
+def get_sitemap_state() -> SitemapState | None:
+    """
+    Paylasilan SitemapState'i dondurur.
+
+    FEATURE_INCREMENTAL_SITEMAP kapaliysa None doner.
+    """
+    global _sitemap_state
+    if _sitemap_state is None:
+        from sade_agents.config import get_settings
+
+        settings = get_settings()
+        if not settings.feature_incremental_sitemap:
+            return None
+        _sitemap_state = SitemapState(settings.get_cache_dir() / "sitemap_state.json")
+    return _sitemap_state
+
+
+__all__ = [
+    "SitemapEntry",
+    "SitemapReader",
+    "SitemapState",
+    "SiteSnapshot",
+    "get_sitemap_state",
+    "parse_lastmod",
+]
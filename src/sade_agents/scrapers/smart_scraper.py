@@ -13,16 +13,44 @@ MAKSİMUM BECERİ PRENSİBİ:
 
 import asyncio
 import json
-from dataclasses import dataclass, field
+import logging
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urljoin, urlparse
 
-import aiohttp
-from bs4 import BeautifulSoup
-from openai import OpenAI
-
 from sade_agents.config import get_settings
-from sade_agents.scrapers.ai_scraper import AIScraper, ScrapingTarget
-from sade_agents.scrapers.base import ProductPrice, ScraperResult
+from sade_agents.scrapers.ai_scraper import (
+    EXTRACTION_PROMPT_VERSION,
+    ScrapingTarget,
+    create_ai_scraper_from_settings,
+)
+from sade_agents.scrapers.base import (
+    PAGE_EVENT,
+    TARGET_EVENT,
+    ProductPrice,
+    ScrapeEvent,
+    ScraperResult,
+)
+from sade_agents.scrapers.fingerprint import get_fingerprint_store, page_fingerprint, product_id
+from sade_agents.scrapers.frontier import CrawlFrontier, FrontierPage, crawl, extract_links
+from sade_agents.scrapers.http_session import get_session_manager
+from sade_agents.scrapers.page_cache import CrawlPageCache
+from sade_agents.scrapers.product_identity import deduplicate_products
+from sade_agents.scrapers.resilience import get_resilience
+from sade_agents.scrapers.sitemap import SitemapReader, SiteSnapshot, get_sitemap_state
+from sade_agents.scrapers.url_classifier import UrlClassifier
+
+logger = logging.getLogger(__name__)
+
+# Sitemap'ten alinacak maksimum aday URL
+SITEMAP_MAX_URLS = 500
+
+# Taranan sayfadan bulunan linklerin guveni (ebeveyn guveni ile carpilir)
+PAGINATION_CONFIDENCE_DECAY = 0.95
+SUBCATEGORY_CONFIDENCE_DECAY = 0.8
 
 
 @dataclass
@@ -43,6 +71,7 @@ class SiteDiscoveryResult:
     product_pages: list[DiscoveredPage] = field(default_factory=list)
     category_pages: list[DiscoveredPage] = field(default_factory=list)
     discovery_method: str = ""  # sitemap, menu, links, ai
+    up_to_date: bool = False  # Artimli tarama: sitemap'te degisen urun sayfasi yok
 
 
 class SmartScraper:
@@ -82,9 +111,16 @@ class SmartScraper:
 
     def __init__(self) -> None:
         self._settings = get_settings()
-        self._client = OpenAI(api_key=self._settings.openai_api_key)
-        self._ai_scraper = AIScraper()
-        self._visited_urls: set[str] = set()
+        # Kesif ve urun cikarma ayni LLM concurrency limitini paylasir
+        self._ai_scraper = create_ai_scraper_from_settings()
+        # Kesif cagrilari AIScraper.complete ile ayni istemciden gider
+        self._client = self._ai_scraper._client
+        # Artimli sitemap taramasi (kapaliysa None)
+        self._sitemap_state = get_sitemap_state()
+        # Sayfa parmak izleri: degismeyen sayfalar cikarilmaz (kapaliysa None)
+        self._fingerprints = get_fingerprint_store()
+        # Derlenmis URL siniflandirici (hedefe ozel pattern'ler domain bazli)
+        self._url_classifier = UrlClassifier(self.PRODUCT_URL_PATTERNS, self.SKIP_URL_PATTERNS)
 
     async def scrape_site(self, target: ScrapingTarget) -> ScraperResult:
         """
@@ -92,7 +128,9 @@ class SmartScraper:
 
         1. Siteyi kesfet (sitemap, menu, linkler)
         2. Urun sayfalarini bul
-        3. Her birini tara
+        3. Her birini tara (icerigi degismeyenler snapshot'tan); sayfalama
+           ve alt kategori linkleri sayfa butcesi/derinlik siniri icinde
+           takip edilir
         4. Sonuclari birlestir
 
         Args:
@@ -101,73 +139,287 @@ class SmartScraper:
         Returns:
             Tum urunleri iceren ScraperResult
         """
-        self._visited_urls.clear()
+        result = None
+        async for event in self.scrape_site_stream(target):
+            result = event.result
+        return result
+
+    async def scrape_site_stream(self, target: ScrapingTarget) -> AsyncIterator[ScrapeEvent]:
+        """
+        scrape_site'in akisli hali.
+
+        Her sayfa tamamlandikca bir sayfa olayi (PAGE_EVENT), en sonda
+        birlesik sonucla bir hedef olayi (TARGET_EVENT) uretir. Yeni
+        sayfalar kesfedildikce pages_total buyuyebilir. Akis erken
+        birakilirsa bekleyen sayfa task'lari iptal edilir.
+
+        Args:
+            target: Scraping hedefi (ana URL)
+        """
+        self._url_classifier.set_domain_patterns(
+            target.url, target.product_url_patterns, target.skip_url_patterns
+        )
         all_products: list[ProductPrice] = []
         errors: list[str] = []
+        pages: list[FrontierPage] = []
+
+        # Tarama boyunca her URL tek kez indirilir ve parse edilir
+        page_cache = CrawlPageCache()
+
+        # Artimli tarama: son taramadan beri degisen sitemap URL'leri taranir,
+        # degismeyen sayfalarin urunleri onceki taramanin snapshot'indan gelir
+        parsed_url = urlparse(target.url)
+        domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        crawl_started = datetime.now(timezone.utc)
+        previous = self._previous_crawl(domain, crawl_started)
+        since = previous.crawled_at if previous is not None else None
 
         try:
             # 1. Siteyi kesfet
-            discovery = await self._discover_site(target.url)
+            discovery = await self._discover_site(target.url, page_cache, since=since)
 
             # 2. Taranacak sayfalari belirle
             pages_to_scrape = self._prioritize_pages(discovery)
 
-            if not pages_to_scrape:
+            if not pages_to_scrape and not discovery.up_to_date:
                 # Kesif basarisiz, en azindan ana sayfayi tara
                 pages_to_scrape = [DiscoveredPage(
                     url=target.url,
                     page_type="unknown",
                     confidence=0.5,
                 )]
+            # 3. Sinir kuyrugu: once kesfedilenler (oncelik sirasiyla), sonra
+            # taranan sayfalardaki sayfalama ve alt kategori linkleri
+            frontier = CrawlFrontier(
+                max_pages=self._settings.scraping_max_pages_per_site,
+                max_depth=self._settings.scraping_max_crawl_depth,
+            )
+            for page in pages_to_scrape:
+                frontier.push(page.url, page.page_type, page.confidence)
+            pages = frontier.pages
 
-            # 3. Her sayfayi tara (paralel)
-            scrape_tasks = []
-            for page in pages_to_scrape[:10]:  # Max 10 sayfa (token limiti)
+            async def visit(page: FrontierPage) -> ScraperResult:
                 page_target = ScrapingTarget(
                     name=f"{target.name}_{urlparse(page.url).path.replace('/', '_')}",
                     url=page.url,
                     description=target.description,
                 )
-                scrape_tasks.append(self._ai_scraper.scrape(page_target))
-
-            results = await asyncio.gather(*scrape_tasks, return_exceptions=True)
+                result = await self._scrape_page(page_target, page_cache)
+                self._expand_frontier(frontier, page, page_cache)
+                return result
 
-            # 4. Sonuclari birlestir
-            for page, result in zip(pages_to_scrape, results):
-                if isinstance(result, Exception):
+            # Sayfalar sabit sayida worker ile taranir, tamamlandikca uretilir
+            results: dict[int, ScraperResult | BaseException] = {}
+            crawler = crawl(frontier, visit, workers=self._settings.scraping_crawl_workers)
+            try:
+                async for page, result in crawler:
+                    results[page.index] = result
+                    if isinstance(result, BaseException):
+                        result = ScraperResult(
+                            source=target.name, success=False, products=[], error=str(result)
+                        )
+                    yield ScrapeEvent(
+                        kind=PAGE_EVENT,
+                        source=target.name,
+                        result=result,
+                        url=page.url,
+                        pages_done=len(results),
+                        pages_total=frontier.admitted,
+                    )
+            finally:
+                await crawler.aclose()
+
+            # 4. Sonuclari birlestir (sayfa onceligi sirasiyla)
+            method_counts: Counter[str] = Counter()
+            pages_skipped = 0
+            page_products: dict[str, list[ProductPrice]] = {}
+            for page in pages:
+                result = results[page.index]
+                if isinstance(result, BaseException):
                     errors.append(f"{page.url}: {str(result)}")
-                elif result.success and result.products:
+                    continue
+                pages_skipped += result.pages_skipped
+                if result.success and result.extraction_method and not result.pages_skipped:
+                    method_counts[result.extraction_method] += 1
+                if result.success:
+                    page_products[page.url] = result.products
+                if result.success and result.products:
                     all_products.extend(result.products)
                 elif result.error:
                     errors.append(f"{page.url}: {result.error}")
 
-            # 5. Tekrar eden urunleri kaldir (isim bazli)
+            # Bu taramada basariyla taranmayan onceki sayfalar snapshot'tan
+            if previous is not None:
+                carried = 0
+                for url, products in previous.pages.items():
+                    if url not in page_products:
+                        page_products[url] = products
+                        all_products.extend(products)
+                        carried += 1
+                pages_skipped += carried
+                logger.info(
+                    "%s: artimli tarama, %d sayfa tarandi, %d sayfa onceki taramadan",
+                    target.name,
+                    len(pages),
+                    carried,
+                )
+
+            if method_counts or pages_skipped:
+                logger.info(
+                    "%s: %d sayfa yapisal veriden, %d sayfa LLM ile cikarildi, "
+                    "%d sayfa degismedigi icin atlandi",
+                    target.name,
+                    method_counts["structured"],
+                    method_counts["llm"],
+                    pages_skipped,
+                )
+
+            # 5. Tekrar eden urunleri kaldir (bulanik isim + gramaj eslestirme)
             unique_products = self._deduplicate_products(all_products)
 
             # Basari durumunu belirle
             success = len(unique_products) > 0
+            if success and self._sitemap_state is not None:
+                self._sitemap_state.mark_crawled(
+                    domain, crawl_started, pages=page_products, full=previous is None
+                )
             error_msg = None
             if not success:
-                error_msg = f"Urun bulunamadi. Denenen sayfalar: {len(pages_to_scrape)}. "
+                error_msg = f"Urun bulunamadi. Denenen sayfalar: {len(pages)}. "
                 if errors:
                     error_msg += f"Hatalar: {'; '.join(errors[:3])}"
 
-            return ScraperResult(
+            site_result = ScraperResult(
                 source=target.name,
                 success=success,
                 products=unique_products,
                 error=error_msg,
+                extraction_method=self._merge_extraction_methods(method_counts, pages_skipped),
+                pages_skipped=pages_skipped,
             )
 
         except Exception as e:
-            return ScraperResult(
+            site_result = ScraperResult(
                 source=target.name,
                 success=False,
                 products=[],
                 error=f"Site tarama hatasi: {str(e)}",
             )
 
-    async def _discover_site(self, base_url: str) -> SiteDiscoveryResult:
+        yield ScrapeEvent(
+            kind=TARGET_EVENT,
+            source=target.name,
+            result=site_result,
+            targets_done=1,
+            targets_total=1,
+            pages_done=len(pages),
+            pages_total=len(pages),
+        )
+
+    def _previous_crawl(self, domain: str, now: datetime) -> SiteSnapshot | None:
+        """
+        Artimli taramanin dayanacagi onceki tarama (yoksa tam tarama).
+
+        Sayfa snapshot'i olmayan veya son tam taramasi
+        scraping_sitemap_full_crawl_hours'tan eski siteler tam taranir
+        (sitemap'ten kaldirilan sayfalarin urunleri boylece duser).
+        """
+        if self._sitemap_state is None:
+            return None
+        snapshot = self._sitemap_state.snapshot(domain)
+        if snapshot is None or snapshot.full_crawl_at is None:
+            return None
+        max_age = timedelta(hours=self._settings.scraping_sitemap_full_crawl_hours)
+        if now - snapshot.full_crawl_at > max_age:
+            logger.info("%s: periyodik tam tarama", domain)
+            return None
+        return snapshot
+
+    async def _scrape_page(
+        self, page_target: ScrapingTarget, page_cache: CrawlPageCache
+    ) -> ScraperResult:
+        """
+        Tek sayfayi tarar; parmak izi degismediyse son snapshot'i dondurur.
+
+        Sayfa yine indirilir (conditional GET ile genelde 304), ama yapisal
+        veri ve LLM cikarimi atlanir. Atlanan sayfada pages_skipped=1 olur.
+        """
+        if self._fingerprints is None:
+            return await self._ai_scraper.scrape(page_target, page_cache=page_cache)
+
+        url = page_target.url
+        response = await page_cache.fetch(url)
+        text = await page_cache.get_text(url) if response.status == 200 else None
+        if text is None:
+            return await self._ai_scraper.scrape(page_target, page_cache=page_cache)
+
+        fingerprint = page_fingerprint(
+            text,
+            EXTRACTION_PROMPT_VERSION,
+            self._settings.openai_model_name,
+            page_target.description,
+        )
+        snapshot = self._fingerprints.get(url)
+        if snapshot is not None and snapshot.fingerprint == fingerprint:
+            return ScraperResult(
+                source=page_target.name,
+                success=True,
+                products=snapshot.products,
+                extraction_method=snapshot.extraction_method,
+                pages_skipped=1,
+            )
+
+        result = await self._ai_scraper.scrape(page_target, page_cache=page_cache)
+        if result.success:
+            if snapshot is not None:
+                old_ids = set(snapshot.product_ids)
+                new_ids = {product_id(p) for p in result.products}
+                logger.info(
+                    "%s degisti: %d yeni, %d kaldirilan urun",
+                    url,
+                    len(new_ids - old_ids),
+                    len(old_ids - new_ids),
+                )
+            self._fingerprints.put(url, fingerprint, result.products, result.extraction_method)
+        return result
+
+    def _expand_frontier(
+        self, frontier: CrawlFrontier, page: FrontierPage, page_cache: CrawlPageCache
+    ) -> None:
+        """
+        Taranan sayfanin sayfalama ve alt kategori linklerini kuyruga ekler.
+
+        Sadece tarama sirasinda zaten parse edilmis DOM kullanilir (ek istek
+        yok). Sayfalama ayni derinlikte kalir; alt kategori bir seviye
+        derine iner.
+        """
+        if frontier.full:
+            return
+        soup = page_cache.peek_soup(page.url)
+        if soup is None:
+            return
+
+        links = extract_links(soup, page.url)
+        for url in links.pagination:
+            frontier.push(
+                url, page.page_type, page.confidence * PAGINATION_CONFIDENCE_DECAY, page.depth
+            )
+        for url, _text in links.links:
+            verdict = self._url_classifier.classify(url)
+            if not verdict.skip and verdict.page_type in ("product_list", "category"):
+                frontier.push(
+                    url,
+                    verdict.page_type,
+                    page.confidence * SUBCATEGORY_CONFIDENCE_DECAY,
+                    page.depth + 1,
+                )
+
+    async def _discover_site(
+        self,
+        base_url: str,
+        page_cache: CrawlPageCache | None = None,
+        since: datetime | None = None,
+    ) -> SiteDiscoveryResult:
         """
         Siteyi kesfeder - sitemap, menu, linkler.
 
@@ -175,18 +427,27 @@ class SmartScraper:
         1. Sitemap.xml dene
         2. Ana sayfadan menu/nav kesfet
         3. AI ile urun sayfalarini tahmin et
+
+        Args:
+            base_url: Sitenin ana URL'i
+            page_cache: Tarama bazli sayfa cache'i (None ise yenisi olusturulur)
+            since: Son tarama zamani (sitemap'ten sadece degisen sayfalar secilir)
         """
+        if page_cache is None:
+            page_cache = CrawlPageCache()
+
         result = SiteDiscoveryResult(base_url=base_url)
         parsed = urlparse(base_url)
         domain = f"{parsed.scheme}://{parsed.netloc}"
 
         # 1. Sitemap dene
-        sitemap_pages = await self._try_sitemap(domain)
-        if sitemap_pages:
+        sitemap_pages = await self._try_sitemap(domain, page_cache, since=since)
+        if sitemap_pages is not None:
             result.sitemap_found = True
             result.discovery_method = "sitemap"
-            for url in sitemap_pages:
-                page_type = self._guess_page_type(url)
+            verdicts = self._url_classifier.classify_many(sitemap_pages)
+            for url, verdict in zip(sitemap_pages, verdicts):
+                page_type = verdict.page_type
                 if page_type in ("product_list", "category"):
                     result.product_pages.append(DiscoveredPage(
                         url=url,
@@ -195,9 +456,13 @@ class SmartScraper:
                     ))
             if result.product_pages:
                 return result
+            if since is not None:
+                # Artimli tarama: degisen urun sayfasi yok, menuye dusulmez
+                result.up_to_date = True
+                return result
 
         # 2. Ana sayfadan menu/navigation kesfet
-        menu_pages = await self._discover_from_menu(base_url)
+        menu_pages = await self._discover_from_menu(base_url, page_cache)
         if menu_pages:
             result.discovery_method = "menu"
             result.product_pages.extend(menu_pages)
@@ -205,68 +470,71 @@ class SmartScraper:
                 return result
 
         # 3. AI ile sayfa linklerini analiz et
-        ai_pages = await self._discover_with_ai(base_url)
+        ai_pages = await self._discover_with_ai(base_url, page_cache)
         if ai_pages:
             result.discovery_method = "ai"
             result.product_pages.extend(ai_pages)
 
         return result
 
-    async def _try_sitemap(self, domain: str) -> list[str]:
-        """Sitemap.xml'den URL'leri ceker."""
-        sitemap_urls = [
-            f"{domain}/sitemap.xml",
-            f"{domain}/sitemap_index.xml",
-            f"{domain}/sitemap-products.xml",
-        ]
+    async def _try_sitemap(
+        self,
+        domain: str,
+        page_cache: CrawlPageCache | None = None,
+        since: datetime | None = None,
+    ) -> list[str] | None:
+        """
+        Sitemap'lerden aday URL'leri toplar (robots.txt, index'ler, .xml.gz dahil).
 
-        for sitemap_url in sitemap_urls:
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        sitemap_url,
-                        timeout=aiohttp.ClientTimeout(total=10),
-                    ) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            return self._parse_sitemap(content, domain)
-            except Exception:
-                continue
-
-        return []
-
-    def _parse_sitemap(self, content: str, domain: str) -> list[str]:
-        """Sitemap XML'ini parse eder."""
+        since verilirse sadece o tarihten sonra degisen URL'ler secilir
+        (degismeyenlerin urunleri onceki taramanin snapshot'indan gelir).
+
+        Returns:
+            URL listesi; sitemap bulunamadiysa None
+        """
+        if page_cache is None:
+            page_cache = CrawlPageCache()
+
+        reader = SitemapReader(page_cache=page_cache)
+        urls = await self._collect_sitemap_urls(reader, domain, since)
+        if not urls and not reader.sitemaps_read:
+            return None
+        if not urls and since is not None:
+            logger.info("%s: sitemap'te %s sonrasi degisiklik yok", domain, since.isoformat())
+        return urls
+
+    async def _collect_sitemap_urls(
+        self, reader: SitemapReader, domain: str, since: datetime | None = None
+    ) -> list[str]:
+        """Sitemap kayitlarini akis halinde filtreler (limit dolunca okuma durur)."""
         urls = []
+        entries = reader.iter_entries(domain, since=since)
         try:
-            soup = BeautifulSoup(content, "xml")
-            for loc in soup.find_all("loc"):
-                url = loc.text.strip()
+            async for entry in entries:
                 # Sadece ayni domain ve urun olabilecek sayfalar
-                if domain in url and not self._should_skip_url(url):
-                    urls.append(url)
+                if domain in entry.url and not self._should_skip_url(entry.url):
+                    urls.append(entry.url)
+                    if len(urls) >= SITEMAP_MAX_URLS:
+                        break
         except Exception:
             pass
-        return urls[:50]  # Max 50 URL
+        finally:
+            await entries.aclose()
+        return urls
 
-    async def _discover_from_menu(self, base_url: str) -> list[DiscoveredPage]:
+    async def _discover_from_menu(
+        self, base_url: str, page_cache: CrawlPageCache | None = None
+    ) -> list[DiscoveredPage]:
         """Ana sayfadaki menu/navigation'dan urun sayfalarini bulur."""
+        if page_cache is None:
+            page_cache = CrawlPageCache()
+
         pages = []
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                }
-                async with session.get(
-                    base_url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as response:
-                    if response.status != 200:
-                        return pages
-                    html = await response.text()
-
-            soup = BeautifulSoup(html, "html.parser")
+            soup = await page_cache.get_soup(base_url)
+            if soup is None:
+                return pages
+
             parsed_base = urlparse(base_url)
             domain = f"{parsed_base.scheme}://{parsed_base.netloc}"
 
@@ -324,25 +592,20 @@ class SmartScraper:
 
         return pages
 
-    async def _discover_with_ai(self, base_url: str) -> list[DiscoveredPage]:
+    async def _discover_with_ai(
+        self, base_url: str, page_cache: CrawlPageCache | None = None
+    ) -> list[DiscoveredPage]:
         """AI kullanarak urun sayfalarini kesfeder."""
+        if page_cache is None:
+            page_cache = CrawlPageCache()
+
         pages = []
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                }
-                async with session.get(
-                    base_url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as response:
-                    if response.status != 200:
-                        return pages
-                    html = await response.text()
-
-            # HTML'den linkleri cikar
-            soup = BeautifulSoup(html, "html.parser")
+            # HTML'den linkleri cikar (ana sayfa menu kesfinde zaten indirildi)
+            soup = await page_cache.get_soup(base_url)
+            if soup is None:
+                return pages
+
             all_links = []
             parsed_base = urlparse(base_url)
 
@@ -379,17 +642,17 @@ JSON array dondur:
 Hicbir uygun sayfa yoksa bos array dondur: []
 """
 
-            response = self._client.chat.completions.create(
-                model=self._settings.openai_model_name,
-                messages=[
-                    {"role": "system", "content": "Sen bir web scraping asistanisin. Sadece JSON dondur."},
+            # Kesif ve urun cikarma ayni LLM limitini ve devre kesiciyi paylasir
+            content = await self._ai_scraper.complete(
+                [
+                    {
+                        "role": "system",
+                        "content": "Sen bir web scraping asistanisin. Sadece JSON dondur.",
+                    },
                     {"role": "user", "content": prompt},
                 ],
-                temperature=0,
                 max_tokens=1000,
             )
-
-            content = response.choices[0].message.content or "[]"
             content = content.strip()
             if content.startswith("```"):
                 content = content.split("```")[1]
@@ -413,21 +676,11 @@ Hicbir uygun sayfa yoksa bos array dondur: []
 
     def _guess_page_type(self, url: str) -> str:
         """URL'den sayfa tipini tahmin eder."""
-        url_lower = url.lower()
-
-        for pattern in self.PRODUCT_URL_PATTERNS:
-            if pattern in url_lower:
-                return "product_list"
-
-        return "other"
+        return self._url_classifier.classify(url).page_type
 
     def _should_skip_url(self, url: str) -> bool:
         """Bu URL atlanmali mi?"""
-        url_lower = url.lower()
-        for pattern in self.SKIP_URL_PATTERNS:
-            if pattern in url_lower:
-                return True
-        return False
+        return self._url_classifier.classify(url).skip
 
     def _prioritize_pages(self, discovery: SiteDiscoveryResult) -> list[DiscoveredPage]:
         """Sayfalari oncelik sirasina gore siralar."""
@@ -446,17 +699,19 @@ Hicbir uygun sayfa yoksa bos array dondur: []
 
         return unique_pages
 
+    def _merge_extraction_methods(
+        self, method_counts: Counter[str], pages_skipped: int = 0
+    ) -> str | None:
+        """Sayfa bazli cikarma yollarini tek etikete indirger."""
+        if not method_counts:
+            return "unchanged" if pages_skipped else None
+        if len(method_counts) == 1:
+            return next(iter(method_counts))
+        return "mixed"
+
     def _deduplicate_products(self, products: list[ProductPrice]) -> list[ProductPrice]:
-        """Tekrar eden urunleri kaldirir (isim bazli)."""
-        seen_names = set()
-        unique = []
-        for p in products:
-            # Normalize isim (kucuk harf, bosluk temizle)
-            normalized = p.name.lower().strip()
-            if normalized not in seen_names:
-                seen_names.add(normalized)
-                unique.append(p)
-        return unique
+        """Tekrar eden urunleri kaldirir (Turkce duyarli bulanik eslestirme)."""
+        return deduplicate_products(products)
 
 
 async def smart_scrape_all(tenant_id: str = "default") -> dict[str, ScraperResult]:
@@ -487,9 +742,41 @@ async def smart_scrape_all(tenant_id: str = "default") -> dict[str, ScraperResul
             error="Scraping hedefi tanimlanmamis. UI'dan veya scraping_targets.json'dan rakip ekleyin.",
         )}
 
+    manager = get_session_manager()
+    stats_before = manager.stats
+    scheduler_before = manager.scheduler.metrics() if manager.scheduler else None
+
+    # Tarama boyunca tekrar denemeler tek butceyi paylasir
+    resilience = get_resilience()
+    budget_scope = resilience.failure_budget() if resilience else nullcontext()
     scraper = SmartScraper()
     tasks = [scraper.scrape_site(target) for target in targets]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    with budget_scope:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    run_stats = manager.stats.since(stats_before)
+    logger.info(
+        "Smart scrape tamamlandi: %d istek, %d yeni baglanti, %d tekrar kullanilan baglanti",
+        run_stats.requests,
+        run_stats.connections_created,
+        run_stats.connections_reused,
+    )
+    if manager.scheduler:
+        manager.scheduler.log_metrics(since=scheduler_before)
+    if resilience and resilience.open_circuits():
+        logger.warning("Acik devreler: %s", ", ".join(resilience.open_circuits()))
+    pages_skipped = sum(r.pages_skipped for r in results if isinstance(r, ScraperResult))
+    if pages_skipped:
+        logger.info("Icerigi degismeyen %d sayfa snapshot'tan verildi", pages_skipped)
+
+    # Fiyat gecmisine yaz (FEATURE_PRICE_HISTORY)
+    from sade_agents.storage.price_history import get_price_history
+
+    price_history = get_price_history()
+    if price_history is not None:
+        scraped = [r for r in results if isinstance(r, ScraperResult)]
+        rows = price_history.record_many(scraped, tenant_id=tenant_id)
+        logger.info("Fiyat gecmisine %d satir eklendi", rows)
 
     output = {}
     for target, result in zip(targets, results, strict=False):
@@ -504,3 +791,113 @@ async def smart_scrape_all(tenant_id: str = "default") -> dict[str, ScraperResul
             output[target.name] = result
 
     return output
+
+
+async def smart_scrape_stream(tenant_id: str = "default") -> AsyncIterator[ScrapeEvent]:
+    """
+    smart_scrape_all'in akisli hali.
+
+    Hedefler paralel taranir; her sayfa ve her hedef tamamlandikca bir
+    ScrapeEvent uretilir. Hizli rakiplerin sonuclari yavas olanlar
+    beklenmeden islenebilir. Sayaclar tum tarama icindir (targets_done,
+    pages_done/pages_total).
+
+    Hedef sonuclari tamamlandikca fiyat gecmisine yazilir
+    (FEATURE_PRICE_HISTORY).
+
+    Args:
+        tenant_id: Tenant kimlik
+
+    Yields:
+        ScrapeEvent (PAGE_EVENT / TARGET_EVENT)
+    """
+    from sade_agents.scrapers.ai_scraper import load_targets_from_config
+    from sade_agents.storage.price_history import get_price_history
+
+    targets = load_targets_from_config(tenant_id)
+
+    if not targets:
+        yield ScrapeEvent(
+            kind=TARGET_EVENT,
+            source="_warning",
+            result=ScraperResult(
+                source="config",
+                success=False,
+                products=[],
+                error=(
+                    "Scraping hedefi tanimlanmamis. UI'dan veya scraping_targets.json'dan "
+                    "rakip ekleyin."
+                ),
+            ),
+        )
+        return
+
+    manager = get_session_manager()
+    stats_before = manager.stats
+    scheduler_before = manager.scheduler.metrics() if manager.scheduler else None
+    price_history = get_price_history()
+
+    scraper = SmartScraper()
+    queue: asyncio.Queue[ScrapeEvent] = asyncio.Queue()
+
+    async def pump(target: ScrapingTarget) -> None:
+        try:
+            async for event in scraper.scrape_site_stream(target):
+                await queue.put(event)
+        except Exception as e:
+            await queue.put(
+                ScrapeEvent(
+                    kind=TARGET_EVENT,
+                    source=target.name,
+                    result=ScraperResult(
+                        source=target.name, success=False, products=[], error=str(e)
+                    ),
+                )
+            )
+
+    # Tarama boyunca tekrar denemeler tek butceyi paylasir (task'lar
+    # olusturulurken butceyi context'ten devralir)
+    resilience = get_resilience()
+    with resilience.failure_budget() if resilience else nullcontext() as budget:
+        tasks = [asyncio.create_task(pump(target)) for target in targets]
+
+    page_totals: dict[str, int] = {}
+    pages_done = targets_done = pages_skipped = 0
+    try:
+        while targets_done < len(targets):
+            event = await queue.get()
+            if event.is_final:
+                targets_done += 1
+                page_totals[event.source] = event.pages_total
+                pages_skipped += event.result.pages_skipped
+                if price_history is not None:
+                    price_history.record(event.result, tenant_id=tenant_id)
+            else:
+                pages_done += 1
+                page_totals[event.source] = event.pages_total
+            yield replace(
+                event,
+                targets_done=targets_done,
+                targets_total=len(targets),
+                pages_done=pages_done,
+                pages_total=sum(page_totals.values()),
+            )
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    run_stats = manager.stats.since(stats_before)
+    logger.info(
+        "Smart scrape tamamlandi: %d istek, %d yeni baglanti, %d tekrar kullanilan baglanti",
+        run_stats.requests,
+        run_stats.connections_created,
+        run_stats.connections_reused,
+    )
+    if manager.scheduler:
+        manager.scheduler.log_metrics(since=scheduler_before)
+    if budget is not None and budget.exhausted:
+        logger.warning("Tekrar deneme butcesi tukendi (%d)", budget.limit)
+    if resilience and resilience.open_circuits():
+        logger.warning("Acik devreler: %s", ", ".join(resilience.open_circuits()))
+    if pages_skipped:
+        logger.info("Icerigi degismeyen %d sayfa snapshot'tan verildi", pages_skipped)
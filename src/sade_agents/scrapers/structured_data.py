@@ -0,0 +1,297 @@
+"""
+Sade Agents - Yapisal Veri (JSON-LD, Microdata, OpenGraph) Cikarici.
+
+Turk e-ticaret sitelerinin cogu schema.org Product/Offer JSON-LD'si veya
+urun meta etiketleri gomer. Bu veriler deterministik olarak parse edilir;
+yeterli urun ve fiyat bulunursa LLM cagrisina gerek kalmaz.
+
+Desteklenen kaynaklar:
+- <script type="application/ld+json">: Product, ItemList, @graph
+- Microdata: itemtype="schema.org/Product" + itemprop="offers"
+- OpenGraph: og:title + product:price:amount
+"""
+
+import json
+from typing import Any, Iterator
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Tag
+
+from sade_agents.scrapers.base import ProductPrice, parse_price, parse_weight
+
+# TL disi para birimli teklifler atlanir
+_ACCEPTED_CURRENCIES = {"TRY", "TL", "YTL"}
+
+# JSON-LD ic ice yapilarda guvenlik siniri
+_MAX_DEPTH = 8
+
+
+def extract_structured_products(
+    soup: BeautifulSoup, page_url: str | None = None
+) -> list[ProductPrice]:
+    """
+    Sayfadaki yapisal verilerden urun listesi cikarir.
+
+    Args:
+        soup: Parse edilmis sayfa (DEGISTIRILMEZ)
+        page_url: Goreli urun URL'lerini tamamlamak icin sayfa URL'i
+
+    Returns:
+        Fiyati olan urunler (isim+fiyat bazinda tekil)
+    """
+    products: list[ProductPrice] = []
+    products.extend(_from_json_ld(soup, page_url))
+    products.extend(_from_microdata(soup, page_url))
+    if not products:
+        # OpenGraph tek urunu tarif eder, diger kaynaklar yoksa kullan
+        products.extend(_from_opengraph(soup, page_url))
+
+    seen: set[tuple[str, float]] = set()
+    unique = []
+    for product in products:
+        key = (product.name.lower().strip(), product.price_tl)
+        if key not in seen:
+            seen.add(key)
+            unique.append(product)
+    return unique
+
+
+# ============================================================================
+# JSON-LD
+# ============================================================================
+
+
+def _from_json_ld(soup: BeautifulSoup, page_url: str | None) -> list[ProductPrice]:
+    """application/ld+json bloklarindaki Product'lari cikarir."""
+    products = []
+    for script in soup.find_all("script", type="application/ld+json"):
+        raw = script.string or script.get_text()
+        if not raw or not raw.strip():
+            continue
+        try:
+            data = json.loads(raw)
+        except (json.JSONDecodeError, ValueError):
+            continue
+
+        for node in _iter_product_nodes(data):
+            product = _product_from_json_ld(node, page_url)
+            if product is not None:
+                products.append(product)
+    return products
+
+
+def _iter_product_nodes(data: Any, depth: int = 0) -> Iterator[dict]:
+    """JSON-LD agacindaki Product dugumlerini gezer (ItemList, @graph dahil)."""
+    if depth > _MAX_DEPTH:
+        return
+
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_product_nodes(item, depth + 1)
+        return
+
+    if not isinstance(data, dict):
+        return
+
+    if _has_type(data, "Product"):
+        yield data
+        return
+
+    # @graph, ItemList.itemListElement, ListItem.item
+    for key in ("@graph", "itemListElement", "item", "mainEntity"):
+        if key in data:
+            yield from _iter_product_nodes(data[key], depth + 1)
+
+
+def _has_type(node: dict, type_name: str) -> bool:
+    """@type alani verilen tipi iceriyor mu?"""
+    node_type = node.get("@type")
+    if isinstance(node_type, list):
+        return any(str(t).endswith(type_name) for t in node_type)
+    return isinstance(node_type, str) and node_type.endswith(type_name)
+
+
+def _product_from_json_ld(node: dict, page_url: str | None) -> ProductPrice | None:
+    """Tek bir JSON-LD Product dugumunu ProductPrice'a cevirir."""
+    name = node.get("name")
+    if not isinstance(name, str) or not name.strip():
+        return None
+    name = name.strip()
+
+    price = None
+    for offer in _iter_offers(node.get("offers")):
+        currency = offer.get("priceCurrency")
+        if currency and str(currency).upper() not in _ACCEPTED_CURRENCIES:
+            continue
+        price = _to_price(offer.get("price", offer.get("lowPrice")))
+        if price is None and isinstance(offer.get("priceSpecification"), dict):
+            price = _to_price(offer["priceSpecification"].get("price"))
+        if price is not None:
+            break
+    if price is None or price <= 0:
+        return None
+
+    url = node.get("url") if isinstance(node.get("url"), str) else None
+    category = node.get("category") if isinstance(node.get("category"), str) else None
+
+    return ProductPrice(
+        name=name,
+        price_tl=price,
+        weight_grams=_weight_from_node(node, name),
+        url=urljoin(page_url, url) if (url and page_url) else url,
+        category=_guess_category(f"{name} {category or ''}"),
+    )
+
+
+def _iter_offers(offers: Any) -> Iterator[dict]:
+    """Offer / AggregateOffer / liste yapilarini duzler."""
+    if isinstance(offers, list):
+        for offer in offers:
+            yield from _iter_offers(offer)
+    elif isinstance(offers, dict):
+        yield offers
+        if "offers" in offers:  # AggregateOffer icindeki teklifler
+            yield from _iter_offers(offers["offers"])
+
+
+def _weight_from_node(node: dict, name: str) -> int | None:
+    """Gramaji schema.org weight alanindan veya urun adindan cikarir."""
+    weight = node.get("weight")
+    if isinstance(weight, dict):
+        value = weight.get("value")
+        unit = str(weight.get("unitCode") or weight.get("unitText") or "g")
+        if value is not None:
+            parsed = parse_weight(f"{value} {'kg' if unit.upper() in ('KGM', 'KG') else 'g'}")
+            if parsed:
+                return parsed
+    elif isinstance(weight, str):
+        parsed = parse_weight(weight)
+        if parsed:
+            return parsed
+    return parse_weight(name)
+
+
+# ============================================================================
+# Microdata
+# ============================================================================
+
+
+def _from_microdata(soup: BeautifulSoup, page_url: str | None) -> list[ProductPrice]:
+    """itemtype=schema.org/Product elementlerini cikarir."""
+    products = []
+    for scope in soup.find_all(attrs={"itemtype": True}):
+        if not str(scope.get("itemtype", "")).rstrip("/").endswith("/Product"):
+            continue
+
+        name = _itemprop_value(scope, "name")
+        price = _to_price(_itemprop_value(scope, "price"))
+        if price is None:
+            price = _to_price(_itemprop_value(scope, "lowPrice"))
+        currency = _itemprop_value(scope, "priceCurrency")
+        if not name or price is None or price <= 0:
+            continue
+        if currency and currency.upper() not in _ACCEPTED_CURRENCIES:
+            continue
+
+        url = _itemprop_value(scope, "url")
+        products.append(
+            ProductPrice(
+                name=name,
+                price_tl=price,
+                weight_grams=parse_weight(name),
+                url=urljoin(page_url, url) if (url and page_url) else url,
+                category=_guess_category(name),
+            )
+        )
+    return products
+
+
+def _itemprop_value(scope: Tag, prop: str) -> str | None:
+    """Scope icindeki ilk itemprop degerini (content/href/metin) dondurur."""
+    element = scope.find(attrs={"itemprop": prop})
+    if element is None:
+        return None
+    for attr in ("content", "href", "src"):
+        value = element.get(attr)
+        if value:
+            return str(value).strip()
+    text = element.get_text(" ", strip=True)
+    return text or None
+
+
+# ============================================================================
+# OpenGraph
+# ============================================================================
+
+
+def _from_opengraph(soup: BeautifulSoup, page_url: str | None) -> list[ProductPrice]:
+    """og:title + product:price:amount meta etiketlerinden tek urun cikarir."""
+
+    def meta(prop: str) -> str | None:
+        element = soup.find("meta", attrs={"property": prop}) or soup.find(
+            "meta", attrs={"name": prop}
+        )
+        value = element.get("content") if element else None
+        return str(value).strip() if value else None
+
+    name = meta("og:title")
+    price = _to_price(meta("product:price:amount") or meta("og:price:amount"))
+    currency = meta("product:price:currency") or meta("og:price:currency")
+    if not name or price is None or price <= 0:
+        return []
+    if currency and currency.upper() not in _ACCEPTED_CURRENCIES:
+        return []
+
+    return [
+        ProductPrice(
+            name=name,
+            price_tl=price,
+            weight_grams=parse_weight(name),
+            url=meta("og:url") or page_url,
+            category=_guess_category(name),
+        )
+    ]
+
+
+# ============================================================================
+# Yardimcilar
+# ============================================================================
+
+
+def _to_price(value: Any) -> float | None:
+    """
+    Fiyat degerini float'a cevirir.
+
+    schema.org fiyatlari nokta ondalikli ("450.00") gelir; once dogrudan
+    float() denenir, olmazsa Turkce format (parse_price) denenir.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return parse_price(text)
+
+
+def _guess_category(text: str) -> str:
+    """Urun adina gore kategori tahmin eder (LLM kategorileriyle ayni set)."""
+    text_lower = text.lower()
+
+    if any(kw in text_lower for kw in ["truffle", "trüf", "praline", "pralin"]):
+        return "truffle"
+    if any(kw in text_lower for kw in ["draje", "badem"]):
+        return "draje"
+    if any(kw in text_lower for kw in ["kutu", "box", "hediye", "set"]):
+        return "hediye_kutu"
+    if any(kw in text_lower for kw in ["tablet", "bar"]):
+        return "tablet"
+
+    return "diger"
+
+
+__all__ = ["extract_structured_products"]
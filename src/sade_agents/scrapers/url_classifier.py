@@ -0,0 +1,167 @@
+"""
+Sade Agents - Derlenmis URL Siniflandirici.
+
+SmartScraper her URL icin ~35 pattern'i tek tek `in` ile deniyordu;
+tam okunan sitemap'ler on binlerce URL icerir. UrlClassifier:
+
+- Pattern listesini TEK regex'e derler; alternatifler ortak onekleri
+  paylasan bir trie olarak yazilir ("/ca(?:rt|tegory)"), boylece regex
+  motoru her konumda sadece ilk karakteri tutan dallari dener
+  (60k URL'de ~3x hizli)
+- Kararlari sinirli bir cache'te tutar: menu/nav linkleri taranan her
+  sayfada tekrar eder, ikinci kez siniflandirilmaz. Sitemap gibi tekil
+  URL listeleri classify_many ile cache'i doldurmadan siniflandirilir
+- Domain bazli ek pattern'leri (tenant hedef ayarlari) kabul eder;
+  derlenmis matcher pattern kumesi bazinda cache'lenir, tekrar
+  derlenmez
+
+Kullanim:
+    classifier = UrlClassifier(PRODUCT_PATTERNS, SKIP_PATTERNS)
+    classifier.set_domain_patterns("https://site.com", product=["/tatli"])
+    verdict = classifier.classify(url)  # UrlVerdict(skip, page_type)
+"""
+
+import re
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+# URL karar cache'inin boyutu (dolunca en eski kayit atilir)
+DEFAULT_CACHE_SIZE = 4096
+
+PRODUCT_LIST = "product_list"
+OTHER = "other"
+
+
+class UrlVerdict(NamedTuple):
+    """URL siniflandirma sonucu."""
+
+    skip: bool
+    page_type: str  # product_list, other
+
+
+# (skip, product) -> paylasilan sonuc objesi
+_VERDICTS = {
+    (skip, product): UrlVerdict(skip=skip, page_type=PRODUCT_LIST if product else OTHER)
+    for skip in (False, True)
+    for product in (False, True)
+}
+
+def _trie_regex(patterns: Iterable[str]) -> str:
+    """Literal pattern'leri ortak onekleri paylasan alternation'a cevirir."""
+    trie: dict = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        # Daha kisa bir pattern burada bitiyorsa devami gereksiz (`in` semantigi)
+        if "" in node:
+            return ""
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    return render(trie)
+
+
+@dataclass(frozen=True, eq=False)
+class _Matcher:
+    """Bir pattern kumesinin derlenmis hali (kimlik ile hash'lenir)."""
+
+    product: re.Pattern | None
+    skip: re.Pattern | None
+
+    def verdict(self, url: str) -> UrlVerdict:
+        lower = url.lower()
+        return _VERDICTS[(
+            self.skip is not None and self.skip.search(lower) is not None,
+            self.product is not None and self.product.search(lower) is not None,
+        )]
+
+
+@lru_cache(maxsize=64)
+def _compile(product: tuple[str, ...], skip: tuple[str, ...]) -> _Matcher:
+    """Pattern kumesini derler (ayni kume tekrar derlenmez)."""
+
+    def build(patterns: tuple[str, ...]) -> re.Pattern | None:
+        literals = sorted({p.lower() for p in patterns if p})
+        return re.compile(_trie_regex(literals)) if literals else None
+
+    return _Matcher(product=build(product), skip=build(skip))
+
+
+class UrlClassifier:
+    """
+    URL'leri urun listesi / atlanacak olarak siniflandirir.
+
+    Karar pattern'lerin URL'de (kucuk harf) alt-dizi olarak gecmesine
+    gore verilir (eski `pattern in url` davranisi).
+    """
+
+    def __init__(
+        self,
+        product_patterns: Iterable[str],
+        skip_patterns: Iterable[str],
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self.product_patterns = tuple(product_patterns)
+        self.skip_patterns = tuple(skip_patterns)
+        self.cache_size = cache_size
+        self._default = _compile(self.product_patterns, self.skip_patterns)
+        self._domains: dict[str, _Matcher] = {}
+        self._verdicts: OrderedDict[str, UrlVerdict] = OrderedDict()
+
+    def set_domain_patterns(
+        self,
+        url: str,
+        product: Iterable[str] = (),
+        skip: Iterable[str] = (),
+    ) -> None:
+        """
+        Bir domain icin varsayilanlara ek pattern'ler tanimlar.
+
+        Args:
+            url: Domain'e ait herhangi bir URL
+            product: Ek urun listesi pattern'leri
+            skip: Ek atlanacak URL pattern'leri
+        """
+        host = urlsplit(url.lower()).netloc
+        product, skip = tuple(product), tuple(skip)
+        if product or skip:
+            matcher = _compile(self.product_patterns + product, self.skip_patterns + skip)
+        else:
+            matcher = self._default
+        if self._domains.get(host, self._default) is not matcher:
+            self._domains[host] = matcher
+            self._verdicts.clear()
+
+    def classify(self, url: str) -> UrlVerdict:
+        """URL'in atlanip atlanmayacagini ve sayfa tipini dondurur (cache'li)."""
+        verdict = self._verdicts.get(url)
+        if verdict is None:
+            verdict = self._matcher(url).verdict(url)
+            if len(self._verdicts) >= self.cache_size:
+                self._verdicts.popitem(last=False)
+            self._verdicts[url] = verdict
+        return verdict
+
+    def classify_many(self, urls: Iterable[str]) -> list[UrlVerdict]:
+        """URL'leri toplu siniflandirir (cache'e yazmaz; sitemap listeleri icin)."""
+        if not self._domains:
+            verdict = self._default.verdict
+            return [verdict(url) for url in urls]
+        return [self._matcher(url).verdict(url) for url in urls]
+
+    def _matcher(self, url: str) -> _Matcher:
+        """URL'in domain'ine ait matcher (ek pattern yoksa varsayilan)."""
+        if not self._domains:
+            return self._default
+        return self._domains.get(urlsplit(url.lower()).netloc, self._default)
+
+
+__all__ = ["UrlClassifier", "UrlVerdict"]
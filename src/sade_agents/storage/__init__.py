@@ -3,6 +3,9 @@ Sade Agents - Storage modulu.
 
 Crew sonuclarini saklamak icin storage backend'leri.
 Firebase/Firestore ve in-memory fallback destegi.
+
+Fiyat gecmisi (scrape sonuclarinin zaman serisi) icin
+sade_agents.storage.price_history modulune bakin.
 """
 
 from sade_agents.storage.base import BaseStorage, CrewResult
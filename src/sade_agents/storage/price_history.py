@@ -0,0 +1,443 @@
+"""
+Sade Agents - Yerel Fiyat Gecmisi (Zaman Serisi) Deposu.
+
+Her scrape sonucu (ScraperResult) satir satir SQLite'a eklenir:
+(tenant, kaynak, urun anahtari, fiyat, gramaj, kategori, zaman).
+Fiyat trendi sorulari icin tekrar scrape etmeye gerek kalmaz.
+
+Sorgular milyonlarca satirda milisaniyede cevaplanacak sekilde
+indekslenmistir:
+- En son fiyatlar: ekleme sirasinda guncellenen latest_prices tablosu
+  (gecmis taranmaz)
+- Zaman araligi: (tenant, kaynak, urun, zaman) indeksi
+- Kategori ozetleri: ekleme sirasinda guncellenen gunluk ozet tablosu
+  (category_daily); gun sinirina denk gelmeyen araliklarda
+  (tenant, zaman, kategori, fiyat, gramaj) kapsayan indeksi
+
+Urun anahtarlari product_identity ile taramalar arasi eslestirilir.
+
+Zamanlar UTC epoch saniyesi olarak saklanir; API naive UTC datetime
+kullanir (ScraperResult.scraped_at ile ayni).
+"""
+
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sade_agents.scrapers.base import ProductPrice, ScraperResult
+from sade_agents.scrapers.product_identity import ProductIndex
+
+
+@dataclass
+class PricePoint:
+    """Bir urunun bir andaki fiyati."""
+
+    tenant_id: str
+    source: str
+    product_key: str
+    name: str
+    price_tl: float
+    weight_grams: int | None
+    category: str | None
+    scraped_at: datetime
+
+    @property
+    def price_per_gram(self) -> float | None:
+        """TL/gram (gramaj yoksa None)."""
+        if not self.weight_grams:
+            return None
+        return round(self.price_tl / self.weight_grams, 2)
+
+
+@dataclass
+class CategoryStats:
+    """Bir kategorinin fiyat ozeti."""
+
+    category: str | None
+    count: int
+    min_price: float
+    max_price: float
+    avg_price: float
+    avg_price_per_gram: float | None
+
+
+# Gunluk kategori ozeti anahtari icin gun uzunlugu (saniye)
+DAY_SECONDS = 86400
+
+_POINT_COLUMNS = (
+    "tenant_id, source, product_key, name, price_tl, weight_grams, category, scraped_at"
+)
+
+
+def _to_epoch(value: datetime) -> float:
+    """Naive (UTC kabul edilir) veya timezone'lu datetime -> epoch."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _from_epoch(value: float) -> datetime:
+    """Epoch -> naive UTC datetime."""
+    return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+
+
+def _point(row: tuple) -> PricePoint:
+    return PricePoint(*row[:7], scraped_at=_from_epoch(row[7]))
+
+
+class PriceHistoryStore:
+    """
+    SQLite tabanli fiyat gecmisi.
+
+    Kullanim:
+        store.record(result, tenant_id="default")
+        store.latest_prices(source="vakko")
+        store.price_range(source="vakko", product_key=key, start=last_month)
+        store.category_stats(start=last_week)
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path: SQLite dosya yolu (dizin yoksa olusturulur)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS price_history (
+                id INTEGER PRIMARY KEY,
+                tenant_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                product_key TEXT NOT NULL,
+                name TEXT NOT NULL,
+                price_tl REAL NOT NULL,
+                weight_grams INTEGER,
+                category TEXT,
+                scraped_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_price_history_product
+                ON price_history(tenant_id, source, product_key, scraped_at);
+            CREATE INDEX IF NOT EXISTS idx_price_history_time
+                ON price_history(tenant_id, scraped_at, category, price_tl, weight_grams);
+
+            CREATE TABLE IF NOT EXISTS latest_prices (
+                tenant_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                product_key TEXT NOT NULL,
+                name TEXT NOT NULL,
+                price_tl REAL NOT NULL,
+                weight_grams INTEGER,
+                category TEXT,
+                scraped_at REAL NOT NULL,
+                PRIMARY KEY (tenant_id, source, product_key)
+            );
+
+            -- Kategorisiz urunler '' altinda tutulur (NULL anahtar cakisma vermez)
+            CREATE TABLE IF NOT EXISTS category_daily (
+                tenant_id TEXT NOT NULL,
+                category TEXT NOT NULL,
+                day INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                sum_price REAL NOT NULL,
+                min_price REAL NOT NULL,
+                max_price REAL NOT NULL,
+                sum_price_per_gram REAL NOT NULL,
+                count_price_per_gram INTEGER NOT NULL,
+                PRIMARY KEY (tenant_id, category, day)
+            );
+            """
+        )
+        self._conn.commit()
+
+    def record(self, result: ScraperResult, tenant_id: str = "default") -> int:
+        """
+        Basarili bir scrape sonucunun urunlerini ekler.
+
+        Returns:
+            Eklenen satir sayisi
+        """
+        return self.record_many([result], tenant_id=tenant_id)
+
+    def record_many(self, results: Iterable[ScraperResult], tenant_id: str = "default") -> int:
+        """
+        Birden fazla sonucu tek transaction'da ekler (basarisizlar atlanir).
+
+        Urun anahtarlari kaynagin bilinen urunleriyle eslestirilir: onceki
+        taramada farkli yazilmis ayni urun ("Cikolata"/"Çikolata") ayni
+        anahtari alir ve gecmisi tek seride kalir.
+        """
+        indexes: dict[str, ProductIndex] = {}
+        rows = []
+        for result in results:
+            if not result.success:
+                continue
+            if result.source not in indexes:
+                indexes[result.source] = self._product_index(tenant_id, result.source)
+            index = indexes[result.source]
+            scraped_at = _to_epoch(result.scraped_at)
+            for product in result.products:
+                rows.append(
+                    (
+                        tenant_id,
+                        result.source,
+                        index.resolve(product),
+                        product.name,
+                        product.price_tl,
+                        product.weight_grams,
+                        product.category,
+                        scraped_at,
+                    )
+                )
+        if not rows:
+            return 0
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT INTO price_history ({_POINT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                # Eski bir scrape sonradan eklenirse en son fiyat ezilmez
+                self._conn.executemany(
+                    f"INSERT INTO latest_prices ({_POINT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (tenant_id, source, product_key) DO UPDATE SET "
+                    "name = excluded.name, price_tl = excluded.price_tl, "
+                    "weight_grams = excluded.weight_grams, category = excluded.category, "
+                    "scraped_at = excluded.scraped_at "
+                    "WHERE excluded.scraped_at >= latest_prices.scraped_at",
+                    rows,
+                )
+                self._conn.executemany(
+                    "INSERT INTO category_daily VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (tenant_id, category, day) DO UPDATE SET "
+                    "count = count + 1, sum_price = sum_price + excluded.sum_price, "
+                    "min_price = MIN(min_price, excluded.min_price), "
+                    "max_price = MAX(max_price, excluded.max_price), "
+                    "sum_price_per_gram = sum_price_per_gram + excluded.sum_price_per_gram, "
+                    "count_price_per_gram = count_price_per_gram + excluded.count_price_per_gram",
+                    [self._daily_row(row) for row in rows],
+                )
+        return len(rows)
+
+    def latest_prices(
+        self,
+        tenant_id: str = "default",
+        source: str | None = None,
+        category: str | None = None,
+    ) -> list[PricePoint]:
+        """Her urunun en son fiyati (kaynak ve urun adina gore sirali)."""
+        query = f"SELECT {_POINT_COLUMNS} FROM latest_prices WHERE tenant_id = ?"
+        params: list = [tenant_id]
+        if source is not None:
+            query += " AND source = ?"
+            params.append(source)
+        if category is not None:
+            query += " AND category = ?"
+            params.append(category)
+        query += " ORDER BY source, name"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [_point(row) for row in rows]
+
+    def price_range(
+        self,
+        tenant_id: str = "default",
+        source: str | None = None,
+        product_key: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[PricePoint]:
+        """
+        Zaman araligindaki fiyat noktalari (eskiden yeniye).
+
+        Args:
+            source: Sadece bu kaynak
+            product_key: Sadece bu urun (source ile birlikte verilmesi onerilir)
+            start: Dahil alt sinir
+            end: Haric ust sinir
+            limit: Maksimum satir
+        """
+        query = f"SELECT {_POINT_COLUMNS} FROM price_history WHERE tenant_id = ?"
+        params: list = [tenant_id]
+        if source is not None:
+            query += " AND source = ?"
+            params.append(source)
+        if product_key is not None:
+            query += " AND product_key = ?"
+            params.append(product_key)
+        query, params = self._time_filter(query, params, start, end)
+        query += " ORDER BY scraped_at"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [_point(row) for row in rows]
+
+    def category_stats(
+        self,
+        tenant_id: str = "default",
+        start: datetime | None = None,
+        end: datetime | None = None,
+        latest_only: bool = False,
+    ) -> list[CategoryStats]:
+        """
+        Kategori bazli fiyat ozeti.
+
+        Args:
+            start: Dahil alt sinir
+            end: Haric ust sinir
+            latest_only: Sadece urunlerin en son fiyatlari (gecmis yerine)
+        """
+        if not latest_only and self._is_day_aligned(start) and self._is_day_aligned(end):
+            return self._category_stats_daily(tenant_id, start, end)
+
+        table = "latest_prices" if latest_only else "price_history"
+        query = (
+            "SELECT category, COUNT(*), MIN(price_tl), MAX(price_tl), AVG(price_tl), "
+            "AVG(CASE WHEN weight_grams > 0 THEN price_tl / weight_grams END) "
+            f"FROM {table} WHERE tenant_id = ?"
+        )
+        params: list = [tenant_id]
+        query, params = self._time_filter(query, params, start, end)
+        query += " GROUP BY category ORDER BY category"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            CategoryStats(
+                category=row[0],
+                count=row[1],
+                min_price=row[2],
+                max_price=row[3],
+                avg_price=round(row[4], 2),
+                avg_price_per_gram=round(row[5], 2) if row[5] is not None else None,
+            )
+            for row in rows
+        ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM price_history").fetchone()[0]
+
+    def close(self) -> None:
+        """SQLite baglantisini kapatir."""
+        with self._lock:
+            self._conn.close()
+
+    def _product_index(self, tenant_id: str, source: str) -> ProductIndex:
+        """Kaynagin bilinen urunleri (latest_prices) ile kimlik indeksi."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT product_key, name, price_tl, weight_grams, category "
+                "FROM latest_prices WHERE tenant_id = ? AND source = ?",
+                (tenant_id, source),
+            ).fetchall()
+        index = ProductIndex()
+        for key, name, price, weight, category in rows:
+            index.add(
+                ProductPrice(name=name, price_tl=price, weight_grams=weight, category=category),
+                key=key,
+            )
+        return index
+
+    def _category_stats_daily(
+        self, tenant_id: str, start: datetime | None, end: datetime | None
+    ) -> list[CategoryStats]:
+        """Gun sinirli araliklar icin gunluk ozet tablosundan hesaplar."""
+        query = (
+            "SELECT category, SUM(count), MIN(min_price), MAX(max_price), "
+            "SUM(sum_price) / SUM(count), "
+            "SUM(sum_price_per_gram) / NULLIF(SUM(count_price_per_gram), 0) "
+            "FROM category_daily WHERE tenant_id = ?"
+        )
+        params: list = [tenant_id]
+        if start is not None:
+            query += " AND day >= ?"
+            params.append(int(_to_epoch(start)) // DAY_SECONDS)
+        if end is not None:
+            query += " AND day < ?"
+            params.append(int(_to_epoch(end)) // DAY_SECONDS)
+        query += " GROUP BY category ORDER BY category"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            CategoryStats(
+                category=row[0] or None,
+                count=row[1],
+                min_price=row[2],
+                max_price=row[3],
+                avg_price=round(row[4], 2),
+                avg_price_per_gram=round(row[5], 2) if row[5] is not None else None,
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _daily_row(row: tuple) -> tuple:
+        """price_history satirindan gunluk ozet satiri."""
+        tenant_id, _, _, _, price, weight, category, scraped_at = row
+        price_per_gram = price / weight if weight and weight > 0 else 0.0
+        return (
+            tenant_id,
+            category or "",
+            int(scraped_at) // DAY_SECONDS,
+            price,
+            price,
+            price,
+            price_per_gram,
+            1 if weight and weight > 0 else 0,
+        )
+
+    @staticmethod
+    def _is_day_aligned(value: datetime | None) -> bool:
+        return value is None or _to_epoch(value) % DAY_SECONDS == 0
+
+    @staticmethod
+    def _time_filter(
+        query: str, params: list, start: datetime | None, end: datetime | None
+    ) -> tuple[str, list]:
+        if start is not None:
+            query += " AND scraped_at >= ?"
+            params.append(_to_epoch(start))
+        if end is not None:
+            query += " AND scraped_at < ?"
+            params.append(_to_epoch(end))
+        return query, params
+
+
+_price_history: PriceHistoryStore | None = None
+
+
+def get_price_history() -> PriceHistoryStore | None:
+    """
+    Paylasilan PriceHistoryStore'u dondurur.
+
+    FEATURE_PRICE_HISTORY kapaliysa None doner.
+    """
+    global _price_history
+    if _price_history is None:
+        from sade_agents.config import get_settings
+
+        settings = get_settings()
+        if not settings.feature_price_history:
+            return None
+        _price_history = PriceHistoryStore(settings.get_price_history_path())
+    return _price_history
+
+
+__all__ = [
+    "CategoryStats",
+    "PriceHistoryStore",
+    "PricePoint",
+    "get_price_history",
+]
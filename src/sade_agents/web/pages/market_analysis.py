@@ -149,10 +149,7 @@ def _run_crew(inputs: dict) -> None:
         status.text("Crew hazirlaniyor...")
         progress.progress(10)
 
-        from sade_agents.crews import SadeCrewFactory
-
-        factory = SadeCrewFactory()
-        crew = factory.create_crew("market_analysis")
+        from sade_agents.crews import lease_crew
 
         # Crew'u calistir
         competitor_url = inputs.get("competitor_url", "")
@@ -168,7 +165,8 @@ def _run_crew(inputs: dict) -> None:
         status.text("🤖 AI agentlar GERÇEK VERİYİ analiz ediyor...")
         progress.progress(50)
 
-        result = crew.kickoff(inputs=inputs)
+        with lease_crew("market_analysis") as crew:
+            result = crew.kickoff(inputs=inputs)
 
         progress.progress(90)
 
@@ -103,16 +103,14 @@ def _run_crew(inputs: dict) -> None:
         status.text("Crew hazirlaniyor...")
         progress.progress(20)
 
-        from sade_agents.crews import SadeCrewFactory
-
-        factory = SadeCrewFactory()
-        crew = factory.create_crew("quality_audit")
+        from sade_agents.crews import lease_crew
 
         # Crew'u calistir
         status.text("AI agentlar calisiyor...")
         progress.progress(40)
 
-        result = crew.kickoff(inputs=inputs)
+        with lease_crew("quality_audit") as crew:
+            result = crew.kickoff(inputs=inputs)
 
         progress.progress(90)
 
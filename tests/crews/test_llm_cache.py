@@ -0,0 +1,163 @@
+"""Crew task cevap cache'i testleri."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from crewai import Agent, Task
+from crewai.tasks.task_output import TaskOutput
+
+from sade_agents.crews import llm_cache
+from sade_agents.crews.base_crew import create_task_with_context
+from sade_agents.crews.llm_cache import CachedTask, CrewResponseCache
+from sade_agents.crews.product_launch_crew import ProductLaunchCrew
+from sade_agents.models import ProductLaunchInput
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CrewResponseCache(tmp_path / "crew_cache.sqlite3", ttl_seconds=60)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def shared_cache(cache):
+    with patch.object(llm_cache, "_crew_cache", cache):
+        yield cache
+
+
+@pytest.fixture
+def agent():
+    return Agent(role="Analist", goal="Analiz", backstory="Test", llm="gpt-4o-mini")
+
+
+def key(description: str = "Analiz yap", context: str | None = None) -> str:
+    return CrewResponseCache.make_key(
+        "gpt-4o-mini", "Analist", description, "JSON", context, ["fiyat_kontrol"]
+    )
+
+
+class TestCrewResponseCache:
+    """SQLite store testleri."""
+
+    def test_put_get_roundtrip(self, cache):
+        """Kaydedilen cevap ayni anahtar ve namespace ile doner."""
+        cache.put("market_analysis", key(), "cevap")
+
+        assert cache.get("market_analysis", key()) == "cevap"
+        assert cache.get("product_launch", key()) is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_key_covers_inputs(self):
+        """Aciklama, context veya tool degisirse anahtar degisir."""
+        assert key() != key(description="Baska analiz")
+        assert key() != key(context="onceki cikti")
+        assert key() != CrewResponseCache.make_key(
+            "gpt-4o-mini", "Analist", "Analiz yap", "JSON", None, []
+        )
+
+    def test_expired_entry_is_miss(self, cache):
+        """TTL'i gecmis kayit donmez ve silinir."""
+        cache.put("market_analysis", key(), "eski")
+
+        with patch.object(llm_cache.time, "time", return_value=time.time() + 120):
+            assert cache.get("market_analysis", key()) is None
+
+        assert cache.stats.expired == 1
+        assert len(cache) == 0
+
+    def test_invalidate_namespace(self, cache):
+        """invalidate sadece verilen crew'un kayitlarini siler."""
+        cache.put("market_analysis", key(), "a")
+        cache.put("product_launch", key(), "b")
+
+        assert cache.invalidate("market_analysis") == 1
+        assert cache.get("product_launch", key()) == "b"
+        assert cache.invalidate() == 1
+        assert len(cache) == 0
+
+
+class TestCachedTask:
+    """Task entegrasyonu testleri."""
+
+    def run(self, task: Task, agent: Agent, calls: list) -> TaskOutput:
+        def fake_execute(self, agent, context, tools):
+            calls.append(self.description)
+            return TaskOutput(description=self.description, raw="LLM cevabi", agent=agent.role)
+
+        with patch.object(Task, "_execute_core", fake_execute):
+            return task.execute_sync(agent=agent)
+
+    def test_repeat_run_served_from_cache(self, shared_cache, agent):
+        """Ayni task ikinci kez agent calistirilmadan cache'ten doner."""
+        calls = []
+        first = self.run(
+            create_task_with_context("Analiz yap", "JSON", agent, cache_namespace="market"),
+            agent,
+            calls,
+        )
+        task = create_task_with_context("Analiz yap", "JSON", agent, cache_namespace="market")
+        second = self.run(task, agent, calls)
+
+        assert isinstance(task, CachedTask)
+        assert calls == ["Analiz yap"]
+        assert first.raw == second.raw == "LLM cevabi"
+        assert task.output is second
+        assert second.agent == "Analist"
+
+    def test_async_paths_share_cache(self, shared_cache, agent):
+        """execute_async ve aexecute_sync ayni cache kaydini yazar ve okur."""
+        calls = []
+
+        def fake_execute(self, agent, context, tools):
+            calls.append(self.description)
+            return TaskOutput(description=self.description, raw="LLM cevabi", agent=agent.role)
+
+        async def fake_aexecute(self, agent, context, tools):
+            return fake_execute(self, agent, context, tools)
+
+        def make_task():
+            return create_task_with_context("Analiz yap", "JSON", agent, cache_namespace="market")
+
+        with patch.object(Task, "_execute_core", fake_execute), \
+             patch.object(Task, "_aexecute_core", fake_aexecute):
+            first = make_task().execute_async(agent=agent).result(timeout=5)
+            second = make_task().execute_async(agent=agent).result(timeout=5)
+            third = asyncio.run(make_task().aexecute_sync(agent=agent))
+
+        assert calls == ["Analiz yap"]
+        assert first.raw == second.raw == third.raw == "LLM cevabi"
+
+    def test_crewai_supported(self):
+        """Kurulu crewai public task metotlarini beklenen imzayla sunar."""
+        assert llm_cache.crewai_supported()
+
+    def test_unsupported_crewai_disables_cache(self, tmp_path):
+        """Desteklenmeyen crewai surumunde cache acilmaz."""
+        settings = MagicMock(feature_crew_cache=True)
+        settings.get_cache_dir.return_value = tmp_path
+        with patch("sade_agents.config.get_settings", return_value=settings), \
+             patch.object(llm_cache, "_crew_cache", None), \
+             patch.object(llm_cache, "crewai_supported", return_value=False):
+            assert llm_cache.get_crew_cache() is None
+
+    def test_disabled_cache_runs_agent(self, agent):
+        """Cache kapaliyken task her seferinde calisir."""
+        calls = []
+        with patch.object(llm_cache, "get_crew_cache", return_value=None):
+            for _ in range(2):
+                self.run(CachedTask(description="Analiz yap", expected_output="JSON"), agent, calls)
+
+        assert len(calls) == 2
+
+    def test_side_effect_task_not_cached(self):
+        """Etiket PNG'si ureten Curator task'i cache'lenmez."""
+        crew = ProductLaunchCrew()
+        tasks = crew._create_tasks(ProductLaunchInput(flavor_concept="Antep Fistikli"))
+
+        cached = {task.agent.role: isinstance(task, CachedTask) for task in tasks}
+        assert cached[crew.curator.role] is False
+        assert cached[crew.alchemist.role] is True
@@ -0,0 +1,110 @@
+"""LoopRunner ve async crew kickoff testleri."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+
+from sade_agents.crews import SadeCrewFactory
+from sade_agents.crews.loop_runner import LoopRunner
+
+AUDIT_INPUTS = {"content": "Sessiz luks", "content_type": "metin", "source_agent": "narrator"}
+
+
+@pytest.fixture
+def runner():
+    runner = LoopRunner(name="test-loop")
+    yield runner
+    runner.stop()
+
+
+async def current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+class TestLoopRunner:
+    """Arka plan loop'u testleri."""
+
+    def test_reuses_one_loop(self, runner):
+        """Ardisik cagrilar ayni (arka plan thread'indeki) loop'ta calisir."""
+        first = runner.run(current_loop())
+        second = runner.run(current_loop())
+
+        assert first is second
+        assert first is not None and not first.is_closed()
+
+    def test_callable_from_running_loop(self, runner):
+        """Calisan bir loop'un icinden senkron cagri kilitlenmez."""
+
+        async def caller():
+            return runner.run(current_loop()), asyncio.get_running_loop()
+
+        runner_loop, caller_loop = asyncio.run(caller())
+
+        assert runner_loop is not caller_loop
+
+    def test_own_loop_call_rejected(self, runner):
+        """Runner'in kendi loop'undan run() cagrisi hata verir."""
+
+        async def nested():
+            return runner.run(current_loop())
+
+        with pytest.raises(RuntimeError):
+            runner.run(nested())
+
+    def test_timeout_cancels(self, runner):
+        """Sure asilinca coroutine iptal edilir."""
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            runner.run(slow(), timeout=0.05)
+
+        assert cancelled.wait(1)
+
+    def test_restart_after_stop(self, runner):
+        """stop() sonrasi run() yeni bir loop baslatir."""
+        first = runner.run(current_loop())
+        runner.stop()
+
+        assert runner.run(current_loop()) is not first
+        assert first.is_closed()
+
+
+class TestAkickoff:
+    """Crew'larin async kickoff'u."""
+
+    def test_crews_share_caller_loop(self):
+        """Tek loop'ta iki crew ayni anda calisir; loop bloklanmaz."""
+        spans = []
+
+        def fake_execute(self, agent, context, tools):
+            start = time.perf_counter()
+            time.sleep(0.2)
+            spans.append((start, time.perf_counter()))
+            self.output = TaskOutput(description=self.description, raw="denetim", agent=agent.role)
+            return self.output
+
+        async def run_two():
+            factory = SadeCrewFactory()
+            return await asyncio.gather(
+                factory.akickoff("quality_audit", AUDIT_INPUTS),
+                factory.akickoff("quality_audit", AUDIT_INPUTS),
+            )
+
+        with patch.object(Task, "_execute_core", fake_execute):
+            outputs = asyncio.run(run_two())
+
+        assert [o.audit_result.summary_tr for o in outputs] == ["denetim", "denetim"]
+        (a_start, a_end), (b_start, b_end) = spans
+        assert a_start < b_end and b_start < a_end
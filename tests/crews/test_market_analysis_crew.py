@@ -0,0 +1,172 @@
+"""MarketAnalysisCrew task zinciri testleri."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from crewai import Crew, Process, Task
+from crewai.tasks.task_output import TaskOutput
+
+from sade_agents.crews.market_analysis_crew import MarketAnalysisCrew
+from sade_agents.models import MarketAnalysisInput
+
+AGENT_SECONDS = 0.2
+
+INPUTS = MarketAnalysisInput(
+    competitor_name="Rakip",
+    competitor_url="https://rakip.com",
+    product_category="tablet",
+    include_trends=True,
+)
+
+
+@pytest.fixture
+def crew():
+    return MarketAnalysisCrew()
+
+
+def run_tasks(tasks: list[Task], agents: list) -> tuple[dict[str, tuple], dict[str, str]]:
+    """Task'lari sahte (AGENT_SECONDS suren) agent'larla calistirir."""
+    spans: dict[str, tuple[float, float]] = {}
+    contexts: dict[str, str] = {}
+    lock = threading.Lock()
+
+    def fake_execute(self, agent, context, tools):
+        start = time.perf_counter()
+        time.sleep(AGENT_SECONDS)
+        with lock:
+            spans[agent.role] = (start, time.perf_counter())
+            contexts[agent.role] = context or ""
+        self.output = TaskOutput(
+            description=self.description, raw=f"{agent.role} cikti", agent=agent.role
+        )
+        return self.output
+
+    crew = Crew(agents=agents, tasks=tasks, process=Process.sequential)
+    with patch.object(Task, "_execute_core", fake_execute):
+        crew.kickoff()
+    return spans, contexts
+
+
+class TestParallelTasks:
+    """Fiyat ve trend task'larinin paralel calismasi."""
+
+    def test_sequential_chain_by_default(self, crew):
+        """Varsayilan modda trend task'i fiyat ciktisini context alir."""
+        pricing, trend, summary = crew._create_tasks(INPUTS, "veri")
+
+        assert not pricing.async_execution and not trend.async_execution
+        assert trend.context == [pricing]
+        assert summary.context == [pricing, trend]
+
+    def test_parallel_tasks_overlap(self, crew):
+        """Paralel modda fiyat ve trend ayni anda calisir, ozet ikisini bekler."""
+        crew.parallel_tasks = True
+        tasks = crew._create_tasks(INPUTS, "veri")
+
+        spans, contexts = run_tasks(tasks, [crew.pricing, crew.growth, crew.narrator])
+
+        pricing, trend = spans[crew.pricing.role], spans[crew.growth.role]
+        assert trend[0] < pricing[1] and pricing[0] < trend[1]
+        assert spans[crew.narrator.role][0] >= max(pricing[1], trend[1])
+        assert contexts[crew.growth.role] == ""
+        summary_context = contexts[crew.narrator.role]
+        assert f"{crew.pricing.role} cikti" in summary_context
+        assert f"{crew.growth.role} cikti" in summary_context
+
+    def test_parallel_without_trends_stays_sync(self, crew):
+        """Trend yoksa tek task paralel calistirilmaz."""
+        crew.parallel_tasks = True
+        tasks = crew._create_tasks(INPUTS.model_copy(update={"include_trends": False}), "veri")
+
+        assert [t.async_execution for t in tasks] == [False, False]
+
+
+class TestScrapeOverlap:
+    """Scrape ile trend analizinin ayni anda calismasi."""
+
+    def test_trend_runs_during_scrape(self, crew):
+        """Trend task'i scrape bitmeden baslar; fiyat task'i scrape verisini bekler."""
+        events: list[str] = []
+
+        async def fake_fetch(competitor_name, competitor_url):
+            events.append("scrape_start")
+            await asyncio.sleep(AGENT_SECONDS)
+            events.append("scrape_end")
+            return "GERCEK VERI"
+
+        def fake_execute(self, agent, context, tools):
+            events.append(agent.role)
+            time.sleep(AGENT_SECONDS / 4)
+            self.output = TaskOutput(description=self.description, raw="cikti", agent=agent.role)
+            return self.output
+
+        crew.parallel_tasks = True
+        with patch.object(crew, "_fetch_real_data", fake_fetch), \
+             patch.object(Task, "_execute_core", fake_execute):
+            output = crew.kickoff(INPUTS.model_dump())
+
+        assert events.index(crew.growth.role) < events.index("scrape_end")
+        assert events.index("scrape_end") < events.index(crew.pricing.role)
+        assert events.count(crew.growth.role) == 1
+        assert events[-1] == crew.narrator.role
+        assert output.summary == "cikti"
+
+    def test_sequential_mode_does_not_overlap(self, crew):
+        """Varsayilan sirali modda trend fiyat analizini bekler (scrape ile cakismaz)."""
+        events: list[str] = []
+
+        async def fake_fetch(competitor_name, competitor_url):
+            events.append("scrape_end")
+            return "GERCEK VERI"
+
+        def fake_execute(self, agent, context, tools):
+            events.append(agent.role)
+            self.output = TaskOutput(description=self.description, raw="cikti", agent=agent.role)
+            return self.output
+
+        crew.parallel_tasks = False
+        with patch.object(crew, "_fetch_real_data", fake_fetch), \
+             patch.object(Task, "_execute_core", fake_execute):
+            crew.kickoff(INPUTS.model_dump())
+
+        assert events == ["scrape_end", crew.pricing.role, crew.growth.role, crew.narrator.role]
+
+    def test_scrape_error_becomes_text(self, crew):
+        """Scrape hatasi kickoff'u durdurmaz, veri metnine yazilir."""
+
+        async def failing_fetch(competitor_name, competitor_url):
+            raise RuntimeError("baglanti koptu")
+
+        with patch.object(crew, "_fetch_real_data", failing_fetch):
+            real_data = asyncio.run(crew._prepare_inputs("Rakip", "https://rakip.com"))
+
+        assert real_data == "HATA: Veri cekilemedi - baglanti koptu"
+
+    def test_trend_error_cancels_scrape(self, crew):
+        """Trend hatasi devam eden scrape'i iptal eder ve yukari iletilir."""
+        scrape_state: list[str] = []
+
+        async def slow_fetch(competitor_name, competitor_url):
+            scrape_state.append("start")
+            try:
+                await asyncio.sleep(AGENT_SECONDS * 10)
+            except asyncio.CancelledError:
+                scrape_state.append("cancelled")
+                raise
+            return "GERCEK VERI"
+
+        async def prepare() -> list[str]:
+            with pytest.raises(RuntimeError, match="trend coktu"):
+                await crew._prepare_inputs("Rakip", "https://rakip.com", trend_task)
+            # Hata gorundugunde scrape zaten iptal edilip beklenmis olmali
+            return list(scrape_state)
+
+        trend_task = crew._create_trend_task(INPUTS)
+        with patch.object(crew, "_fetch_real_data", slow_fetch), \
+             patch.object(Task, "execute_sync", side_effect=RuntimeError("trend coktu")):
+            state_on_error = asyncio.run(prepare())
+
+        assert state_on_error == ["start", "cancelled"]
@@ -0,0 +1,145 @@
+"""CrewPool testleri."""
+
+import threading
+
+import pytest
+from crewai import Agent
+
+from sade_agents.crews import pool as pool_module
+from sade_agents.crews.pool import CrewPool, config_fingerprint, lease_crew
+
+
+class FakeCrew:
+    """Tek agent'li sahte crew."""
+
+    def __init__(self) -> None:
+        self.agent = Agent(role="Denetci", goal="Denetle", backstory="Test", llm="gpt-4o-mini")
+
+
+class FakeFactory:
+    """Kurulan crew'lari sayan sahte factory."""
+
+    def __init__(self) -> None:
+        self.built = 0
+
+    def create_crew(self, crew_type):
+        if crew_type not in ("quality_audit", "market_analysis"):
+            raise ValueError(crew_type)
+        self.built += 1
+        return FakeCrew()
+
+
+@pytest.fixture
+def factory():
+    return FakeFactory()
+
+
+@pytest.fixture
+def pool(factory):
+    return CrewPool(factory=factory, max_idle=1)
+
+
+class TestCrewPool:
+    """Kiralama ve yeniden kullanim."""
+
+    def test_crew_reused_across_leases(self, pool, factory):
+        """Iade edilen crew bir sonraki kiralamada tekrar verilir."""
+        with pool.lease("quality_audit") as first:
+            pass
+        with pool.lease("quality_audit") as second:
+            pass
+
+        assert first is second
+        assert factory.built == 1
+        assert (pool.stats.built, pool.stats.reused) == (1, 1)
+
+    def test_concurrent_leases_get_distinct_crews(self, pool, factory):
+        """Ayni anda kiralanan crew'lar paylasilmaz; fazlasi havuza alinmaz."""
+        with pool.lease("quality_audit") as a, pool.lease("quality_audit") as b:
+            assert a is not b
+
+        assert factory.built == 2
+        assert pool.idle_count("quality_audit") == 1
+
+    def test_agent_state_reset_on_release(self, pool):
+        """Onceki calismanin tool sonuclari ve hata sayaci temizlenir."""
+        with pool.lease("quality_audit") as crew:
+            crew.agent.tools_results.append({"result": "eski", "result_as_answer": True})
+            crew.agent._times_executed = 2
+
+        with pool.lease("quality_audit") as crew:
+            assert crew.agent.tools_results == []
+            assert crew.agent._times_executed == 0
+
+    def test_config_change_rebuilds(self, pool, factory, monkeypatch):
+        """Yapilandirma degisince bekleyen ve kiradaki eski crew'lar atilir."""
+        pool.warm(["quality_audit"])
+        leased = pool.acquire("quality_audit")
+
+        monkeypatch.setenv("OPENAI_MODEL_NAME", "gpt-4o")
+        with pool.lease("quality_audit") as fresh:
+            assert fresh is not leased
+        pool.release("quality_audit", leased)
+
+        assert factory.built == 2
+        assert pool.stats.rebuilds == 1
+        assert pool.idle_count("quality_audit") == 1
+        with pool.lease("quality_audit") as crew:
+            assert crew is fresh
+
+    def test_invalid_crew_type(self, pool):
+        """Gecersiz crew turu factory hatasini iletir."""
+        with pytest.raises(ValueError):
+            pool.acquire("bilinmeyen")
+
+    def test_thread_safe_leases(self, pool, factory):
+        """Paralel kiralamalarda ayni crew iki thread'e verilmez."""
+        in_use: set[int] = set()
+        errors = []
+        lock = threading.Lock()
+
+        def work():
+            for _ in range(20):
+                with pool.lease("quality_audit") as crew:
+                    with lock:
+                        if id(crew) in in_use:
+                            errors.append(id(crew))
+                        in_use.add(id(crew))
+                    with lock:
+                        in_use.discard(id(crew))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert factory.built <= 4
+
+
+class TestFingerprint:
+    """Yapilandirma parmak izi."""
+
+    def test_tracks_settings_env_only(self, monkeypatch):
+        """Sadece Settings alanlarina ait ortam degiskenleri parmak izini degistirir."""
+        before = config_fingerprint()
+        monkeypatch.setenv("UNRELATED_VARIABLE", "x")
+        assert config_fingerprint() == before
+
+        monkeypatch.setenv("FEATURE_CREW_CACHE", "true")
+        assert config_fingerprint() != before
+
+
+def test_lease_crew_without_pool(monkeypatch, factory):
+    """Havuz kapaliyken her kiralama yeni crew kurar."""
+    monkeypatch.setattr(pool_module, "get_crew_pool", lambda: None)
+    monkeypatch.setattr(pool_module, "SadeCrewFactory", lambda: factory)
+
+    with lease_crew("quality_audit") as first:
+        pass
+    with lease_crew("quality_audit") as second:
+        pass
+
+    assert first is not second
+    assert factory.built == 2
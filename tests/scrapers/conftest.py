@@ -0,0 +1,20 @@
+"""Scraper testleri icin ortak fixture'lar."""
+
+import pytest
+
+from sade_agents.scrapers import http_session
+from sade_agents.scrapers.http_session import HttpSessionManager
+from sade_agents.scrapers.scheduler import PolitenessScheduler
+
+
+@pytest.fixture(autouse=True)
+def unthrottled_session_manager(monkeypatch):
+    """
+    Paylasilan session yoneticisini hiz limitsiz bir zamanlayiciyla degistirir.
+
+    Varsayilan domain hiz limiti (istek/saniye) mock'lu testleri yavaslatir;
+    zamanlayici davranisi test_scheduler.py'de ayrica test edilir.
+    """
+    manager = HttpSessionManager(scheduler=PolitenessScheduler(rate_per_second=0))
+    monkeypatch.setattr(http_session, "_session_manager", manager)
+    return manager
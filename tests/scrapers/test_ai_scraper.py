@@ -4,13 +4,16 @@ AIScraper Unit Testleri.
 HTML parsing, AI extraction ve hata yonetimi testleri.
 """
 
+import asyncio
 import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from sade_agents.config import Settings
 from sade_agents.scrapers.ai_scraper import (
     AIScraper,
     ScrapingTarget,
+    create_ai_scraper_from_settings,
     scrape_all_with_ai,
 )
 from sade_agents.scrapers.base import ProductPrice, ScraperResult
@@ -152,7 +155,7 @@ class TestProductExtraction:
             mock_settings.return_value.openai_model_name = "gpt-4"
 
             scraper = AIScraper()
-            scraper._client.chat.completions.create = MagicMock(return_value=mock_openai_response)
+            scraper._client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
 
             products = await scraper._extract_products_with_ai(
                 "Sample HTML text",
@@ -185,7 +188,7 @@ class TestProductExtraction:
     {"name": "Test Product", "price_tl": 100, "weight_grams": 50, "category": "tablet"}
 ]
 ```"""
-            scraper._client.chat.completions.create = MagicMock(return_value=mock_response)
+            scraper._client.chat.completions.create = AsyncMock(return_value=mock_response)
 
             products = await scraper._extract_products_with_ai(
                 "Sample HTML",
@@ -208,7 +211,7 @@ class TestProductExtraction:
             mock_response = MagicMock()
             mock_response.choices = [MagicMock()]
             mock_response.choices[0].message.content = "[]"
-            scraper._client.chat.completions.create = MagicMock(return_value=mock_response)
+            scraper._client.chat.completions.create = AsyncMock(return_value=mock_response)
 
             products = await scraper._extract_products_with_ai(
                 "No products here",
@@ -230,7 +233,7 @@ class TestProductExtraction:
             mock_response = MagicMock()
             mock_response.choices = [MagicMock()]
             mock_response.choices[0].message.content = "Not valid JSON at all"
-            scraper._client.chat.completions.create = MagicMock(return_value=mock_response)
+            scraper._client.chat.completions.create = AsyncMock(return_value=mock_response)
 
             products = await scraper._extract_products_with_ai(
                 "Sample HTML",
@@ -256,7 +259,7 @@ class TestProductExtraction:
                 {"name": "Invalid", "price_tl": "not-a-number"},  # Invalid price
                 {"name": "Another Valid", "price_tl": 300, "category": "truffle"},
             ])
-            scraper._client.chat.completions.create = MagicMock(return_value=mock_response)
+            scraper._client.chat.completions.create = AsyncMock(return_value=mock_response)
 
             products = await scraper._extract_products_with_ai(
                 "Sample HTML",
@@ -282,7 +285,7 @@ class TestScraping:
 
             scraper = AIScraper()
             scraper._fetch_page = AsyncMock(return_value=sample_html)
-            scraper._client.chat.completions.create = MagicMock(return_value=mock_openai_response)
+            scraper._client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
 
             result = await scraper.scrape(sample_target)
 
@@ -316,7 +319,7 @@ class TestScraping:
 
             scraper = AIScraper()
             scraper._fetch_page = AsyncMock(return_value=sample_html)
-            scraper._client.chat.completions.create = MagicMock(
+            scraper._client.chat.completions.create = AsyncMock(
                 side_effect=Exception("API rate limit exceeded")
             )
 
@@ -353,8 +356,9 @@ class TestScrapeAllWithAI:
             mock_load.return_value = targets
 
             with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
-                mock_settings.return_value.openai_api_key = "test-key"
-                mock_settings.return_value.openai_model_name = "gpt-4"
+                mock_settings.return_value = Settings(
+                    openai_api_key="test-key", openai_model_name="gpt-4"
+                )
 
                 # Mock scraper.scrape method directly
                 async def mock_scrape(self, target):
@@ -383,8 +387,9 @@ class TestScrapeAllWithAI:
             mock_load.return_value = targets
 
             with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
-                mock_settings.return_value.openai_api_key = "test-key"
-                mock_settings.return_value.openai_model_name = "gpt-4"
+                mock_settings.return_value = Settings(
+                    openai_api_key="test-key", openai_model_name="gpt-4"
+                )
 
                 async def mock_scrape(self, target):
                     if target.name == "bad_shop":
@@ -403,3 +408,147 @@ class TestScrapeAllWithAI:
             assert results["good_shop"].success is True
             assert results["bad_shop"].success is False
             assert "Scraping failed" in results["bad_shop"].error
+
+
+class TestCreateFromSettings:
+    """Ayarlardan AIScraper kurulumu (tum tarama yollari ayni kurulumu kullanir)."""
+
+    def test_uses_llm_chunk_and_batch_settings(self):
+        """LLM limitleri, parcalama ve toplu cikarma ayarlari uygulanir."""
+        settings = Settings(
+            openai_api_key="test-key",
+            scraping_llm_concurrency=7,
+            scraping_llm_timeout_seconds=12.5,
+            scraping_chunk_tokens=3000,
+            feature_batched_extraction=True,
+            scraping_batch_tokens=4000,
+        )
+        with patch("sade_agents.scrapers.ai_scraper.get_settings", return_value=settings):
+            scraper = create_ai_scraper_from_settings()
+
+        assert scraper.max_concurrency == 7
+        assert scraper.llm_timeout == 12.5
+        assert scraper.chunk_tokens == 3000
+        assert scraper._batcher is not None
+
+    @pytest.mark.asyncio
+    async def test_scrape_all_uses_settings_scraper(self):
+        """scrape_all_with_ai ayarlardan kurulan scraper'i kullanir."""
+        targets = [ScrapingTarget(name="shop", url="https://shop.com", description="cikolata")]
+        used: list[AIScraper] = []
+
+        async def mock_scrape(self, target):
+            used.append(self)
+            return ScraperResult(source=target.name, success=True, products=[])
+
+        settings = Settings(openai_api_key="test-key", scraping_llm_timeout_seconds=9.0)
+        with patch("sade_agents.scrapers.ai_scraper.load_targets_from_config",
+                   return_value=targets), \
+             patch("sade_agents.scrapers.ai_scraper.get_settings", return_value=settings), \
+             patch.object(AIScraper, "scrape", new=mock_scrape):
+            await scrape_all_with_ai()
+
+        assert [scraper.llm_timeout for scraper in used] == [9.0]
+
+
+class TestAsyncExtraction:
+    """Async LLM cikarma (concurrency ve timeout) testleri."""
+
+    @staticmethod
+    def _make_slow_create(delay: float, tracker: dict):
+        """Gecikmeli ve eszamanli cagri sayisini olcen sahte create()."""
+
+        async def slow_create(**kwargs):
+            tracker["in_flight"] += 1
+            tracker["max_in_flight"] = max(tracker["max_in_flight"], tracker["in_flight"])
+            await asyncio.sleep(delay)
+            tracker["in_flight"] -= 1
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = "[]"
+            return response
+
+        return slow_create
+
+    @pytest.mark.asyncio
+    async def test_extractions_overlap(self):
+        """Birden fazla sayfa cikarma gercekten paralel calisir."""
+        with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
+            mock_settings.return_value.openai_model_name = "gpt-4"
+            scraper = AIScraper(max_concurrency=10)
+
+        tracker = {"in_flight": 0, "max_in_flight": 0}
+        scraper._client.chat.completions.create = AsyncMock(
+            side_effect=self._make_slow_create(0.05, tracker)
+        )
+
+        await asyncio.gather(
+            *(
+                scraper._extract_products_with_ai(f"Sayfa {i}", "shop", "cikolata")
+                for i in range(10)
+            )
+        )
+
+        assert tracker["max_in_flight"] == 10
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limited_by_semaphore(self):
+        """Eszamanli LLM cagrisi max_concurrency'yi asmaz."""
+        with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
+            mock_settings.return_value.openai_model_name = "gpt-4"
+            scraper = AIScraper(max_concurrency=3)
+
+        tracker = {"in_flight": 0, "max_in_flight": 0}
+        scraper._client.chat.completions.create = AsyncMock(
+            side_effect=self._make_slow_create(0.01, tracker)
+        )
+
+        await asyncio.gather(
+            *(
+                scraper._extract_products_with_ai(f"Sayfa {i}", "shop", "cikolata")
+                for i in range(10)
+            )
+        )
+
+        assert tracker["max_in_flight"] == 3
+
+    def test_semaphore_usable_from_multiple_loops(self):
+        """Ayni scraper farkli event loop'larda cekisme altinda kullanilabilir."""
+        with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
+            mock_settings.return_value.openai_model_name = "gpt-4"
+            scraper = AIScraper(max_concurrency=2)
+
+        tracker = {"in_flight": 0, "max_in_flight": 0}
+        scraper._client.chat.completions.create = AsyncMock(
+            side_effect=self._make_slow_create(0.01, tracker)
+        )
+
+        async def run_batch():
+            await asyncio.gather(
+                *(
+                    scraper._extract_products_with_ai(f"Sayfa {i}", "shop", "cikolata")
+                    for i in range(5)
+                )
+            )
+
+        asyncio.run(run_batch())
+        asyncio.run(run_batch())
+
+        assert tracker["max_in_flight"] == 2
+
+    @pytest.mark.asyncio
+    async def test_llm_timeout_fails_page(self, sample_target, sample_html):
+        """Timeout asan LLM cagrisi sayfayi basarisiz yapar."""
+        with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
+            mock_settings.return_value.openai_model_name = "gpt-4"
+            scraper = AIScraper(llm_timeout=0.01)
+
+        tracker = {"in_flight": 0, "max_in_flight": 0}
+        scraper._fetch_page = AsyncMock(return_value=sample_html)
+        scraper._client.chat.completions.create = AsyncMock(
+            side_effect=self._make_slow_create(1.0, tracker)
+        )
+
+        result = await scraper.scrape(sample_target)
+
+        assert result.success is False
@@ -0,0 +1,150 @@
+"""Buyuk sayfa parcalama (map-reduce cikarma) testleri."""
+
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sade_agents.scrapers.ai_scraper import AIScraper
+from sade_agents.scrapers.base import ProductPrice
+from sade_agents.scrapers.chunking import (
+    CHARS_PER_TOKEN,
+    merge_product_lists,
+    split_into_chunks,
+)
+
+
+def catalog_text(count: int) -> str:
+    """count urunluk kategori sayfasi metni."""
+    return " ".join(f"Bitter Tablet No{i} 100g {400 + i},00 TL" for i in range(count))
+
+
+class TestSplitIntoChunks:
+    """split_into_chunks testleri."""
+
+    def test_short_text_single_chunk(self):
+        """Butceye sigan metin bolunmez."""
+        text = catalog_text(3)
+        assert split_into_chunks(text, max_tokens=1000) == [text]
+
+    def test_chunks_respect_budget_and_product_boundaries(self):
+        """Parcalar butceyi asmaz ve her parca bir fiyatla biter."""
+        text = catalog_text(200)
+        max_tokens = 300
+
+        chunks = split_into_chunks(text, max_tokens)
+
+        assert len(chunks) > 1
+        assert all(len(c) <= max_tokens * CHARS_PER_TOKEN for c in chunks)
+        assert all(c.endswith("TL") for c in chunks)
+        # Hicbir urun kaybolmaz veya ikiye bolunmez
+        assert sum(len(re.findall(r"No\d+ 100g \d+,00 TL", c)) for c in chunks) == 200
+
+    def test_falls_back_to_whitespace(self):
+        """Fiyat yoksa bosluktan bolunur."""
+        text = " ".join(["kelime"] * 500)
+
+        chunks = split_into_chunks(text, max_tokens=100)
+
+        assert len(chunks) > 1
+        assert all(set(c.split()) == {"kelime"} for c in chunks)
+
+
+class TestMergeProductLists:
+    """merge_product_lists testleri."""
+
+    def test_dedupes_and_fills_missing_fields(self):
+        """Ayni isim+fiyat tek kayit olur, eksik alanlar tamamlanir."""
+        merged = merge_product_lists(
+            [
+                [ProductPrice(name="Bitter  Tablet", price_tl=450)],
+                [
+                    ProductPrice(name="bitter tablet", price_tl=450, weight_grams=100),
+                    ProductPrice(name="Truffle", price_tl=890),
+                ],
+            ]
+        )
+
+        assert [p.name for p in merged] == ["Bitter  Tablet", "Truffle"]
+        assert merged[0].weight_grams == 100
+        assert merged[0].price_per_gram == 4.5
+
+    def test_same_name_different_price_kept(self):
+        """Farkli fiyatli ayni isim (farkli varyant) korunur."""
+        merged = merge_product_lists(
+            [[ProductPrice(name="Kutu", price_tl=500)], [ProductPrice(name="Kutu", price_tl=900)]]
+        )
+        assert len(merged) == 2
+
+
+class TestChunkedExtraction:
+    """AIScraper'in buyuk sayfalari parcalayarak cikarmasi."""
+
+    @pytest.fixture
+    def scraper(self):
+        with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
+            mock_settings.return_value.openai_model_name = "gpt-4"
+            return AIScraper(chunk_tokens=300, max_concurrency=10)
+
+    @staticmethod
+    def echo_llm(delay: float = 0.0):
+        """Prompt'taki urunleri JSON olarak geri donduren sahte LLM."""
+
+        async def create(**kwargs):
+            await asyncio.sleep(delay)
+            prompt = kwargs["messages"][1]["content"]
+            items = [
+                {"name": f"Bitter Tablet No{n}", "price_tl": float(p), "weight_grams": 100}
+                for n, p in re.findall(r"No(\d+) 100g (\d+),00 TL", prompt)
+            ]
+            # MagicMock yerine hafif obje: olcumlu testte mock kurulum maliyeti olmasin
+            message = SimpleNamespace(content=json.dumps(items))
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        return create
+
+    @pytest.mark.asyncio
+    async def test_large_page_loses_no_products(self, scraper):
+        """Butceyi asan sayfadaki tum urunler cikarilir."""
+        scraper._client.chat.completions.create = AsyncMock(side_effect=self.echo_llm())
+
+        products = await scraper._extract_products_with_ai(catalog_text(200), "shop", "cikolata")
+
+        assert len(products) == 200
+        assert scraper._client.chat.completions.create.call_count > 1
+
+    @pytest.mark.asyncio
+    async def test_chunks_extracted_in_parallel(self, scraper):
+        """Parcalar paralel cikarilir (sure parca sayisiyla dogrusal artmaz)."""
+        scraper._client.chat.completions.create = AsyncMock(side_effect=self.echo_llm(0.05))
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await scraper._extract_products_with_ai(catalog_text(200), "shop", "cikolata")
+        elapsed = loop.time() - start
+
+        calls = scraper._client.chat.completions.create.call_count
+        assert calls >= 4
+        assert elapsed < 0.05 * calls / 2
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_does_not_drop_others(self, scraper):
+        """Bir parca basarisiz olursa digerlerinin urunleri korunur."""
+        echo = self.echo_llm()
+        calls = 0
+
+        async def flaky(**kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise asyncio.TimeoutError()
+            return await echo(**kwargs)
+
+        scraper._client.chat.completions.create = AsyncMock(side_effect=flaky)
+
+        products = await scraper._extract_products_with_ai(catalog_text(200), "shop", "cikolata")
+
+        assert 0 < len(products) < 200
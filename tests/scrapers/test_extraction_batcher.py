@@ -0,0 +1,132 @@
+"""Kucuk sayfalarin toplu LLM cikarma testleri."""
+
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sade_agents.scrapers.ai_scraper import AIScraper
+from sade_agents.scrapers.extraction_cache import ExtractionCache
+
+PAGE_PATTERN = re.compile(r"=== SAYFA (\d+) \(.*?\) ===\n(.*?)(?=\n\n=== SAYFA|\Z)", re.S)
+PRODUCT_PATTERN = re.compile(r"No(\d+) 100g (\d+),00 TL")
+
+
+def page_text(*numbers: int) -> str:
+    return " ".join(f"Bitter Tablet No{n} 100g {400 + n},00 TL" for n in numbers)
+
+
+def products_in(text: str) -> list[dict]:
+    return [
+        {"name": f"Bitter Tablet No{n}", "price_tl": float(p), "weight_grams": 100}
+        for n, p in PRODUCT_PATTERN.findall(text)
+    ]
+
+
+def fake_llm(drop_pages: tuple[str, ...] = ()):
+    """Toplu prompt'ta {sayfa: urunler}, tek sayfada urun listesi donduren sahte LLM."""
+
+    async def create(**kwargs):
+        await asyncio.sleep(0)
+        prompt = kwargs["messages"][1]["content"]
+        pages = PAGE_PATTERN.findall(prompt)
+        if pages:
+            data = {n: products_in(text) for n, text in pages if n not in drop_pages}
+        else:
+            data = products_in(prompt)
+        message = SimpleNamespace(content=json.dumps(data))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    return create
+
+
+@pytest.fixture
+def scraper():
+    with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
+        mock_settings.return_value.openai_model_name = "gpt-4"
+        return AIScraper(batch_tokens=200, batch_page_tokens=100, max_concurrency=10)
+
+
+async def extract_pages(scraper, pages: list[str]) -> list[list[str]]:
+    results = await asyncio.gather(
+        *(
+            scraper._extract_products_with_ai(text, f"shop_{i}", "cikolata")
+            for i, text in enumerate(pages)
+        )
+    )
+    return [[p.name for p in products] for products in results]
+
+
+class TestBatchedExtraction:
+    """AIScraper toplu cikarma testleri."""
+
+    @pytest.mark.asyncio
+    async def test_small_pages_share_one_request(self, scraper):
+        """Eszamanli kucuk sayfalar tek istekte cikarilir, urunler dogru sayfaya doner."""
+        scraper._client.chat.completions.create = AsyncMock(side_effect=fake_llm())
+
+        names = await extract_pages(scraper, [page_text(1, 2), page_text(3), ""])
+
+        assert names == [["Bitter Tablet No1", "Bitter Tablet No2"], ["Bitter Tablet No3"], []]
+        assert scraper._client.chat.completions.create.call_count == 1
+        assert scraper._batcher.batches_sent == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_splits_batches_and_large_pages_bypass(self, scraper):
+        """Token butcesi asilinca yeni batch; buyuk sayfa tek basina cikarilir."""
+        scraper._client.chat.completions.create = AsyncMock(side_effect=fake_llm())
+        small = [page_text(*range(n * 5, n * 5 + 5)) for n in range(6)]  # ~50 token
+        large = page_text(*range(100, 130))  # ~300 token
+
+        names = await extract_pages(scraper, [*small, large])
+
+        assert [len(n) for n in names] == [5] * 6 + [30]
+        assert names[2][0] == "Bitter Tablet No10"
+        # 6 kucuk sayfa 200 token butcesiyle 2 batch'e, buyuk sayfa ayri istege
+        assert scraper._client.chat.completions.create.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_page_extracted_alone(self, scraper):
+        """Cevapta olmayan sayfa baska sayfanin urunlerini almaz, tek basina cikarilir."""
+        scraper._client.chat.completions.create = AsyncMock(side_effect=fake_llm(drop_pages=("2",)))
+
+        names = await extract_pages(scraper, [page_text(1), page_text(2)])
+
+        assert names == [["Bitter Tablet No1"], ["Bitter Tablet No2"]]
+        assert scraper._client.chat.completions.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_llm_error_reaches_every_page(self, scraper):
+        """LLM hatasi batch'teki tum cagiranlara iletilir."""
+        scraper._client.chat.completions.create = AsyncMock(side_effect=asyncio.TimeoutError())
+
+        results = await asyncio.gather(
+            scraper._extract_products_with_ai(page_text(1), "a", "cikolata"),
+            scraper._extract_products_with_ai(page_text(2), "b", "cikolata"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, asyncio.TimeoutError) for r in results)
+        assert scraper._client.chat.completions.create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batched_pages_cached_individually(self, tmp_path):
+        """Toplu cikarilan sayfa sonraki taramada cache'ten gelir."""
+        with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
+            mock_settings.return_value.openai_model_name = "gpt-4"
+            scraper = AIScraper(
+                batch_tokens=200,
+                batch_page_tokens=100,
+                extraction_cache=ExtractionCache(tmp_path / "extraction.sqlite3"),
+            )
+        scraper._client.chat.completions.create = AsyncMock(side_effect=fake_llm())
+
+        await extract_pages(scraper, [page_text(1), page_text(2)])
+        names = await extract_pages(scraper, [page_text(1), page_text(2), page_text(3)])
+
+        assert names[1] == ["Bitter Tablet No2"]
+        # Ikinci turda sadece yeni sayfa LLM'e gider (tek sayfalik batch)
+        assert scraper._client.chat.completions.create.call_count == 2
@@ -0,0 +1,133 @@
+"""ExtractionCache unit testleri."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sade_agents.scrapers.ai_scraper import AIScraper
+from sade_agents.scrapers.base import ProductPrice
+from sade_agents.scrapers.extraction_cache import ExtractionCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Gecici dizinde ExtractionCache."""
+    cache = ExtractionCache(tmp_path / "extraction.sqlite3")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def sample_products():
+    """Ornek urun listesi."""
+    return [
+        ProductPrice(name="Bitter 100g", price_tl=450, weight_grams=100, category="tablet"),
+        ProductPrice(name="Truffle Kutu", price_tl=890, category="truffle"),
+    ]
+
+
+class TestExtractionCache:
+    """Cache temel davranislari."""
+
+    def test_key_depends_on_all_parts(self):
+        """Metin, prompt versiyonu, model veya aciklama degisirse anahtar degisir."""
+        base = ExtractionCache.make_key("metin", "1", "gpt-4o-mini", "cikolata")
+
+        assert base == ExtractionCache.make_key("metin", "1", "gpt-4o-mini", "cikolata")
+        assert base != ExtractionCache.make_key("metin2", "1", "gpt-4o-mini", "cikolata")
+        assert base != ExtractionCache.make_key("metin", "2", "gpt-4o-mini", "cikolata")
+        assert base != ExtractionCache.make_key("metin", "1", "gpt-4o", "cikolata")
+        assert base != ExtractionCache.make_key("metin", "1", "gpt-4o-mini", "truffle")
+
+    def test_roundtrip_returns_fresh_objects(self, cache, sample_products):
+        """Kayit geri okunur; her okuma yeni obje uretir."""
+        cache.put("k", sample_products)
+
+        first = cache.get("k")
+        second = cache.get("k")
+
+        assert first == sample_products
+        assert first[0] is not second[0]
+        assert first[0].price_per_gram == 4.5
+        assert cache.stats.hits == 2
+
+    def test_persists_across_instances(self, tmp_path, sample_products):
+        """Kayit diskte kalir."""
+        path = tmp_path / "extraction.sqlite3"
+        writer = ExtractionCache(path)
+        writer.put("k", sample_products)
+        writer.close()
+
+        reader = ExtractionCache(path)
+        try:
+            assert reader.get("k") == sample_products
+        finally:
+            reader.close()
+
+    def test_ttl_expiry(self, tmp_path, sample_products):
+        """TTL'i gecen kayit okunmaz."""
+        cache = ExtractionCache(tmp_path / "ttl.sqlite3", ttl_seconds=-1)
+        try:
+            cache.put("k", sample_products)
+            assert cache.get("k") is None
+            assert cache.stats.expired == 1
+            assert len(cache) == 0
+        finally:
+            cache.close()
+
+    def test_lru_eviction(self, tmp_path, sample_products):
+        """Kayit limiti asilinca en eski erisilen silinir."""
+        cache = ExtractionCache(tmp_path / "lru.sqlite3", max_entries=2, memory_entries=0)
+        try:
+            cache.put("a", sample_products)
+            cache.put("b", sample_products)
+            cache.get("a")
+            cache.put("c", sample_products)
+
+            assert len(cache) == 2
+            assert cache.get("b") is None
+            assert cache.get("a") is not None
+        finally:
+            cache.close()
+
+
+class TestAIScraperIntegration:
+    """AIScraper'in cache'i kullanmasi."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_text_skips_llm(self, cache):
+        """Ayni metin ikinci kez LLM'e gitmez."""
+        with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
+            mock_settings.return_value.openai_model_name = "gpt-4"
+            scraper = AIScraper(extraction_cache=cache)
+
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = json.dumps(
+            [{"name": "Bitter 100g", "price_tl": 450, "weight_grams": 100, "category": "tablet"}]
+        )
+        scraper._client.chat.completions.create = AsyncMock(return_value=response)
+
+        first = await scraper._extract_products_with_ai("Sayfa metni", "shop", "cikolata")
+        second = await scraper._extract_products_with_ai("Sayfa metni", "shop", "cikolata")
+        changed = await scraper._extract_products_with_ai("Yeni metin", "shop", "cikolata")
+
+        assert first == second == changed
+        assert scraper._client.chat.completions.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_not_cached(self, cache):
+        """Parse edilemeyen LLM yaniti cache'lenmez."""
+        with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
+            mock_settings.return_value.openai_model_name = "gpt-4"
+            scraper = AIScraper(extraction_cache=cache)
+
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "gecersiz"
+        scraper._client.chat.completions.create = AsyncMock(return_value=response)
+
+        await scraper._extract_products_with_ai("Sayfa metni", "shop", "cikolata")
+
+        assert len(cache) == 0
@@ -0,0 +1,155 @@
+"""Sayfa parmak izi deposu ve artimli yeniden tarama testleri."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sade_agents.scrapers.ai_scraper import ScrapingTarget
+from sade_agents.scrapers.base import ProductPrice
+from sade_agents.scrapers.fingerprint import FingerprintStore, page_fingerprint, product_id
+from sade_agents.scrapers.http_session import FetchResponse
+from sade_agents.scrapers.page_cache import CrawlPageCache
+from sade_agents.scrapers.smart_scraper import SiteDiscoveryResult, SmartScraper
+
+URL = "https://shop.com/cikolata"
+
+
+def page(body: str) -> str:
+    return f"<html><body><nav>Menu</nav><main>{body}</main></body></html>"
+
+
+def make_page_cache(html: str) -> CrawlPageCache:
+    """Tek URL'i donduren sahte manager ile sayfa cache'i."""
+
+    async def fake_fetch(url, timeout=30, **kwargs):
+        return FetchResponse(url=url, status=200, text=html)
+
+    manager = MagicMock()
+    manager.fetch = AsyncMock(side_effect=fake_fetch)
+    return CrawlPageCache(manager=manager)
+
+
+def llm_response(products: list[dict]) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = json.dumps(products)
+    return response
+
+
+class TestFingerprint:
+    """Parmak izi ve urun kimligi."""
+
+    def test_whitespace_and_case_insensitive(self):
+        """Sadece bosluk/buyuk-kucuk harf farki parmak izini degistirmez."""
+        assert page_fingerprint("Bitter  100g\n450 TL") == page_fingerprint("bitter 100g 450 tl")
+        assert page_fingerprint("Bitter 450 TL") != page_fingerprint("Bitter 475 TL")
+
+    def test_context_changes_fingerprint(self):
+        """Prompt versiyonu/model degisirse sayfa yeniden cikarilir."""
+        assert page_fingerprint("metin", "1", "gpt-4o-mini") != page_fingerprint(
+            "metin", "2", "gpt-4o-mini"
+        )
+
+    def test_product_id_ignores_price(self):
+        """Urun kimligi fiyat degisince ayni kalir."""
+        old = ProductPrice(name="Bitter  Tablet", price_tl=450, weight_grams=100)
+        new = ProductPrice(name="bitter tablet", price_tl=475, weight_grams=100)
+        other = ProductPrice(name="Bitter Tablet", price_tl=900, weight_grams=200)
+
+        assert product_id(old) == product_id(new)
+        assert product_id(old) != product_id(other)
+
+
+class TestFingerprintStore:
+    """FingerprintStore testleri."""
+
+    def test_roundtrip(self, tmp_path):
+        """Snapshot diske yazilir ve yeniden acilinca okunur."""
+        path = tmp_path / "fp.sqlite3"
+        products = [ProductPrice(name="Bitter", price_tl=450, weight_grams=100, category="tablet")]
+
+        store = FingerprintStore(path)
+        store.put(URL, "abc", products, "llm")
+        store.close()
+
+        snapshot = FingerprintStore(path).get(URL)
+        assert snapshot.fingerprint == "abc"
+        assert snapshot.products == products
+        assert snapshot.product_ids == [product_id(products[0])]
+        assert snapshot.extraction_method == "llm"
+        assert FingerprintStore(path).get("https://shop.com/yok") is None
+
+
+class TestIncrementalScraping:
+    """SmartScraper'in degismeyen sayfalari atlamasi."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        scraper = SmartScraper()
+        scraper._fingerprints = FingerprintStore(tmp_path / "fp.sqlite3")
+        scraper._client.chat.completions.create = AsyncMock(
+            return_value=llm_response([{"name": "Bitter Tablet", "price_tl": 450}])
+        )
+        return scraper
+
+    async def scrape(self, scraper: SmartScraper, html: str):
+        target = ScrapingTarget(name="shop", url=URL, description="cikolata")
+        return await scraper._scrape_page(target, make_page_cache(html))
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_served_from_snapshot(self, scraper):
+        """Ayni icerik ikinci taramada cikarilmaz, urunler snapshot'tan gelir."""
+        first = await self.scrape(scraper, page("Bitter Tablet 450 TL"))
+        second = await self.scrape(scraper, page("Bitter   Tablet 450 TL"))
+
+        assert first.pages_skipped == 0
+        assert second.pages_skipped == 1
+        assert second.products == first.products
+        assert second.extraction_method == "llm"
+        assert scraper._client.chat.completions.create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_page_re_extracted(self, scraper):
+        """Icerik degisince sayfa yeniden cikarilir ve snapshot guncellenir."""
+        await self.scrape(scraper, page("Bitter Tablet 450 TL"))
+        scraper._client.chat.completions.create.return_value = llm_response(
+            [{"name": "Bitter Tablet", "price_tl": 475}]
+        )
+
+        result = await self.scrape(scraper, page("Bitter Tablet 475 TL"))
+
+        assert result.pages_skipped == 0
+        assert [p.price_tl for p in result.products] == [475]
+        assert scraper._fingerprints.get(URL).products[0].price_tl == 475
+        assert scraper._client.chat.completions.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_extraction_not_stored(self, scraper):
+        """Basarisiz cikarim snapshot olarak saklanmaz."""
+        scraper._client.chat.completions.create.side_effect = asyncio.TimeoutError()
+
+        result = await self.scrape(scraper, page("Bitter Tablet 450 TL"))
+
+        assert result.success is False
+        assert scraper._fingerprints.get(URL) is None
+
+    @pytest.mark.asyncio
+    async def test_scrape_site_reports_skipped_pages(self, scraper):
+        """scrape_site atlanan sayfa sayisini raporlar."""
+        html = page("Bitter Tablet 450 TL")
+        scraper._discover_site = AsyncMock(return_value=SiteDiscoveryResult(base_url=URL))
+        target = ScrapingTarget(name="shop", url=URL, description="cikolata")
+
+        with patch(
+            "sade_agents.scrapers.smart_scraper.CrawlPageCache", lambda: make_page_cache(html)
+        ):
+            first = await scraper.scrape_site(target)
+            second = await scraper.scrape_site(target)
+
+        assert first.pages_skipped == 0
+        assert second.success is True
+        assert second.pages_skipped == 1
+        assert second.extraction_method == "unchanged"
+        assert [p.name for p in second.products] == ["Bitter Tablet"]
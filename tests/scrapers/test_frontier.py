@@ -0,0 +1,169 @@
+"""Oncelikli tarama kuyrugu (CrawlFrontier) testleri."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from sade_agents.scrapers.base import ProductPrice, ScraperResult
+from sade_agents.scrapers.frontier import (
+    CrawlFrontier,
+    canonicalize_url,
+    crawl,
+    extract_links,
+    listing_key,
+    page_number,
+)
+from sade_agents.scrapers.parsing import parse_html
+from sade_agents.scrapers.smart_scraper import (
+    DiscoveredPage,
+    ScrapingTarget,
+    SiteDiscoveryResult,
+    SmartScraper,
+)
+
+LISTING_HTML = """
+<html><head><link rel="next" href="/cikolata?page=2"></head><body>
+  <a href="/cikolata?page=2#top">2</a>
+  <a href="/cikolata?page=3&utm_source=x">3</a>
+  <a href="/cikolata?page=1">1</a>
+  <a href="/tablet/sayfa/2">Tablet 2</a>
+  <a href="/cikolata/bitter/">Bitter</a>
+  <a href="/hakkimizda">Hakkimizda</a>
+  <a href="https://baska.com/cikolata?page=2">Dis</a>
+  <a href="javascript:void(0)">JS</a>
+</body></html>
+"""
+
+
+class TestCanonicalize:
+    """URL kanonik hali."""
+
+    def test_normalizes_host_query_and_fragment(self):
+        url = "HTTPS://Shop.COM:443/Cikolata/?utm_source=mail&b=2&a=1#liste"
+
+        assert canonicalize_url(url) == "https://shop.com/Cikolata?a=1&b=2"
+        assert canonicalize_url("../tablet", "https://shop.com/a/b") == "https://shop.com/tablet"
+        assert canonicalize_url("https://shop.com") == "https://shop.com/"
+
+    def test_page_number_and_listing_key(self):
+        assert page_number("https://shop.com/cikolata?page=3") == 3
+        assert page_number("https://shop.com/cikolata/sayfa/4") == 4
+        assert page_number("https://shop.com/cikolata") is None
+        assert listing_key("https://shop.com/cikolata/sayfa/4") == "https://shop.com/cikolata"
+        assert listing_key("https://shop.com/c?page=2&sort=a") == "https://shop.com/c?sort=a"
+
+
+class TestExtractLinks:
+    """Sayfalama ve link siniflandirma."""
+
+    def test_pagination_detected_for_same_listing(self):
+        links = extract_links(parse_html(LISTING_HTML), "https://shop.com/cikolata")
+
+        assert links.pagination == [
+            "https://shop.com/cikolata?page=2",
+            "https://shop.com/cikolata?page=3",
+        ]
+        urls = [url for url, _ in links.links]
+        # 1. sayfa ve baska listenin sayfasi normal link; dis host ve JS atlanir
+        assert "https://shop.com/cikolata?page=1" in urls
+        assert "https://shop.com/tablet/sayfa/2" in urls
+        assert "https://shop.com/cikolata/bitter" in urls
+        assert not any("baska.com" in url or "javascript" in url for url in urls)
+
+
+class TestCrawlFrontier:
+    """Oncelik, tekrar, derinlik ve butce."""
+
+    def test_priority_dedup_depth_and_budget(self):
+        frontier = CrawlFrontier(max_pages=3, max_depth=1)
+
+        assert frontier.push("https://shop.com/a", "category", 0.6)
+        assert frontier.push("https://shop.com/b/", "product_list", 0.9)
+        assert frontier.push("https://shop.com/b", "product_list", 0.9) is None
+        assert frontier.push("https://shop.com/c", "category", 0.5, depth=2) is None
+        assert frontier.push("https://shop.com/d", "category", 0.5, depth=1)
+        assert frontier.push("https://shop.com/e", "category", 0.99) is None  # butce dolu
+
+        assert [frontier.pop().url for _ in range(3)] == [
+            "https://shop.com/b",
+            "https://shop.com/a",
+            "https://shop.com/d",
+        ]
+        assert frontier.pop() is None
+
+    @pytest.mark.asyncio
+    async def test_crawl_bounded_workers_and_discovery(self):
+        """Worker sayisi kadar esszamanlilik; sonradan eklenenler de taranir."""
+        frontier = CrawlFrontier(max_pages=20, max_depth=5)
+        frontier.push("https://shop.com/0", "product_list", 0.9)
+        running = peak = 0
+
+        async def visit(page):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if page.depth < 3:
+                for i in range(3):
+                    frontier.push(f"{page.url}/{i}", "category", 0.5, page.depth + 1)
+            if page.url.endswith("/2/2"):
+                raise ValueError("bozuk sayfa")
+            return page.depth
+
+        results = [item async for item in crawl(frontier, visit, workers=3)]
+
+        assert len(results) == frontier.admitted == 20
+        assert peak == 3
+        errors = [r for _, r in results if isinstance(r, ValueError)]
+        assert len(errors) == 1
+
+
+class TestSmartScraperFrontier:
+    """SmartScraper sayfalamayi ve alt kategorileri takip eder."""
+
+    @pytest.mark.asyncio
+    async def test_follows_pagination_within_budget(self):
+        pages = {
+            "https://shop.com/cikolata": (
+                '<a href="/cikolata?page=2">2</a><a href="/cikolata/tablet">Tablet</a>'
+                '<a href="/iletisim">Iletisim</a>'
+            ),
+            "https://shop.com/cikolata?page=2": '<a href="/cikolata?page=3">3</a>',
+            "https://shop.com/cikolata?page=3": "",
+            "https://shop.com/cikolata/tablet": "",
+        }
+        scraped = []
+
+        async def fake_discover(self, url, page_cache=None, since=None):
+            return SiteDiscoveryResult(
+                base_url=url,
+                product_pages=[DiscoveredPage(
+                    url="https://shop.com/cikolata/", page_type="product_list", confidence=0.9
+                )],
+            )
+
+        async def fake_scrape_page(self, page_target, page_cache):
+            scraped.append(page_target.url)
+            page_cache._soups[page_target.url] = parse_html(pages[page_target.url])
+            return ScraperResult(
+                source=page_target.name,
+                success=True,
+                products=[ProductPrice(name=f"Urun {len(scraped)}", price_tl=100)],
+            )
+
+        target = ScrapingTarget(name="shop", url="https://shop.com", description="cikolata")
+        with patch.object(SmartScraper, "_discover_site", fake_discover), \
+             patch.object(SmartScraper, "_scrape_page", fake_scrape_page):
+            scraper = SmartScraper()
+            events = [e async for e in scraper.scrape_site_stream(target)]
+
+            scraper._settings.scraping_max_pages_per_site = 2
+            scraped.clear()
+            limited = await scraper.scrape_site(target)
+
+        assert sorted(e.url for e in events if not e.is_final) == sorted(pages)
+        assert events[-1].pages_total == 4
+        assert len(events[-1].result.products) == 4
+        assert len(scraped) == len(limited.products) == 2
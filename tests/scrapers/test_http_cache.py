@@ -0,0 +1,173 @@
+"""HttpCache (conditional-GET disk cache) unit testleri."""
+
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sade_agents.scrapers.http_cache import CachedResponse, HttpCache
+from sade_agents.scrapers.http_session import HttpSessionManager
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Gecici dizinde HttpCache."""
+    cache = HttpCache(tmp_path / "http_cache.sqlite3")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+async def etag_server():
+    """ETag / max-age destekli yerel test sunucusu."""
+    hits = {"etag": 0, "max_age": 0}
+
+    async def handle_etag(request: web.Request) -> web.Response:
+        hits["etag"] += 1
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.Response(text="<urlset>v1</urlset>", headers={"ETag": '"v1"'})
+
+    async def handle_max_age(request: web.Request) -> web.Response:
+        hits["max_age"] += 1
+        return web.Response(text="taze", headers={"Cache-Control": "public, max-age=600"})
+
+    app = web.Application()
+    app.router.add_get("/sitemap.xml", handle_etag)
+    app.router.add_get("/fresh", handle_max_age)
+
+    server = TestServer(app)
+    await server.start_server()
+    server.hits = hits
+    yield server
+    await server.close()
+
+
+# ============================================================================
+# Test: HttpCache
+# ============================================================================
+
+
+class TestHttpCache:
+    """Disk cache temel davranislari."""
+
+    def test_store_and_get(self, cache):
+        """ETag'li yanit saklanir ve geri okunur."""
+        assert cache.store("https://a.com/p", "govde", {"ETag": '"x"'}) is True
+
+        entry = cache.get("https://a.com/p")
+
+        assert entry.body == "govde"
+        assert entry.conditional_headers() == {"If-None-Match": '"x"'}
+
+    def test_store_skips_without_validators(self, cache):
+        """Dogrulayici ve max-age yoksa saklanmaz."""
+        assert cache.store("https://a.com/p", "govde", {}) is False
+        assert cache.get("https://a.com/p") is None
+
+    def test_store_skips_no_store(self, cache):
+        """Cache-Control: no-store saygi gorur."""
+        headers = {"ETag": '"x"', "Cache-Control": "no-store"}
+        assert cache.store("https://a.com/p", "govde", headers) is False
+
+    def test_freshness_from_max_age(self):
+        """max-age icinde taze, sonrasinda degil; no-cache hic taze degil."""
+        now = time.time()
+        entry = CachedResponse(url="u", body="b", cache_control="max-age=60", stored_at=now)
+        assert entry.is_fresh(now + 30) is True
+        assert entry.is_fresh(now + 61) is False
+
+        no_cache = CachedResponse(url="u", body="b", cache_control="no-cache, max-age=60")
+        assert no_cache.is_fresh() is False
+
+    def test_lru_eviction(self, tmp_path):
+        """Boyut limiti asilinca en eski erisilen kayit silinir."""
+        cache = HttpCache(tmp_path / "small.sqlite3", max_bytes=250)
+        try:
+            cache.store("https://a.com/1", "x" * 100, {"ETag": "1"})
+            cache.store("https://a.com/2", "x" * 100, {"ETag": "2"})
+            cache.get("https://a.com/1")  # 1 yeniden kullanildi, 2 en eski
+            cache.store("https://a.com/3", "x" * 100, {"ETag": "3"})
+
+            assert cache.get("https://a.com/2") is None
+            assert cache.get("https://a.com/1") is not None
+            assert cache.get("https://a.com/3") is not None
+            assert cache.total_bytes() <= 250
+        finally:
+            cache.close()
+
+    def test_domain_stats(self, cache):
+        """Domain bazli hit/miss sayilir."""
+        cache.record("https://a.com/1", "miss")
+        cache.record("https://a.com/1", "revalidated")
+        cache.record("https://a.com/2", "fresh")
+        cache.record("https://b.com/1", "miss")
+
+        stats = cache.stats
+        assert stats["a.com"].hits == 2
+        assert stats["a.com"].misses == 1
+        assert stats["a.com"].hit_ratio == pytest.approx(0.667)
+        assert stats["b.com"].hits == 0
+
+
+# ============================================================================
+# Test: HttpSessionManager entegrasyonu
+# ============================================================================
+
+
+class TestConditionalFetch:
+    """HttpSessionManager.fetch(use_cache=True) davranisi."""
+
+    @pytest.mark.asyncio
+    async def test_304_served_from_disk(self, cache, etag_server):
+        """Ikinci istek conditional gider, 304 govdesi diskten gelir."""
+        manager = HttpSessionManager(http_cache=cache)
+        url = str(etag_server.make_url("/sitemap.xml"))
+        try:
+            first = await manager.fetch(url, use_cache=True)
+            second = await manager.fetch(url, use_cache=True)
+        finally:
+            await manager.close()
+
+        assert first.from_cache is False
+        assert second.from_cache is True
+        assert second.status == 200
+        assert second.text == "<urlset>v1</urlset>"
+        assert etag_server.hits["etag"] == 2
+        domain_stats = next(iter(cache.stats.values()))
+        assert domain_stats.misses == 1
+        assert domain_stats.revalidated_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_skips_network(self, cache, etag_server):
+        """max-age icindeki kayit icin istek atilmaz."""
+        manager = HttpSessionManager(http_cache=cache)
+        url = str(etag_server.make_url("/fresh"))
+        try:
+            await manager.fetch(url, use_cache=True)
+            second = await manager.fetch(url, use_cache=True)
+        finally:
+            await manager.close()
+
+        assert second.from_cache is True
+        assert second.text == "taze"
+        assert etag_server.hits["max_age"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_bypassed_without_flag(self, cache, etag_server):
+        """use_cache=False iken cache okunmaz ve yazilmaz."""
+        manager = HttpSessionManager(http_cache=cache)
+        url = str(etag_server.make_url("/fresh"))
+        try:
+            await manager.fetch(url)
+            await manager.fetch(url)
+        finally:
+            await manager.close()
+
+        assert etag_server.hits["max_age"] == 2
+        assert cache.get(url) is None
@@ -0,0 +1,132 @@
+"""HttpSessionManager unit testleri."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sade_agents.scrapers.http_session import (
+    DEFAULT_HEADERS,
+    ConnectionStats,
+    HttpSessionManager,
+    get_session_manager,
+)
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+async def local_server():
+    """Keep-alive destekli yerel test sunucusu."""
+
+    async def handle_page(request: web.Request) -> web.Response:
+        return web.Response(
+            text=f"<html><body>{request.headers.get('Accept-Language', '')}</body></html>",
+            content_type="text/html",
+        )
+
+    async def handle_missing(request: web.Request) -> web.Response:
+        return web.Response(status=404, text="yok")
+
+    app = web.Application()
+    app.router.add_get("/page", handle_page)
+    app.router.add_get("/missing", handle_missing)
+
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def manager():
+    """Her test icin izole HttpSessionManager."""
+    manager = HttpSessionManager()
+    yield manager
+    await manager.close()
+
+
+# ============================================================================
+# Test: Session paylasimi
+# ============================================================================
+
+
+class TestSessionSharing:
+    """Session havuzu testleri."""
+
+    @pytest.mark.asyncio
+    async def test_same_session_within_loop(self, manager):
+        """Ayni loop icinde ayni session doner."""
+        first = await manager.get_session()
+        second = await manager.get_session()
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_closed_session_is_recreated(self, manager):
+        """Kapatilan session yerine yenisi olusturulur."""
+        first = await manager.get_session()
+        await first.close()
+        second = await manager.get_session()
+        assert second is not first
+        assert not second.closed
+
+    def test_get_session_manager_singleton(self):
+        """Process genelinde tek manager vardir."""
+        assert get_session_manager() is get_session_manager()
+
+    @pytest.mark.asyncio
+    async def test_default_headers_sent(self, manager, local_server):
+        """Varsayilan header'lar her istekte gonderilir."""
+        response = await manager.fetch(str(local_server.make_url("/page")))
+        assert DEFAULT_HEADERS["Accept-Language"] in response.text
+
+
+# ============================================================================
+# Test: Fetch ve istatistikler
+# ============================================================================
+
+
+class TestFetchAndStats:
+    """fetch() ve baglanti istatistikleri testleri."""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, manager, local_server):
+        """Ayni host'a ardisik isteklerde baglanti tekrar kullanilir."""
+        url = str(local_server.make_url("/page"))
+        for _ in range(3):
+            response = await manager.fetch(url)
+            assert response.ok
+
+        stats = manager.stats
+        assert stats.requests == 3
+        assert stats.connections_created == 1
+        assert stats.connections_reused == 2
+
+    @pytest.mark.asyncio
+    async def test_non_200_returns_status(self, manager, local_server):
+        """raise_for_status=False iken 404 durum kodu doner."""
+        response = await manager.fetch(str(local_server.make_url("/missing")))
+        assert response.status == 404
+        assert response.text == ""
+
+    @pytest.mark.asyncio
+    async def test_raise_for_status(self, manager, local_server):
+        """raise_for_status=True iken 404 hata firlatir."""
+        import aiohttp
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            await manager.fetch(str(local_server.make_url("/missing")), raise_for_status=True)
+
+    def test_stats_since_and_ratio(self):
+        """Run bazli fark ve reuse orani hesaplanir."""
+        before = ConnectionStats(requests=2, connections_created=1, connections_reused=1)
+        after = ConnectionStats(requests=6, connections_created=2, connections_reused=4)
+
+        delta = after.since(before)
+
+        assert delta.requests == 4
+        assert delta.connections_created == 1
+        assert delta.connections_reused == 3
+        assert delta.reuse_ratio == 0.75
+        assert ConnectionStats().reuse_ratio == 0.0
@@ -0,0 +1,150 @@
+"""CrawlPageCache unit testleri."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sade_agents.scrapers.ai_scraper import AIScraper, ScrapingTarget
+from sade_agents.scrapers.http_session import FetchResponse
+from sade_agents.scrapers.page_cache import CrawlPageCache
+from sade_agents.scrapers.smart_scraper import SmartScraper
+
+HOMEPAGE_HTML = """
+<html><body>
+    <div class="content">
+        <a href="/cikolata">Cikolatalar</a>
+        <a href="/hakkimizda">Hakkimizda</a>
+    </div>
+    <div>Bitter 100g 450 TL</div>
+</body></html>
+"""
+
+
+def make_manager(responses: dict[str, FetchResponse], delay: float = 0.0) -> MagicMock:
+    """URL -> FetchResponse eslemesiyle sahte HttpSessionManager."""
+
+    async def fake_fetch(url, timeout=30, **kwargs):
+        await asyncio.sleep(delay)
+        if url in responses:
+            return responses[url]
+        return FetchResponse(url=url, status=404, text="")
+
+    manager = MagicMock()
+    manager.fetch = AsyncMock(side_effect=fake_fetch)
+    return manager
+
+
+# ============================================================================
+# Test: Single-flight ve memoization
+# ============================================================================
+
+
+class TestCrawlPageCache:
+    """CrawlPageCache testleri."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_share_one_request(self):
+        """Eszamanli ayni URL istekleri tek istege indirgenir."""
+        url = "https://example.com/"
+        manager = make_manager({url: FetchResponse(url=url, status=200, text="ok")}, delay=0.01)
+        cache = CrawlPageCache(manager=manager)
+
+        results = await asyncio.gather(*(cache.fetch(url) for _ in range(5)))
+
+        assert manager.fetch.call_count == 1
+        assert all(r.text == "ok" for r in results)
+        assert cache.stats.fetches == 1
+        assert cache.stats.hits == 4
+
+    @pytest.mark.asyncio
+    async def test_soup_parsed_once(self):
+        """Ayni sayfanin DOM'u tek kez parse edilir."""
+        url = "https://example.com/"
+        manager = make_manager({url: FetchResponse(url=url, status=200, text=HOMEPAGE_HTML)})
+        cache = CrawlPageCache(manager=manager)
+
+        first = await cache.get_soup(url)
+        second = await cache.get_soup(url)
+
+        assert first is second
+        assert cache.stats.parses == 1
+        assert cache.peek_soup(url) is first
+
+    @pytest.mark.asyncio
+    async def test_non_200_returns_none(self):
+        """200 olmayan sayfa icin None doner."""
+        manager = make_manager({})
+        cache = CrawlPageCache(manager=manager)
+
+        assert await cache.get_html("https://example.com/yok") is None
+        assert await cache.get_soup("https://example.com/yok") is None
+        assert manager.fetch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_memoized(self):
+        """Basarisiz istek ayni tarama icinde tekrar denenmez."""
+        manager = MagicMock()
+        manager.fetch = AsyncMock(side_effect=Exception("Network error"))
+        cache = CrawlPageCache(manager=manager)
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="Network error"):
+                await cache.fetch("https://example.com/")
+
+        assert manager.fetch.call_count == 1
+
+
+# ============================================================================
+# Test: Scraper entegrasyonu
+# ============================================================================
+
+
+class TestScraperIntegration:
+    """SmartScraper / AIScraper'in cache'i paylasmasi."""
+
+    @pytest.mark.asyncio
+    async def test_homepage_fetched_once_across_stages(self):
+        """Ana sayfa menu kesfi, AI kesfi ve urun cikarma icin tek kez indirilir."""
+        url = "https://example.com"
+        manager = make_manager({url: FetchResponse(url=url, status=200, text=HOMEPAGE_HTML)})
+        cache = CrawlPageCache(manager=manager)
+
+        scraper = SmartScraper()
+        ai_choice = MagicMock()
+        ai_choice.message.content = json.dumps([{"url": f"{url}/cikolata", "confidence": 0.9}])
+        ai_response = MagicMock()
+        ai_response.choices = [ai_choice]
+
+        create = AsyncMock(return_value=ai_response)
+        with patch.object(scraper._client.chat.completions, "create", create):
+            await scraper._discover_from_menu(url, cache)
+            await scraper._discover_with_ai(url, cache)
+
+        scraper._ai_scraper._extract_products_with_ai = AsyncMock(return_value=[])
+        target = ScrapingTarget(name="test", url=url, description="cikolata")
+        result = await scraper._ai_scraper.scrape(target, page_cache=cache)
+
+        assert result.success is True
+        home_calls = [c for c in manager.fetch.call_args_list if c.args[0] == url]
+        assert len(home_calls) == 1
+        assert cache.stats.parses == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_dom_not_mutated_by_cleaning(self):
+        """Metin temizleme paylasilan DOM'u degistirmez."""
+        url = "https://example.com"
+        html = "<html><body><nav>Menu</nav><script>x=1</script><div>Urun</div></body></html>"
+        manager = make_manager({url: FetchResponse(url=url, status=200, text=html)})
+        cache = CrawlPageCache(manager=manager)
+
+        with patch("sade_agents.scrapers.ai_scraper.get_settings"):
+            scraper = AIScraper()
+        soup = await cache.get_soup(url)
+
+        cleaned = scraper._clean_soup(soup)
+
+        assert cleaned == "Urun"
+        assert soup.find("nav") is not None
+        assert soup.find("script") is not None
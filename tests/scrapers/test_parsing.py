@@ -0,0 +1,46 @@
+"""Ortak HTML parse asamasi testleri."""
+
+from sade_agents.scrapers.parsing import HTML_PARSER, clean_text, parse_html
+from sade_agents.scrapers.vakko import VakkoScraper
+
+
+class TestParseHtml:
+    """parse_html / clean_text testleri."""
+
+    def test_uses_lxml_backend(self):
+        """lxml kuruluyken lxml kullanilir."""
+        assert HTML_PARSER == "lxml"
+
+    def test_clean_text_skips_noise_without_mutating(self):
+        """Gurultu elementleri atlanir, DOM degismez."""
+        soup = parse_html(
+            "<html><body><header>Logo</header><div>Bitter <b>100g</b></div>"
+            "<script>x=1</script><footer>Adres</footer></body></html>"
+        )
+
+        assert clean_text(soup) == "Bitter 100g"
+        assert soup.find("script") is not None
+
+    def test_clean_text_fragment(self):
+        """Body'siz parca da temizlenir."""
+        assert clean_text(parse_html("<p>Truffle</p><style>p{}</style>")) == "Truffle"
+
+
+class TestLegacyScrapers:
+    """Eski CSS scraper'larin ortak parser ile calismasi."""
+
+    def test_vakko_parse_products(self):
+        """Urun kartlari lxml DOM'undan okunur."""
+        html = """
+        <div class="product-card">
+            <h3>Bitter Tablet 100g</h3>
+            <span class="price">450,00 TL</span>
+            <a href="/urun/bitter">Detay</a>
+        </div>
+        """
+        products = VakkoScraper()._parse_products(html)
+
+        assert len(products) == 1
+        assert products[0].name == "Bitter Tablet 100g"
+        assert products[0].price_tl == 450.0
+        assert products[0].weight_grams == 100
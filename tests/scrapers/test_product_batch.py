@@ -0,0 +1,89 @@
+"""ProductBatch (kolon bazli urun toplulugu) testleri."""
+
+import numpy as np
+import pytest
+
+from sade_agents.scrapers.base import ProductPrice, ScraperResult
+from sade_agents.scrapers.product_batch import ProductBatch, compute_price_per_gram
+
+PRODUCTS = [
+    ProductPrice(name="Bitter Tablet", price_tl=450, weight_grams=100, category="tablet"),
+    ProductPrice(name="Truffle Kutusu", price_tl=900, url="https://shop.com/truffle"),
+    ProductPrice(name="Bitter Tablet", price_tl=800, weight_grams=200, category="tablet"),
+]
+
+
+class TestProductPrice:
+    """ProductPrice __slots__ kullanir."""
+
+    def test_no_instance_dict(self):
+        product = ProductPrice(name="Bitter", price_tl=450, weight_grams=100)
+
+        assert not hasattr(product, "__dict__")
+        assert product.price_per_gram == 4.5
+
+
+class TestProductBatch:
+    """ProductBatch testleri."""
+
+    def test_columns_and_interned_strings(self):
+        """Tekrar eden isim/kategori bir kez saklanir, kolonlar tiplidir."""
+        batch = ProductBatch.from_products(PRODUCTS, source="vakko")
+
+        assert len(batch) == 3
+        assert batch.price_tl.dtype == np.float64
+        assert batch.names == ["Bitter Tablet", "Truffle Kutusu"]
+        assert batch.name_codes.tolist() == [0, 1, 0]
+        assert batch.categories == ["tablet", None]
+        np.testing.assert_array_equal(batch.price_per_gram, [4.5, np.nan, 4.0])
+
+    def test_roundtrip_products(self):
+        """Indeksleme ayni ProductPrice'lari uretir."""
+        batch = ProductBatch.from_products(PRODUCTS, source="vakko")
+
+        assert list(batch) == PRODUCTS
+        assert batch.source_of(1) == "vakko"
+
+    def test_from_results_skips_failed(self):
+        """Basarisiz sonuclar atlanir, kaynak kodlanir."""
+        results = {
+            "vakko": ScraperResult(source="vakko", success=True, products=PRODUCTS[:2]),
+            "godiva": ScraperResult(source="godiva", success=False, products=PRODUCTS),
+            "kahve": ScraperResult(source="kahve", success=True, products=PRODUCTS[2:]),
+        }
+
+        batch = ProductBatch.from_results(results)
+
+        assert len(batch) == 3
+        assert [batch.source_of(i) for i in range(3)] == ["vakko", "vakko", "kahve"]
+
+    def test_to_frame_shares_numeric_columns(self):
+        """DataFrame sayisal kolonlari kopyalamaz; string kolonlar Categorical."""
+        batch = ProductBatch.from_products(PRODUCTS, source="vakko")
+
+        df = batch.to_frame()
+
+        assert np.shares_memory(df["price_tl"].to_numpy(), batch.price_tl)
+        assert df["name"].dtype == "category"
+        assert df["category"].isna().tolist() == [False, True, False]
+        assert df["name"].tolist() == [p.name for p in PRODUCTS]
+
+    def test_compute_price_per_gram_keeps_given_values(self):
+        """Verilmis TL/gram korunur, eksikler toplu hesaplanir."""
+        result = compute_price_per_gram(
+            np.array([450.0, 333.0, 100.0]),
+            np.array([100.0, 100.0, np.nan]),
+            np.array([np.nan, 3.0, np.nan]),
+        )
+
+        assert result[:2].tolist() == [4.5, 3.0]
+        assert np.isnan(result[2])
+
+    def test_empty(self):
+        """Bos batch DataFrame'e donusur, indeksleme hata verir."""
+        batch = ProductBatch.from_products([])
+
+        assert len(batch) == 0
+        assert batch.to_frame().empty
+        with pytest.raises(IndexError):
+            batch[0]
@@ -0,0 +1,92 @@
+"""ProductFrame (vektorel urun analitigi) testleri."""
+
+import pytest
+
+from sade_agents.scrapers.base import ProductPrice, ScraperResult
+from sade_agents.scrapers.product_frame import ProductFrame
+
+
+def result(source: str, products: list[ProductPrice], success: bool = True) -> ScraperResult:
+    return ScraperResult(source=source, success=success, products=products)
+
+
+@pytest.fixture
+def frame() -> ProductFrame:
+    vakko = result(
+        "vakko",
+        [
+            ProductPrice(name="Bitter Tablet", price_tl=450, weight_grams=100, category="tablet"),
+            ProductPrice(name="Sutlu Tablet", price_tl=400, weight_grams=100, category="tablet"),
+            ProductPrice(name="Beyaz Tablet", price_tl=420, weight_grams=100, category="tablet"),
+            ProductPrice(name="Altin Tablet", price_tl=4000, weight_grams=100, category="tablet"),
+            ProductPrice(name="Truffle Kutusu 12 adet", price_tl=900, category="truffle"),
+            ProductPrice(name="Fiyatsiz", price_tl=0),
+        ],
+    )
+    kahve = result(
+        "kahve_dunyasi",
+        [
+            ProductPrice(name="Bitter Tablet", price_tl=380, weight_grams=100, category="tablet"),
+            ProductPrice(name="Pralin 16'lı", price_tl=800),
+        ],
+    )
+    failed = result("godiva", [ProductPrice(name="Eski", price_tl=999)], success=False)
+    return ProductFrame.from_results({"vakko": vakko, "kahve_dunyasi": kahve, "godiva": failed})
+
+
+class TestProductFrame:
+    """ProductFrame testleri."""
+
+    def test_build_skips_failed_results_and_zero_prices(self, frame):
+        """Basarisiz sonuclar ve fiyatsiz urunler alinmaz, birim fiyatlar hesaplanir."""
+        df = frame.df
+
+        assert len(frame) == 7
+        assert set(df["source"]) == {"vakko", "kahve_dunyasi"}
+        assert df.loc[df["name"] == "Bitter Tablet", "price_per_gram"].tolist() == [4.5, 3.8]
+        assert df.loc[df["name"] == "Truffle Kutusu 12 adet", "price_per_piece"].item() == 75
+        assert df.loc[df["name"] == "Pralin 16'lı", "pieces"].item() == 16
+        assert df.loc[df["name"] == "Pralin 16'lı", "category"].item() == "diger"
+
+    def test_summary(self, frame):
+        """Genel ozet tum urunleri kapsar."""
+        summary = frame.summary()
+
+        assert summary["count"] == 7
+        assert summary["min_price"] == 380
+        assert summary["max_price"] == 4000
+        assert summary["median_price_per_gram"] == 4.2
+
+    def test_category_percentiles(self, frame):
+        """Kategori bazli yuzdelikler."""
+        table = frame.category_percentiles("price_tl", (0.5,))
+
+        assert table.loc["tablet", "count"] == 5
+        assert table.loc["tablet", "p50"] == 420
+        assert list(table.index) == ["diger", "tablet", "truffle"]
+
+    def test_outliers_within_category(self, frame):
+        """Kategori icinde asiri pahali urun isaretlenir."""
+        flagged = frame.df.loc[frame.outliers(), "name"].tolist()
+
+        assert flagged == ["Altin Tablet"]
+
+    def test_brand_comparison(self, frame):
+        """Kaynak x kategori medyan TL/gram tablosu."""
+        table = frame.brand_comparison()
+
+        assert table.loc["vakko", "tablet"] == pytest.approx(4.35)
+        assert table.loc["kahve_dunyasi", "tablet"] == 3.8
+
+    def test_to_text_and_empty_frame(self, frame):
+        """Prompt satirlari kategori basina bir satir; bos frame hata vermez."""
+        lines = frame.to_text()
+
+        assert len(lines) == 3
+        assert "1 aykiri fiyat" in next(line for line in lines if "tablet" in line)
+        assert "75 TL/adet" in next(line for line in lines if "truffle" in line)
+
+        empty = ProductFrame.from_results(result("bos", []))
+        assert len(empty) == 0
+        assert empty.summary()["min_price"] is None
+        assert empty.to_text() == []
@@ -0,0 +1,111 @@
+"""Urun kimligi ve bulanik tekrar tespiti testleri."""
+
+from sade_agents.scrapers.base import ProductPrice
+from sade_agents.scrapers.product_identity import (
+    ProductIndex,
+    deduplicate_products,
+    fold_turkish,
+    normalize_name,
+    product_key,
+)
+
+
+class TestNormalization:
+    """Turkce duyarli isim normalizasyonu."""
+
+    def test_turkish_characters_folded(self):
+        """ı/İ/ş/ğ/ü/ö/ç ASCII karsiliklarina iner."""
+        assert fold_turkish("SÜTLÜ FINDIKLI İKRAM") == "sutlu findikli ikram"
+        assert fold_turkish("Çağla Şöleni") == "cagla soleni"
+
+    def test_weight_punctuation_and_order_ignored(self):
+        """Gramaj, noktalama ve kelime sirasi normalize isimde yok sayilir."""
+        assert normalize_name("Sütlü  Fındıklı Tablet 100g!") == "findikli sutlu tablet"
+        assert normalize_name("Tablet - Fındıklı, Sütlü (100 gr)") == "findikli sutlu tablet"
+        assert normalize_name("Bitter %70") == "70 bitter"
+
+    def test_product_key_stable_across_variants(self):
+        """Yazim farklari anahtari degistirmez; gramaj degistirir."""
+        a = ProductPrice(name="Sütlü Fındıklı Tablet", price_tl=400, weight_grams=100)
+        b = ProductPrice(name="sutlu findikli tablet 100g", price_tl=420, weight_grams=100)
+        c = ProductPrice(name="Sütlü Fındıklı Tablet", price_tl=700, weight_grams=200)
+
+        assert product_key(a) == product_key(b)
+        assert product_key(a) != product_key(c)
+        assert len(product_key(a)) == 16
+
+
+class TestDeduplication:
+    """Bulanik tekrar kaldirma."""
+
+    def test_near_duplicates_merged_and_fields_filled(self):
+        """Kategori ve detay sayfasindaki ayni urun tek kayit olur, eksik alanlar tamamlanir."""
+        products = [
+            ProductPrice(name="Sade Bitter Çikolata Tablet", price_tl=450, weight_grams=100),
+            ProductPrice(
+                name="Sade Bitter Cikolata Tablet.",
+                price_tl=450,
+                weight_grams=100,
+                category="tablet",
+                url="https://shop.com/bitter",
+            ),
+            ProductPrice(name="Sade Sütlü Çikolata Tablet", price_tl=420, weight_grams=100),
+        ]
+
+        unique = deduplicate_products(products)
+
+        assert [p.name for p in unique] == [
+            "Sade Bitter Çikolata Tablet",
+            "Sade Sütlü Çikolata Tablet",
+        ]
+        assert unique[0].category == "tablet"
+        assert unique[0].url == "https://shop.com/bitter"
+
+    def test_different_weight_number_or_category_not_merged(self):
+        """Gramaj, isimdeki sayi veya kategori farkli urunler birlesmez."""
+        products = [
+            ProductPrice(name="Bitter Tablet %70 Kakao", price_tl=450, weight_grams=100),
+            ProductPrice(name="Bitter Tablet %85 Kakao", price_tl=470, weight_grams=100),
+            ProductPrice(name="Bitter Tablet %70 Kakao", price_tl=800, weight_grams=200),
+            ProductPrice(name="Pralin Kutusu", price_tl=900, weight_grams=250, category="truffle"),
+            ProductPrice(name="Pralin Kutusu", price_tl=900, weight_grams=250, category="hediye"),
+        ]
+
+        assert len(deduplicate_products(products)) == 5
+
+    def test_large_catalog(self):
+        """Buyuk katalogda yakin tekrarlar bulunur, farkli urunler korunur."""
+        flavors = ["Bitter", "Sütlü", "Beyaz", "Fındıklı", "Antep Fıstıklı"]
+        products = [
+            ProductPrice(
+                name=f"{flavors[i % 5]} Tablet Seri {i}",
+                price_tl=100 + i % 500,
+                weight_grams=(100, 200)[i % 2],
+            )
+            for i in range(10000)
+        ]
+        variants = [
+            ProductPrice(
+                name=p.name.upper().replace("TABLET", "Tabletler"),
+                price_tl=p.price_tl,
+                weight_grams=p.weight_grams,
+            )
+            for p in products[:2000]
+        ]
+
+        assert len(deduplicate_products(products + variants)) == 10000
+
+
+class TestProductIndex:
+    """Taramalar arasi kimlik eslestirme."""
+
+    def test_resolve_returns_known_key(self):
+        """Onceden bilinen urunun varyanti bilinen anahtari alir."""
+        index = ProductIndex()
+        index.add(ProductPrice(name="Sade Bitter Tablet", price_tl=450, weight_grams=100), key="k1")
+
+        variant = ProductPrice(name="SADE BİTTER TABLETİ", price_tl=475, weight_grams=100)
+        assert index.resolve(variant) == "k1"
+        new_key = index.resolve(ProductPrice(name="Sütlü Tablet", price_tl=400, weight_grams=100))
+        assert new_key != "k1"
+        assert len(index) == 2
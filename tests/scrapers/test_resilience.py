@@ -0,0 +1,283 @@
+"""Tekrar deneme, devre kesici ve hata butcesi testleri."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import urlparse
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sade_agents.scrapers.ai_scraper import AIScraper
+from sade_agents.scrapers.http_session import HttpSessionManager
+from sade_agents.scrapers.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResiliencePolicy,
+    is_transient_error,
+)
+from sade_agents.scrapers.scheduler import PolitenessScheduler
+
+
+def fast_policy(**kwargs) -> ResiliencePolicy:
+    """Testler icin beklemesi cok kisa politika."""
+    kwargs.setdefault("backoff_base", 0.001)
+    kwargs.setdefault("backoff_max", 0.005)
+    return ResiliencePolicy(**kwargs)
+
+
+def failing(times: int, error: Exception, result="ok"):
+    """Ilk `times` cagrida hata firlatan, sonra result donduren fonksiyon."""
+    calls = {"count": 0}
+
+    async def func():
+        calls["count"] += 1
+        if calls["count"] <= times:
+            raise error
+        return result
+
+    return func, calls
+
+
+# ============================================================================
+# Test: CircuitBreaker
+# ============================================================================
+
+
+class TestCircuitBreaker:
+    """Devre kesici durum gecisleri."""
+
+    def test_opens_after_threshold_and_half_opens(self):
+        """Esik asilinca acilir, sure dolunca tek deneme istegine izin verir."""
+        breaker = CircuitBreaker("shop.com", failure_threshold=2, reset_timeout=0.05)
+
+        breaker.record_failure()
+        breaker.before_call()  # Henuz kapali
+        breaker.record_failure()
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        time.sleep(0.06)
+        breaker.before_call()  # Deneme istegi
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # Deneme surerken digerleri reddedilir
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+        breaker.before_call()
+
+    def test_failed_trial_reopens(self):
+        """Half-open deneme basarisizsa devre tekrar acilir."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+
+    def test_transient_classification(self):
+        """Baglanti/timeout/5xx gecici; 404, 503 ve diger hatalar degil."""
+        request_info = MagicMock()
+
+        def http_error(status):
+            return aiohttp.ClientResponseError(request_info, (), status=status)
+
+        assert is_transient_error(aiohttp.ClientConnectionError())
+        assert is_transient_error(asyncio.TimeoutError())
+        assert is_transient_error(http_error(502))
+        assert not is_transient_error(http_error(404))
+        assert not is_transient_error(http_error(503))  # Zamanlayici tekrar dener
+        assert not is_transient_error(ValueError())
+        assert not is_transient_error(CircuitOpenError("shop.com", 1))
+
+
+# ============================================================================
+# Test: ResiliencePolicy.call
+# ============================================================================
+
+
+class TestResiliencePolicy:
+    """Tekrar deneme davranisi."""
+
+    @pytest.mark.asyncio
+    async def test_transient_error_retried(self):
+        """Gecici hata tekrar denenir."""
+        func, calls = failing(2, aiohttp.ClientConnectionError())
+
+        assert await fast_policy(max_attempts=3).call("shop.com", func) == "ok"
+        assert calls["count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_attempts_are_bounded(self):
+        """Deneme limiti dolunca son hata firlatilir."""
+        func, calls = failing(10, asyncio.TimeoutError())
+
+        with pytest.raises(asyncio.TimeoutError):
+            await fast_policy(max_attempts=3).call("shop.com", func)
+        assert calls["count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_permanent_error_not_retried(self):
+        """Kalici hata tekrar denenmez."""
+        func, calls = failing(1, ValueError("bozuk"))
+
+        with pytest.raises(ValueError):
+            await fast_policy().call("shop.com", func)
+        assert calls["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_result_retried_then_returned(self):
+        """is_failure sonucu tekrar denenir; denemeler tukenince son sonuc doner."""
+        results = iter([502, 502, 502])
+
+        async def func():
+            return next(results)
+
+        result = await fast_policy(max_attempts=3).call(
+            "shop.com", func, is_failure=lambda status: status >= 500
+        )
+        assert result == 502
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """Acik devrede fonksiyon hic cagrilmaz."""
+        policy = fast_policy(max_attempts=1, failure_threshold=2)
+        func, calls = failing(10, aiohttp.ClientConnectionError())
+
+        for _ in range(2):
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await policy.call("dead.com", func)
+        with pytest.raises(CircuitOpenError):
+            await policy.call("dead.com", func)
+
+        assert calls["count"] == 2
+        assert policy.open_circuits() == ["dead.com"]
+        # Diger anahtarlar etkilenmez
+        assert await policy.call("shop.com", failing(0, ValueError())[0]) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_failure_budget_shared_across_tasks(self):
+        """Butce tukenince tarama icindeki hicbir cagri tekrar denenmez."""
+        policy = fast_policy(max_attempts=5, failure_threshold=100, run_failure_budget=3)
+        funcs = [failing(10, aiohttp.ClientConnectionError()) for _ in range(4)]
+
+        with policy.failure_budget() as budget:
+            await asyncio.gather(
+                *(policy.call(f"site{i}.com", func) for i, (func, _) in enumerate(funcs)),
+                return_exceptions=True,
+            )
+
+        # 4 ilk deneme + butceden 3 tekrar
+        assert sum(calls["count"] for _, calls in funcs) == 7
+        assert budget.exhausted
+
+
+# ============================================================================
+# Test: HttpSessionManager ve AIScraper entegrasyonu
+# ============================================================================
+
+
+@pytest.fixture
+async def flaky_site():
+    """Ilk N istege 502 donen yerel sunucu."""
+    state = {"requests": 0, "fail_first": 0}
+
+    async def handle(request: web.Request) -> web.Response:
+        state["requests"] += 1
+        if state["requests"] <= state["fail_first"]:
+            return web.Response(status=502)
+        return web.Response(text="<html>ok</html>")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    state["url"] = str(server.make_url("/cikolata"))
+    yield state
+    await server.close()
+
+
+class TestIntegration:
+    """Sayfa cekme ve LLM cagrilarinin sarilmasi."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_retries_5xx(self, flaky_site):
+        """502 sonrasi sayfa tekrar cekilir."""
+        flaky_site["fail_first"] = 1
+        manager = HttpSessionManager(resilience=fast_policy())
+        try:
+            response = await manager.fetch(flaky_site["url"])
+        finally:
+            await manager.close()
+
+        assert response.status == 200
+        assert flaky_site["requests"] == 2
+
+    @pytest.mark.asyncio
+    async def test_dead_domain_fails_fast(self, flaky_site):
+        """Surekli hata veren domain'e devre acildiktan sonra istek gitmez."""
+        flaky_site["fail_first"] = 1000
+        manager = HttpSessionManager(
+            resilience=fast_policy(max_attempts=2, failure_threshold=3)
+        )
+        outcomes = []
+        try:
+            for _ in range(5):
+                try:
+                    outcomes.append((await manager.fetch(flaky_site["url"])).status)
+                except CircuitOpenError:
+                    outcomes.append("open")
+        finally:
+            await manager.close()
+
+        assert flaky_site["requests"] == 3
+        assert outcomes[-3:] == ["open", "open", "open"]
+
+    @pytest.mark.asyncio
+    async def test_circuit_opened_during_slot_wait_stays_open(self, flaky_site):
+        """Slot beklenirken acilan devre, reddedilen istekle kapanmaz."""
+        policy = fast_policy(failure_threshold=2)
+        scheduler = PolitenessScheduler(per_domain_limit=1, rate_per_second=1000.0)
+        manager = HttpSessionManager(scheduler=scheduler, resilience=policy)
+        breaker = policy.breaker(urlparse(flaky_site["url"]).netloc)
+        try:
+            async with scheduler.slot(flaky_site["url"]):
+                fetch = asyncio.create_task(manager.fetch(flaky_site["url"]))
+                await asyncio.sleep(0.01)
+                breaker.record_failure()
+                breaker.record_failure()
+            with pytest.raises(CircuitOpenError):
+                await fetch
+        finally:
+            await manager.close()
+
+        assert breaker.state == "open"
+        assert flaky_site["requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_llm_timeout_retried(self):
+        """LLM timeout'u tekrar denenir."""
+        with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
+            mock_settings.return_value.openai_model_name = "gpt-4"
+            scraper = AIScraper(resilience=fast_policy())
+
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = json.dumps(
+            [{"name": "Bitter Tablet", "price_tl": 450}]
+        )
+        scraper._client.chat.completions.create = AsyncMock(
+            side_effect=[asyncio.TimeoutError(), response]
+        )
+
+        products = await scraper._extract_products_with_ai(
+            "Bitter Tablet 450 TL", "shop", "cikolata"
+        )
+
+        assert [p.name for p in products] == ["Bitter Tablet"]
+        assert scraper._client.chat.completions.create.call_count == 2
@@ -0,0 +1,206 @@
+"""PolitenessScheduler unit testleri."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sade_agents.scrapers.http_session import HttpSessionManager
+from sade_agents.scrapers.scheduler import PolitenessScheduler, TokenBucket, parse_retry_after
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class ThrottlingSite:
+    """Eszamanli istek sayisini olcen, istenirse 429 donen test sitesi."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.requests = 0
+        self.throttle_first = 0  # Ilk N istege 429 don
+        self.retry_after = "0"
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.requests <= self.throttle_first:
+            return web.Response(status=429, headers={"Retry-After": self.retry_after})
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.05)
+        self.active -= 1
+        return web.Response(text="ok")
+
+
+@pytest.fixture
+async def site():
+    """Yerel test sunucusu."""
+    site = ThrottlingSite()
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", site.handle)
+    server = TestServer(app)
+    await server.start_server()
+    site.url = str(server.make_url("/page"))
+    yield site
+    await server.close()
+
+
+def make_manager(scheduler: PolitenessScheduler) -> HttpSessionManager:
+    return HttpSessionManager(scheduler=scheduler)
+
+
+# ============================================================================
+# Test: Yardimcilar
+# ============================================================================
+
+
+class TestHelpers:
+    """TokenBucket ve Retry-After parse testleri."""
+
+    def test_token_bucket_burst_then_rate(self):
+        """Burst kadar istek beklemesiz, sonrakiler hiza gore bekler."""
+        bucket = TokenBucket(rate=10, burst=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_parse_retry_after(self):
+        """Saniye ve HTTP tarihi formatlari."""
+        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        assert parse_retry_after("120") == 120
+        assert parse_retry_after("Mon, 01 Jan 2024 12:00:30 GMT", now=now) == 30
+        assert parse_retry_after("Mon, 01 Jan 2024 11:00:00 GMT", now=now) == 0
+        assert parse_retry_after("gecersiz") is None
+        assert parse_retry_after(None) is None
+
+
+# ============================================================================
+# Test: Limitler
+# ============================================================================
+
+
+class TestLimits:
+    """Eszamanlilik ve hiz limitleri."""
+
+    @pytest.mark.asyncio
+    async def test_per_domain_concurrency_cap(self, site):
+        """Ayni domain'e eszamanli istek limiti asilmaz; kuyruk olculur."""
+        scheduler = PolitenessScheduler(per_domain_limit=2, rate_per_second=0)
+        manager = make_manager(scheduler)
+        try:
+            await asyncio.gather(*(manager.fetch(site.url) for _ in range(6)))
+        finally:
+            await manager.close()
+
+        assert site.peak == 2
+        metrics = next(iter(scheduler.metrics().values()))
+        assert metrics.requests == 6
+        assert metrics.max_queue_depth >= 4
+        assert metrics.queue_depth == 0
+        assert metrics.in_flight == 0
+        assert metrics.avg_latency > 0
+
+    @pytest.mark.asyncio
+    async def test_global_limit_across_domains(self):
+        """Farkli domain'ler toplamda global limiti asmaz."""
+        scheduler = PolitenessScheduler(global_limit=2, per_domain_limit=10, rate_per_second=0)
+        active = peak = 0
+
+        async def request(url):
+            nonlocal active, peak
+            async with scheduler.slot(url):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(request(f"https://site{i % 3}.com/") for i in range(9)))
+
+        assert peak == 2
+        assert set(scheduler.metrics()) == {"site0.com", "site1.com", "site2.com"}
+
+    @pytest.mark.asyncio
+    async def test_rate_limit(self):
+        """Domain basina istek hizi token bucket ile sinirlanir."""
+        scheduler = PolitenessScheduler(rate_per_second=20, burst=1)
+        loop = asyncio.get_running_loop()
+
+        async def request():
+            async with scheduler.slot("https://shop.com/"):
+                pass
+
+        start = loop.time()
+        await asyncio.gather(*(request() for _ in range(5)))
+
+        # Ilk istek aninda, sonraki 4 istek 50 ms arayla
+        assert loop.time() - start >= 0.19
+
+
+# ============================================================================
+# Test: 429 / Retry-After
+# ============================================================================
+
+
+class TestThrottling:
+    """429 ve Retry-After davranisi."""
+
+    @pytest.mark.asyncio
+    async def test_429_is_retried(self, site):
+        """429 sonrasi istek tekrar denenir ve basarili olur."""
+        site.throttle_first = 1
+        scheduler = PolitenessScheduler(rate_per_second=0)
+        manager = make_manager(scheduler)
+        try:
+            response = await manager.fetch(site.url)
+        finally:
+            await manager.close()
+
+        assert response.status == 200
+        metrics = next(iter(scheduler.metrics().values()))
+        assert metrics.throttled == 1
+        assert metrics.retries == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_are_bounded(self, site):
+        """Tekrar deneme limiti dolunca 429 dondurulur."""
+        site.throttle_first = 100
+        scheduler = PolitenessScheduler(rate_per_second=0, max_retries=2)
+        manager = make_manager(scheduler)
+        try:
+            response = await manager.fetch(site.url)
+        finally:
+            await manager.close()
+
+        assert response.status == 429
+        assert site.requests == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_after_blocks_domain(self):
+        """Retry-After suresince domain'e yeni istek gonderilmez (ust sinirla)."""
+        scheduler = PolitenessScheduler(rate_per_second=0, max_retry_after=0.2)
+        loop = asyncio.get_running_loop()
+
+        scheduler.note_response("https://shop.com/a", 429, {"Retry-After": "3600"})
+        start = loop.time()
+        async with scheduler.slot("https://shop.com/b"):
+            waited = loop.time() - start
+        async with scheduler.slot("https://baska.com/"):
+            other_waited = loop.time() - start - waited
+
+        assert 0.15 <= waited < 1
+        assert other_waited < 0.05
+
+    def test_non_throttle_status_not_retried(self):
+        """200/404 gibi yanitlar tekrar denenmez."""
+        scheduler = PolitenessScheduler()
+
+        assert scheduler.note_response("https://shop.com/", 200, {}) is False
+        assert scheduler.note_response("https://shop.com/", 404, {}) is False
+        assert scheduler.metrics() == {}
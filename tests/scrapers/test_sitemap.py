@@ -0,0 +1,377 @@
+"""Akisli sitemap okuyucu testleri."""
+
+import asyncio
+import gzip
+import zlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sade_agents.scrapers.ai_scraper import ScrapingTarget
+from sade_agents.scrapers.base import ProductPrice, ScraperResult
+from sade_agents.scrapers.http_cache import HttpCache
+from sade_agents.scrapers.http_session import HttpSessionManager
+from sade_agents.scrapers.page_cache import CrawlPageCache
+from sade_agents.scrapers.sitemap import SitemapReader, SitemapState, parse_lastmod
+from sade_agents.scrapers.smart_scraper import SmartScraper
+
+SITEMAP_NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def urlset(entries: list[tuple[str, str | None]]) -> str:
+    """(path, lastmod) listesinden urlset XML'i uretir (BASE sonradan degistirilir)."""
+    items = "".join(
+        f"<url><loc>BASE{path}</loc>{f'<lastmod>{lastmod}</lastmod>' if lastmod else ''}</url>"
+        for path, lastmod in entries
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {SITEMAP_NS}>{items}</urlset>'
+
+
+def sitemapindex(entries: list[tuple[str, str | None]]) -> str:
+    """(path, lastmod) listesinden sitemapindex XML'i uretir."""
+    items = "".join(
+        f"<sitemap><loc>BASE{path}</loc>"
+        f"{f'<lastmod>{lastmod}</lastmod>' if lastmod else ''}</sitemap>"
+        for path, lastmod in entries
+    )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f"<sitemapindex {SITEMAP_NS}>{items}</sitemapindex>"
+    )
+
+
+class SitemapSite:
+    """Yol -> (govde, gecikme) eslemesiyle yerel test sitesi."""
+
+    def __init__(self) -> None:
+        self.routes: dict[str, tuple[str | bytes, float]] = {}
+        self.requests: list[str] = []
+        self.not_modified: list[str] = []
+        self.server: TestServer | None = None
+
+    def add(self, path: str, body: str | bytes, delay: float = 0.0) -> None:
+        self.routes[path] = (body, delay)
+
+    @property
+    def base(self) -> str:
+        return str(self.server.make_url("")).rstrip("/")
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append(request.path)
+        if request.path not in self.routes:
+            return web.Response(status=404, text="yok")
+        body, delay = self.routes[request.path]
+        await asyncio.sleep(delay)
+        raw = body if isinstance(body, bytes) else body.encode()
+        etag = f'"{zlib.crc32(raw):08x}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified.append(request.path)
+            return web.Response(status=304, headers={"ETag": etag})
+        if isinstance(body, bytes):
+            body = gzip.compress(body.replace(b"BASE", self.base.encode()))
+            return web.Response(
+                body=body, content_type="application/x-gzip", headers={"ETag": etag}
+            )
+        return web.Response(
+            text=body.replace("BASE", self.base),
+            content_type="application/xml",
+            headers={"ETag": etag},
+        )
+
+
+@pytest.fixture
+async def site():
+    """Yerel sitemap sunucusu."""
+    site = SitemapSite()
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", site.handle)
+    site.server = TestServer(app)
+    await site.server.start_server()
+    yield site
+    await site.server.close()
+
+
+@pytest.fixture
+async def manager():
+    """Izole HttpSessionManager."""
+    manager = HttpSessionManager()
+    yield manager
+    await manager.close()
+
+
+async def read_all(reader: SitemapReader, domain: str, since: datetime | None = None) -> list:
+    return [entry async for entry in reader.iter_entries(domain, since=since)]
+
+
+class TestParseLastmod:
+    """lastmod parse testleri."""
+
+    def test_formats(self):
+        """Tarih, saat ve timezone'lu formatlar UTC'li datetime olur."""
+        assert parse_lastmod("2024-03-01") == datetime(2024, 3, 1, tzinfo=timezone.utc)
+        assert parse_lastmod("2024-03-01T12:00:00Z") == datetime(
+            2024, 3, 1, 12, tzinfo=timezone.utc
+        )
+        assert parse_lastmod("2024-03-01T15:00:00+03:00") == datetime(
+            2024, 3, 1, 12, tzinfo=timezone.utc
+        )
+        assert parse_lastmod("gecersiz") is None
+        assert parse_lastmod(None) is None
+
+
+class TestSitemapReader:
+    """SitemapReader testleri."""
+
+    @pytest.mark.asyncio
+    async def test_plain_urlset_with_lastmod(self, site, manager):
+        """Duz urlset URL'leri lastmod ile doner."""
+        site.add("/sitemap.xml", urlset([("/cikolata", "2024-03-01"), ("/truffle", None)]))
+
+        entries = await read_all(SitemapReader(manager=manager), site.base)
+
+        assert [e.url for e in entries] == [f"{site.base}/cikolata", f"{site.base}/truffle"]
+        assert entries[0].lastmod == datetime(2024, 3, 1, tzinfo=timezone.utc)
+        assert entries[1].lastmod is None
+
+    @pytest.mark.asyncio
+    async def test_index_recursion_and_gzip(self, site, manager):
+        """Ic ice index'ler ve .xml.gz alt sitemap'ler izlenir."""
+        site.add("/sitemap.xml", sitemapindex([("/nested-index.xml", None), ("/pages.xml", None)]))
+        site.add("/nested-index.xml", sitemapindex([("/products.xml.gz", None)]))
+        site.add("/products.xml.gz", urlset([(f"/urun/{i}", None) for i in range(3)]).encode())
+        site.add("/pages.xml", urlset([("/kategori/cikolata", None)]))
+
+        urls = [e.url for e in await read_all(SitemapReader(manager=manager), site.base)]
+
+        assert urls == [
+            f"{site.base}/urun/0",
+            f"{site.base}/urun/1",
+            f"{site.base}/urun/2",
+            f"{site.base}/kategori/cikolata",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_robots_sitemaps_preferred(self, site, manager):
+        """robots.txt'teki Sitemap: satirlari kullanilir."""
+        site.add("/robots.txt", "User-agent: *\nDisallow: /sepet\nSitemap: BASE/custom-map.xml\n")
+        site.add("/custom-map.xml", urlset([("/koleksiyon", None)]))
+        site.add("/sitemap.xml", urlset([("/eski", None)]))
+
+        urls = [e.url for e in await read_all(SitemapReader(manager=manager), site.base)]
+
+        assert urls == [f"{site.base}/koleksiyon"]
+
+    @pytest.mark.asyncio
+    async def test_candidates_probed_concurrently(self, site, manager):
+        """robots.txt ve aday yollar sirayla degil eszamanli yoklanir."""
+        site.add("/robots.txt", "User-agent: *", delay=0.3)
+        site.add("/sitemap-products.xml", urlset([("/cikolata", None)]), delay=0.3)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        entries = await read_all(SitemapReader(manager=manager), site.base)
+        elapsed = loop.time() - start
+
+        # Sirali yoklama: robots + 3 aday + okuma ~1.2 sn; eszamanli ~0.6 sn
+        assert len(entries) == 1
+        assert elapsed < 0.8
+
+    @pytest.mark.asyncio
+    async def test_probed_sitemap_downloaded_once(self, site, manager):
+        """Yoklamada secilen sitemap'in akisi okumada kullanilir (tek istek)."""
+        site.add("/sitemap.xml", urlset([("/cikolata", None), ("/truffle", None)]))
+        site.add("/sitemap_index.xml", urlset([("/eski", None)]))
+
+        urls = [e.url for e in await read_all(SitemapReader(manager=manager), site.base)]
+
+        assert urls == [f"{site.base}/cikolata", f"{site.base}/truffle"]
+        assert site.requests.count("/sitemap.xml") == 1
+
+    @pytest.mark.asyncio
+    async def test_robots_sitemaps_skip_candidate_probes(self, site, manager):
+        """robots.txt sitemap listeliyorsa varsayilan yollar yoklanmaz."""
+        site.add("/robots.txt", "Sitemap: BASE/custom-map.xml\n")
+        site.add("/custom-map.xml", urlset([("/koleksiyon", None)]))
+
+        await read_all(SitemapReader(manager=manager), site.base)
+
+        assert site.requests == ["/robots.txt", "/custom-map.xml"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sitemaps_revalidated_from_cache(self, site, tmp_path):
+        """HTTP cache'li okumada degismeyen sitemap'ler 304 ile diskten okunur."""
+        site.add("/sitemap.xml", sitemapindex([("/products.xml.gz", None)]))
+        site.add("/products.xml.gz", urlset([("/cikolata", None), ("/truffle", None)]).encode())
+        manager = HttpSessionManager(http_cache=HttpCache(tmp_path / "http.sqlite3"))
+        try:
+            first = [e.url for e in await read_all(SitemapReader(manager=manager), site.base)]
+            second = [e.url for e in await read_all(SitemapReader(manager=manager), site.base)]
+        finally:
+            await manager.close()
+
+        assert first == second == [f"{site.base}/cikolata", f"{site.base}/truffle"]
+        assert sorted(site.not_modified) == ["/products.xml.gz", "/sitemap.xml"]
+
+    @pytest.mark.asyncio
+    async def test_since_filters_entries_and_child_sitemaps(self, site, manager):
+        """since: degismeyen URL'ler ve alt sitemap'ler atlanir (indirilmez)."""
+        site.add(
+            "/sitemap.xml",
+            sitemapindex([("/old.xml", "2024-01-01"), ("/new.xml", "2024-06-01")]),
+        )
+        site.add("/old.xml", urlset([("/eski-urun", "2024-01-01")]))
+        site.add(
+            "/new.xml",
+            urlset([
+                ("/degismis", "2024-06-01T10:00:00+00:00"),
+                ("/ayni", "2024-02-01"),
+                ("/bilinmiyor", None),
+            ]),
+        )
+        since = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+        urls = [e.url for e in await read_all(SitemapReader(manager=manager), site.base, since)]
+
+        assert urls == [f"{site.base}/degismis", f"{site.base}/bilinmiyor"]
+        assert "/old.xml" not in site.requests
+
+    @pytest.mark.asyncio
+    async def test_non_xml_200_is_not_a_sitemap(self, site, manager):
+        """200 donen HTML (soft 404) sitemap sayilmaz."""
+        site.routes["/sitemap.xml"] = ("<html><body>Sayfa bulunamadi</body></html>", 0.0)
+
+        reader = SitemapReader(manager=manager)
+        assert await read_all(reader, site.base) == []
+        assert reader.sitemaps_read == []
+
+    @pytest.mark.asyncio
+    async def test_lazy_iteration_stops_early(self, site, manager):
+        """Tuketici durunca okuma durur."""
+        site.add("/sitemap.xml", urlset([(f"/urun/{i}", None) for i in range(5000)]))
+        reader = SitemapReader(manager=manager)
+
+        entries = reader.iter_entries(site.base)
+        first = [await anext(entries) for _ in range(3)]
+        await entries.aclose()
+
+        assert len(first) == 3
+
+
+class TestSitemapState:
+    """SitemapState testleri."""
+
+    def test_roundtrip(self, tmp_path):
+        """Son tarama zamani ve sayfa urunleri diske yazilir ve okunur."""
+        path = tmp_path / "state.json"
+        when = datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+        pages = {"https://shop.com/tablet": [ProductPrice(name="Bitter", price_tl=90.0)]}
+
+        SitemapState(path).mark_crawled("https://shop.com", when, pages=pages)
+
+        state = SitemapState(path)
+        assert state.last_crawl("https://shop.com") == when
+        assert state.last_crawl("https://baska.com") is None
+        snapshot = state.snapshot("https://shop.com")
+        assert snapshot.full_crawl_at == when
+        assert snapshot.pages == pages
+
+    def test_incremental_keeps_full_crawl_time(self, tmp_path):
+        """Artimli kayit son tam tarama zamanini degistirmez."""
+        state = SitemapState(tmp_path / "state.json")
+        full = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        later = datetime(2024, 6, 2, tzinfo=timezone.utc)
+        pages = {"https://shop.com/tablet": []}
+
+        state.mark_crawled("https://shop.com", full, pages=pages)
+        state.mark_crawled("https://shop.com", later, pages=pages, full=False)
+
+        snapshot = state.snapshot("https://shop.com")
+        assert snapshot.crawled_at == later
+        assert snapshot.full_crawl_at == full
+
+    def test_legacy_timestamp_has_no_snapshot(self, tmp_path):
+        """Eski format (sadece zaman) kayitta snapshot yok: tam tarama yapilir."""
+        path = tmp_path / "state.json"
+        path.write_text('{"https://shop.com": "2024-06-01T00:00:00+00:00"}', encoding="utf-8")
+
+        state = SitemapState(path)
+
+        assert state.last_crawl("https://shop.com") == datetime(2024, 6, 1, tzinfo=timezone.utc)
+        assert state.snapshot("https://shop.com") is None
+
+
+class TestSmartScraperIncremental:
+    """SmartScraper artimli sitemap secimi."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_urls_selected(self, site, manager):
+        """since: sadece degisen URL'ler doner; sitemap yoksa None."""
+        site.add("/sitemap.xml", urlset([("/cikolata", "2024-01-01"), ("/truffle", "2024-01-02")]))
+        scraper = SmartScraper()
+        page_cache = CrawlPageCache(manager=manager)
+
+        changed = await scraper._try_sitemap(
+            site.base, page_cache, since=datetime(2023, 12, 1, tzinfo=timezone.utc)
+        )
+        unchanged = await scraper._try_sitemap(
+            site.base, page_cache, since=datetime(2024, 6, 1, tzinfo=timezone.utc)
+        )
+        del site.routes["/sitemap.xml"]
+        missing = await scraper._try_sitemap(site.base, CrawlPageCache(manager=manager))
+
+        assert changed == [f"{site.base}/cikolata", f"{site.base}/truffle"]
+        assert unchanged == []
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_incremental_run_returns_full_product_set(self, site, tmp_path):
+        """Degismeyen sayfalar taranmaz ama urunleri sonuca eklenir."""
+        paths = ["/kategori/tablet", "/kategori/truffle", "/kategori/hediye"]
+        site.add("/sitemap.xml", urlset([(path, "2024-01-01") for path in paths]))
+        prices = {f"{site.base}{path}": 100.0 + i for i, path in enumerate(paths)}
+        scraped: list[str] = []
+
+        async def fake_scrape_page(page_target, page_cache):
+            scraped.append(page_target.url)
+            product = ProductPrice(name=page_target.url, price_tl=prices[page_target.url])
+            return ScraperResult(
+                source=page_target.name,
+                success=True,
+                products=[product],
+                extraction_method="structured",
+            )
+
+        scraper = SmartScraper()
+        scraper._sitemap_state = SitemapState(tmp_path / "sitemap_state.json")
+        scraper._scrape_page = fake_scrape_page
+        target = ScrapingTarget(name="rakip", url=site.base, description="cikolata")
+
+        def catalog(result):
+            return sorted((p.name, p.price_tl) for p in result.products)
+
+        full = await scraper.scrape_site(target)
+        assert sorted(scraped) == sorted(prices)
+
+        # Hicbir sey degismedi: sayfa taranmaz, katalog ayni
+        scraped.clear()
+        unchanged = await scraper.scrape_site(target)
+        assert scraped == []
+        assert unchanged.success
+        assert unchanged.pages_skipped == 3
+        assert catalog(unchanged) == catalog(full)
+
+        # Tek sayfa degisti: sadece o taranir, digerleri snapshot'tan
+        changed_url = f"{site.base}/kategori/truffle"
+        tomorrow = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+        site.add(
+            "/sitemap.xml",
+            urlset([(path, tomorrow if path == "/kategori/truffle" else "2024-01-01")
+                    for path in paths]),
+        )
+        prices[changed_url] = 150.0
+        scraped.clear()
+        incremental = await scraper.scrape_site(target)
+        assert scraped == [changed_url]
+        assert catalog(incremental) == sorted((url, price) for url, price in prices.items())
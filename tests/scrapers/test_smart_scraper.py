@@ -3,10 +3,12 @@
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
 
 from sade_agents.scrapers.ai_scraper import ScrapingTarget
 from sade_agents.scrapers.base import ProductPrice, ScraperResult
+from sade_agents.scrapers.http_session import HttpSessionManager
 from sade_agents.scrapers.smart_scraper import (
     DiscoveredPage,
     SiteDiscoveryResult,
@@ -20,6 +22,36 @@ from sade_agents.scrapers.smart_scraper import (
 # ============================================================================
 
 
+def make_mock_session(routes: dict[str, str]) -> MagicMock:
+    """URL -> govde eslemesiyle sahte aiohttp session (diger URL'ler 404)."""
+
+    def get(url, **kwargs):
+        body = routes.get(url)
+        status = 200 if body is not None else 404
+
+        response = MagicMock()
+        response.status = status
+        response.headers = {}
+        response.text = AsyncMock(return_value=body or "")
+        if status >= 400:
+            response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+                MagicMock(), (), status=status
+            )
+
+        async def iter_chunked(size):
+            yield (body or "").encode()
+
+        response.content.iter_chunked = iter_chunked
+
+        context = AsyncMock()
+        context.__aenter__.return_value = response
+        return context
+
+    session = MagicMock()
+    session.get.side_effect = get
+    return session
+
+
 @pytest.fixture
 def mock_html_with_products():
     """Urun iceren ornek HTML."""
@@ -102,12 +134,6 @@ class TestSmartScraperInit:
         assert hasattr(scraper, "_ai_scraper")
         assert scraper._ai_scraper is not None
 
-    def test_init_clears_visited_urls(self):
-        """visited_urls seti boş başlar."""
-        scraper = SmartScraper()
-        assert isinstance(scraper._visited_urls, set)
-        assert len(scraper._visited_urls) == 0
-
 
 # ============================================================================
 # Test: Site Discovery
@@ -121,23 +147,9 @@ class TestSiteDiscovery:
     async def test_discover_from_sitemap(self, mock_sitemap_xml):
         """Sitemap bulunduğunda doğru URL'ler döner."""
         scraper = SmartScraper()
+        mock_session = make_mock_session({"https://example.com/sitemap.xml": mock_sitemap_xml})
 
-        # Mock HTTP response
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value=mock_sitemap_xml)
-
-        # Mock context manager
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = mock_response
-
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_context
-
-        mock_session_context = AsyncMock()
-        mock_session_context.__aenter__.return_value = mock_session
-
-        with patch("aiohttp.ClientSession", return_value=mock_session_context):
+        with patch.object(HttpSessionManager, "get_session", AsyncMock(return_value=mock_session)):
             result = await scraper._discover_site("https://example.com")
 
             assert result.sitemap_found is True
@@ -154,32 +166,9 @@ class TestSiteDiscovery:
         scraper = SmartScraper()
 
         # Sitemap yok (404), menu var (200)
-        mock_response_404 = MagicMock()
-        mock_response_404.status = 404
-
-        mock_response_200 = MagicMock()
-        mock_response_200.status = 200
-        mock_response_200.text = AsyncMock(return_value=mock_html_with_products)
-
-        # Sitemap denemelerinde 404, menu fetch'inde 200
-        contexts = []
-        for _ in range(3):  # 3 sitemap denemesi
-            ctx = AsyncMock()
-            ctx.__aenter__.return_value = mock_response_404
-            contexts.append(ctx)
-
-        # Menu fetch için 200
-        menu_ctx = AsyncMock()
-        menu_ctx.__aenter__.return_value = mock_response_200
-        contexts.append(menu_ctx)
+        mock_session = make_mock_session({"https://example.com": mock_html_with_products})
 
-        mock_session = MagicMock()
-        mock_session.get.side_effect = contexts
-
-        mock_session_context = AsyncMock()
-        mock_session_context.__aenter__.return_value = mock_session
-
-        with patch("aiohttp.ClientSession", return_value=mock_session_context):
+        with patch.object(HttpSessionManager, "get_session", AsyncMock(return_value=mock_session)):
             result = await scraper._discover_site("https://example.com")
 
             assert result.discovery_method == "menu"
@@ -203,13 +192,6 @@ class TestSiteDiscovery:
         </body></html>
         """
 
-        mock_response_404 = MagicMock()
-        mock_response_404.status = 404
-
-        mock_response_200 = MagicMock()
-        mock_response_200.status = 200
-        mock_response_200.text = AsyncMock(return_value=html_with_links)
-
         # OpenAI response mock
         ai_response = [
             {"url": "https://example.com/cikolata", "confidence": 0.9, "reason": "cikolata kategorisi"},
@@ -222,26 +204,13 @@ class TestSiteDiscovery:
         mock_openai_response = MagicMock()
         mock_openai_response.choices = [mock_openai_choice]
 
-        # Sitemap'ler 404 (3x), menu 200, AI için 200
-        contexts = []
-        for _ in range(3):
-            ctx = AsyncMock()
-            ctx.__aenter__.return_value = mock_response_404
-            contexts.append(ctx)
-
-        for _ in range(2):  # menu + AI
-            ctx = AsyncMock()
-            ctx.__aenter__.return_value = mock_response_200
-            contexts.append(ctx)
-
-        mock_session = MagicMock()
-        mock_session.get.side_effect = contexts
-
-        mock_session_context = AsyncMock()
-        mock_session_context.__aenter__.return_value = mock_session
+        # Sitemap'ler 404, ana sayfa 200
+        mock_session = make_mock_session({"https://example.com": html_with_links})
 
-        with patch("aiohttp.ClientSession", return_value=mock_session_context), \
-             patch.object(scraper._client.chat.completions, "create", return_value=mock_openai_response):
+        get_session = AsyncMock(return_value=mock_session)
+        create = AsyncMock(return_value=mock_openai_response)
+        with patch.object(HttpSessionManager, "get_session", get_session), \
+             patch.object(scraper._client.chat.completions, "create", create):
 
             result = await scraper._discover_site("https://example.com")
 
@@ -249,30 +218,24 @@ class TestSiteDiscovery:
             assert len(result.product_pages) > 0
 
     @pytest.mark.asyncio
-    async def test_discovery_priority(self, mock_sitemap_xml):
+    async def test_discovery_priority(self, mock_sitemap_xml, mock_html_with_products):
         """Sitemap > Menu > AI sırası doğru."""
         scraper = SmartScraper()
 
         # Sitemap bulunduğunda menu/AI çağrılmamalı
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value=mock_sitemap_xml)
-
-        mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = mock_response
-
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_context
-
-        mock_session_context = AsyncMock()
-        mock_session_context.__aenter__.return_value = mock_session
+        mock_session = make_mock_session({
+            "https://example.com/sitemap.xml": mock_sitemap_xml,
+            "https://example.com": mock_html_with_products,
+        })
 
-        with patch("aiohttp.ClientSession", return_value=mock_session_context):
+        with patch.object(HttpSessionManager, "get_session", AsyncMock(return_value=mock_session)):
             result = await scraper._discover_site("https://example.com")
 
             assert result.discovery_method == "sitemap"
             # Sitemap başarılı oldu, menu/AI çağrılmadı
             assert len(result.product_pages) > 0
+            requested = [c.args[0] for c in mock_session.get.call_args_list]
+            assert "https://example.com" not in requested
 
 
 # ============================================================================
@@ -397,7 +360,7 @@ class TestScraping:
         )
 
         # Her sayfa farklı ürün dönsün
-        async def mock_scrape_func(target):
+        async def mock_scrape_func(target, page_cache=None):
             return ScraperResult(
                 source=target.name,
                 success=True,
@@ -427,7 +390,7 @@ class TestScraping:
         )
 
         # İlk sayfa başarılı, ikinci hata
-        async def mock_scrape_side_effect(target):
+        async def mock_scrape_side_effect(target, page_cache=None):
             if "page1" in target.url:
                 return ScraperResult(source=target.name, success=True, products=[
                     ProductPrice(name="Product 1", price_tl=450, weight_grams=100),
@@ -0,0 +1,163 @@
+"""Akisli tarama (ScrapeEvent) testleri."""
+
+import asyncio
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import pytest
+
+from sade_agents.config import Settings
+from sade_agents.scrapers.ai_scraper import AIScraper, ScrapingTarget, scrape_all_with_ai_stream
+from sade_agents.scrapers.base import PAGE_EVENT, TARGET_EVENT, ProductPrice, ScraperResult
+from sade_agents.scrapers.smart_scraper import (
+    DiscoveredPage,
+    SiteDiscoveryResult,
+    SmartScraper,
+    smart_scrape_stream,
+)
+
+# Sayfa yolu -> gecikme (saniye)
+DELAYS = {"/yavas": 0.2, "/hizli": 0.01}
+
+
+async def fake_discover(self, url, page_cache=None, since=None):
+    """Her site icin /yavas ve /hizli sayfalari (yavas olan once)."""
+    return SiteDiscoveryResult(
+        base_url=url,
+        product_pages=[
+            DiscoveredPage(url=f"{url}/yavas", page_type="product_list", confidence=0.9),
+            DiscoveredPage(url=f"{url}/hizli", page_type="product_list", confidence=0.8),
+        ],
+    )
+
+
+async def fake_scrape_page(self, page_target, page_cache):
+    """Gecikmeli sahte sayfa taramasi; 'yavas.com' sitesi her sayfada yavastir."""
+    parsed = urlparse(page_target.url)
+    delay = DELAYS[parsed.path] + (0.3 if parsed.netloc == "yavas.com" else 0)
+    await asyncio.sleep(delay)
+    return ScraperResult(
+        source=page_target.name,
+        success=True,
+        products=[ProductPrice(name=f"Urun {parsed.netloc}{parsed.path}", price_tl=100)],
+        extraction_method="llm",
+    )
+
+
+@pytest.fixture
+def fake_site():
+    with patch.object(SmartScraper, "_discover_site", fake_discover), \
+         patch.object(SmartScraper, "_scrape_page", fake_scrape_page):
+        yield
+
+
+class TestScrapeSiteStream:
+    """Tek hedef akisi."""
+
+    @pytest.mark.asyncio
+    async def test_pages_streamed_as_completed(self, fake_site):
+        """Hizli sayfa once gelir; birlesik sonuc sayfa onceligi sirasini korur."""
+        target = ScrapingTarget(name="shop", url="https://shop.com", description="cikolata")
+
+        events = [event async for event in SmartScraper().scrape_site_stream(target)]
+
+        assert [(e.kind, e.url) for e in events] == [
+            (PAGE_EVENT, "https://shop.com/hizli"),
+            (PAGE_EVENT, "https://shop.com/yavas"),
+            (TARGET_EVENT, None),
+        ]
+        assert [(e.pages_done, e.pages_total) for e in events] == [(1, 2), (2, 2), (2, 2)]
+        assert [p.name for p in events[-1].result.products] == [
+            "Urun shop.com/yavas",
+            "Urun shop.com/hizli",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_pending_pages(self, fake_site):
+        """Akis erken birakilinca bekleyen sayfa task'lari iptal edilir."""
+        target = ScrapingTarget(name="shop", url="https://shop.com", description="cikolata")
+        stream = SmartScraper().scrape_site_stream(target)
+
+        first = await anext(stream)
+        await stream.aclose()
+
+        assert first.url == "https://shop.com/hizli"
+        pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        await asyncio.sleep(0)
+        assert all(t.done() for t in pending)
+
+
+class TestSmartScrapeStream:
+    """Tum hedefler akisi."""
+
+    @pytest.mark.asyncio
+    async def test_fast_target_completes_before_slow_pages(self, fake_site):
+        """Hizli rakibin sonucu yavas rakibin sayfalari beklenmeden gelir."""
+        targets = [
+            ScrapingTarget(name="yavas", url="https://yavas.com", description="cikolata"),
+            ScrapingTarget(name="hizli", url="https://hizli.com", description="cikolata"),
+        ]
+
+        with patch(
+            "sade_agents.scrapers.ai_scraper.load_targets_from_config", return_value=targets
+        ):
+            events = [event async for event in smart_scrape_stream()]
+
+        finals = [e for e in events if e.is_final]
+        assert [e.source for e in finals] == ["hizli", "yavas"]
+        assert events.index(finals[0]) < max(
+            i for i, e in enumerate(events) if e.source == "yavas" and not e.is_final
+        )
+        assert [e.targets_done for e in finals] == [1, 2]
+        assert all(e.targets_total == 2 for e in events)
+        assert [e.pages_done for e in events if not e.is_final] == [1, 2, 3, 4]
+        assert events[-1].pages_total == 4
+
+    @pytest.mark.asyncio
+    async def test_no_targets_yields_warning(self):
+        """Hedef yoksa tek uyari olayi uretilir."""
+        with patch("sade_agents.scrapers.ai_scraper.load_targets_from_config", return_value=[]):
+            events = [event async for event in smart_scrape_stream()]
+
+        assert len(events) == 1
+        assert events[0].source == "_warning"
+        assert events[0].result.success is False
+
+
+class TestScrapeAllWithAIStream:
+    """AIScraper hedef akisi."""
+
+    @pytest.mark.asyncio
+    async def test_targets_streamed_as_completed(self):
+        """Hedefler tamamlanma sirasiyla gelir; hata basarisiz sonuca donusur."""
+        targets = [
+            ScrapingTarget(name="yavas", url="https://yavas.com", description="cikolata"),
+            ScrapingTarget(name="hatali", url="https://hatali.com", description="cikolata"),
+            ScrapingTarget(name="hizli", url="https://hizli.com", description="cikolata"),
+        ]
+        delays = {"yavas": 0.1, "hatali": 0.05, "hizli": 0.0}
+
+        async def mock_scrape(self, target):
+            await asyncio.sleep(delays[target.name])
+            if target.name == "hatali":
+                raise Exception("Scraping failed")
+            return ScraperResult(source=target.name, success=True, products=[])
+
+        with patch("sade_agents.scrapers.ai_scraper.load_targets_from_config",
+                   return_value=targets), \
+             patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings, \
+             patch.object(AIScraper, "scrape", new=mock_scrape):
+            mock_settings.return_value = Settings(
+                openai_api_key="test-key", openai_model_name="gpt-4"
+            )
+            events = [event async for event in scrape_all_with_ai_stream()]
+
+        assert [(e.source, e.targets_done, e.targets_total) for e in events] == [
+            ("hizli", 1, 3),
+            ("hatali", 2, 3),
+            ("yavas", 3, 3),
+        ]
+        # Hedef sayaclari sayfa alanlarina yazilmaz
+        assert all(e.pages_done == e.pages_total == 0 for e in events)
+        assert events[1].result.success is False
+        assert "Scraping failed" in events[1].result.error
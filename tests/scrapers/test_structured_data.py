@@ -0,0 +1,190 @@
+"""Yapisal veri (JSON-LD / microdata / OpenGraph) cikarici testleri."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bs4 import BeautifulSoup
+
+from sade_agents.scrapers.ai_scraper import AIScraper, ScrapingTarget
+from sade_agents.scrapers.base import parse_price, parse_weight
+from sade_agents.scrapers.structured_data import extract_structured_products
+
+
+def soup_of(html: str) -> BeautifulSoup:
+    """Test HTML'ini parse eder."""
+    return BeautifulSoup(html, "html.parser")
+
+
+@pytest.fixture
+def json_ld_listing_html():
+    """ItemList icinde iki Product iceren kategori sayfasi."""
+    data = {
+        "@context": "https://schema.org",
+        "@type": "ItemList",
+        "itemListElement": [
+            {
+                "@type": "ListItem",
+                "position": 1,
+                "item": {
+                    "@type": "Product",
+                    "name": "Bitter Tablet 100g",
+                    "url": "/urun/bitter-tablet",
+                    "offers": {"@type": "Offer", "price": "450.00", "priceCurrency": "TRY"},
+                },
+            },
+            {
+                "@type": "ListItem",
+                "position": 2,
+                "item": {
+                    "@type": "Product",
+                    "name": "Truffle Kutusu",
+                    "offers": {"@type": "AggregateOffer", "lowPrice": 890, "priceCurrency": "TRY"},
+                },
+            },
+        ],
+    }
+    return f"""
+    <html><head><script type="application/ld+json">{json.dumps(data)}</script></head>
+    <body>
+        <div>Bitter Tablet 100g 450,00 TL</div>
+        <div>Truffle Kutusu 890,00 TL</div>
+    </body></html>
+    """
+
+
+class TestParseHelpers:
+    """base.py fiyat/gramaj yardimcilari."""
+
+    def test_parse_price_turkish_format(self):
+        """Turkce binlik/ondalik ayiricilari."""
+        assert parse_price("1.250,50 ₺") == 1250.5
+        assert parse_price("450,00 TL") == 450.0
+        assert parse_price("") is None
+
+    def test_parse_weight(self):
+        """Gram ve kilogram."""
+        assert parse_weight("Bitter 100g") == 100
+        assert parse_weight("0,5 kg kutu") == 500
+        assert parse_weight("Truffle") is None
+
+
+class TestStructuredExtraction:
+    """extract_structured_products testleri."""
+
+    def test_json_ld_item_list(self, json_ld_listing_html):
+        """ItemList icindeki Product'lar ve fiyatlari cikarilir."""
+        products = extract_structured_products(
+            soup_of(json_ld_listing_html), "https://shop.com/kategori/cikolata"
+        )
+
+        assert len(products) == 2
+        assert products[0].name == "Bitter Tablet 100g"
+        assert products[0].price_tl == 450.0
+        assert products[0].weight_grams == 100
+        assert products[0].url == "https://shop.com/urun/bitter-tablet"
+        assert products[0].category == "tablet"
+        assert products[1].price_tl == 890.0
+        assert products[1].category == "truffle"
+
+    def test_json_ld_graph_and_foreign_currency(self):
+        """@graph gezilir, TL disi teklif atlanir."""
+        data = {
+            "@graph": [
+                {"@type": "WebPage", "name": "Sayfa"},
+                {"@type": ["Product"], "name": "Dubai Chocolate",
+                 "offers": [{"price": "20", "priceCurrency": "EUR"},
+                            {"price": "745", "priceCurrency": "TRY"}]},
+            ]
+        }
+        html = f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+        products = extract_structured_products(soup_of(html))
+
+        assert len(products) == 1
+        assert products[0].price_tl == 745.0
+
+    def test_invalid_json_ld_ignored(self):
+        """Bozuk JSON-LD hata firlatmaz."""
+        html = '<script type="application/ld+json">{ bozuk json</script>'
+        assert extract_structured_products(soup_of(html)) == []
+
+    def test_microdata(self):
+        """schema.org/Product microdata."""
+        html = """
+        <div itemscope itemtype="https://schema.org/Product">
+            <h3 itemprop="name">Sutlu Tablet 80g</h3>
+            <div itemprop="offers" itemscope itemtype="https://schema.org/Offer">
+                <meta itemprop="priceCurrency" content="TRY">
+                <span itemprop="price" content="320.50">320,50 TL</span>
+            </div>
+        </div>
+        """
+        products = extract_structured_products(soup_of(html))
+
+        assert len(products) == 1
+        assert products[0].name == "Sutlu Tablet 80g"
+        assert products[0].price_tl == 320.5
+        assert products[0].weight_grams == 80
+
+    def test_opengraph_fallback(self):
+        """Diger kaynak yoksa OpenGraph urun etiketleri kullanilir."""
+        html = """
+        <head>
+            <meta property="og:title" content="Hediye Kutusu 250g">
+            <meta property="product:price:amount" content="1.250,00">
+            <meta property="product:price:currency" content="TRY">
+        </head>
+        """
+        products = extract_structured_products(soup_of(html), "https://shop.com/p/1")
+
+        assert len(products) == 1
+        assert products[0].price_tl == 1250.0
+        assert products[0].url == "https://shop.com/p/1"
+        assert products[0].category == "hediye_kutu"
+
+
+class TestAIScraperFastPath:
+    """AIScraper yapisal veri hizli yolu."""
+
+    @pytest.fixture
+    def scraper(self):
+        with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_settings:
+            mock_settings.return_value.openai_model_name = "gpt-4"
+            scraper = AIScraper()
+        scraper._client.chat.completions.create = AsyncMock()
+        return scraper
+
+    @pytest.mark.asyncio
+    async def test_structured_skips_llm(self, scraper, json_ld_listing_html):
+        """Yapisal veri yeterliyse LLM cagrilmaz."""
+        scraper._fetch_page = AsyncMock(return_value=json_ld_listing_html)
+        target = ScrapingTarget(name="shop", url="https://shop.com/c", description="cikolata")
+
+        result = await scraper.scrape(target)
+
+        assert result.success is True
+        assert result.extraction_method == "structured"
+        assert len(result.products) == 2
+        scraper._client.chat.completions.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_partial_structured_falls_back_to_llm(self, scraper):
+        """Sayfada yapisal veriden cok daha fazla fiyat varsa LLM kullanilir."""
+        data = {"@type": "Product", "name": "One Cikan", "offers": {"price": 100}}
+        listing = "".join(f"<div>Urun {i} {100 + i},00 TL</div>" for i in range(10))
+        html = (
+            f'<html><head><script type="application/ld+json">{json.dumps(data)}</script>'
+            f"</head><body>{listing}</body></html>"
+        )
+        scraper._fetch_page = AsyncMock(return_value=html)
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "[]"
+        scraper._client.chat.completions.create.return_value = response
+        target = ScrapingTarget(name="shop", url="https://shop.com/c", description="cikolata")
+
+        result = await scraper.scrape(target)
+
+        assert result.extraction_method == "llm"
+        scraper._client.chat.completions.create.assert_called_once()
@@ -59,6 +59,25 @@ class TestLoadTargetsFromFile:
             assert targets[0].description == "vakko cikolata"
             assert targets[1].name == "kahve"
 
+    def test_load_from_file_url_patterns(self):
+        """Hedefe ozel URL pattern'leri okunur; verilmezse bos liste."""
+        data = json.dumps({
+            "targets": [
+                {"name": "vakko", "url": "https://vakko.com", "product_url_patterns": ["/tatli"],
+                 "skip_url_patterns": ["/kampanya"]},
+                {"name": "kahve", "url": "https://kahve.com"},
+            ]
+        })
+        with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_get_settings, \
+             patch("pathlib.Path.exists", return_value=True), \
+             patch("builtins.open", mock_open(read_data=data)):
+            mock_get_settings.return_value.scraping_targets_file = "scraping_targets.json"
+            targets = load_targets_from_file()
+
+        assert targets[0].product_url_patterns == ["/tatli"]
+        assert targets[0].skip_url_patterns == ["/kampanya"]
+        assert targets[1].product_url_patterns == []
+
     def test_load_from_file_not_found(self):
         """Dosya yoksa bos liste doner."""
         with patch("sade_agents.scrapers.ai_scraper.get_settings") as mock_get_settings:
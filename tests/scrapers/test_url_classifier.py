@@ -0,0 +1,73 @@
+"""Derlenmis URL siniflandirici testleri."""
+
+from sade_agents.scrapers.smart_scraper import SmartScraper
+from sade_agents.scrapers.url_classifier import UrlClassifier, UrlVerdict, _trie_regex
+
+URLS = [
+    "https://shop.com/",
+    "https://shop.com/cikolata/bitter",
+    "https://example.com/Urunler?page=2",
+    "https://example.com/sepet",
+    "https://example.com/blog/cikolata-tarihi",
+    "https://example.com/img/tablet.JPG",
+    "https://example.com/hakkimizda#ekip",
+    "https://example.com/shopping-bag",
+]
+
+
+def naive(url: str) -> UrlVerdict:
+    """Eski `pattern in url` davranisi."""
+    lower = url.lower()
+    product = any(p in lower for p in SmartScraper.PRODUCT_URL_PATTERNS)
+    return UrlVerdict(
+        skip=any(p in lower for p in SmartScraper.SKIP_URL_PATTERNS),
+        page_type="product_list" if product else "other",
+    )
+
+
+def make_classifier(**kwargs) -> UrlClassifier:
+    return UrlClassifier(
+        SmartScraper.PRODUCT_URL_PATTERNS, SmartScraper.SKIP_URL_PATTERNS, **kwargs
+    )
+
+
+class TestUrlClassifier:
+    """UrlClassifier testleri."""
+
+    def test_matches_naive_substring_semantics(self):
+        """Derlenmis regex eski alt-dizi kontrolu ile ayni karari verir."""
+        classifier = make_classifier()
+
+        assert classifier.classify_many(URLS) == [naive(url) for url in URLS]
+        assert [classifier.classify(url) for url in URLS] == [naive(url) for url in URLS]
+
+    def test_trie_regex_shares_prefixes(self):
+        """Ortak onekler tek dalda; kisa pattern uzununu kapsar."""
+        assert _trie_regex(["/category", "/cat"]) == "/cat"
+        assert _trie_regex(["/cart", "/category"]) == "/ca(?:rt|tegory)"
+
+    def test_domain_patterns_extend_defaults(self):
+        """Ek pattern'ler sadece o domain'de gecerli, cache temizlenir."""
+        classifier = make_classifier()
+        assert classifier.classify("https://vakko.com/tatli").page_type == "other"
+
+        classifier.set_domain_patterns(
+            "https://vakko.com", product=["/tatli"], skip=["/kampanya"]
+        )
+
+        assert classifier.classify("https://vakko.com/tatli").page_type == "product_list"
+        assert classifier.classify("https://VAKKO.com/kampanya/cikolata").skip is True
+        assert classifier.classify("https://godiva.com/tatli").page_type == "other"
+        assert classifier.classify("https://vakko.com/sepet").skip is True
+
+        classifier.set_domain_patterns("https://vakko.com")
+        assert classifier.classify("https://vakko.com/tatli").page_type == "other"
+
+    def test_cache_is_bounded(self):
+        """Cache boyutu asilmaz; en eski kayit atilir."""
+        classifier = make_classifier(cache_size=2)
+
+        for url in URLS:
+            classifier.classify(url)
+
+        assert list(classifier._verdicts) == URLS[-2:]
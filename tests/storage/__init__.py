@@ -0,0 +1 @@
+"""Sade Agents - Storage test paketi."""
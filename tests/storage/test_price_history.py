@@ -0,0 +1,153 @@
+"""PriceHistoryStore unit testleri."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from sade_agents.scrapers.base import ProductPrice, ScraperResult
+from sade_agents.scrapers.product_identity import product_key
+from sade_agents.storage.price_history import PriceHistoryStore
+
+DAY1 = datetime(2024, 6, 1, 12, 0)
+DAY2 = DAY1 + timedelta(days=1)
+DAY3 = DAY1 + timedelta(days=2)
+
+BITTER = ProductPrice(name="Bitter Tablet", price_tl=450, weight_grams=100, category="tablet")
+
+
+def result(source: str, products: list[ProductPrice], when: datetime, success: bool = True):
+    return ScraperResult(source=source, success=success, products=products, scraped_at=when)
+
+
+def priced(product: ProductPrice, price: float) -> ProductPrice:
+    return ProductPrice(
+        name=product.name,
+        price_tl=price,
+        weight_grams=product.weight_grams,
+        category=product.category,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PriceHistoryStore(tmp_path / "history.sqlite3")
+    yield store
+    store.close()
+
+
+class TestRecord:
+    """Ekleme testleri."""
+
+    def test_appends_rows_and_skips_failed_results(self, store):
+        """Her scrape satir olarak eklenir, basarisiz sonuclar atlanir."""
+        truffle = ProductPrice(name="Truffle Kutusu", price_tl=890, category="truffle")
+
+        assert store.record(result("vakko", [BITTER, truffle], DAY1)) == 2
+        assert store.record(result("vakko", [priced(BITTER, 475)], DAY2)) == 1
+        assert store.record(result("vakko", [], DAY3, success=False)) == 0
+
+        assert len(store) == 3
+
+    def test_tenants_are_isolated(self, store):
+        """Tenant'lar birbirinin verisini gormez."""
+        store.record(result("vakko", [BITTER], DAY1), tenant_id="a")
+
+        assert store.latest_prices(tenant_id="b") == []
+        assert len(store.latest_prices(tenant_id="a")) == 1
+
+    def test_spelling_variant_keeps_product_key(self, store):
+        """Sonraki taramada farkli yazilan ayni urun ayni seride eklenir."""
+        store.record(result("vakko", [ProductPrice("Sade Bitter Tablet", 450, 100)], DAY1))
+        store.record(result("vakko", [ProductPrice("Sade Bitter Tablet.", 475, 100)], DAY2))
+        store.record(result("vakko", [ProductPrice("Sutlu Tablet", 400, 100)], DAY2))
+
+        keys = {p.name: p.product_key for p in store.price_range(source="vakko")}
+        assert keys["Sade Bitter Tablet"] == keys["Sade Bitter Tablet."]
+        assert keys["Sutlu Tablet"] != keys["Sade Bitter Tablet"]
+        assert len(store.latest_prices(source="vakko")) == 2
+
+
+class TestQueries:
+    """Sorgu API'si testleri."""
+
+    @pytest.fixture
+    def filled(self, store):
+        truffle = ProductPrice(
+            name="Truffle Kutusu", price_tl=890, weight_grams=200, category="truffle"
+        )
+        store.record(result("vakko", [BITTER, truffle], DAY1))
+        store.record(result("vakko", [priced(BITTER, 475)], DAY2))
+        store.record(result("kahve_dunyasi", [priced(BITTER, 300)], DAY2))
+        return store
+
+    def test_latest_prices(self, filled):
+        """Her urunun en son fiyati doner."""
+        latest = {(p.source, p.name): p.price_tl for p in filled.latest_prices()}
+
+        assert latest == {
+            ("vakko", "Bitter Tablet"): 475,
+            ("vakko", "Truffle Kutusu"): 890,
+            ("kahve_dunyasi", "Bitter Tablet"): 300,
+        }
+        assert [p.name for p in filled.latest_prices(source="vakko", category="tablet")] == [
+            "Bitter Tablet"
+        ]
+
+    def test_late_insert_does_not_override_latest(self, filled):
+        """Eski tarihli scrape sonradan eklenirse en son fiyat degismez."""
+        filled.record(result("vakko", [priced(BITTER, 100)], DAY1 - timedelta(days=7)))
+
+        latest = filled.latest_prices(source="vakko", category="tablet")[0]
+        assert latest.price_tl == 475
+        assert latest.scraped_at == DAY2
+
+    def test_price_range(self, filled):
+        """Urunun zaman araligindaki fiyatlari eskiden yeniye doner."""
+        key = product_key(BITTER)
+
+        history = filled.price_range(source="vakko", product_key=key)
+        assert [(p.scraped_at, p.price_tl) for p in history] == [(DAY1, 450), (DAY2, 475)]
+
+        assert [p.price_tl for p in filled.price_range(source="vakko", start=DAY2)] == [475]
+        assert len(filled.price_range(end=DAY2)) == 2
+
+    def test_category_stats(self, filled):
+        """Kategori bazli ozetler (gecmis ve sadece son fiyatlar)."""
+        stats = {s.category: s for s in filled.category_stats()}
+        assert stats["tablet"].count == 3
+        assert stats["tablet"].min_price == 300
+        assert stats["tablet"].max_price == 475
+        assert stats["tablet"].avg_price_per_gram == pytest.approx((4.5 + 4.75 + 3.0) / 3, abs=0.01)
+
+        # Gun sinirli aralik (gunluk ozet) ve saat iceren aralik (ham satirlar) ayni sonucu verir
+        day_aligned = {s.category: s for s in filled.category_stats(start=datetime(2024, 6, 2))}
+        raw = {s.category: s for s in filled.category_stats(start=DAY1 + timedelta(hours=1))}
+        assert day_aligned == raw
+        assert raw["tablet"].count == 2
+        assert raw["tablet"].avg_price == 387.5
+        assert "truffle" not in raw
+
+        latest = {s.category: s for s in filled.category_stats(latest_only=True)}
+        assert latest["tablet"].count == 2
+        assert latest["truffle"].avg_price_per_gram == 4.45
+
+    def test_queries_use_indexes(self, filled):
+        """Sorgular tam tablo taramasi yapmaz."""
+        conn = filled._conn
+
+        def plan(sql, params):
+            return " ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+        range_plan = plan(
+            "SELECT * FROM price_history WHERE tenant_id = ? AND source = ? "
+            "AND product_key = ? AND scraped_at >= ?",
+            ("default", "vakko", "x", 0),
+        )
+        category_plan = plan(
+            "SELECT category, AVG(price_tl) FROM price_history WHERE tenant_id = ? "
+            "AND scraped_at >= ? GROUP BY category",
+            ("default", 0),
+        )
+
+        assert "idx_price_history_product" in range_plan
+        assert "USING COVERING INDEX idx_price_history_time" in category_plan